@@ -0,0 +1,59 @@
+# coding=utf-8
+"""Utility functions for mapping lists of values to categories using thresholds."""
+from bisect import bisect_left, bisect_right
+
+
+def categorize(values, low_thresholds=(), high_thresholds=(), categories=(0,)):
+    """Map a list of values to categories using sorted lists of thresholds.
+
+    Each value is located with a binary search over the thresholds rather than
+    a chain of comparisons, which makes this function suitable for classifying
+    entire annual lists of values at once. A value is assigned to the
+    lowest categories when it is strictly below a low threshold and to the
+    highest categories when it is strictly above a high threshold, matching
+    the if/elif checks that are used for single values across this package.
+
+    Args:
+        values: A list of numbers to be categorized.
+        low_thresholds: A list of thresholds sorted from lowest to highest.
+            Values strictly below the Nth low threshold will be assigned to
+            a category with an index less than or equal to N.
+        high_thresholds: A list of thresholds sorted from lowest to highest.
+            All of these must be greater than or equal to the last low threshold.
+            Values strictly above the Nth high threshold will be assigned to
+            a category with an index greater than len(low_thresholds) + N.
+        categories: A list of the category values to be returned. This must have
+            a length equal to len(low_thresholds) + len(high_thresholds) + 1.
+
+    Returns:
+        A list of categories with one item for each of the input values.
+
+    Usage:
+
+    .. code-block:: python
+
+        # classify values as cold (-1), neutral (0) or hot (+1)
+        categorize([5, 15, 30], [9], [26], [-1, 0, 1])  # returns [-1, 0, 1]
+    """
+    assert len(categories) == len(low_thresholds) + len(high_thresholds) + 1, \
+        'Number of categories ({}) must be one more than the number of ' \
+        'thresholds ({}).'.format(
+            len(categories), len(low_thresholds) + len(high_thresholds))
+    low, high, cats = list(low_thresholds), list(high_thresholds), list(categories)
+    low_count = len(low)
+    b_right, b_left = bisect_right, bisect_left  # local names are faster to look up
+    if len(high) == 0:
+        return [cats[b_right(low, val)] for val in values]
+    elif low_count == 0:
+        return [cats[b_left(high, val)] for val in values]
+    bot_lim, top_lim = low[-1], high[0]
+    mid_cat = cats[low_count]
+    result = []
+    for val in values:
+        if val < bot_lim:
+            result.append(cats[b_right(low, val)])
+        elif val > top_lim:
+            result.append(cats[low_count + b_left(high, val)])
+        else:
+            result.append(mid_cat)
+    return result
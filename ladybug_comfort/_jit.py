@@ -0,0 +1,44 @@
+# coding=utf-8
+"""Optional compilation of the iterative comfort model kernels with numba.
+
+When numba is installed, the functions decorated with jit are compiled the first
+time that they are called, which makes the iterative loops of the PMV, SET and
+PHS models many times faster. Otherwise, the decorator returns the functions
+unchanged such that the same pure Python code is used. Setting the
+NUMBA_DISABLE_JIT environment variable to 1 also uses the pure Python code.
+
+Compiled math functions return inf or NaN where Python raises an OverflowError,
+so the results of compiled functions that callers solve over should be passed
+through check_overflow in order to raise the same errors as pure Python.
+"""
+import math
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional dependency
+    njit = None
+
+JIT_AVAILABLE = njit is not None
+
+
+def jit(funct):
+    """Compile a function with numba if it is installed or return it unchanged.
+
+    Decorated functions must only use numbers, booleans and the math module so
+    that they can be compiled.
+    """
+    if njit is None:
+        return funct
+    return njit(cache=True, error_model='numpy')(funct)
+
+
+def python_function(funct):
+    """Get the pure Python function of a function that is decorated with jit."""
+    return getattr(funct, 'py_func', funct)
+
+
+def check_overflow(value):
+    """Raise an OverflowError if a number is inf or NaN or return it unchanged."""
+    if math.isinf(value) or math.isnan(value):
+        raise OverflowError('math range error')
+    return value
@@ -0,0 +1,83 @@
+# coding=utf-8
+"""Utilities for handling sequences of input values without copying them."""
+from itertools import repeat
+
+
+class ConstantSequence(object):
+    """Immutable sequence that repeats one value without storing a list of copies.
+
+    This is used in place of lists like [0.1] * 8760 for comfort model inputs
+    that are the same at every step. It can be iterated, indexed and sliced
+    like a tuple while only storing the value and the length.
+
+    Args:
+        value: The value of every item in the sequence.
+        length: An integer for the number of items in the sequence.
+
+    Properties:
+        * value
+    """
+    __slots__ = ('_value', '_length')
+
+    def __init__(self, value, length):
+        """Initialize a ConstantSequence."""
+        self._value = value
+        self._length = int(length)
+        assert self._length >= 0, 'ConstantSequence length must be greater than ' \
+            'or equal to 0. Got {}.'.format(length)
+
+    @property
+    def value(self):
+        """The value of every item in the sequence."""
+        return self._value
+
+    def tolist(self):
+        """Get a list with all of the items of this sequence."""
+        return [self._value] * self._length
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        return repeat(self._value, self._length)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return ConstantSequence(self._value, len(range(*key.indices(self._length))))
+        if not -self._length <= key < self._length:
+            raise IndexError('ConstantSequence index out of range.')
+        return self._value
+
+    def __contains__(self, item):
+        return self._length > 0 and item == self._value
+
+    def __eq__(self, other):
+        try:
+            return len(other) == self._length and all(v == self._value for v in other)
+        except TypeError:
+            return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        """ConstantSequence representation."""
+        return 'ConstantSequence({}, {})'.format(self._value, self._length)
+
+
+def is_sequence(obj):
+    """Check whether an object is a sized sequence of values (but not text).
+
+    This includes lists, tuples, arrays, memoryviews, NumPy arrays and any
+    other object that supports len() and indexing.
+    """
+    if isinstance(obj, (str, bytes, bytearray, dict)) or \
+            not hasattr(obj, '__getitem__'):
+        return False
+    try:
+        len(obj)
+    except TypeError:  # eg. a zero-dimensional NumPy array
+        return False
+    return True
@@ -2,6 +2,8 @@
 """Utility functions for calculating Adaptive Thermal Comfort."""
 from __future__ import division
 
+from .backend import register_implementation, implementation
+
 import math
 import sys
 if (sys.version_info > (3, 0)):
@@ -31,6 +33,9 @@ def adaptive_comfort_ashrae55(t_prevail, to):
             Negative values indicate cool conditions and positive values
             indicate warm conditions.
     """
+    impl = implementation('adaptive_comfort_ashrae55')
+    if impl is not None:
+        return impl(t_prevail, to)
     # fix upper and lower outdoor temperatures if outside the range of the model
     if t_prevail < 10.:
         t_prevail = 10.
@@ -73,6 +78,9 @@ def adaptive_comfort_en15251(t_prevail, to):
             Negative values indicate cool conditions and positive values
             indicate warm conditions.
     """
+    impl = implementation('adaptive_comfort_en15251')
+    if impl is not None:
+        return impl(t_prevail, to)
     # fix upper and lower outdoor temperatures if outside the range of the model
     if t_prevail < 10.:
         t_prevail = 10.
@@ -122,6 +130,9 @@ def adaptive_comfort_conditioned(t_prevail, to, conditioning, model):
             Negative values indicate cool conditions and positive values
             indicate warm conditions.
     """
+    impl = implementation('adaptive_comfort_conditioned')
+    if impl is not None:
+        return impl(t_prevail, to, conditioning, model)
     # fix upper and lower outdoor temperatures if outside the range of the model
     if t_prevail < 10.0:
         t_prevail = 10.0
@@ -543,3 +554,10 @@ def check_prevailing_temperatures_range(t_prevail, lower, upper, standard=''):
             message = '{}\n{}'.format(cold_msg, hot_msg)
 
     return all_in_range, message
+
+
+# register the pure Python implementations of the model kernels
+register_implementation('adaptive_comfort_ashrae55', 'python', adaptive_comfort_ashrae55)
+register_implementation('adaptive_comfort_en15251', 'python', adaptive_comfort_en15251)
+register_implementation(
+    'adaptive_comfort_conditioned', 'python', adaptive_comfort_conditioned)
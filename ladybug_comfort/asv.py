@@ -1,5 +1,11 @@
 # coding=utf-8
 """Utility functions for calculating Actual Sensation Vote (ASV)"""
+from ._categorize import categorize
+
+try:
+    from itertools import izip as zip  # python 2
+except ImportError:
+    pass
 
 
 def actual_sensation_vote(ta, ws, rh, sr):
@@ -31,6 +37,25 @@ def actual_sensation_vote(ta, ws, rh, sr):
     return asv
 
 
+def actual_sensation_vote_batch(ta, ws, rh, sr):
+    """Calculate Actual Sensation Vote (ASV) for lists of air temperature, wind
+    speed, relative humidity and solar radiation.
+
+    This is equivalent to calling actual_sensation_vote() for each set of values.
+
+    Args:
+        ta: A list of air temperatures [C]
+        ws: A list of wind speeds [m/s] that align with ta.
+        rh: A list of relative humidity values [%] that align with ta.
+        sr: A list of solar radiation values [Wh/m2] that align with ta.
+
+    Returns:
+        asv -- A list of Actual sensation vote values [unitless]
+    """
+    return [0.049 * t + 0.001 * s - 0.051 * w + 0.014 * r - 2.079
+            for t, w, r, s in zip(ta, ws, rh, sr)]
+
+
 def actual_sensation_vote_effect_category(asv):
     """Get the category of effect associated with a given actual sensation vote
     (ASV).
@@ -69,3 +94,19 @@ def actual_sensation_vote_effect_category(asv):
         category = -2
 
     return category
+
+
+def actual_sensation_vote_effect_category_batch(asv):
+    """Get the categories of effect associated with a list of actual sensation
+    vote (ASV) values.
+
+    This is equivalent to calling actual_sensation_vote_effect_category() for
+    each value.
+
+    Args:
+        asv: A list of Actual Sensation Vote values [unitless]
+
+    Returns:
+        category -- A list of integers from -2 (Very cold) to 2 (Very Hot).
+    """
+    return categorize(asv, (-2, -1), (1, 2), range(-2, 3))
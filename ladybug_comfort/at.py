@@ -2,8 +2,15 @@
 """Utility functions for calculating the Apparent Temperature (AT)."""
 from __future__ import division
 
+from ._categorize import categorize
+
 import math
 
+try:
+    from itertools import izip as zip  # python 2
+except ImportError:
+    pass
+
 
 def apparent_temperature(ta, rh, ws):
     """Calculate apparent temperature (AT) from air temperature, relative humidity,
@@ -37,6 +44,25 @@ def apparent_temperature(ta, rh, ws):
     return at
 
 
+def apparent_temperature_batch(ta, rh, ws):
+    """Calculate apparent temperature (AT) for lists of air temperature, relative
+    humidity and wind speed.
+
+    This is equivalent to calling apparent_temperature() for each set of values.
+
+    Args:
+        ta: A list of air temperatures [C]
+        rh: A list of relative humidity values [%] that align with ta.
+        ws: A list of wind speeds (km /h) that align with ta.
+
+    Returns:
+        at -- A list of Apparent Temperature values [C]
+    """
+    exp = math.exp
+    return [t + (0.33 * ((r / 100) * 6.105 * exp((17.27 * t) / (237.7 + t)))) -
+            (0.70 * w) - 4.00 for t, r, w in zip(ta, rh, ws)]
+
+
 def apparent_temperature_warning_category(at):
     """Get the category of apparent suggestion associated with a given apparent
     temperature (AT).
@@ -99,3 +125,19 @@ def apparent_temperature_warning_category(at):
         category = -6
 
     return category
+
+
+def apparent_temperature_warning_category_batch(at):
+    """Get the categories of apparent suggestion associated with a list of apparent
+    temperature (AT) values.
+
+    This is equivalent to calling apparent_temperature_warning_category() for
+    each value.
+
+    Args:
+        at: A list of Apparent temperature values [C]
+
+    Returns:
+        category -- A list of integers from -6 (Overcoat) to 4 (Minimal clothing).
+    """
+    return categorize(at, (), (-5, 0, 5, 10, 15, 20, 25, 30, 35, 40), range(-6, 5))
@@ -0,0 +1,188 @@
+# coding=utf-8
+"""Registry of the implementations of comfort model kernels for different backends.
+
+Each model kernel has a name (eg. fanger_pmv) and one implementation for each
+backend that supports it. The backends are the following.
+
+* python - The pure Python reference code, which is available everywhere,
+  including IronPython.
+* numpy - Implementations that use NumPy.
+* compiled - Implementations that are compiled with numba (see the _jit module).
+
+The pure Python implementation of each kernel is registered by the module that
+defines the kernel and any other implementation must accept the same arguments
+and return the same results. For the fanger_pmv, pierce_set and
+predictedHeatStrain kernels, these are the arguments and results of the
+_fanger_pmv_kernel, _pierce_set_kernel and _predicted_heat_strain_kernel
+functions. For the other kernels, they are those of the public function with the
+kernel name.
+
+The active backend can be selected globally with set_backend, for a block of
+code with use_backend, or for a single comfort Data Collection object with its
+backend argument. The backend of a use_backend block (and of a Data Collection)
+only applies to the thread that runs it such that Data Collections with
+different backends can be computed on different threads. The global backend of
+set_backend is used by all threads outside of use_backend blocks. Kernels
+without an implementation for the active backend use the pure Python
+implementation such that any backend can be selected in environments where
+NumPy or numba are not available.
+
+Usage:
+
+.. code-block:: python
+
+    from ladybug_comfort.backend import use_backend
+    from ladybug_comfort.pmv import predicted_mean_vote
+
+    with use_backend('python'):  # use the reference implementation
+        result = predicted_mean_vote(25, 25, 0.5, 50, 1.1, 0.7)
+"""
+import threading
+
+from ._jit import JIT_AVAILABLE, python_function
+
+BACKENDS = ('python', 'numpy', 'compiled')
+KERNELS = (
+    'fanger_pmv', 'pierce_set', 'predictedHeatStrain',
+    'universal_thermal_climate_index', 'outdoor_sky_heat_exch',
+    'adaptive_comfort_ashrae55', 'adaptive_comfort_en15251',
+    'adaptive_comfort_conditioned')
+
+_implementations = {}  # dictionary of kernel name: {backend name: function}
+_backend = ['compiled' if JIT_AVAILABLE else 'python']  # name of the global backend
+_local = threading.local()  # backend attribute for the use_backend block of a thread
+
+
+def register_implementation(kernel, backend, function):
+    """Register a function as the implementation of a kernel for a backend.
+
+    Any existing implementation of the kernel for the backend is replaced.
+
+    Args:
+        kernel: Text for the name of the kernel. Must be one of the KERNELS.
+        backend: Text for the name of the backend. Must be one of the BACKENDS.
+        function: The function implementing the kernel, which must accept the
+            same arguments and return the same results as the python
+            implementation of the kernel.
+    """
+    assert kernel in KERNELS, 'Kernel "{}" is not recognized. Choose from: ' \
+        '{}.'.format(kernel, ', '.join(KERNELS))
+    _check_backend(backend)
+    try:
+        _implementations[kernel][backend] = function
+    except KeyError:
+        _implementations[kernel] = {backend: function}
+
+
+def register_jit_kernel(kernel, function):
+    """Register a function decorated with jit as the python and compiled kernel.
+
+    The compiled implementation is only registered when numba is available.
+
+    Args:
+        kernel: Text for the name of the kernel. Must be one of the KERNELS.
+        function: A function decorated with the jit decorator of the _jit module.
+
+    Returns:
+        The pure Python function, which should be called when implementation()
+        returns None.
+    """
+    py_function = python_function(function)
+    register_implementation(kernel, 'python', py_function)
+    if JIT_AVAILABLE:
+        register_implementation(kernel, 'compiled', function)
+    return py_function
+
+
+def implementation(kernel):
+    """Get the implementation of a kernel for the active backend.
+
+    Args:
+        kernel: Text for the name of the kernel.
+
+    Returns:
+        The function implementing the kernel for the active backend or None if
+        the python implementation should be used, either because python is the
+        active backend or because the kernel has no implementation for it.
+    """
+    backend = get_backend()
+    if backend == 'python':
+        return None
+    return _implementations.get(kernel, {}).get(backend)
+
+
+def available_backends(kernel):
+    """Get a list of the names of backends that have an implementation of a kernel.
+
+    Args:
+        kernel: Text for the name of the kernel.
+    """
+    impls = _implementations.get(kernel, {})
+    return [backend for backend in BACKENDS if backend in impls]
+
+
+def get_backend():
+    """Get the name of the active backend of the current thread."""
+    return getattr(_local, 'backend', None) or _backend[0]
+
+
+def set_backend(backend):
+    """Set the global backend for all subsequent kernel calls.
+
+    The backend of any use_backend block takes precedence over the global
+    backend within the block.
+
+    Args:
+        backend: Text for the name of the backend. Must be one of the BACKENDS.
+            Kernels without an implementation for this backend will use
+            their python implementation.
+    """
+    _check_backend(backend)
+    _backend[0] = backend
+
+
+class use_backend(object):
+    """Context manager to use a backend within a block of code.
+
+    The backend only applies to the thread that runs the block and the
+    previously active backend of the thread is restored at the end of the block.
+
+    Args:
+        backend: Text for the name of the backend. Must be one of the BACKENDS.
+            If None, the active backend will be used within the block.
+    """
+    __slots__ = ('_backend', '_previous')
+
+    def __init__(self, backend):
+        if backend is not None:
+            _check_backend(backend)
+        self._backend = backend
+        self._previous = None
+
+    def __enter__(self):
+        self._previous = getattr(_local, 'backend', None)
+        if self._backend is not None:
+            _local.backend = self._backend
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._backend is not None:
+            _local.backend = self._previous
+
+    @property
+    def backend(self):
+        """Text for the name of the backend used within the block."""
+        return self._backend
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'Use Backend: {}'.format(self._backend)
+
+
+def _check_backend(backend):
+    """Check that a backend name is one of the BACKENDS."""
+    assert backend in BACKENDS, 'Backend "{}" is not recognized. Choose from: ' \
+        '{}.'.format(backend, ', '.join(BACKENDS))
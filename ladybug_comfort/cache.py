@@ -0,0 +1,334 @@
+# coding=utf-8
+"""Utilities for caching the results of comfort calculations in memory and on disk."""
+from __future__ import division
+
+from ._sequence import is_sequence
+
+from collections import OrderedDict
+from array import array
+import hashlib
+import json
+import os
+
+try:
+    from itertools import izip as zip  # python 2
+except ImportError:
+    pass
+
+# number of leading arguments (ta, tr, vel, rh) that a single quantum snaps
+_SNAPPED_ARG_COUNT = 4
+# version of the layout of cache entries, which should be increased when it changes
+CACHE_SCHEMA = 1
+_code_version = []  # list to hold the code_version once it is computed
+
+
+class ResultCache(object):
+    """Bounded least-recently-used (LRU) cache of the results of a comfort function.
+
+    Calling this object with the arguments of the function will return the result
+    of the function, only computing it when the same inputs have not been seen
+    recently. This is useful for functions like predicted_mean_vote or pierce_set,
+    which are often evaluated with many identical inputs (eg. constant met and
+    clo with EPW temperatures that are recorded to 0.1 C).
+
+    Results that are dictionaries or lists are copied each time that they are
+    returned such that editing a result does not change the cached result.
+
+    Args:
+        function: The function to be cached (eg. predicted_mean_vote). All of
+            the arguments to this function must be numbers or other hashable
+            objects and they must be passed positionally.
+        max_size: An integer for the maximum number of results to keep in the
+            cache. When the cache is full, the least recently used result is
+            discarded. Default: 100000.
+        quantum: A number for the precision to which the first four numerical
+            inputs are snapped before the function is evaluated. These are the
+            air temperature, radiant temperature, air speed and relative humidity
+            of functions like predicted_mean_vote, pierce_set and
+            universal_thermal_climate_index. All other inputs (eg. met and clo)
+            are used exactly as they are given. Inputs that snap to the same values
+            will share the same result. This can also be a list of numbers
+            with one quantum for each positional argument of the function, which
+            is useful when some inputs should be snapped more coarsely than
+            others or when other inputs should also be snapped. Arguments
+            beyond the end of the list are used exactly as they are given.
+            A quantum of zero means that the input is used exactly as it is
+            given. Default: 0.
+
+    Properties:
+        * function
+        * max_size
+        * quantum
+        * hits
+        * misses
+        * size
+
+    Usage:
+
+    .. code-block:: python
+
+        from ladybug_comfort.pmv import predicted_mean_vote
+        from ladybug_comfort.cache import ResultCache
+
+        pmv_cache = ResultCache(predicted_mean_vote, quantum=0.01)
+        result = pmv_cache(22, 22, 0.1, 50, 1.1, 0.7, 0)
+        result = pmv_cache(22.001, 22, 0.1, 50, 1.1, 0.7, 0)  # cached result
+        print(pmv_cache.hits, pmv_cache.misses)  # 1 1
+    """
+    __slots__ = ('_function', '_max_size', '_quantum', '_cache', '_hits', '_misses')
+
+    def __init__(self, function, max_size=100000, quantum=0):
+        """Initialize a ResultCache."""
+        assert callable(function), 'ResultCache function must be callable. ' \
+            'Got {}.'.format(type(function))
+        self._function = function
+        self._max_size = int(max_size)
+        assert self._max_size > 0, 'ResultCache max_size must be greater than 0. ' \
+            'Got {}.'.format(max_size)
+        if isinstance(quantum, (list, tuple)):
+            self._quantum = tuple(float(q) for q in quantum)
+        else:
+            self._quantum = float(quantum)
+        for q in self._quanta(1):
+            assert q >= 0, 'ResultCache quantum must be greater than or equal ' \
+                'to 0. Got {}.'.format(q)
+        self._cache = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def function(self):
+        """The function for which results are cached."""
+        return self._function
+
+    @property
+    def max_size(self):
+        """The maximum number of results kept in the cache."""
+        return self._max_size
+
+    @property
+    def quantum(self):
+        """The precision to which numerical inputs are snapped."""
+        return self._quantum
+
+    @property
+    def hits(self):
+        """The number of calls that were answered from the cache."""
+        return self._hits
+
+    @property
+    def misses(self):
+        """The number of calls that required the function to be evaluated."""
+        return self._misses
+
+    @property
+    def size(self):
+        """The number of results that are currently in the cache."""
+        return len(self._cache)
+
+    def clear(self):
+        """Remove all results from the cache and reset the hit and miss counters."""
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def _quanta(self, arg_count):
+        """Get a list of the quantum to be used for each snapped argument."""
+        if isinstance(self._quantum, tuple):
+            return self._quantum
+        return (self._quantum,) * min(arg_count, _SNAPPED_ARG_COUNT)
+
+    def __call__(self, *args):
+        """Get the result of the function for the input arguments."""
+        # snap the inputs to the quantum to get the cache key
+        key, snapped = [], []
+        for arg, q in zip(args, self._quanta(len(args))):
+            if q != 0 and isinstance(arg, (int, float)) and \
+                    not isinstance(arg, bool):
+                steps = int(round(arg / q))
+                key.append(steps)
+                snapped.append(steps * q)
+            else:
+                key.append(arg)
+                snapped.append(arg)
+        snapped.extend(args[len(snapped):])  # arguments beyond the quanta
+        key = tuple(key) + tuple(args[len(key):])
+
+        # look up the result or evaluate the function
+        try:
+            result = self._cache.pop(key)
+            self._hits += 1
+        except KeyError:
+            result = self._function(*snapped)
+            self._misses += 1
+            if len(self._cache) >= self._max_size:
+                self._cache.popitem(last=False)  # discard the least recently used
+        self._cache[key] = result
+        return _copy_result(result)
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """ResultCache representation."""
+        return 'Result Cache: {} [size: {}/{}] [hits: {}, misses: {}]'.format(
+            getattr(self._function, '__name__', self._function), self.size,
+            self._max_size, self._hits, self._misses)
+
+
+def _copy_result(result):
+    """Copy the dictionaries and lists of a result so that callers cannot edit the cache.
+    """
+    if isinstance(result, dict):
+        return dict((key, _copy_result(val)) for key, val in result.items())
+    if isinstance(result, list):
+        return [_copy_result(val) for val in result]
+    return result
+
+
+def package_version():
+    """Get the installed version of ladybug-comfort or 'unknown' if it is unavailable.
+    """
+    try:
+        from importlib.metadata import version  # python 3.8+
+        return version('ladybug-comfort')
+    except Exception:
+        try:
+            import pkg_resources  # python 2 and older versions of python 3
+            return pkg_resources.get_distribution('ladybug-comfort').version
+        except Exception:
+            return 'unknown'
+
+
+def code_version():
+    """Get text that identifies the version of the code of ladybug-comfort.
+
+    This combines the package_version, the CACHE_SCHEMA and a hash of the source
+    of all modules of the package. So cached results are invalidated whenever
+    the code changes, even in a source checkout where the package version is
+    unknown or unchanged.
+    """
+    if not _code_version:
+        sha = hashlib.sha1()
+        package_folder = os.path.dirname(os.path.abspath(__file__))
+        for root, dirs, files in os.walk(package_folder):
+            dirs.sort()
+            for f_name in sorted(files):
+                if f_name.endswith('.py'):
+                    f_path = os.path.join(root, f_name)
+                    sha.update(os.path.relpath(f_path, package_folder).encode('utf-8'))
+                    with open(f_path, 'rb') as inf:
+                        sha.update(inf.read())
+        _code_version.append('{}-{}-{}'.format(
+            package_version(), CACHE_SCHEMA, sha.hexdigest()))
+    return _code_version[0]
+
+
+def hash_inputs(*inputs):
+    """Get a SHA-1 hash that uniquely identifies a set of inputs.
+
+    Args:
+        *inputs: Any number of inputs to be hashed. Sequences of numbers (eg.
+            lists, tuples and arrays) are hashed from their binary representation
+            and all other inputs (including sequences containing non-numbers)
+            are hashed from their repr.
+
+    Returns:
+        Text for the hexadecimal digest of the hash.
+    """
+    sha = hashlib.sha1()
+    for item in inputs:
+        if is_sequence(item):
+            try:
+                data = _array_to_bytes(array('d', item))
+            except TypeError:
+                data = repr(item).encode('utf-8')
+        else:
+            data = repr(item).encode('utf-8')
+        sha.update(str(len(data)).encode('utf-8'))
+        sha.update(data)
+    return sha.hexdigest()
+
+
+def write_result_columns(folder, key, columns):
+    """Write columns of results to a binary file in a cache folder.
+
+    Each cache entry consists of a binary file with the values of all of the
+    columns and a JSON index file that records the name, type and length of
+    each column. The index file is written last so that incomplete entries
+    are never read.
+
+    Args:
+        folder: Path to the folder in which the cache files will be written.
+            It will be created if it does not exist.
+        key: Text for the unique key of the results (eg. from hash_inputs).
+        columns: A list of tuples with three elements each. The first is text
+            for the name of the column, the second is the array typecode that
+            the column values will be written with (eg. 'd' for floats and 'b'
+            for small integers) and the third is a list of the values.
+
+    Returns:
+        The path to the JSON index file that was written.
+    """
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+    index = {'version': code_version(), 'columns': []}
+    with open(os.path.join(folder, '{}.bin'.format(key)), 'wb') as outf:
+        for name, typecode, values in columns:
+            outf.write(_array_to_bytes(array(typecode, values)))
+            index['columns'].append([name, typecode, len(values)])
+    index_path = os.path.join(folder, '{}.json'.format(key))
+    with open(index_path, 'w') as outf:
+        json.dump(index, outf)
+    return index_path
+
+
+def read_result_columns(folder, key):
+    """Read columns of results that were written with write_result_columns.
+
+    Args:
+        folder: Path to the folder in which the cache files were written.
+        key: Text for the unique key of the results.
+
+    Returns:
+        A dictionary with the column names as keys and lists of values as values.
+        None will be returned if no valid cache entry exists for the key.
+    """
+    index_path = os.path.join(folder, '{}.json'.format(key))
+    bin_path = os.path.join(folder, '{}.bin'.format(key))
+    if not os.path.isfile(index_path) or not os.path.isfile(bin_path):
+        return None
+    try:
+        with open(index_path) as inf:
+            index = json.load(inf)
+        with open(bin_path, 'rb') as inf:
+            data = inf.read()
+        columns, start = {}, 0
+        for name, typecode, count in index['columns']:
+            arr = array(str(typecode))
+            end = start + arr.itemsize * count
+            _array_from_bytes(arr, data[start:end])
+            columns[name] = arr.tolist()
+            start = end
+    except (ValueError, KeyError, EOFError):
+        return None  # corrupted or incomplete cache entry
+    if start != len(data):
+        return None
+    return columns
+
+
+def _array_to_bytes(arr):
+    """Get the bytes of an array in a way that works in both python 2 and 3."""
+    try:
+        return arr.tobytes()
+    except AttributeError:  # python 2
+        return arr.tostring()
+
+
+def _array_from_bytes(arr, data):
+    """Extend an array with bytes in a way that works in both python 2 and 3."""
+    try:
+        arr.frombytes(data)
+    except AttributeError:  # python 2
+        arr.fromstring(data)
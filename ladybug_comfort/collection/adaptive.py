@@ -2,11 +2,15 @@
 """Object for calculating Adaptive comfort from DataCollections."""
 from __future__ import division
 
+from bisect import bisect_right
+
 from ..adaptive import adaptive_comfort_ashrae55, adaptive_comfort_en15251, \
     adaptive_comfort_conditioned_function, cooling_effect_ashrae55, \
-    cooling_effect_en15251, t_operative, \
+    cooling_effect_en15251, t_operative, neutral_temperature_conditioned, \
     weighted_running_mean_hourly, weighted_running_mean_daily
 from ..parameter.adaptive import AdaptiveParameter
+from ..backend import use_backend
+from .._sequence import ConstantSequence
 from .base import ComfortCollection
 
 from ladybug._datacollectionbase import BaseCollection
@@ -49,6 +53,17 @@ class Adaptive(ComfortCollection):
         comfort_parameter: Optional AdaptiveParameter object to specify parameters
             under which conditions are considered acceptable. If None, default will
             assume ASHRAE-55 criteria.
+        backend: Optional text for the name of the backend of the model kernels
+            to be used for the calculation of this object (see the backend
+            module). Choose from: python, numpy, compiled. Kernels without an
+            implementation for the backend will use pure Python. If None, the
+            active backend will be used. (Default: None).
+        mask: An optional Data Collection or list of booleans with one value
+            for each step of the operative_temperature, which notes the steps at which
+            adaptive comfort is evaluated (eg. an occupancy schedule of 0 and 1 values).
+            Steps that are False (or 0) are not computed, their values in the
+            output Data Collections are None and they are excluded from all
+            percent statistics. If None, all steps are evaluated. (Default: None).
 
     Properties:
         * prevailing_outdoor_temperature
@@ -67,16 +82,19 @@ class Adaptive(ComfortCollection):
         * percent_cold
     """
     _model = 'Adaptive'
+    _percent_properties = ('percent_comfortable', 'percent_uncomfortable',
+                           'percent_neutral', 'percent_hot', 'percent_cold')
     __slots__ = ('_op_temp', '_air_speed', '_comfort_par', '_t_out', '_prevail_temp',
                  '_neutral_temperature', '_degrees_from_neutral', '_is_comfortable',
                  '_thermal_condition', '_cooling_effect', '_is_comfortable_coll',
                  '_thermal_condition_coll', '_op_temp_coll', '_air_speed_coll',
                  '_comfort_par_coll', '_t_out_coll', '_prevail_temp_coll',
                  '_neutral_temperature_coll', '_degrees_from_neutral_coll',
-                 '_cooling_effect_coll')
+                 '_cooling_effect_coll', '_condition_count_dict', '_mask',
+                 '_sweep_values')
 
     def __init__(self, outdoor_temperature, operative_temperature, air_speed=None,
-                 comfort_parameter=None):
+                 comfort_parameter=None, backend=None, mask=None):
         """Initialize an Adaptive comfort object from DataCollections of inputs.
         """
         # set up the object using operative temperature as a base
@@ -91,7 +109,8 @@ class Adaptive(ComfortCollection):
         if air_speed is not None:
             self._air_speed = self._check_input(air_speed, Speed, 'm/s', 'air_speed')
         else:
-            self._air_speed = [0.1] * self.calc_length
+            self._air_speed = ConstantSequence(0.1, self.calc_length)
+        self._mask = self._check_mask(mask)
 
         # check comfort parameters
         if comfort_parameter is None:
@@ -117,7 +136,8 @@ class Adaptive(ComfortCollection):
                 self._t_out, PrevailingOutdoorTemperature, 'C', 'outdoor_temperature')
 
         # calculate Adaptive comfort
-        self._calculate_adaptive()
+        with use_backend(backend):
+            self._calculate_adaptive()
 
     @classmethod
     def from_air_and_rad_temp(cls, outdoor_temperature, air_temperature,
@@ -137,8 +157,6 @@ class Adaptive(ComfortCollection):
         # empty properties to be calculated
         self._neutral_temperature = []
         self._degrees_from_neutral = []
-        self._is_comfortable = []
-        self._thermal_condition = []
         self._cooling_effect = []
 
         # determine the comfort function to use
@@ -157,20 +175,20 @@ class Adaptive(ComfortCollection):
             cooling_funct = cooling_effect_en15251
 
         # perform the Adaptive calculation
-        for tp, to, vel in zip(self._prevail_temp, self._op_temp, self._air_speed):
+        op_temp = self._masked_values(self._op_temp)
+        for tp, to, vel in zip(self._masked_values(self._prevail_temp), op_temp,
+                               self._masked_values(self._air_speed)):
             result = comf_funct(tp, to)
-            ce = cooling_funct(vel, to)
-            comf = self._comfort_par.is_comfortable(result, ce)
-            if comf == 0:
-                condit = 1 if result['deg_comf'] > 0 else -1
-            else:
-                condit = 0
-
             self._neutral_temperature.append(result['t_comf'])
             self._degrees_from_neutral.append(result['deg_comf'])
-            self._is_comfortable.append(comf)
-            self._thermal_condition.append(condit)
-            self._cooling_effect.append(ce)
+            self._cooling_effect.append(cooling_funct(vel, to))
+
+        # determine whether conditions are acceptable
+        self._is_comfortable = self._comfort_par.is_comfortable_batch(
+            op_temp, self._degrees_from_neutral, self._cooling_effect)
+        self._thermal_condition = self._comfort_par.thermal_condition_batch(
+            op_temp, self._degrees_from_neutral, self._cooling_effect,
+            self._is_comfortable)
 
     @property
     def prevailing_outdoor_temperature(self):
@@ -243,7 +261,7 @@ class Adaptive(ComfortCollection):
     @property
     def percent_comfortable(self):
         """The percent of time comfortabe given by the assigned comfort_parameter."""
-        return (sum(self._is_comfortable) / self._calc_length) * 100
+        return (sum(self._is_comfortable) / self._result_length()) * 100
 
     @property
     def percent_uncomfortable(self):
@@ -253,20 +271,93 @@ class Adaptive(ComfortCollection):
     @property
     def percent_neutral(self):
         """The percent of time that the thermal_condition is neutral."""
-        _vals = [1 for x in self._thermal_condition if x == 0]
-        return (sum(_vals) / self._calc_length) * 100
+        return self._percent_of(self._condition_count(), (0,))
 
     @property
     def percent_cold(self):
         """The percent of time that the thermal_condition is cold."""
-        _vals = [1 for x in self._thermal_condition if x == -1]
-        return (sum(_vals) / self._calc_length) * 100
+        return self._percent_of(self._condition_count(), (-1,))
 
     @property
     def percent_hot(self):
         """The percent of time that the thermal_condition is hot."""
-        _vals = [1 for x in self._thermal_condition if x == 1]
-        return (sum(_vals) / self._calc_length) * 100
+        return self._percent_of(self._condition_count(), (1,))
+
+    def category_counts(self):
+        """Get a dictionary with the number of values in each thermal_condition.
+
+        Keys are the integers of thermal_condition (-1, 0, +1) and values are
+        the number of time steps that fall into each category.
+        """
+        return dict(self._condition_count())
+
+    def threshold_sweep(self, neutral_offsets):
+        """Get the comfort percentages of this object for a list of neutral offsets.
+
+        This is equivalent to getting the percent_comfortable, percent_hot, etc.
+        of an Adaptive object with each neutral_offset in its comfort_parameter.
+        However, the smallest neutral offset at which each step is comfortable
+        is only computed and sorted once and each neutral offset is then
+        evaluated with a binary search. So it is much faster than recomputing the
+        object for sensitivity studies of the neutral offset. Note that results
+        can differ from those of recomputed objects for steps that lie exactly
+        on the edge of the comfort band because of floating point rounding.
+
+        Args:
+            neutral_offsets: A list of numbers for the degrees Celsius from the
+                neutral temperature where the operative temperature is considered
+                acceptable. Each value must be greater than 0 and less than
+                or equal to 10.
+
+        Returns:
+            A dictionary with 'percent_comfortable', 'percent_uncomfortable',
+            'percent_neutral', 'percent_hot' and 'percent_cold' as keys and
+            lists with the percent of time for each neutral offset as values.
+        """
+        if not hasattr(self, '_sweep_values'):
+            self._sweep_values = self._sweep_offsets()
+        all_offsets, hot_offsets, cold_offsets = self._sweep_values
+
+        # count the steps on each side of the offsets with binary searches
+        count = self._result_length()
+        sweep = dict((prop, []) for prop in self._percent_properties)
+        for offset in neutral_offsets:
+            assert 0 < offset <= 10, \
+                'neutral_offset must be between 0 and 10 C. Got {}'.format(offset)
+            comfortable = (bisect_right(all_offsets, offset) / count) * 100
+            hot = len(hot_offsets) - bisect_right(hot_offsets, offset)
+            cold = len(cold_offsets) - bisect_right(cold_offsets, offset)
+            sweep['percent_comfortable'].append(comfortable)
+            sweep['percent_uncomfortable'].append(100 - comfortable)
+            sweep['percent_neutral'].append(comfortable)
+            sweep['percent_hot'].append((hot / count) * 100)
+            sweep['percent_cold'].append((cold / count) * 100)
+        return sweep
+
+    def _sweep_offsets(self):
+        """Get sorted lists of the smallest neutral offsets that make steps comfortable.
+
+        The three lists are for all steps, steps that are warmer than neutral and
+        steps that are not.
+        """
+        # the minimum operative temperature is this value minus the neutral offset
+        par = self._comfort_par
+        min_op_base = neutral_temperature_conditioned(
+            par.cold_prevail_temp_limit, par.conditioning, par.standard)
+        all_offsets, hot_offsets, cold_offsets = [], [], []
+        for to, deg, ce in zip(self._masked_values(self._op_temp),
+                               self._degrees_from_neutral, self._cooling_effect):
+            offset = max(min_op_base - to, -deg, deg - ce)
+            all_offsets.append(offset)
+            if deg > 0:
+                hot_offsets.append(offset)
+            else:
+                cold_offsets.append(offset)
+        return sorted(all_offsets), sorted(hot_offsets), sorted(cold_offsets)
+
+    def _condition_count(self):
+        return self._count_values('_condition_count_dict', self._thermal_condition,
+                                  (-1, 0, 1))
 
 
 class PrevailingTemperature(object):
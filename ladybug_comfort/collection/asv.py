@@ -0,0 +1,177 @@
+# coding=utf-8
+"""Object for calculating Actual Sensation Vote from DataCollections."""
+from __future__ import division
+
+from ..asv import actual_sensation_vote_batch, \
+    actual_sensation_vote_effect_category_batch
+from .base import ComfortCollection
+
+from ladybug.datatype.temperature import Temperature, AirTemperature
+from ladybug.datatype.fraction import RelativeHumidity
+from ladybug.datatype.speed import Speed, WindSpeed
+from ladybug.datatype.energyintensity import Radiation
+from ladybug.datatype.generic import GenericType
+
+
+class ActualSensationVote(ComfortCollection):
+    """Actual Sensation Vote (ASV) DataCollection object.
+
+    Args:
+        air_temperature: Data Collection of air temperature values in Celsius.
+        wind_speed: Data Collection of meteorological wind speed values in m/s
+            or a single wind speed value to be used for the whole analysis.
+        rel_humidity: Data Collection of relative humidity values in % or a
+            single relative humidity value to be used for the whole analysis.
+        solar_radiation: Data Collection of solar radiation values in Wh/m2 or
+            a single radiation value to be used for the whole analysis.
+        check_alignment: Boolean to note whether the input Data Collections should
+            be checked for alignment with one another. (Default: True).
+
+    Properties:
+        * air_temperature
+        * wind_speed
+        * rel_humidity
+        * solar_radiation
+        * actual_sensation_vote
+        * actual_sensation_vote_category
+        * percent_neutral
+        * percent_hot
+        * percent_cold
+    """
+    _model = 'Actual Sensation Vote'
+    _value_type = GenericType('Actual Sensation Vote', 'unitless', abbreviation='ASV')
+    _category_type = GenericType(
+        'Actual Sensation Vote Category', 'condition', -2, 2, 'ASVcat',
+        {-2: 'Very Cold', -1: 'Cold', 0: 'Comfort', 1: 'Hot', 2: 'Very Hot'})
+    __slots__ = ('_air_temperature', '_wind_speed', '_rel_humidity', '_solar_rad',
+                 '_asv', '_asv_category', '_air_temperature_coll', '_wind_speed_coll',
+                 '_rel_humidity_coll', '_solar_rad_coll', '_asv_coll',
+                 '_asv_category_coll', '_category_count_dict')
+
+    def __init__(self, air_temperature, wind_speed, rel_humidity, solar_radiation,
+                 check_alignment=True):
+        """Initialize an Actual Sensation Vote object from DataCollections of inputs.
+        """
+        # set up the object using air temperature as a base
+        self._check_datacoll(air_temperature, Temperature, 'C', 'air_temperature')
+        self._input_collections = [air_temperature]
+        self._calc_length = len(air_temperature)
+        self._base_collection = air_temperature
+
+        # check required inputs
+        self._air_temperature = air_temperature.values
+        self._wind_speed = self._check_input(wind_speed, Speed, 'm/s', 'wind_speed')
+        self._rel_humidity = self._check_input(
+            rel_humidity, RelativeHumidity, '%', 'rel_humidity')
+        self._solar_rad = self._check_input(
+            solar_radiation, Radiation, 'Wh/m2', 'solar_radiation')
+        if check_alignment:
+            self._check_aligned()
+
+        # compute the actual sensation vote for all values at once
+        self._asv = actual_sensation_vote_batch(
+            self._air_temperature, self._wind_speed, self._rel_humidity,
+            self._solar_rad)
+        self._asv_category = actual_sensation_vote_effect_category_batch(self._asv)
+
+    @classmethod
+    def from_epw(cls, epw, include_wind=True, include_sun=True):
+        """Get an Actual Sensation Vote object from the conditions within an EPW file.
+
+        Args:
+            epw: A ladybug EPW object from which the ActualSensationVote object
+                will be created.
+            include_wind: Set to True to include the EPW wind speed in the calculation.
+                Setting to False will assume a condition that is shielded from wind
+                where the human experiences a very low wind speed of 0.1 m/s.
+                Default is True to include wind.
+            include_sun: Set to True to include the EPW global horizontal radiation
+                in the calculation. Setting to False will assume a shaded
+                condition with no solar radiation. Default is True to include sun.
+
+        Usage:
+
+        .. code-block:: python
+
+            from ladybug.epw import EPW
+            from ladybug_comfort.collection.asv import ActualSensationVote
+
+            epw = EPW('./tests/epw/chicago.epw')
+            asv_obj = ActualSensationVote.from_epw(epw)
+            print(asv_obj.percent_neutral)  # percent of time that is comfortable
+        """
+        wind_speed = epw.wind_speed if include_wind is True else 0.1
+        solar_rad = epw.global_horizontal_radiation if include_sun is True else 0
+        return cls(epw.dry_bulb_temperature, wind_speed, epw.relative_humidity,
+                   solar_rad)
+
+    @property
+    def air_temperature(self):
+        """Data Collection of air temperature values in degrees C."""
+        return self._get_coll('_air_temperature_coll', self._air_temperature,
+                              AirTemperature, 'C')
+
+    @property
+    def wind_speed(self):
+        """Data Collection of wind speed values in m/s."""
+        return self._get_coll('_wind_speed_coll', self._wind_speed,
+                              WindSpeed, 'm/s')
+
+    @property
+    def rel_humidity(self):
+        """Data Collection of relative humidity values in %."""
+        return self._get_coll('_rel_humidity_coll', self._rel_humidity,
+                              RelativeHumidity, '%')
+
+    @property
+    def solar_radiation(self):
+        """Data Collection of solar radiation values in Wh/m2."""
+        return self._get_coll('_solar_rad_coll', self._solar_rad,
+                              Radiation, 'Wh/m2')
+
+    @property
+    def actual_sensation_vote(self):
+        """Data Collection of unitless actual sensation vote values."""
+        return self._get_coll('_asv_coll', self._asv, self._value_type, 'unitless')
+
+    @property
+    def actual_sensation_vote_category(self):
+        """Data Collection of integers noting the actual sensation vote category.
+
+        Values are one of the following:
+
+        * -2 = Very cold
+        * -1 = Cold
+        * 0 = Comfort
+        * 1 = Hot
+        * 2 = Very hot
+        """
+        return self._get_coll('_asv_category_coll', self._asv_category,
+                              self._category_type, 'condition')
+
+    @property
+    def percent_neutral(self):
+        """The percent of time that the effect category is comfort."""
+        return self._percent_of(self._category_count(), (0,))
+
+    @property
+    def percent_hot(self):
+        """The percent of time that the effect category is hot or very hot."""
+        return self._percent_of(self._category_count(), (1, 2))
+
+    @property
+    def percent_cold(self):
+        """The percent of time that the effect category is cold or very cold."""
+        return self._percent_of(self._category_count(), (-2, -1))
+
+    def category_counts(self):
+        """Get a dictionary with the number of values in each effect category.
+
+        Keys are the integers of actual_sensation_vote_category (from -2 to 2)
+        and values are the number of time steps that fall into each category.
+        """
+        return dict(self._category_count())
+
+    def _category_count(self):
+        return self._count_values('_category_count_dict', self._asv_category,
+                                  range(-2, 3))
@@ -0,0 +1,180 @@
+# coding=utf-8
+"""Object for calculating Apparent Temperature from DataCollections."""
+from __future__ import division
+
+from ..at import apparent_temperature_batch, \
+    apparent_temperature_warning_category_batch
+from .._sequence import ConstantSequence
+from .base import ComfortCollection
+
+from ladybug.datatype.temperature import Temperature, AirTemperature
+from ladybug.datatype.fraction import RelativeHumidity
+from ladybug.datatype.speed import Speed, WindSpeed
+from ladybug.datatype.generic import GenericType
+
+
+class ApparentTemperature(ComfortCollection):
+    """Apparent Temperature DataCollection object.
+
+    Args:
+        air_temperature: Data Collection of air temperature values in Celsius.
+        rel_humidity: Data Collection of relative humidity values in % or a
+            single relative humidity value to be used for the whole analysis.
+        wind_speed: Data Collection of meteorological wind speed values in m/s
+            or a single wind speed value to be used for the whole analysis.
+            Note that these are converted to km/h for the apparent temperature
+            calculation. If None, this will default to a very low wind speed
+            of 0.1 m/s.
+        check_alignment: Boolean to note whether the input Data Collections should
+            be checked for alignment with one another. (Default: True).
+
+    Properties:
+        * air_temperature
+        * rel_humidity
+        * wind_speed
+        * apparent_temperature
+        * apparent_temperature_category
+        * percent_neutral
+        * percent_hot
+        * percent_cold
+    """
+    _model = 'Apparent Temperature'
+    _category_type = GenericType(
+        'Apparent Temperature Category', 'condition', -6, 4, 'ATcat',
+        {-6: 'Overcoat, Head Insulation', -5: 'Overcoat', -4: 'Coat and Sweater',
+         -3: 'Sweater', -2: 'Thin Sweater', -1: 'Normal Office Wear',
+         0: 'Cotton-type Slacks', 1: 'Light Undershirt', 2: 'Short Sleeve',
+         3: 'Minimal Clothing', 4: 'Minimal Clothing, Sun Protection'})
+    __slots__ = ('_air_temperature', '_rel_humidity', '_wind_speed', '_at',
+                 '_at_category', '_air_temperature_coll', '_rel_humidity_coll',
+                 '_wind_speed_coll', '_at_coll', '_at_category_coll',
+                 '_category_count_dict')
+
+    def __init__(self, air_temperature, rel_humidity, wind_speed=None,
+                 check_alignment=True):
+        """Initialize an Apparent Temperature object from DataCollections of inputs.
+        """
+        # set up the object using air temperature as a base
+        self._check_datacoll(air_temperature, Temperature, 'C', 'air_temperature')
+        self._input_collections = [air_temperature]
+        self._calc_length = len(air_temperature)
+        self._base_collection = air_temperature
+
+        # check required inputs
+        self._air_temperature = air_temperature.values
+        self._rel_humidity = self._check_input(
+            rel_humidity, RelativeHumidity, '%', 'rel_humidity')
+
+        # check inputs with defaults
+        if wind_speed is not None:
+            self._wind_speed = self._check_input(
+                wind_speed, Speed, 'm/s', 'wind_speed')
+        else:
+            self._wind_speed = ConstantSequence(0.1, self.calc_length)
+        if check_alignment:
+            self._check_aligned()
+
+        # compute the apparent temperature for all values at once
+        self._at = apparent_temperature_batch(
+            self._air_temperature, self._rel_humidity,
+            (ws * 3.6 for ws in self._wind_speed))
+        self._at_category = apparent_temperature_warning_category_batch(self._at)
+
+    @classmethod
+    def from_epw(cls, epw, include_wind=True):
+        """Get an Apparent Temperature object from the conditions within an EPW file.
+
+        Args:
+            epw: A ladybug EPW object from which the ApparentTemperature object
+                will be created.
+            include_wind: Set to True to include the EPW wind speed in the calculation.
+                Setting to False will assume a condition that is shielded from wind
+                where the human experiences a very low wind speed of 0.1 m/s.
+                Default is True to include wind.
+
+        Usage:
+
+        .. code-block:: python
+
+            from ladybug.epw import EPW
+            from ladybug_comfort.collection.at import ApparentTemperature
+
+            epw = EPW('./tests/epw/chicago.epw')
+            at_obj = ApparentTemperature.from_epw(epw)
+            print(at_obj.percent_neutral)  # percent of time with cotton-type slacks
+        """
+        wind_speed = epw.wind_speed if include_wind is True else 0.1
+        return cls(epw.dry_bulb_temperature, epw.relative_humidity, wind_speed)
+
+    @property
+    def air_temperature(self):
+        """Data Collection of air temperature values in degrees C."""
+        return self._get_coll('_air_temperature_coll', self._air_temperature,
+                              AirTemperature, 'C')
+
+    @property
+    def rel_humidity(self):
+        """Data Collection of relative humidity values in %."""
+        return self._get_coll('_rel_humidity_coll', self._rel_humidity,
+                              RelativeHumidity, '%')
+
+    @property
+    def wind_speed(self):
+        """Data Collection of wind speed values in m/s."""
+        return self._get_coll('_wind_speed_coll', self._wind_speed,
+                              WindSpeed, 'm/s')
+
+    @property
+    def apparent_temperature(self):
+        """Data Collection of apparent temperature values in degrees C."""
+        return self._get_coll('_at_coll', self._at,
+                              Temperature('Apparent Temperature'), 'C')
+
+    @property
+    def apparent_temperature_category(self):
+        """Data Collection of integers noting the apparent temperature category.
+
+        Values are one of the following:
+
+        * 4 = (>40 C) Minimal clothing; sun protection required.
+        * 3 = (35-40 C) Minimal clothing; sun protection as needed.
+        * 2 = (30-35 C) Short sleeve, shirt and shorts.
+        * 1 = (25-30 C) Light undershirt.
+        * 0 = (20-25 C) Cotton-type slacks (pants).
+        * -1 = (15-20 C) Normal office wear.
+        * -2 = (10-15 C) Thin or sleeveless sweater.
+        * -3 = (5-10 C) Sweater. Thicker underwear.
+        * -4 = (0-5 C) Coat and sweater.
+        * -5 = (-5-0 C) Overcoat. Wind protection as needed.
+        * -6 = (<-5 C) Overcoat. Head insulation. Heavier footwear.
+        """
+        return self._get_coll('_at_category_coll', self._at_category,
+                              self._category_type, 'condition')
+
+    @property
+    def percent_neutral(self):
+        """The percent of time that the apparent temperature is between 20 and 25 C.
+        """
+        return self._percent_of(self._category_count(), (0,))
+
+    @property
+    def percent_hot(self):
+        """The percent of time that the apparent temperature is above 25 C."""
+        return self._percent_of(self._category_count(), (1, 2, 3, 4))
+
+    @property
+    def percent_cold(self):
+        """The percent of time that the apparent temperature is below 20 C."""
+        return self._percent_of(self._category_count(), (-6, -5, -4, -3, -2, -1))
+
+    def category_counts(self):
+        """Get a dictionary with the number of values in each warning category.
+
+        Keys are the integers of apparent_temperature_category (from -6 to 4)
+        and values are the number of time steps that fall into each category.
+        """
+        return dict(self._category_count())
+
+    def _category_count(self):
+        return self._count_values('_category_count_dict', self._at_category,
+                                  range(-6, 5))
@@ -1,5 +1,10 @@
 # coding=utf-8
 """Comfort data collection base object."""
+from __future__ import division
+
+from ..cache import hash_inputs, code_version, read_result_columns, \
+    write_result_columns
+from .._sequence import ConstantSequence, is_sequence
 
 from ladybug._datacollectionbase import BaseCollection
 from ladybug.datatype.base import DataTypeBase
@@ -8,6 +13,11 @@ from ladybug.datatype.base import DataTypeBase
 class ComfortCollection(object):
     """Base class for all thermal comfort collections.
 
+    Besides Data Collections and single numbers, the inputs of comfort collections
+    that are aligned with the base collection can be any sequence of numbers
+    (eg. lists, arrays, memoryviews or NumPy arrays), which are used without
+    being copied.
+
     Properties:
         * comfort_model
         * calc_length
@@ -16,6 +26,8 @@ class ComfortCollection(object):
         * percent_cold
     """
     _model = None
+    _percent_properties = ('percent_neutral', 'percent_hot', 'percent_cold')
+    _mask = None  # indices of the evaluated steps for collections with a mask input
     __slots__ = ('_calc_length', '_base_collection', '_input_collections')
 
     def __init__(self):
@@ -51,6 +63,23 @@ class ComfortCollection(object):
         raise NotImplementedError('percent_hot has not yet been implemented for '
                                   '{}.'.format(self.__class__.__name__))
 
+    def category_counts(self):
+        """Get a dictionary with the number of values in each thermal category.
+
+        The counts are computed in a single pass over the values the first time
+        that they are requested and are reused by all of the percent properties.
+        """
+        raise NotImplementedError('category_counts has not yet been implemented for '
+                                  '{}.'.format(self.__class__.__name__))
+
+    def summary(self):
+        """Get a dictionary with all of the percent statistics of this object.
+
+        Keys are the names of the percent properties (eg. 'percent_neutral') and
+        values are the percent of time that conditions fall into each category.
+        """
+        return dict((prop, getattr(self, prop)) for prop in self._percent_properties)
+
     def _check_datacoll(self, data_coll, dat_type, unit, name):
         """Check the data type and units of a Data Collection."""
         assert isinstance(data_coll, BaseCollection), '{} must be a ' \
@@ -62,22 +91,119 @@ class ComfortCollection(object):
                                   data_coll.header.unit)
 
     def _check_input(self, data_coll, dat_type, unit, name):
-        """Check the a Data Collection."""
+        """Check an input that can be a Data Collection, a sequence or a number.
+
+        Sequences of values (eg. lists, arrays, memoryviews or NumPy arrays) are
+        returned as they are without being copied, which means that they are
+        assumed to already be in the correct units. Numbers are returned as
+        a ConstantSequence instead of being expanded into a list.
+        """
         if isinstance(data_coll, BaseCollection):
             self._check_datacoll(data_coll, dat_type, unit, name)
             self._input_collections.append(data_coll)
             return data_coll.values
+        elif is_sequence(data_coll):
+            assert len(data_coll) == self.calc_length, 'Length of {} ({}) does ' \
+                'not match the length of the base collection ({}).'.format(
+                    name, len(data_coll), self.calc_length)
+            return data_coll
         else:
             try:
-                return [float(data_coll)] * self.calc_length
-            except ValueError:
-                raise TypeError('{} must be either a number or a Data Collection. '
-                                'Got {}'.format(name, type(data_coll)))
+                return ConstantSequence(float(data_coll), self.calc_length)
+            except (ValueError, TypeError):
+                raise TypeError('{} must be a number, a sequence of numbers or a '
+                                'Data Collection. Got {}'.format(name, type(data_coll)))
+
+    def _check_mask(self, mask):
+        """Check a mask input and get the indices of the steps to be evaluated.
+
+        Args:
+            mask: A Data Collection or a sequence with one value for each step
+                of the base collection. Steps with values that are True (or
+                non-zero) are evaluated. None evaluates all steps.
+
+        Returns:
+            A list of the indices of the steps to be evaluated or None if all
+            of the steps are evaluated.
+        """
+        if mask is None:
+            return None
+        if isinstance(mask, BaseCollection):
+            self._input_collections.append(mask)
+            mask = mask.values
+        assert len(mask) == self.calc_length, 'Length of mask ({}) does not ' \
+            'match the length of the base collection ({}).'.format(
+                len(mask), self.calc_length)
+        indices = [i for i, val in enumerate(mask) if val]
+        assert len(indices) != 0, 'mask must include at least one step to evaluate.'
+        return indices if len(indices) != self.calc_length else None
+
+    def _masked_values(self, values):
+        """Get the values of an input sequence at the steps that are evaluated."""
+        if self._mask is None:
+            return values
+        if isinstance(values, ConstantSequence):
+            return ConstantSequence(values.value, len(self._mask))
+        return [values[i] for i in self._mask]
+
+    def _result_length(self):
+        """Get the number of steps at which the comfort model is evaluated."""
+        return self._calc_length if self._mask is None else len(self._mask)
+
+    def _check_aligned(self):
+        """Check that all of the input Data Collections are aligned with one another.
+
+        Collections that are aligned with the first input collection by construction
+        are identified in O(1) without comparing their datetimes. These include
+        the same collection object input more than once, continuous hourly
+        collections with equal analysis periods and collections that share the
+        same tuple of datetimes (eg. those from get_aligned_collection). All
+        other collections are checked with the element-wise comparison of
+        are_collections_aligned.
+        """
+        colls = self._input_collections
+        if len(colls) < 2:
+            return True
+        first = colls[0]
+        to_compare = [first]
+        for coll in colls[1:]:
+            if not self._is_aligned_by_header(first, coll):
+                to_compare.append(coll)
+        return BaseCollection.are_collections_aligned(to_compare)
+
+    @staticmethod
+    def _is_aligned_by_header(coll_1, coll_2):
+        """Check if two Data Collections are aligned without comparing datetimes.
+
+        A return value of False means that alignment could not be determined
+        quickly and not necessarily that the collections are unaligned.
+        """
+        if coll_1 is coll_2:
+            return True
+        if coll_1._collection_type != coll_2._collection_type or \
+                len(coll_1) != len(coll_2):
+            return False
+        if coll_1._collection_type == 'HourlyContinuous':
+            a_per_1 = coll_1.header.analysis_period
+            a_per_2 = coll_2.header.analysis_period
+            return a_per_1 is a_per_2 or a_per_1 == a_per_2
+        return coll_1.datetimes is coll_2.datetimes
 
     def _get_coll(self, attr_name, value_list, dat_type, unit):
         if not hasattr(self, attr_name):
             if callable(value_list):
                 value_list = value_list()  # get values if passed a function
+            if isinstance(value_list, ConstantSequence):
+                value_list = value_list.value  # repeated by the aligned collection
+            elif self._mask is not None and len(value_list) != self._calc_length:
+                # results of the evaluated steps; steps outside the mask are None
+                full_list = [None] * self._calc_length
+                for i, val in zip(self._mask, value_list):
+                    full_list[i] = val
+                value_list = full_list
+            elif not isinstance(value_list, (list, tuple)):
+                value_list = value_list.tolist() if hasattr(value_list, 'tolist') \
+                    else list(value_list)  # arrays and other sequences
             if not isinstance(dat_type, DataTypeBase):
                 dat_type = dat_type()  # convert the class to an instance
             coll = self._base_collection.get_aligned_collection(
@@ -85,6 +211,71 @@ class ComfortCollection(object):
             setattr(self, attr_name, coll)
         return getattr(self, attr_name)
 
+    def _calculate_cached(self, calc_funct, result_columns, cache_folder,
+                          key_inputs):
+        """Run a calculation function or load its results from a cache folder.
+
+        Args:
+            calc_funct: The function that computes the results of this object.
+            result_columns: A list of (attr_name, typecode) tuples for the
+                lists of results that are set by the calc_funct. The typecode
+                is the array typecode used to store the results on disk.
+            cache_folder: Path to a folder where results are cached. If None,
+                the calc_funct will always be run.
+            key_inputs: A list of all inputs that affect the results (eg. lists
+                of input values and comfort parameters). These are combined with
+                the class name, the code_version of this library and any mask of
+                this object to make the key of the cache entry.
+        """
+        if cache_folder is None:
+            return calc_funct()
+        if self._mask is not None:
+            key_inputs = tuple(key_inputs) + (self._mask,)
+        key = hash_inputs(self.__class__.__name__, code_version(),
+                          self._calc_length, *key_inputs)
+        columns = read_result_columns(cache_folder, key)
+        result_length = self._result_length()
+        if columns is not None and all(
+                len(columns.get(attr, ())) == result_length
+                for attr, _ in result_columns):
+            for attr, _ in result_columns:
+                setattr(self, attr, columns[attr])
+            return
+        calc_funct()
+        write_result_columns(cache_folder, key, [
+            (attr, typecode, getattr(self, attr)) for attr, typecode in result_columns])
+
+    @staticmethod
+    def _parameter_state(parameter):
+        """Get a tuple of all slot values of a parameter object for use in cache keys.
+        """
+        state = [parameter.__class__.__name__]
+        for cls in type(parameter).__mro__:
+            for slot in getattr(cls, '__slots__', ()):
+                state.append((slot, getattr(parameter, slot, None)))
+        return tuple(state)
+
+    def _count_values(self, attr_name, value_list, categories=()):
+        """Get a dictionary counting the occurrences of each value in a list.
+
+        The dictionary is built in a single pass and stored under attr_name such
+        that all subsequent requests for the counts are served from it.
+        """
+        if not hasattr(self, attr_name):
+            counts = dict((cat, 0) for cat in categories)
+            for val in value_list:
+                try:
+                    counts[val] += 1
+                except KeyError:
+                    counts[val] = 1
+            setattr(self, attr_name, counts)
+        return getattr(self, attr_name)
+
+    def _percent_of(self, counts, categories):
+        """Get the percent of time that values fall within a set of categories."""
+        return (sum(counts.get(cat, 0) for cat in categories) /
+                self._result_length()) * 100
+
     def ToString(self):
         """Overwrite .NET ToString."""
         return self.__repr__()
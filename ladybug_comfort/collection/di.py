@@ -0,0 +1,145 @@
+# coding=utf-8
+"""Object for calculating Discomfort Index from DataCollections."""
+from __future__ import division
+
+from ..di import discomfort_index_batch, discomfort_index_effect_category_batch
+from .base import ComfortCollection
+
+from ladybug.datatype.temperature import Temperature, AirTemperature
+from ladybug.datatype.fraction import RelativeHumidity
+from ladybug.datatype.generic import GenericType
+
+
+class DiscomfortIndex(ComfortCollection):
+    """Discomfort Index DataCollection object.
+
+    Args:
+        air_temperature: Data Collection of air temperature values in Celsius.
+        rel_humidity: Data Collection of relative humidity values in % or a
+            single relative humidity value to be used for the whole analysis.
+        check_alignment: Boolean to note whether the input Data Collections should
+            be checked for alignment with one another. (Default: True).
+
+    Properties:
+        * air_temperature
+        * rel_humidity
+        * discomfort_index
+        * discomfort_index_category
+        * percent_neutral
+        * percent_hot
+        * percent_cold
+    """
+    _model = 'Discomfort Index'
+    _category_type = GenericType(
+        'Discomfort Index Category', 'condition', -6, 3, 'DIcat',
+        {-6: 'Hyper-glacial', -5: 'Glacial', -4: 'Extremely Cold', -3: 'Very Cold',
+         -2: 'Cold', -1: 'Cool', 0: 'Comfortable', 1: 'Hot', 2: 'Very Hot',
+         3: 'Torrid'})
+    __slots__ = ('_air_temperature', '_rel_humidity', '_di', '_di_category',
+                 '_air_temperature_coll', '_rel_humidity_coll', '_di_coll',
+                 '_di_category_coll', '_category_count_dict')
+
+    def __init__(self, air_temperature, rel_humidity, check_alignment=True):
+        """Initialize a Discomfort Index object from DataCollections of inputs."""
+        # set up the object using air temperature as a base
+        self._check_datacoll(air_temperature, Temperature, 'C', 'air_temperature')
+        self._input_collections = [air_temperature]
+        self._calc_length = len(air_temperature)
+        self._base_collection = air_temperature
+
+        # check required inputs
+        self._air_temperature = air_temperature.values
+        self._rel_humidity = self._check_input(
+            rel_humidity, RelativeHumidity, '%', 'rel_humidity')
+        if check_alignment:
+            self._check_aligned()
+
+        # compute the discomfort index for all values at once
+        self._di = discomfort_index_batch(self._air_temperature, self._rel_humidity)
+        self._di_category = discomfort_index_effect_category_batch(self._di)
+
+    @classmethod
+    def from_epw(cls, epw):
+        """Get a Discomfort Index object from the conditions within an EPW file.
+
+        Args:
+            epw: A ladybug EPW object from which the DiscomfortIndex object
+                will be created.
+
+        Usage:
+
+        .. code-block:: python
+
+            from ladybug.epw import EPW
+            from ladybug_comfort.collection.di import DiscomfortIndex
+
+            epw = EPW('./tests/epw/chicago.epw')
+            di_obj = DiscomfortIndex.from_epw(epw)
+            print(di_obj.percent_neutral)  # percent of time that is comfortable
+        """
+        return cls(epw.dry_bulb_temperature, epw.relative_humidity)
+
+    @property
+    def air_temperature(self):
+        """Data Collection of air temperature values in degrees C."""
+        return self._get_coll('_air_temperature_coll', self._air_temperature,
+                              AirTemperature, 'C')
+
+    @property
+    def rel_humidity(self):
+        """Data Collection of relative humidity values in %."""
+        return self._get_coll('_rel_humidity_coll', self._rel_humidity,
+                              RelativeHumidity, '%')
+
+    @property
+    def discomfort_index(self):
+        """Data Collection of discomfort index values in degrees C."""
+        return self._get_coll('_di_coll', self._di,
+                              Temperature('Discomfort Index'), 'C')
+
+    @property
+    def discomfort_index_category(self):
+        """Data Collection of integers noting the discomfort index effect category.
+
+        Values are one of the following:
+
+        * -6 = Hyper-glacial
+        * -5 = Glacial
+        * -4 = Extremely cold
+        * -3 = Very cold
+        * -2 = Cold
+        * -1 = Cool
+        * 0 = Comfortable
+        * 1 = Hot
+        * 2 = Very hot
+        * 3 = Torrid
+        """
+        return self._get_coll('_di_category_coll', self._di_category,
+                              self._category_type, 'condition')
+
+    @property
+    def percent_neutral(self):
+        """The percent of time that the effect category is comfortable."""
+        return self._percent_of(self._category_count(), (0,))
+
+    @property
+    def percent_hot(self):
+        """The percent of time that the effect category is hot or hotter."""
+        return self._percent_of(self._category_count(), (1, 2, 3))
+
+    @property
+    def percent_cold(self):
+        """The percent of time that the effect category is cool or colder."""
+        return self._percent_of(self._category_count(), (-6, -5, -4, -3, -2, -1))
+
+    def category_counts(self):
+        """Get a dictionary with the number of values in each effect category.
+
+        Keys are the integers of discomfort_index_category (from -6 to 3) and
+        values are the number of time steps that fall into each category.
+        """
+        return dict(self._category_count())
+
+    def _category_count(self):
+        return self._count_values('_category_count_dict', self._di_category,
+                                  range(-6, 4))
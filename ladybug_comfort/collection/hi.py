@@ -0,0 +1,158 @@
+# coding=utf-8
+"""Object for calculating Heat Index from DataCollections."""
+from __future__ import division
+
+from ..hi import heat_index_batch, heat_index_warning_category_batch
+from .base import ComfortCollection
+
+from ladybug.datatype.temperature import Temperature, AirTemperature
+from ladybug.datatype.fraction import RelativeHumidity
+from ladybug.datatype.generic import GenericType
+
+
+class HeatIndex(ComfortCollection):
+    """Heat Index DataCollection object.
+
+    Args:
+        air_temperature: Data Collection of air temperature values in Celsius.
+        rel_humidity: Data Collection of relative humidity values in % or a
+            single relative humidity value to be used for the whole analysis.
+        check_alignment: Boolean to note whether the input Data Collections should
+            be checked for alignment with one another. (Default: True).
+
+    Properties:
+        * air_temperature
+        * rel_humidity
+        * heat_index
+        * heat_index_category
+        * percent_neutral
+        * percent_hot
+        * percent_caution
+        * percent_extreme_caution
+        * percent_danger
+        * percent_extreme_danger
+    """
+    _model = 'Heat Index'
+    _percent_properties = (
+        'percent_neutral', 'percent_hot', 'percent_caution',
+        'percent_extreme_caution', 'percent_danger', 'percent_extreme_danger')
+    _category_type = GenericType(
+        'Heat Index Category', 'condition', 0, 4, 'HIcat',
+        {0: 'No Warning', 1: 'Caution', 2: 'Extreme Caution', 3: 'Danger',
+         4: 'Extreme Danger'})
+    __slots__ = ('_air_temperature', '_rel_humidity', '_hi', '_hi_category',
+                 '_air_temperature_coll', '_rel_humidity_coll', '_hi_coll',
+                 '_hi_category_coll', '_category_count_dict')
+
+    def __init__(self, air_temperature, rel_humidity, check_alignment=True):
+        """Initialize a Heat Index object from DataCollections of inputs."""
+        # set up the object using air temperature as a base
+        self._check_datacoll(air_temperature, Temperature, 'C', 'air_temperature')
+        self._input_collections = [air_temperature]
+        self._calc_length = len(air_temperature)
+        self._base_collection = air_temperature
+
+        # check required inputs
+        self._air_temperature = air_temperature.values
+        self._rel_humidity = self._check_input(
+            rel_humidity, RelativeHumidity, '%', 'rel_humidity')
+        if check_alignment:
+            self._check_aligned()
+
+        # compute the heat index for all values at once
+        self._hi = heat_index_batch(self._air_temperature, self._rel_humidity)
+        self._hi_category = heat_index_warning_category_batch(self._hi)
+
+    @classmethod
+    def from_epw(cls, epw):
+        """Get a Heat Index object from the conditions within an EPW file.
+
+        Args:
+            epw: A ladybug EPW object from which the HeatIndex object will be created.
+
+        Usage:
+
+        .. code-block:: python
+
+            from ladybug.epw import EPW
+            from ladybug_comfort.collection.hi import HeatIndex
+
+            epw = EPW('./tests/epw/chicago.epw')
+            hi_obj = HeatIndex.from_epw(epw)
+            print(hi_obj.percent_hot)  # percent of time with any heat warning
+        """
+        return cls(epw.dry_bulb_temperature, epw.relative_humidity)
+
+    @property
+    def air_temperature(self):
+        """Data Collection of air temperature values in degrees C."""
+        return self._get_coll('_air_temperature_coll', self._air_temperature,
+                              AirTemperature, 'C')
+
+    @property
+    def rel_humidity(self):
+        """Data Collection of relative humidity values in %."""
+        return self._get_coll('_rel_humidity_coll', self._rel_humidity,
+                              RelativeHumidity, '%')
+
+    @property
+    def heat_index(self):
+        """Data Collection of heat index values in degrees C."""
+        return self._get_coll('_hi_coll', self._hi, Temperature('Heat Index'), 'C')
+
+    @property
+    def heat_index_category(self):
+        """Data Collection of integers noting the heat index warning category.
+
+        Values are one of the following:
+
+        * 0 = No Warning
+        * 1 = Caution
+        * 2 = Extreme Caution
+        * 3 = Danger
+        * 4 = Extreme Danger
+        """
+        return self._get_coll('_hi_category_coll', self._hi_category,
+                              self._category_type, 'condition')
+
+    @property
+    def percent_neutral(self):
+        """The percent of time that there is no heat warning."""
+        return self._percent_of(self._category_count(), (0,))
+
+    @property
+    def percent_hot(self):
+        """The percent of time that there is any heat warning."""
+        return 100 - self.percent_neutral
+
+    @property
+    def percent_caution(self):
+        """The percent of time that the warning category is Caution."""
+        return self._percent_of(self._category_count(), (1,))
+
+    @property
+    def percent_extreme_caution(self):
+        """The percent of time that the warning category is Extreme Caution."""
+        return self._percent_of(self._category_count(), (2,))
+
+    @property
+    def percent_danger(self):
+        """The percent of time that the warning category is Danger."""
+        return self._percent_of(self._category_count(), (3,))
+
+    @property
+    def percent_extreme_danger(self):
+        """The percent of time that the warning category is Extreme Danger."""
+        return self._percent_of(self._category_count(), (4,))
+
+    def category_counts(self):
+        """Get a dictionary with the number of values in each warning category.
+
+        Keys are the integers of heat_index_category (from 0 to 4) and values
+        are the number of time steps that fall into each category.
+        """
+        return dict(self._category_count())
+
+    def _category_count(self):
+        return self._count_values('_category_count_dict', self._hi_category,
+                                  range(5))
@@ -0,0 +1,160 @@
+# coding=utf-8
+"""Object for calculating Humidex from DataCollections."""
+from __future__ import division
+
+from ..humidex import humidex_batch, humidex_degree_of_comfort_batch
+from .base import ComfortCollection
+
+from ladybug.datatype.temperature import Temperature, AirTemperature, \
+    DewPointTemperature
+from ladybug.datatype.generic import GenericType
+
+
+class Humidex(ComfortCollection):
+    """Humidex DataCollection object.
+
+    Args:
+        air_temperature: Data Collection of air temperature values in Celsius.
+        dew_point_temperature: Data Collection of dew point temperature values
+            in Celsius or a single dew point value to be used for the whole
+            analysis.
+        check_alignment: Boolean to note whether the input Data Collections should
+            be checked for alignment with one another. (Default: True).
+
+    Properties:
+        * air_temperature
+        * dew_point_temperature
+        * humidex
+        * humidex_category
+        * percent_neutral
+        * percent_hot
+        * percent_little_discomfort
+        * percent_some_discomfort
+        * percent_great_discomfort
+        * percent_dangerous
+    """
+    _model = 'Humidex'
+    _percent_properties = (
+        'percent_neutral', 'percent_hot', 'percent_little_discomfort',
+        'percent_some_discomfort', 'percent_great_discomfort', 'percent_dangerous')
+    _category_type = GenericType(
+        'Humidex Category', 'condition', 0, 4, 'HXcat',
+        {0: 'No Discomfort', 1: 'Little Discomfort', 2: 'Some Discomfort',
+         3: 'Great Discomfort', 4: 'Dangerous'})
+    __slots__ = ('_air_temperature', '_dew_point', '_humidex', '_humidex_category',
+                 '_air_temperature_coll', '_dew_point_coll', '_humidex_coll',
+                 '_humidex_category_coll', '_category_count_dict')
+
+    def __init__(self, air_temperature, dew_point_temperature, check_alignment=True):
+        """Initialize a Humidex object from DataCollections of inputs."""
+        # set up the object using air temperature as a base
+        self._check_datacoll(air_temperature, Temperature, 'C', 'air_temperature')
+        self._input_collections = [air_temperature]
+        self._calc_length = len(air_temperature)
+        self._base_collection = air_temperature
+
+        # check required inputs
+        self._air_temperature = air_temperature.values
+        self._dew_point = self._check_input(
+            dew_point_temperature, Temperature, 'C', 'dew_point_temperature')
+        if check_alignment:
+            self._check_aligned()
+
+        # compute the humidex for all values at once
+        self._humidex = humidex_batch(self._air_temperature, self._dew_point)
+        self._humidex_category = humidex_degree_of_comfort_batch(self._humidex)
+
+    @classmethod
+    def from_epw(cls, epw):
+        """Get a Humidex object from the conditions within an EPW file.
+
+        Args:
+            epw: A ladybug EPW object from which the Humidex object will be created.
+
+        Usage:
+
+        .. code-block:: python
+
+            from ladybug.epw import EPW
+            from ladybug_comfort.collection.humidex import Humidex
+
+            epw = EPW('./tests/epw/chicago.epw')
+            humidex_obj = Humidex.from_epw(epw)
+            print(humidex_obj.percent_hot)  # percent of time with any discomfort
+        """
+        return cls(epw.dry_bulb_temperature, epw.dew_point_temperature)
+
+    @property
+    def air_temperature(self):
+        """Data Collection of air temperature values in degrees C."""
+        return self._get_coll('_air_temperature_coll', self._air_temperature,
+                              AirTemperature, 'C')
+
+    @property
+    def dew_point_temperature(self):
+        """Data Collection of dew point temperature values in degrees C."""
+        return self._get_coll('_dew_point_coll', self._dew_point,
+                              DewPointTemperature, 'C')
+
+    @property
+    def humidex(self):
+        """Data Collection of humidex values in degrees C."""
+        return self._get_coll('_humidex_coll', self._humidex,
+                              Temperature('Humidex'), 'C')
+
+    @property
+    def humidex_category(self):
+        """Data Collection of integers noting the humidex degree of comfort.
+
+        Values are one of the following:
+
+        * 0 = No discomfort
+        * 1 = Little discomfort
+        * 2 = Some discomfort
+        * 3 = Great discomfort; avoid exertion
+        * 4 = Dangerous; heat stroke possible
+        """
+        return self._get_coll('_humidex_category_coll', self._humidex_category,
+                              self._category_type, 'condition')
+
+    @property
+    def percent_neutral(self):
+        """The percent of time that there is no discomfort."""
+        return self._percent_of(self._category_count(), (0,))
+
+    @property
+    def percent_hot(self):
+        """The percent of time that there is any discomfort."""
+        return 100 - self.percent_neutral
+
+    @property
+    def percent_little_discomfort(self):
+        """The percent of time that there is little discomfort."""
+        return self._percent_of(self._category_count(), (1,))
+
+    @property
+    def percent_some_discomfort(self):
+        """The percent of time that there is some discomfort."""
+        return self._percent_of(self._category_count(), (2,))
+
+    @property
+    def percent_great_discomfort(self):
+        """The percent of time that there is great discomfort."""
+        return self._percent_of(self._category_count(), (3,))
+
+    @property
+    def percent_dangerous(self):
+        """The percent of time that conditions are dangerous."""
+        return self._percent_of(self._category_count(), (4,))
+
+    def category_counts(self):
+        """Get a dictionary with the number of values in each degree of comfort.
+
+        Keys are the integers of humidex_category (from 0 to 4) and values
+        are the number of time steps that fall into each category.
+        """
+        return dict(self._category_count())
+
+    def _category_count(self):
+        return self._count_values('_category_count_dict', self._humidex_category,
+                                  range(5))
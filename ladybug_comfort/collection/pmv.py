@@ -2,13 +2,20 @@
 """Object for calculating PMV comfort from DataCollections."""
 from __future__ import division
 
-from ..pmv import predicted_mean_vote
+from bisect import bisect_left, bisect_right
+
+from ..pmv import predicted_mean_vote, PierceSetCoefficients
+from ..settable import PierceSetTable
 from ..parameter.pmv import PMVParameter
+from ..cache import ResultCache
+from ..backend import use_backend
+from ..psychrometrics import PsychrometricColumns
+from .._categorize import categorize
+from .._sequence import ConstantSequence
 from .base import ComfortCollection
 from .solarcal import OutdoorSolarCal
 
 from ladybug._datacollectionbase import BaseCollection
-from ladybug.psychrometrics import humid_ratio_from_db_rh
 
 from ladybug.datatype.temperature import Temperature, MeanRadiantTemperature, \
     StandardEffectiveTemperature, AirTemperature
@@ -54,6 +61,51 @@ class PMV(ComfortCollection):
             which conditions are considered acceptable. If None, default will
             assume a PPD threshold of 10%, no absolute humidity constraints
             and a still air threshold of 0.1 m/s.
+        result_cache: Optional ResultCache object wrapping the predicted_mean_vote
+            function, which will be used to avoid recomputing PMV for repeated
+            input conditions. The same ResultCache can be shared across several
+            PMV objects (eg. several design variants) to reuse results between
+            them. If None, PMV will be computed for every step of the
+            Data Collection.
+        cache_folder: Optional path to a folder where the results of this object
+            will be cached on disk. When an object with identical inputs and
+            comfort parameters has already been computed with the same
+            cache_folder, its results will be loaded instead of recomputed.
+            If None, results are always computed and nothing is written to disk.
+        check_alignment: Boolean to note whether the input Data Collections should
+            be checked for alignment with one another. Inputs that share the
+            analysis period or datetimes of the air_temperature are always
+            checked quickly but this can be set to False to skip the check
+            entirely for pipelines where the inputs are known to be aligned.
+            (Default: True).
+        warm_start: Boolean to note whether the cooling effect of each step should
+            be solved starting from the cooling effect of the previous step,
+            which needs fewer SET calculations for time series with elevated
+            air speeds since consecutive steps have similar cooling effects.
+            The previous cooling effect is only used when a bracket of 2 C
+            around it contains a solution, which keeps results within the
+            precision of the default solution. This is ignored when a
+            result_cache is used. (Default: False).
+        set_surrogate: Boolean to note whether the standard effective temperature
+            (SET) should be approximated with a PierceSetTable instead of the full
+            SET model. The table of each distinct met, clo and external work is
+            computed once per session and then shared by all PMV objects, which
+            makes SET calculations several times faster at the cost of an error
+            of about 0.1 C (see the settable module). Since each table takes
+            several seconds to compute, the met_rate, clo_value and external_work
+            must be the same at all steps in order to use it. This is ignored
+            when a result_cache is used. (Default: False).
+        backend: Optional text for the name of the backend of the model kernels
+            to be used for the calculation of this object (see the backend
+            module). Choose from: python, numpy, compiled. Kernels without an
+            implementation for the backend will use pure Python. If None, the
+            active backend will be used. (Default: None).
+        mask: An optional Data Collection or list of booleans with one value
+            for each step of the air_temperature, which notes the steps at which
+            PMV is evaluated (eg. an occupancy schedule of 0 and 1 values).
+            Steps that are False (or 0) are not computed, their values in the
+            output Data Collections are None and they are excluded from all
+            percent statistics. If None, all steps are evaluated. (Default: None).
 
     Properties:
         * air_temperature
@@ -88,6 +140,9 @@ class PMV(ComfortCollection):
         * heat_loss_convection
     """
     _model = 'Predicted Mean Vote'
+    _percent_properties = (
+        'percent_comfortable', 'percent_uncomfortable', 'percent_neutral',
+        'percent_hot', 'percent_cold', 'percent_dry', 'percent_humid')
     __slots__ = ('_air_temperature', '_rel_humidity', '_rad_temperature', '_air_speed',
                  '_met_rate', '_clo_value', '_external_work', '_comfort_par',
                  '_hr_calculated', '_hr_comfort_required', '_humidity_ratio',
@@ -103,12 +158,20 @@ class PMV(ComfortCollection):
                  '_discomfort_reason_coll', '_ta_adj_coll', '_cooling_effect_coll',
                  '_hl_conduction_coll', '_hl_sweating_coll',
                  '_hl_latent_respiration_coll', '_hl_dry_respiration_coll',
-                 '_hl_radiation_coll', '_hl_convection_coll')
+                 '_hl_radiation_coll', '_hl_convection_coll', '_condition_count_dict',
+                 '_reason_count_dict', '_result_cache', '_warm_start',
+                 '_set_surrogate', '_backend', '_mask', '_sweep_values')
+    # slots that differ between the objects of from_scenarios
+    _scenario_slots = ('_input_collections', '_met_rate', '_clo_value',
+                       '_met_rate_coll', '_clo_value_coll', '_comfort_par',
+                       '_hr_comfort_required')
 
     def __init__(self, air_temperature, rel_humidity,
                  rad_temperature=None, air_speed=None,
                  met_rate=None, clo_value=None, external_work=None,
-                 comfort_parameter=None):
+                 comfort_parameter=None, result_cache=None, cache_folder=None,
+                 check_alignment=True, warm_start=False, set_surrogate=False,
+                 backend=None, mask=None):
         """Initialize a PMV comfort object from DataCollections of PMV inputs.
         """
         # set up the object using air temperature as a base
@@ -133,50 +196,52 @@ class PMV(ComfortCollection):
             self._air_speed = self._check_input(
                 air_speed, Speed, 'm/s', 'air_speed')
         else:
-            self._air_speed = [0.1] * self.calc_length
+            self._air_speed = ConstantSequence(0.1, self.calc_length)
 
         if met_rate is not None:
             self._met_rate = self._check_input(
                 met_rate, MetabolicRate, 'met', 'met_rate')
         else:
-            self._met_rate = [1.1] * self.calc_length
+            self._met_rate = ConstantSequence(1.1, self.calc_length)
 
         if clo_value is not None:
             self._clo_value = self._check_input(
                 clo_value, ClothingInsulation, 'clo', 'clo_value')
         else:
-            self._clo_value = [0.7] * self.calc_length
+            self._clo_value = ConstantSequence(0.7, self.calc_length)
 
         if external_work is not None:
             self._external_work = self._check_input(
                 external_work, MetabolicRate, 'met', 'external_work')
         else:
-            self._external_work = [0.] * self.calc_length
+            self._external_work = ConstantSequence(0., self.calc_length)
+        self._mask = self._check_mask(mask)
 
         # check that all input data collections are aligned.
-        BaseCollection.are_collections_aligned(self._input_collections)
+        if check_alignment:
+            self._check_aligned()
 
         # check comfort parameters
-        if comfort_parameter is None:
-            self._comfort_par = PMVParameter()
-        else:
-            assert isinstance(comfort_parameter, PMVParameter), 'comfort_parameter '\
-                'must be a PMVParameter object. Got {}'.format(type(comfort_parameter))
-            self._comfort_par = comfort_parameter
-
-        # value to track whether humidity ratio has been computed
-        self._hr_calculated = False
-        self._hr_comfort_required = True
-        if self.comfort_parameter.humid_ratio_lower == 0 and \
-                self.comfort_parameter.humid_ratio_upper == 1:
-            self._hr_comfort_required = False
+        self._hr_calculated = False  # track whether humidity ratio has been computed
+        self._assign_comfort_parameter(comfort_parameter)
+
+        # check the result cache
+        if result_cache is not None:
+            assert isinstance(result_cache, ResultCache) and \
+                result_cache.function is predicted_mean_vote, 'result_cache must be ' \
+                'a ResultCache of predicted_mean_vote. Got {}'.format(result_cache)
+        self._result_cache = result_cache
+        self._warm_start = bool(warm_start)
+        self._set_surrogate = bool(set_surrogate)
+        self._backend = backend
 
         # calculate PMV
-        self._calculate_pmv()
+        self._calculate_pmv_cached(cache_folder)
 
     @classmethod
     def from_epw(cls, epw, include_wind=True, include_sun=True, met_rate=None,
-                 clo_value=None, external_work=None, pmv_parameter=None):
+                 clo_value=None, external_work=None, pmv_parameter=None,
+                 result_cache=None, cache_folder=None):
         """Get a PMV comfort object from the conditions within an EPW file.
 
         Args:
@@ -208,6 +273,14 @@ class PMV(ComfortCollection):
                 which conditions are considered acceptable. If None, default will
                 assume a PPD threshold of 10%, no absolute humidity constraints
                 and a still air threshold of 0.1 m/s.
+            result_cache: Optional ResultCache object wrapping the predicted_mean_vote
+                function, which will be used to avoid recomputing PMV for repeated
+                input conditions.
+            cache_folder: Optional path to a folder where the results will be
+                cached on disk. This includes the results of the OutdoorSolarCal
+                calculation when include_sun is True. Running this method again
+                with the same EPW, inputs and cache_folder will load the results
+                instead of recomputing them. If None, nothing is written to disk.
 
         Returns:
             An object with data collections of the PMV results as properties.
@@ -236,10 +309,7 @@ class PMV(ComfortCollection):
 
         # get the mrt input
         if include_sun is True:
-            solarcal_obj = OutdoorSolarCal(epw.location, epw.direct_normal_radiation,
-                                           epw.diffuse_horizontal_radiation,
-                                           epw.horizontal_infrared_radiation_intensity,
-                                           epw.dry_bulb_temperature)
+            solarcal_obj = OutdoorSolarCal.from_epw(epw, cache_folder=cache_folder)
             mrt = solarcal_obj.mean_radiant_temperature
         else:
             mrt = epw.dry_bulb_temperature
@@ -249,26 +319,173 @@ class PMV(ComfortCollection):
 
         # return the comfort object
         return cls(epw.dry_bulb_temperature, epw.relative_humidity, mrt, wind_speed,
-                   met_rate, clo_value, external_work, pmv_parameter)
+                   met_rate, clo_value, external_work, pmv_parameter, result_cache,
+                   cache_folder)
+
+    @classmethod
+    def from_scenarios(cls, air_temperature, rel_humidity, rad_temperature=None,
+                       air_speed=None, met_rates=None, clo_values=None,
+                       external_work=None, comfort_parameters=None,
+                       result_cache=None, mask=None):
+        """Get a list of PMV objects for several met and clo scenarios in one pass.
+
+        This is much faster than initializing a PMV object for each scenario
+        since the environmental inputs are only checked and aligned once and
+        the humidity ratio is only computed once for all scenarios.
+
+        Args:
+            air_temperature: Data Collection of air temperature values in Celsius.
+            rel_humidity: Data Collection of relative humidity values in % or a
+                single relative humidity value to be used for the whole analysis.
+            rad_temperature: Data Collection of mean radiant temperature (MRT)
+                values in degrees Celsius or a single MRT value to be used for
+                the whole analysis. If None, this will be the same as the
+                air_temperature.
+            air_speed: Data Collection of air speed values in m/s or a single
+                air_speed value to be used for the whole analysis. If None, this
+                will default to 0.1 m/s.
+            met_rates: A list with one metabolic rate for each scenario. Each
+                item can be a Data Collection of metabolic rate in met or a single
+                number. If None, all scenarios will use 1.1 met.
+            clo_values: A list with one clothing value for each scenario. Each
+                item can be a Data Collection of clothing values in clo or a
+                single number. If None, all scenarios will use 0.7 clo.
+            external_work: Data Collection of external work in met or a single
+                external work value to be used for all scenarios. If None,
+                default is set to 0 met.
+            comfort_parameters: An optional list with one PMVParameter object for
+                each scenario. If None, all scenarios will use the default
+                PMVParameter.
+            result_cache: Optional ResultCache object wrapping the predicted_mean_vote
+                function to be shared by all of the scenarios.
+            mask: An optional Data Collection or list of booleans noting the
+                steps at which PMV is evaluated for all scenarios. If None, all
+                steps are evaluated.
+
+        Returns:
+            A list of PMV objects with one for each scenario. The number of
+            scenarios is the length of the longest of the met_rates, clo_values
+            and comfort_parameters lists. Lists with a single item will be
+            used for all scenarios.
+
+        Usage:
+
+        .. code-block:: python
+
+            from ladybug.epw import EPW
+            from ladybug_comfort.collection.pmv import PMV
+
+            epw = EPW('./tests/epw/chicago.epw')
+            scenarios = PMV.from_scenarios(
+                epw.dry_bulb_temperature, epw.relative_humidity,
+                met_rates=[1.0, 1.2, 1.6], clo_values=[0.5, 0.7, 1.0])
+            print([pmv.percent_neutral for pmv in scenarios])
+        """
+        # process the scenario lists and determine the number of scenarios
+        met_rates = [None] if met_rates is None else list(met_rates)
+        clo_values = [None] if clo_values is None else list(clo_values)
+        comfort_parameters = [None] if comfort_parameters is None \
+            else list(comfort_parameters)
+        scenario_lists = (met_rates, clo_values, comfort_parameters)
+        count = max(len(scen) for scen in scenario_lists)
+        for scen, name in zip(scenario_lists,
+                              ('met_rates', 'clo_values', 'comfort_parameters')):
+            assert len(scen) in (1, count), 'Length of {} ({}) does not match the ' \
+                'number of scenarios ({}).'.format(name, len(scen), count)
+            if len(scen) == 1:
+                scen *= count
+
+        # create the first PMV object, which checks all of the shared inputs
+        first = cls(air_temperature, rel_humidity, rad_temperature, air_speed,
+                    met_rates[0], clo_values[0], external_work,
+                    comfort_parameters[0], result_cache, mask=mask)
+        if first._hr_calculated is False and any(
+                par is not None and (par.humid_ratio_lower != 0 or
+                                     par.humid_ratio_upper != 1)
+                for par in comfort_parameters):
+            first._calculate_humidity_ratio()
+        shared_inputs = [coll for coll in first._input_collections
+                         if coll is not met_rates[0] and coll is not clo_values[0]]
+
+        # create the other PMV objects using the shared inputs
+        scenarios = [first]
+        for met, clo, comf_par in zip(met_rates[1:], clo_values[1:],
+                                      comfort_parameters[1:]):
+            # share everything of the first object but the scenario slots
+            # the results of the first object are replaced by the calculation
+            pmv_obj = cls.__new__(cls)
+            for base_cls in cls.__mro__:
+                for attr in getattr(base_cls, '__slots__', ()):
+                    if attr not in cls._scenario_slots and hasattr(first, attr):
+                        setattr(pmv_obj, attr, getattr(first, attr))
+            pmv_obj._input_collections = shared_inputs[:]
+            pmv_obj._met_rate = pmv_obj._check_input(
+                met, MetabolicRate, 'met', 'met_rate') if met is not None \
+                else ConstantSequence(1.1, first._calc_length)
+            pmv_obj._clo_value = pmv_obj._check_input(
+                clo, ClothingInsulation, 'clo', 'clo_value') if clo is not None \
+                else ConstantSequence(0.7, first._calc_length)
+            if isinstance(met, BaseCollection) or isinstance(clo, BaseCollection):
+                pmv_obj._check_aligned()
+            pmv_obj._assign_comfort_parameter(comf_par)
+            pmv_obj._calculate_pmv_cached(None)
+            scenarios.append(pmv_obj)
+        return scenarios
+
+    def _assign_comfort_parameter(self, comfort_parameter):
+        """Set the comfort parameter and note whether humidity ratio is required."""
+        if comfort_parameter is None:
+            self._comfort_par = PMVParameter()
+        else:
+            assert isinstance(comfort_parameter, PMVParameter), 'comfort_parameter '\
+                'must be a PMVParameter object. Got {}'.format(type(comfort_parameter))
+            self._comfort_par = comfort_parameter
+
+        self._hr_comfort_required = True
+        if self._comfort_par.humid_ratio_lower == 0 and \
+                self._comfort_par.humid_ratio_upper == 1:
+            self._hr_comfort_required = False
+
+    def _calculate_pmv_cached(self, cache_folder):
+        """Compute PMV or load the results from a cache_folder if it is not None."""
+        result_columns = [
+            ('_pmv', 'd'), ('_ppd', 'd'), ('_set', 'd'), ('_ta_adj', 'd'),
+            ('_cooling_effect', 'd'), ('_heat_loss_conduction', 'd'),
+            ('_heat_loss_sweating', 'd'), ('_heat_loss_latent_respiration', 'd'),
+            ('_heat_loss_dry_respiration', 'd'), ('_heat_loss_radiation', 'd'),
+            ('_heat_loss_convection', 'd'), ('_is_comfortable', 'b'),
+            ('_thermal_condition', 'b'), ('_discomfort_reason', 'b')]
+        if self._hr_comfort_required is True:
+            result_columns.append(('_humidity_ratio', 'd'))
+        # results of a result_cache depend on its quantum
+        result_cache_state = None if self._result_cache is None else \
+            (self._result_cache.function.__name__, self._result_cache.quantum)
+        with use_backend(self._backend):
+            self._calculate_cached(
+                self._calculate_pmv, result_columns, cache_folder,
+                (self._air_temperature, self._rel_humidity, self._rad_temperature,
+                 self._air_speed, self._met_rate, self._clo_value,
+                 self._external_work, self._parameter_state(self._comfort_par),
+                 self._warm_start, self._set_surrogate, result_cache_state))
+        if self._hr_comfort_required is True:
+            self._hr_calculated = True
 
     def _calculate_humidity_ratio(self):
         """Compute the humidity ratio at each step of the Data Collection."""
-        self._humidity_ratio = [humid_ratio_from_db_rh(db, rh) for db, rh in zip(
-            self._air_temperature, self._rel_humidity)]
+        self._humidity_ratio = PsychrometricColumns(
+            self._masked_values(self._air_temperature),
+            self._masked_values(self._rel_humidity)).humidity_ratio
         self._hr_calculated = True
 
     def _calculate_pmv(self):
         """Compute PMV for each step of the Data Collection."""
-        if self._hr_comfort_required is True:
+        if self._hr_comfort_required is True and self._hr_calculated is False:
             self._calculate_humidity_ratio()
 
         # empty properties to be calculated
         self._pmv = []
         self._ppd = []
         self._set = []
-        self._is_comfortable = []
-        self._thermal_condition = []
-        self._discomfort_reason = []
         self._ta_adj = []
         self._cooling_effect = []
         self._heat_loss_conduction = []
@@ -279,13 +496,38 @@ class PMV(ComfortCollection):
         self._heat_loss_convection = []
 
         # perform the PMV calculation
-        for ta, tr, vel, rh, met, clo, wme, i in \
-            zip(self._air_temperature, self._rad_temperature,
-                self._air_speed, self._rel_humidity,
-                self._met_rate, self._clo_value,
-                self._external_work, range(self._calc_length)):
-            result = predicted_mean_vote(ta, tr, vel, rh, met, clo, wme,
-                                         self._comfort_par.still_air_threshold)
+        # the SET coefficients (and tables) are computed once for each met, clo and wme
+        pmv_funct = predicted_mean_vote if self._result_cache is None \
+            else self._result_cache
+        still_air = self._comfort_par.still_air_threshold
+        set_coeffs = {}
+        ce_guess = None  # cooling effect of the previous step when warm starting
+        mv = self._masked_values
+        if self._set_surrogate and self._result_cache is None:
+            # each table takes several seconds to compute so only one is allowed
+            combinations = set(zip(mv(self._met_rate), mv(self._clo_value),
+                                   mv(self._external_work)))
+            assert len(combinations) == 1, 'set_surrogate requires the same ' \
+                'met_rate, clo_value and external_work at all steps. Got {} ' \
+                'different combinations.'.format(len(combinations))
+        for ta, tr, vel, rh, met, clo, wme in \
+            zip(mv(self._air_temperature), mv(self._rad_temperature),
+                mv(self._air_speed), mv(self._rel_humidity),
+                mv(self._met_rate), mv(self._clo_value), mv(self._external_work)):
+            if self._result_cache is None:
+                try:
+                    coeffs, set_table = set_coeffs[(met, clo, wme)]
+                except KeyError:
+                    coeffs = PierceSetCoefficients(met, clo, wme)
+                    set_table = PierceSetTable.shared_table(met, clo, wme) \
+                        if self._set_surrogate else None
+                    set_coeffs[(met, clo, wme)] = coeffs, set_table
+                result = pmv_funct(ta, tr, vel, rh, met, clo, wme, still_air, coeffs,
+                                   ce_guess, set_table)
+                if self._warm_start:
+                    ce_guess = result['ce']
+            else:
+                result = pmv_funct(ta, tr, vel, rh, met, clo, wme, still_air)
             self._pmv.append(result['pmv'])
             self._ppd.append(result['ppd'])
             self._set.append(result['set'])
@@ -298,21 +540,13 @@ class PMV(ComfortCollection):
             self._heat_loss_radiation.append(result['heat_loss']['rad'])
             self._heat_loss_convection.append(result['heat_loss']['conv'])
 
-            # determine whether conditions are acceptable
-            condit = self._comfort_par.thermal_condition(
-                result['pmv'], result['ppd'])
-            if self._hr_comfort_required is True:
-                hr = self._humidity_ratio[i]
-                comf = self._comfort_par.is_comfortable(result['ppd'], hr)
-                reason = self._comfort_par.discomfort_reason(
-                    result['pmv'], result['ppd'], hr)
-            else:
-                comf = self._comfort_par.is_comfortable(result['ppd'])
-                reason = self._comfort_par.discomfort_reason(
-                    result['pmv'], result['ppd'])
-            self._is_comfortable.append(comf)
-            self._thermal_condition.append(condit)
-            self._discomfort_reason.append(reason)
+        # determine whether conditions are acceptable
+        hr = self._humidity_ratio if self._hr_comfort_required is True else None
+        self._is_comfortable = self._comfort_par.is_comfortable_batch(self._ppd, hr)
+        self._thermal_condition = \
+            self._comfort_par.thermal_condition_batch(self._pmv, self._ppd)
+        self._discomfort_reason = \
+            self._comfort_par.discomfort_reason_batch(self._pmv, self._ppd, hr)
 
     @property
     def air_temperature(self):
@@ -462,7 +696,7 @@ class PMV(ComfortCollection):
     @property
     def percent_comfortable(self):
         """The percent of time comfortabe given by the assigned comfort_parameter."""
-        return (sum(self._is_comfortable) / self._calc_length) * 100
+        return (sum(self._is_comfortable) / self._result_length()) * 100
 
     @property
     def percent_uncomfortable(self):
@@ -472,32 +706,27 @@ class PMV(ComfortCollection):
     @property
     def percent_neutral(self):
         """The percent of time that the thermal_condition is neutral."""
-        _vals = [1 for x in self._thermal_condition if x == 0]
-        return (sum(_vals) / self._calc_length) * 100
+        return self._percent_of(self._condition_count(), (0,))
 
     @property
     def percent_cold(self):
         """The percent of time that the thermal_condition is cold."""
-        _vals = [1 for x in self._thermal_condition if x == -1]
-        return (sum(_vals) / self._calc_length) * 100
+        return self._percent_of(self._condition_count(), (-1,))
 
     @property
     def percent_hot(self):
         """The percent of time that the thermal_condition is hot."""
-        _vals = [1 for x in self._thermal_condition if x == 1]
-        return (sum(_vals) / self._calc_length) * 100
+        return self._percent_of(self._condition_count(), (1,))
 
     @property
     def percent_dry(self):
         """The percent of time that the thermal_condition neutral but it is too dry."""
-        _vals = [1 for x in self._discomfort_reason if x == -2]
-        return (sum(_vals) / self._calc_length) * 100
+        return self._percent_of(self._reason_count(), (-2,))
 
     @property
     def percent_humid(self):
         """The percent of time that the thermal_condition neutral but it is too humid."""
-        _vals = [1 for x in self._discomfort_reason if x == 2]
-        return (sum(_vals) / self._calc_length) * 100
+        return self._percent_of(self._reason_count(), (2,))
 
     @property
     def humidity_ratio(self):
@@ -562,3 +791,80 @@ class PMV(ComfortCollection):
         """Data Collection of heat loss by convection in [W]."""
         return self._get_coll('_hl_convection_coll', self._heat_loss_convection,
                               Power('Heat Loss From Convection'), 'W')
+
+    def category_counts(self):
+        """Get a dictionary with the number of values in each thermal_condition.
+
+        Keys are the integers of thermal_condition (-1, 0, +1) and values are
+        the number of time steps that fall into each category.
+        """
+        return dict(self._condition_count())
+
+    def threshold_sweep(self, ppd_thresholds):
+        """Get the percent statistics of this object for a list of PPD thresholds.
+
+        This is equivalent to getting the summary() of a PMV object for each
+        ppd_comfort_thresh but the PPD values are only sorted once and each
+        threshold is then evaluated with a binary search. So it is much faster
+        than recomputing the object for sensitivity studies of the threshold.
+        The humidity ratio limits of the comfort_parameter are used for
+        all thresholds.
+
+        Args:
+            ppd_thresholds: A list of PPD comfort thresholds [%]. Each must be
+                between 5 and 100.
+
+        Returns:
+            A dictionary with the names of the percent properties as keys
+            (eg. 'percent_neutral') and lists with the percent of time for
+            each of the ppd_thresholds as values.
+        """
+        for thresh in ppd_thresholds:
+            assert 5 <= thresh <= 100, \
+                'ppd_comfort_thresh must be between 5 and 100. Got {}'.format(thresh)
+        if not hasattr(self, '_sweep_values'):
+            hot, cold, comf, dry, humid = [], [], [], [], []
+            if self._hr_comfort_required is True:
+                reasons = categorize(
+                    self._humidity_ratio, (self._comfort_par.humid_ratio_lower,),
+                    (self._comfort_par.humid_ratio_upper,), (-2, 0, 2))
+            else:
+                reasons = (0,) * len(self._ppd)
+            for pmv, ppd, reason in zip(self._pmv, self._ppd, reasons):
+                if pmv > 0:
+                    hot.append(ppd)
+                else:
+                    cold.append(ppd)
+                if reason == 0:
+                    comf.append(ppd)
+                elif reason == -2:
+                    dry.append(ppd)
+                else:
+                    humid.append(ppd)
+            self._sweep_values = tuple(
+                sorted(vals) for vals in (self._ppd, hot, cold, comf, dry, humid))
+        ppd, hot, cold, comf, dry, humid = self._sweep_values
+
+        # count the values on each side of the thresholds with binary searches
+        count = self._result_length()
+        sweep = dict((prop, []) for prop in self._percent_properties)
+        for thresh in ppd_thresholds:
+            comfortable = (bisect_right(comf, thresh) / count) * 100
+            sweep['percent_comfortable'].append(comfortable)
+            sweep['percent_uncomfortable'].append(100 - comfortable)
+            sweep['percent_neutral'].append((bisect_left(ppd, thresh) / count) * 100)
+            sweep['percent_hot'].append(
+                ((len(hot) - bisect_left(hot, thresh)) / count) * 100)
+            sweep['percent_cold'].append(
+                ((len(cold) - bisect_left(cold, thresh)) / count) * 100)
+            sweep['percent_dry'].append((bisect_left(dry, thresh) / count) * 100)
+            sweep['percent_humid'].append((bisect_left(humid, thresh) / count) * 100)
+        return sweep
+
+    def _condition_count(self):
+        return self._count_values('_condition_count_dict', self._thermal_condition,
+                                  (-1, 0, 1))
+
+    def _reason_count(self):
+        return self._count_values('_reason_count_dict', self._discomfort_reason,
+                                  (-2, -1, 0, 1, 2))
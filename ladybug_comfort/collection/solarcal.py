@@ -5,6 +5,8 @@ from __future__ import division
 from ..solarcal import outdoor_sky_heat_exch, indoor_sky_heat_exch, \
     shortwave_from_horiz_solar, sharp_from_solar_and_body_azimuth
 from ..parameter.solarcal import SolarCalParameter
+from ..backend import use_backend
+from .._sequence import ConstantSequence
 from .base import ComfortCollection
 
 from ladybug.location import Location
@@ -92,7 +94,7 @@ class _SolarCalBase(ComfortCollection):
         if data_coll is not None:
             return self._check_input(data_coll, Fraction, 'fraction', name)
         else:
-            return [default] * self._calc_length
+            return ConstantSequence(default, self._calc_length)
 
     def _body_par_check(self, body_par):
         if body_par is None:
@@ -108,7 +110,7 @@ class _SolarCalBase(ComfortCollection):
         sp = Sunpath.from_location(self._location)
         _altitudes = []
         if self._body_par.body_azimuth is None:
-            _sharps = [self._body_par.sharp] * self._calc_length
+            _sharps = ConstantSequence(self._body_par.sharp, self._calc_length)
             for t_date in self._base_collection.datetimes:
                 sun = sp.calculate_sun_from_date_time(t_date)
                 _altitudes.append(sun.altitude)
@@ -154,6 +156,16 @@ class OutdoorSolarCal(_SolarCalBase):
             is characteristic of outdoor grass or dry bare soil.
         solarcal_body_parameter: Optional SolarCalParameter object to account for
             properties of the human geometry.
+        cache_folder: Optional path to a folder where the results of this object
+            will be cached on disk. When an object with identical inputs has
+            already been computed with the same cache_folder, its results will
+            be loaded instead of recomputed. If None, results are always
+            computed and nothing is written to disk.
+        backend: Optional text for the name of the backend of the model kernels
+            to be used for the calculation of this object (see the backend
+            module). Choose from: python, numpy, compiled. Kernels without an
+            implementation for the backend will use pure Python. If None, the
+            active backend will be used. (Default: None).
 
     Properties:
         * location
@@ -181,7 +193,8 @@ class OutdoorSolarCal(_SolarCalBase):
     def __init__(self, location, direct_normal_solar, diffuse_horizontal_solar,
                  horizontal_infrared, surface_temperatures,
                  fraction_body_exposed=None, sky_exposure=None,
-                 floor_reflectance=None, solarcal_body_parameter=None):
+                 floor_reflectance=None, solarcal_body_parameter=None,
+                 cache_folder=None, backend=None):
         """Initialize Outdoor SolarCal object.
         """
         # set up the object using radiation as a base
@@ -206,10 +219,53 @@ class OutdoorSolarCal(_SolarCalBase):
         self._sky_exp = self._fraction_input_check(sky_exposure, 'sky_exposure', 1)
 
         # check that all input data collections are aligned.
-        HourlyDiscontinuousCollection.are_collections_aligned(self._input_collections)
+        self._check_aligned()
 
         # compute SolarCal
-        self._calculate_solarcal()
+        with use_backend(backend):
+            self._calculate_cached(
+                self._calculate_solarcal,
+                (('_s_erf', 'd'), ('_s_dmrt', 'd'), ('_l_erf', 'd'), ('_l_dmrt', 'd'),
+                 ('_dmrt', 'd'), ('_mrt', 'd')), cache_folder,
+                (self._location.latitude, self._location.longitude,
+                 self._location.time_zone, self._location.elevation,
+                 [dt.moy for dt in self._base_collection.datetimes],
+                 self._dir_norm, self._diff_horiz, self._horiz_ir, self._srf_temp,
+                 self._sky_exp, self._fract_exp, self._flr_ref,
+                 self._parameter_state(self._body_par)))
+
+    @classmethod
+    def from_epw(cls, epw, fraction_body_exposed=None, sky_exposure=None,
+                 floor_reflectance=None, solarcal_body_parameter=None,
+                 cache_folder=None):
+        """Get an OutdoorSolarCal object from the conditions within an EPW file.
+
+        The EPW dry bulb temperature will be used as the surface temperature
+        around the person.
+
+        Args:
+            epw: A ladybug EPW object from which the OutdoorSolarCal object
+                will be created.
+            fraction_body_exposed: A Data Collection or number between 0 and 1
+                representing the fraction of the body exposed to direct sunlight.
+                Default is 1 for a person standing in an open area.
+            sky_exposure: A Data Collection or number between 0 and 1 representing
+                the fraction of the sky vault in occupant's view. Default is 1
+                for a person standing in an open area.
+            floor_reflectance: A Data Collection or number between 0 and 1 that
+                represents the reflectance of the floor. Default is for 0.25.
+            solarcal_body_parameter: Optional SolarCalParameter object to account
+                for properties of the human geometry.
+            cache_folder: Optional path to a folder where the results will be
+                cached on disk. Running this method again with the same EPW,
+                inputs and cache_folder will load the results instead of
+                recomputing them. If None, nothing is written to disk.
+        """
+        return cls(epw.location, epw.direct_normal_radiation,
+                   epw.diffuse_horizontal_radiation,
+                   epw.horizontal_infrared_radiation_intensity,
+                   epw.dry_bulb_temperature, fraction_body_exposed, sky_exposure,
+                   floor_reflectance, solarcal_body_parameter, cache_folder)
 
     def _calculate_solarcal(self):
         """Compute SolarCal for each step of the Data Collection."""
@@ -371,7 +427,7 @@ class IndoorSolarCal(_SolarCalBase):
             window_transmittance, 'window_transmittance', 0.4)
 
         # check that all input data collections are aligned.
-        HourlyDiscontinuousCollection.are_collections_aligned(self._input_collections)
+        self._check_aligned()
 
         # compute SolarCal
         self._calculate_solarcal()
@@ -501,7 +557,7 @@ class HorizontalSolarCal(_SolarCalBase):
         self._l_mrt = self._check_input(longwave_mrt, Temperature, 'C', 'longwave_mrt')
 
         # check that all input data collections are aligned.
-        HourlyDiscontinuousCollection.are_collections_aligned(self._input_collections)
+        self._check_aligned()
 
         # compute SolarCal
         self._calculate_solarcal()
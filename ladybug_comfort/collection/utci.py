@@ -2,13 +2,15 @@
 """Object for calculating UTCI comfort from DataCollections."""
 from __future__ import division
 
+from bisect import bisect_left, bisect_right
+
 from ..utci import universal_thermal_climate_index
 from ..parameter.utci import UTCIParameter
+from ..backend import use_backend
+from .._sequence import ConstantSequence
 from .base import ComfortCollection
 from .solarcal import OutdoorSolarCal
 
-from ladybug._datacollectionbase import BaseCollection
-
 from ladybug.datatype.temperature import Temperature, MeanRadiantTemperature, \
     AirTemperature, UniversalThermalClimateIndex
 from ladybug.datatype.fraction import RelativeHumidity
@@ -36,6 +38,28 @@ class UTCI(ComfortCollection):
             which conditions are considered acceptable. If None, default will
             assume comfort thresholds consistent with those used by meterologists
             to categorize outdoor conditions.
+        cache_folder: Optional path to a folder where the results of this object
+            will be cached on disk. When an object with identical inputs and
+            comfort parameters has already been computed with the same
+            cache_folder, its results will be loaded instead of recomputed.
+            If None, results are always computed and nothing is written to disk.
+        check_alignment: Boolean to note whether the input Data Collections should
+            be checked for alignment with one another. Inputs that share the
+            analysis period or datetimes of the air_temperature are always
+            checked quickly but this can be set to False to skip the check
+            entirely for pipelines where the inputs are known to be aligned.
+            (Default: True).
+        backend: Optional text for the name of the backend of the model kernels
+            to be used for the calculation of this object (see the backend
+            module). Choose from: python, numpy, compiled. Kernels without an
+            implementation for the backend will use pure Python. If None, the
+            active backend will be used. (Default: None).
+        mask: An optional Data Collection or list of booleans with one value
+            for each step of the air_temperature, which notes the steps at which
+            UTCI is evaluated (eg. an occupancy schedule of 0 and 1 values).
+            Steps that are False (or 0) are not computed, their values in the
+            output Data Collections are None and they are excluded from all
+            percent statistics. If None, all steps are evaluated. (Default: None).
 
     Properties:
         * air_temperature
@@ -68,15 +92,25 @@ class UTCI(ComfortCollection):
         * percent_extreme_heat_stress
     """
     _model = 'Universal Thermal Climate Index'
+    _percent_properties = (
+        'percent_comfortable', 'percent_uncomfortable', 'percent_neutral',
+        'percent_hot', 'percent_cold', 'percent_extreme_cold_stress',
+        'percent_very_strong_cold_stress', 'percent_strong_cold_stress',
+        'percent_moderate_cold_stress', 'percent_slight_cold_stress',
+        'percent_slight_heat_stress', 'percent_moderate_heat_stress',
+        'percent_strong_heat_stress', 'percent_very_strong_heat_stress',
+        'percent_extreme_heat_stress')
     __slots__ = ('_air_temperature', '_rel_humidity', '_rad_temperature', '_wind_speed',
                  '_comfort_par', '_utci', '_thermal_category', '_air_temperature_coll',
                  '_rel_humidity_coll', '_rad_temperature_coll', '_wind_speed_coll',
                  '_utci_coll', '_is_comfortable_coll', '_thermal_condition_coll',
                  '_five_point_coll', '_seven_point_coll', '_nine_point_coll',
-                 '_eleven_point_coll', '_original_category_coll')
+                 '_eleven_point_coll', '_original_category_coll',
+                 '_category_count_dict', '_mask', '_sweep_values')
 
     def __init__(self, air_temperature, rel_humidity, rad_temperature=None,
-                 wind_speed=None, comfort_parameter=None):
+                 wind_speed=None, comfort_parameter=None, cache_folder=None,
+                 check_alignment=True, backend=None, mask=None):
         """Initialize a UTCI comfort object from DataCollections of UTCI inputs.
         """
         # set up the object using air temperature as a base
@@ -101,10 +135,12 @@ class UTCI(ComfortCollection):
             self._wind_speed = self._check_input(
                 wind_speed, Speed, 'm/s', 'air_speed')
         else:
-            self._wind_speed = [0.1] * self.calc_length
+            self._wind_speed = ConstantSequence(0.1, self.calc_length)
+        self._mask = self._check_mask(mask)
 
         # check that all input data collections are aligned.
-        BaseCollection.are_collections_aligned(self._input_collections)
+        if check_alignment:
+            self._check_aligned()
 
         # check comfort parameters
         if comfort_parameter is None:
@@ -115,11 +151,16 @@ class UTCI(ComfortCollection):
             self._comfort_par = comfort_parameter
 
         # compute UTCI
-        self._calculate_utci()
+        with use_backend(backend):
+            self._calculate_cached(
+                self._calculate_utci, (('_utci', 'd'), ('_thermal_category', 'b')),
+                cache_folder, (self._air_temperature, self._rel_humidity,
+                               self._rad_temperature, self._wind_speed,
+                               self._parameter_state(self._comfort_par)))
 
     @classmethod
     def from_epw(cls, epw, include_wind=True, include_sun=True,
-                 utci_parameter=None):
+                 utci_parameter=None, cache_folder=None):
         """Get a UTCI comfort object from the conditions within an EPW file.
 
         Args:
@@ -141,6 +182,11 @@ class UTCI(ComfortCollection):
                 which conditions are considered acceptable. If None, default will
                 assume comfort thresholds consistent with those used by meterologists
                 to categorize outdoor conditions.
+            cache_folder: Optional path to a folder where the results will be
+                cached on disk. This includes the results of the OutdoorSolarCal
+                calculation when include_sun is True. Running this method again
+                with the same EPW, inputs and cache_folder will load the results
+                instead of recomputing them. If None, nothing is written to disk.
 
         Returns:
             A UTCI object with data collections of the results as properties.
@@ -163,29 +209,26 @@ class UTCI(ComfortCollection):
         # Get wind and mrt inputs
         wind_speed = epw.wind_speed if include_wind is True else 0.1
         if include_sun is True:
-            solarcal_obj = OutdoorSolarCal(epw.location, epw.direct_normal_radiation,
-                                           epw.diffuse_horizontal_radiation,
-                                           epw.horizontal_infrared_radiation_intensity,
-                                           epw.dry_bulb_temperature)
+            solarcal_obj = OutdoorSolarCal.from_epw(epw, cache_folder=cache_folder)
             mrt = solarcal_obj.mean_radiant_temperature
         else:
             mrt = epw.dry_bulb_temperature
 
         # return the comfort object
         return cls(epw.dry_bulb_temperature, epw.relative_humidity, mrt, wind_speed,
-                   utci_parameter)
+                   utci_parameter, cache_folder)
 
     def _calculate_utci(self):
         """Compute UTCI for each step of the Data Collection."""
-        self._utci = []
-        self._thermal_category = []
-        for ta, tr, vel, rh in \
-            zip(self._air_temperature, self._rad_temperature,
-                self._wind_speed, self._rel_humidity):
-            result = universal_thermal_climate_index(ta, tr, vel, rh)
-            self._utci.append(result)
-            self._thermal_category.append(
-                self._comfort_par.thermal_condition_eleven_point(result))
+        self._utci = [
+            universal_thermal_climate_index(ta, tr, vel, rh)
+            for ta, tr, vel, rh in zip(
+                self._masked_values(self._air_temperature),
+                self._masked_values(self._rad_temperature),
+                self._masked_values(self._wind_speed),
+                self._masked_values(self._rel_humidity))]
+        self._thermal_category = \
+            self._comfort_par.thermal_condition_eleven_point_batch(self._utci)
 
     @property
     def air_temperature(self):
@@ -347,8 +390,7 @@ class UTCI(ComfortCollection):
     @property
     def percent_comfortable(self):
         """The percent of time comfortabe given by the assigned comfort_parameter."""
-        _vals = [1 for t in self._thermal_category if t == 0]
-        return (sum(_vals) / self._calc_length) * 100
+        return self._percent_of(self._category_count(), (0,))
 
     @property
     def percent_uncomfortable(self):
@@ -363,89 +405,147 @@ class UTCI(ComfortCollection):
     @property
     def percent_cold(self):
         """The percent of time that the thermal_condition is cold."""
-        _vals = [1 for x in self._thermal_category if x < 0]
-        return (sum(_vals) / self._calc_length) * 100
+        return self._percent_of(self._category_count(), (-5, -4, -3, -2, -1))
 
     @property
     def percent_hot(self):
         """The percent of time that the thermal_condition is hot."""
-        _vals = [1 for x in self._thermal_category if x > 0]
-        return (sum(_vals) / self._calc_length) * 100
+        return self._percent_of(self._category_count(), (1, 2, 3, 4, 5))
 
     @property
     def percent_slight_cold_stress(self):
         """The percent of time that conditions have slight cold stress."""
-        _vals = [1 for x in self._thermal_category if x == -1]
-        return (sum(_vals) / self._calc_length) * 100
+        return self._percent_of(self._category_count(), (-1,))
 
     @property
     def percent_moderate_cold_stress(self):
         """The percent of time that conditions have moderate cold stress."""
-        _vals = [1 for x in self._thermal_category if x == -2]
-        return (sum(_vals) / self._calc_length) * 100
+        return self._percent_of(self._category_count(), (-2,))
 
     @property
     def percent_strong_cold_stress(self):
         """The percent of time that conditions have strong cold stress."""
-        _vals = [1 for x in self._thermal_category if x == -3]
-        return (sum(_vals) / self._calc_length) * 100
+        return self._percent_of(self._category_count(), (-3,))
 
     @property
     def percent_very_strong_cold_stress(self):
         """The percent of time that conditions have very strong cold stress."""
-        _vals = [1 for x in self._thermal_category if x == -4]
-        return (sum(_vals) / self._calc_length) * 100
+        return self._percent_of(self._category_count(), (-4,))
 
     @property
     def percent_extreme_cold_stress(self):
         """The percent of time that conditions have very strong cold stress."""
-        _vals = [1 for x in self._thermal_category if x == -5]
-        return (sum(_vals) / self._calc_length) * 100
+        return self._percent_of(self._category_count(), (-5,))
 
     @property
     def percent_slight_heat_stress(self):
         """The percent of time that conditions have slight heat stress."""
-        _vals = [1 for x in self._thermal_category if x == 1]
-        return (sum(_vals) / self._calc_length) * 100
+        return self._percent_of(self._category_count(), (1,))
 
     @property
     def percent_moderate_heat_stress(self):
         """The percent of time that conditions have moderate heat stress."""
-        _vals = [1 for x in self._thermal_category if x == 2]
-        return (sum(_vals) / self._calc_length) * 100
+        return self._percent_of(self._category_count(), (2,))
 
     @property
     def percent_strong_heat_stress(self):
         """The percent of time that conditions have strong heat stress."""
-        _vals = [1 for x in self._thermal_category if x == 3]
-        return (sum(_vals) / self._calc_length) * 100
+        return self._percent_of(self._category_count(), (3,))
 
     @property
     def percent_very_strong_heat_stress(self):
         """The percent of time that conditions have very strong heat stress."""
-        _vals = [1 for x in self._thermal_category if x == 4]
-        return (sum(_vals) / self._calc_length) * 100
+        return self._percent_of(self._category_count(), (4,))
 
     @property
     def percent_extreme_heat_stress(self):
         """The percent of time that conditions have very strong heat stress."""
-        _vals = [1 for x in self._thermal_category if x == 5]
-        return (sum(_vals) / self._calc_length) * 100
+        return self._percent_of(self._category_count(), (5,))
+
+    def category_counts(self):
+        """Get a dictionary with the number of values in each eleven-point category.
+
+        Keys are the integers of thermal_condition_eleven_point (from -5 to +5)
+        and values are the number of time steps that fall into each category.
+        """
+        return dict(self._category_count())
+
+    def threshold_sweep(self, cold_thresholds=None, heat_thresholds=None):
+        """Get the comfort percentages of this object for lists of UTCI thresholds.
+
+        This is equivalent to getting the percent_comfortable, percent_hot, etc.
+        of a UTCI object for each cold_thresh and heat_thresh but the UTCI
+        values are only sorted once and each threshold is then evaluated with
+        a binary search. So it is much faster than recomputing the object for
+        sensitivity studies of the thresholds.
+
+        Args:
+            cold_thresholds: A list of UTCI thresholds below which conditions are
+                cold [C]. If None, the cold_thresh of the comfort_parameter
+                will be used for all steps of the sweep.
+            heat_thresholds: A list of UTCI thresholds above which conditions are
+                hot [C]. If None, the heat_thresh of the comfort_parameter
+                will be used for all steps of the sweep.
+
+        Returns:
+            A dictionary with 'percent_comfortable', 'percent_uncomfortable',
+            'percent_neutral', 'percent_hot' and 'percent_cold' as keys and
+            lists with the percent of time for each pair of cold and heat
+            thresholds as values. The number of pairs is the length of the
+            longest of the two input lists and lists with a single item are
+            used for all pairs.
+        """
+        cold_thresholds = [self._comfort_par.cold_thresh] if cold_thresholds is None \
+            else list(cold_thresholds)
+        heat_thresholds = [self._comfort_par.heat_thresh] if heat_thresholds is None \
+            else list(heat_thresholds)
+        pairs = max(len(cold_thresholds), len(heat_thresholds))
+        for thresholds, name in ((cold_thresholds, 'cold_thresholds'),
+                                 (heat_thresholds, 'heat_thresholds')):
+            assert len(thresholds) in (1, pairs), 'Length of {} ({}) does not ' \
+                'match the number of thresholds ({}).'.format(
+                    name, len(thresholds), pairs)
+            if len(thresholds) == 1:
+                thresholds *= pairs
+        if not hasattr(self, '_sweep_values'):
+            self._sweep_values = sorted(self._utci)
+        utci = self._sweep_values
+
+        # count the values on each side of the thresholds with binary searches
+        count = self._result_length()
+        sweep = dict((prop, []) for prop in self._percent_properties[:5])
+        for cold_thresh, heat_thresh in zip(cold_thresholds, heat_thresholds):
+            assert cold_thresh <= heat_thresh, 'UTCI cold threshold ({}) must be ' \
+                'less than or equal to the heat threshold ({}).'.format(
+                    cold_thresh, heat_thresh)
+            cold = bisect_left(utci, cold_thresh)
+            hot = len(utci) - bisect_right(utci, heat_thresh)
+            comfortable = ((count - cold - hot) / count) * 100
+            sweep['percent_comfortable'].append(comfortable)
+            sweep['percent_uncomfortable'].append(100 - comfortable)
+            sweep['percent_neutral'].append(comfortable)
+            sweep['percent_hot'].append((hot / count) * 100)
+            sweep['percent_cold'].append((cold / count) * 100)
+        return sweep
+
+    def _category_count(self):
+        return self._count_values('_category_count_dict', self._thermal_category,
+                                  range(-5, 6))
 
     def _comf_val_funct(self):
-        return [self._comfort_par.is_comfortable(t) for t in self._utci]
+        return self._comfort_par.is_comfortable_batch(self._utci)
 
     def _condit_val_funct(self):
-        return [self._comfort_par.thermal_condition(t) for t in self._utci]
+        return self._comfort_par.thermal_condition_batch(self._utci)
 
     def _five_pt_funct(self):
-        return [self._comfort_par.thermal_condition_five_point(t) for t in self._utci]
+        return self._comfort_par.thermal_condition_five_point_batch(self._utci)
 
     def _seven_pt_funct(self):
-        return [self._comfort_par.thermal_condition_seven_point(t) for t in self._utci]
+        return self._comfort_par.thermal_condition_seven_point_batch(self._utci)
 
     def _nine_pt_funct(self):
-        return [self._comfort_par.thermal_condition_nine_point(t) for t in self._utci]
+        return self._comfort_par.thermal_condition_nine_point_batch(self._utci)
 
     def _original_category_funct(self):
-        return [self._comfort_par.original_utci_category(t) for t in self._utci]
+        return self._comfort_par.original_utci_category_batch(self._utci)
@@ -0,0 +1,199 @@
+# coding=utf-8
+"""Object for calculating Wind Chill from DataCollections."""
+from __future__ import division
+
+from ..wc import windchill_index_batch, windchill_index_effect_category_batch, \
+    windchill_temp_batch, windchill_temp_effect_category_batch
+from .base import ComfortCollection
+
+from ladybug.datatype.temperature import Temperature, AirTemperature
+from ladybug.datatype.speed import Speed, WindSpeed
+from ladybug.datatype.energyflux import EnergyFlux
+from ladybug.datatype.generic import GenericType
+
+
+class WindChill(ComfortCollection):
+    """Wind Chill DataCollection object.
+
+    This object computes both the Wind Chill Index (WCI) in W/m2 and the Wind
+    Chill Temperature (WCT) in C. The percent properties of the object are
+    derived from the WCI effect category with the exception of
+    percent_hypothermia_risk, which is derived from the WCT effect category.
+
+    Args:
+        air_temperature: Data Collection of air temperature values in Celsius.
+        wind_speed: Data Collection of meteorological wind speed values in m/s
+            or a single wind speed value to be used for the whole analysis.
+        check_alignment: Boolean to note whether the input Data Collections should
+            be checked for alignment with one another. (Default: True).
+
+    Properties:
+        * air_temperature
+        * wind_speed
+        * windchill_index
+        * windchill_index_category
+        * windchill_temperature
+        * windchill_temperature_category
+        * percent_neutral
+        * percent_hot
+        * percent_cold
+        * percent_hypothermia_risk
+    """
+    _model = 'Wind Chill'
+    _percent_properties = ('percent_neutral', 'percent_hot', 'percent_cold',
+                           'percent_hypothermia_risk')
+    _wci_category_type = GenericType(
+        'Wind Chill Index Category', 'condition', -4, 3, 'WCIcat',
+        {-4: 'Extreme Frost', -3: 'Frosty', -2: 'Cold', -1: 'Cool',
+         0: 'Comfortable', 1: 'Warm', 2: 'Hot', 3: 'Extremely Hot'})
+    _wct_category_type = GenericType(
+        'Wind Chill Temperature Category', 'condition', -6, 0, 'WCTcat',
+        {-6: 'Danger', -5: 'Serious Risk', -4: 'High Frostbite Risk',
+         -3: 'Increasing Frostbite Risk', -2: 'Hypothermia Risk',
+         -1: 'Slight Discomfort', 0: 'No Discomfort'})
+    __slots__ = ('_air_temperature', '_wind_speed', '_wci', '_wci_category',
+                 '_wct', '_wct_category', '_air_temperature_coll', '_wind_speed_coll',
+                 '_wci_coll', '_wci_category_coll', '_wct_coll', '_wct_category_coll',
+                 '_category_count_dict', '_wct_count_dict')
+
+    def __init__(self, air_temperature, wind_speed, check_alignment=True):
+        """Initialize a Wind Chill object from DataCollections of inputs."""
+        # set up the object using air temperature as a base
+        self._check_datacoll(air_temperature, Temperature, 'C', 'air_temperature')
+        self._input_collections = [air_temperature]
+        self._calc_length = len(air_temperature)
+        self._base_collection = air_temperature
+
+        # check required inputs
+        self._air_temperature = air_temperature.values
+        self._wind_speed = self._check_input(wind_speed, Speed, 'm/s', 'wind_speed')
+        if check_alignment:
+            self._check_aligned()
+
+        # compute the wind chill index for all values at once
+        self._wci = windchill_index_batch(self._air_temperature, self._wind_speed)
+        self._wci_category = windchill_index_effect_category_batch(self._wci)
+
+    @classmethod
+    def from_epw(cls, epw):
+        """Get a Wind Chill object from the conditions within an EPW file.
+
+        Args:
+            epw: A ladybug EPW object from which the WindChill object will be created.
+
+        Usage:
+
+        .. code-block:: python
+
+            from ladybug.epw import EPW
+            from ladybug_comfort.collection.wc import WindChill
+
+            epw = EPW('./tests/epw/chicago.epw')
+            wc_obj = WindChill.from_epw(epw)
+            print(wc_obj.percent_cold)  # percent of time that wind chill is cold
+        """
+        return cls(epw.dry_bulb_temperature, epw.wind_speed)
+
+    @property
+    def air_temperature(self):
+        """Data Collection of air temperature values in degrees C."""
+        return self._get_coll('_air_temperature_coll', self._air_temperature,
+                              AirTemperature, 'C')
+
+    @property
+    def wind_speed(self):
+        """Data Collection of wind speed values in m/s."""
+        return self._get_coll('_wind_speed_coll', self._wind_speed,
+                              WindSpeed, 'm/s')
+
+    @property
+    def windchill_index(self):
+        """Data Collection of Wind Chill Index (WCI) values in W/m2."""
+        return self._get_coll('_wci_coll', self._wci,
+                              EnergyFlux('Wind Chill Index'), 'W/m2')
+
+    @property
+    def windchill_index_category(self):
+        """Data Collection of integers noting the WCI effect category.
+
+        Values are one of the following:
+
+        * -4 = Extreme frost
+        * -3 = Frosty
+        * -2 = Cold
+        * -1 = Cool
+        * 0 = Comfortable
+        * 1 = Warm
+        * 2 = Hot
+        * 3 = Extremely hot
+        """
+        return self._get_coll('_wci_category_coll', self._wci_category,
+                              self._wci_category_type, 'condition')
+
+    @property
+    def windchill_temperature(self):
+        """Data Collection of Wind Chill Temperature (WCT) values in degrees C."""
+        return self._get_coll('_wct_coll', self._wct_values,
+                              Temperature('Wind Chill Temperature'), 'C')
+
+    @property
+    def windchill_temperature_category(self):
+        """Data Collection of integers noting the WCT effect category.
+
+        Values are one of the following:
+
+        * 0 = No discomfort
+        * -1 = Slight increase in discomfort
+        * -2 = Risk of hypothermia
+        * -3 = Increasing risk of frostbite in 10 to 30 minutes of exposure
+        * -4 = High risk of frostbite in 5 to 10 minutes of exposure
+        * -5 = High risk of frostbite in 2 to 5 minutes of exposure
+        * -6 = Danger! High risk of frostbite in 2 minutes of exposure or less
+        """
+        return self._get_coll('_wct_category_coll', self._wct_categories,
+                              self._wct_category_type, 'condition')
+
+    @property
+    def percent_neutral(self):
+        """The percent of time that the WCI effect category is comfortable."""
+        return self._percent_of(self._category_count(), (0,))
+
+    @property
+    def percent_hot(self):
+        """The percent of time that the WCI effect category is warm or hotter."""
+        return self._percent_of(self._category_count(), (1, 2, 3))
+
+    @property
+    def percent_cold(self):
+        """The percent of time that the WCI effect category is cool or colder."""
+        return self._percent_of(self._category_count(), (-4, -3, -2, -1))
+
+    @property
+    def percent_hypothermia_risk(self):
+        """The percent of time that the WCT notes a risk of hypothermia."""
+        counts = self._count_values(
+            '_wct_count_dict', self._wct_categories(), range(-6, 1))
+        return self._percent_of(counts, (-6, -5, -4, -3, -2))
+
+    def category_counts(self):
+        """Get a dictionary with the number of values in each WCI effect category.
+
+        Keys are the integers of windchill_index_category (from -4 to 3) and
+        values are the number of time steps that fall into each category.
+        """
+        return dict(self._category_count())
+
+    def _category_count(self):
+        return self._count_values('_category_count_dict', self._wci_category,
+                                  range(-4, 4))
+
+    def _wct_values(self):
+        if not hasattr(self, '_wct'):
+            self._wct = windchill_temp_batch(self._air_temperature, self._wind_speed)
+        return self._wct
+
+    def _wct_categories(self):
+        if not hasattr(self, '_wct_category'):
+            self._wct_category = windchill_temp_effect_category_batch(
+                self._wct_values())
+        return self._wct_category
@@ -1,5 +1,11 @@
 # coding=utf-8
 """Utility function for calculating Discomfort Index (DI)."""
+from ._categorize import categorize
+
+try:
+    from itertools import izip as zip  # python 2
+except ImportError:
+    pass
 
 
 def discomfort_index(ta, rh):
@@ -26,6 +32,22 @@ def discomfort_index(ta, rh):
     return di
 
 
+def discomfort_index_batch(ta, rh):
+    """Calculate discomfort index (DI) for lists of air temperature and relative
+    humidity.
+
+    This is equivalent to calling discomfort_index() for each pair of values.
+
+    Args:
+        ta: A list of air temperatures [C]
+        rh: A list of relative humidity values [%] that align with ta.
+
+    Returns:
+        di -- A list of Discomfort index values [C]
+    """
+    return [t - (0.55 - 0.0055 * r) * (t - 14.5) for t, r in zip(ta, rh)]
+
+
 def discomfort_index_effect_category(di):
     """Get the category of effect associated with a given discomfort index
     (DI).
@@ -84,3 +106,19 @@ def discomfort_index_effect_category(di):
         category = -6
 
     return category
+
+
+def discomfort_index_effect_category_batch(di):
+    """Get the categories of effect associated with a list of discomfort index
+    (DI) values.
+
+    This is equivalent to calling discomfort_index_effect_category() for each value.
+
+    Args:
+        di: A list of Discomfort Index values [C]
+
+    Returns:
+        category -- A list of integers from -6 (Hyper-glacial) to 3 (Torrid).
+    """
+    return categorize(di, (-40, -20, -10, -1.8, 13, 15, 20, 26.5, 30), (),
+                      range(-6, 4))
@@ -0,0 +1,326 @@
+# coding=utf-8
+"""Object for evaluating several comfort models with the conditions of one EPW."""
+from __future__ import division
+
+from .adaptive import t_operative
+from .collection.solarcal import OutdoorSolarCal
+from .collection.utci import UTCI
+from .collection.pmv import PMV
+from .collection.adaptive import Adaptive
+from .collection.hi import HeatIndex
+from .collection.humidex import Humidex
+from .collection.wc import WindChill
+from .collection.at import ApparentTemperature
+from .collection.di import DiscomfortIndex
+from .collection.ts import ThermalSensation
+from .collection.asv import ActualSensationVote
+
+from ladybug.datatype.temperature import OperativeTemperature
+
+try:
+    from itertools import izip as zip  # python 2
+except ImportError:
+    pass
+
+
+class EPWComfort(object):
+    """Several outdoor comfort models evaluated with the conditions of one EPW file.
+
+    The EPW columns are extracted once and the mean radiant temperature (MRT) is
+    computed with a single OutdoorSolarCal calculation, which is shared by all
+    of the comfort models that use it. This avoids repeating the sun position
+    and SolarCal calculations for every model, which is the most expensive
+    part of getting several comfort objects with their from_epw methods.
+    Each comfort model is only computed the first time that its property is
+    requested and the inputs of the models are the same as those of the
+    from_epw methods of the comfort collections.
+
+    Args:
+        epw: A ladybug EPW object from which the comfort models will be evaluated.
+        include_wind: Set to True to include the EPW wind speed in the models.
+            Setting to False will assume a condition that is shielded from wind
+            where the human experiences a very low wind speed of 0.1 m/s. For
+            the PMV and Adaptive models, the wind speed at ground level is assumed
+            to be 2/3 times the meteorological wind speed in the EPW. Default: True.
+        include_sun: Set to True to include the MRT delta from shortwave solar
+            and longwave sky exchange in the models that use MRT as well as
+            the global horizontal radiation in the models that use solar radiation.
+            Setting to False will assume a shaded condition with MRT being equal
+            to the EPW dry bulb temperature. Default: True.
+        solarcal_body_parameter: Optional SolarCalParameter object to account
+            for properties of the human geometry in the MRT calculation.
+        utci_parameter: Optional UTCIParameter object for the UTCI model.
+        pmv_parameter: Optional PMVParameter object for the PMV model.
+        adaptive_parameter: Optional AdaptiveParameter object for the Adaptive model.
+        cache_folder: Optional path to a folder where the results of the
+            OutdoorSolarCal, UTCI and PMV calculations will be cached on disk.
+            If None, nothing is written to disk.
+
+    Properties:
+        * epw
+        * include_wind
+        * include_sun
+        * air_temperature
+        * rel_humidity
+        * wind_speed
+        * mean_radiant_temperature
+        * operative_temperature
+        * solarcal
+        * utci
+        * pmv
+        * adaptive
+        * heat_index
+        * humidex
+        * wind_chill
+        * apparent_temperature
+        * discomfort_index
+        * thermal_sensation
+        * actual_sensation_vote
+
+    Usage:
+
+    .. code-block:: python
+
+        from ladybug.epw import EPW
+        from ladybug_comfort.epw import EPWComfort
+
+        epw = EPW('./tests/epw/chicago.epw')
+        epw_comfort = EPWComfort(epw)
+        print(epw_comfort.utci.percent_neutral)  # only UTCI and MRT are computed
+        print(epw_comfort.pmv.percent_neutral)  # PMV reuses the same MRT
+        report = epw_comfort.summary(('utci', 'pmv', 'heat_index'))
+    """
+    MODELS = ('utci', 'pmv', 'adaptive', 'heat_index', 'humidex', 'wind_chill',
+              'apparent_temperature', 'discomfort_index', 'thermal_sensation',
+              'actual_sensation_vote')
+    __slots__ = ('_epw', '_include_wind', '_include_sun', '_body_par',
+                 '_utci_par', '_pmv_par', '_adaptive_par', '_cache_folder',
+                 '_air_temperature', '_rel_humidity', '_wind_speed', '_ground_wind',
+                 '_solarcal', '_mrt', '_operative', '_utci', '_pmv', '_adaptive',
+                 '_heat_index', '_humidex', '_wind_chill', '_apparent_temperature',
+                 '_discomfort_index', '_thermal_sensation', '_actual_sensation_vote')
+
+    def __init__(self, epw, include_wind=True, include_sun=True,
+                 solarcal_body_parameter=None, utci_parameter=None,
+                 pmv_parameter=None, adaptive_parameter=None, cache_folder=None):
+        """Initialize EPWComfort."""
+        self._epw = epw
+        self._include_wind = bool(include_wind)
+        self._include_sun = bool(include_sun)
+        self._body_par = solarcal_body_parameter
+        self._utci_par = utci_parameter
+        self._pmv_par = pmv_parameter
+        self._adaptive_par = adaptive_parameter
+        self._cache_folder = cache_folder
+
+        # extract the EPW columns that are shared by all of the models
+        self._air_temperature = epw.dry_bulb_temperature
+        self._rel_humidity = epw.relative_humidity
+        if self._include_wind:
+            self._wind_speed = epw.wind_speed
+            self._ground_wind = [spd * (2 / 3) for spd in self._wind_speed.values]
+        else:
+            self._wind_speed = self._ground_wind = 0.1
+
+    @property
+    def epw(self):
+        """The ladybug EPW object from which the comfort models are evaluated."""
+        return self._epw
+
+    @property
+    def include_wind(self):
+        """Boolean to note whether the EPW wind speed is included in the models."""
+        return self._include_wind
+
+    @property
+    def include_sun(self):
+        """Boolean to note whether the sun is included in the models."""
+        return self._include_sun
+
+    @property
+    def air_temperature(self):
+        """Data Collection of the EPW dry bulb temperature in C."""
+        return self._air_temperature
+
+    @property
+    def rel_humidity(self):
+        """Data Collection of the EPW relative humidity in %."""
+        return self._rel_humidity
+
+    @property
+    def wind_speed(self):
+        """Data Collection of the EPW wind speed in m/s or 0.1 if include_wind is False.
+        """
+        return self._wind_speed
+
+    @property
+    def solarcal(self):
+        """The OutdoorSolarCal object used to compute the MRT.
+
+        This is None when include_sun is False.
+        """
+        if not self._include_sun:
+            return None
+        if not hasattr(self, '_solarcal'):
+            self._solarcal = OutdoorSolarCal.from_epw(
+                self._epw, solarcal_body_parameter=self._body_par,
+                cache_folder=self._cache_folder)
+        return self._solarcal
+
+    @property
+    def mean_radiant_temperature(self):
+        """Data Collection of the mean radiant temperature shared by all models in C.
+        """
+        if not hasattr(self, '_mrt'):
+            self._mrt = self.solarcal.mean_radiant_temperature if self._include_sun \
+                else self._air_temperature
+        return self._mrt
+
+    @property
+    def operative_temperature(self):
+        """Data Collection of operative temperature in C used by the Adaptive model.
+        """
+        if not hasattr(self, '_operative'):
+            op_temps = [t_operative(ta, tr) for ta, tr in zip(
+                self._air_temperature.values, self.mean_radiant_temperature.values)]
+            self._operative = self._air_temperature.get_aligned_collection(
+                op_temps, OperativeTemperature(), 'C', mutable=False)
+        return self._operative
+
+    @property
+    def utci(self):
+        """A UTCI comfort object evaluated with the shared inputs."""
+        if not hasattr(self, '_utci'):
+            self._utci = UTCI(
+                self._air_temperature, self._rel_humidity,
+                self.mean_radiant_temperature, self._wind_speed, self._utci_par,
+                self._cache_folder)
+        return self._utci
+
+    @property
+    def pmv(self):
+        """A PMV comfort object evaluated with the shared inputs.
+
+        The metabolic rate is 2.4 met (walking at 1 m/s), the clothing is 0.7 clo
+        and the air speed is the wind speed at ground level, which are the same
+        assumptions as PMV.from_epw.
+        """
+        if not hasattr(self, '_pmv'):
+            self._pmv = PMV(
+                self._air_temperature, self._rel_humidity,
+                self.mean_radiant_temperature, self._ground_wind, 2.4,
+                comfort_parameter=self._pmv_par, cache_folder=self._cache_folder)
+        return self._pmv
+
+    @property
+    def adaptive(self):
+        """An Adaptive comfort object evaluated with the shared inputs.
+
+        The operative temperature is the average of the air temperature and
+        the MRT and the air speed is the wind speed at ground level.
+        """
+        if not hasattr(self, '_adaptive'):
+            self._adaptive = Adaptive(
+                self._air_temperature, self.operative_temperature,
+                self._ground_wind, self._adaptive_par)
+        return self._adaptive
+
+    @property
+    def heat_index(self):
+        """A HeatIndex object evaluated with the shared inputs."""
+        if not hasattr(self, '_heat_index'):
+            self._heat_index = HeatIndex(self._air_temperature, self._rel_humidity)
+        return self._heat_index
+
+    @property
+    def humidex(self):
+        """A Humidex object evaluated with the shared inputs."""
+        if not hasattr(self, '_humidex'):
+            self._humidex = Humidex(
+                self._air_temperature, self._epw.dew_point_temperature)
+        return self._humidex
+
+    @property
+    def wind_chill(self):
+        """A WindChill object evaluated with the shared inputs."""
+        if not hasattr(self, '_wind_chill'):
+            self._wind_chill = WindChill(self._air_temperature, self._wind_speed)
+        return self._wind_chill
+
+    @property
+    def apparent_temperature(self):
+        """An ApparentTemperature object evaluated with the shared inputs."""
+        if not hasattr(self, '_apparent_temperature'):
+            self._apparent_temperature = ApparentTemperature(
+                self._air_temperature, self._rel_humidity, self._wind_speed)
+        return self._apparent_temperature
+
+    @property
+    def discomfort_index(self):
+        """A DiscomfortIndex object evaluated with the shared inputs."""
+        if not hasattr(self, '_discomfort_index'):
+            self._discomfort_index = DiscomfortIndex(
+                self._air_temperature, self._rel_humidity)
+        return self._discomfort_index
+
+    @property
+    def thermal_sensation(self):
+        """A ThermalSensation object evaluated with the shared inputs."""
+        if not hasattr(self, '_thermal_sensation'):
+            self._thermal_sensation = ThermalSensation(
+                self._air_temperature, self._wind_speed, self._rel_humidity,
+                self._solar_radiation())
+        return self._thermal_sensation
+
+    @property
+    def actual_sensation_vote(self):
+        """An ActualSensationVote object evaluated with the shared inputs."""
+        if not hasattr(self, '_actual_sensation_vote'):
+            self._actual_sensation_vote = ActualSensationVote(
+                self._air_temperature, self._wind_speed, self._rel_humidity,
+                self._solar_radiation())
+        return self._actual_sensation_vote
+
+    def comfort_objects(self, models=None):
+        """Get a dictionary of comfort objects for a set of models.
+
+        Args:
+            models: A list of model names from the MODELS of this class
+                (eg. ['utci', 'pmv', 'heat_index']). If None, all models
+                will be evaluated.
+
+        Returns:
+            A dictionary with the model names as keys and the comfort collection
+            objects as values.
+        """
+        models = self.MODELS if models is None else models
+        for model in models:
+            assert model in self.MODELS, 'Comfort model "{}" is not recognized. ' \
+                'Choose from: {}.'.format(model, ', '.join(self.MODELS))
+        return dict((model, getattr(self, model)) for model in models)
+
+    def summary(self, models=None):
+        """Get a dictionary with all of the percent statistics for a set of models.
+
+        Args:
+            models: A list of model names from the MODELS of this class. If None,
+                all models will be evaluated.
+
+        Returns:
+            A dictionary with the model names as keys and the summary dictionary
+            of each comfort collection object as values.
+        """
+        return dict((model, obj.summary())
+                    for model, obj in self.comfort_objects(models).items())
+
+    def _solar_radiation(self):
+        """Get the solar radiation input of the ThermalSensation and ASV models."""
+        return self._epw.global_horizontal_radiation if self._include_sun else 0
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """EPWComfort representation."""
+        return 'EPW Comfort: {}'.format(self._epw.location.city)
@@ -2,8 +2,15 @@
 """Utility functions for calculating Heat Index (HI)."""
 from __future__ import division
 
+from ._categorize import categorize
+
 import math
 
+try:
+    from itertools import izip as zip  # python 2
+except ImportError:
+    pass
+
 
 def heat_index(ta, rh):
     """Calculate heat index (HI) from air temperature and relative humidity.
@@ -56,6 +63,43 @@ def heat_index(ta, rh):
     return hi
 
 
+def heat_index_batch(ta, rh):
+    """Calculate heat index (HI) for lists of air temperature and relative humidity.
+
+    This gives the same results as calling heat_index() for each pair of values
+    but avoids the overhead of a function call for each value.
+
+    Args:
+        ta: A list of air temperatures [C]
+        rh: A list of relative humidity values [%] that align with ta.
+
+    Returns:
+        hi -- A list of heat index values [C]
+    """
+    sqrt = math.sqrt
+    hi_values = []
+    add_value = hi_values.append
+    for t, r in zip(ta, rh):  # same operations as heat_index for identical results
+        tf = t * 9. / 5. + 32.  # convert to fahrenheit
+        if tf < 80:
+            hif = 0.5 * (tf + 61.0 + ((tf - 68.0) * 1.2) + (r * 0.094))
+        else:
+            hif = -42.379 + 2.04901523 * tf + \
+                10.14333127 * r - \
+                0.22475541 * tf * r - \
+                6.83783e-3 * tf ** 2 - \
+                5.481717e-2 * r ** 2 + \
+                1.22874e-3 * tf ** 2 * r + \
+                8.5282e-4 * tf * r ** 2 - \
+                1.99e-6 * tf ** 2 * r ** 2
+            if tf <= 112 and r < 13:
+                hif = hif - ((13. - r) / 4.) * sqrt((17. - abs(tf - 95.)) / 17.)
+            elif tf <= 87 and r > 85:
+                hif = hif + ((r - 85) / 10) * ((87 - tf) / 5)
+        add_value((hif - 32.) * 5. / 9.)  # convert to celsius
+    return hi_values
+
+
 def heat_index_warning_category(hi):
     """Get the category of warning associated with a given heat index (HI).
 
@@ -96,3 +140,17 @@ def heat_index_warning_category(hi):
         category = 4
 
     return category
+
+
+def heat_index_warning_category_batch(hi):
+    """Get the warning categories associated with a list of heat index (HI) values.
+
+    This is equivalent to calling heat_index_warning_category() for each value.
+
+    Args:
+        hi: A list of heat index values [C]
+
+    Returns:
+        category -- A list of integers from 0 (No Warning) to 4 (Extreme Danger).
+    """
+    return categorize(hi, (26.6, 32.2, 40.5, 54.4), (), (0, 1, 2, 3, 4))
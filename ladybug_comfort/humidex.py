@@ -2,8 +2,15 @@
 """Utility functions for calculating the Humidex."""
 from __future__ import division
 
+from ._categorize import categorize
+
 import math
 
+try:
+    from itertools import izip as zip  # python 2
+except ImportError:
+    pass
+
 
 def humidex(ta, tdp):
     """Calculate Humidex from air temperature and the Dew Point.
@@ -46,6 +53,28 @@ def humidex(ta, tdp):
     return humidex_value
 
 
+def humidex_batch(ta, tdp):
+    """Calculate Humidex for lists of air temperature and the Dew Point.
+
+    This is equivalent to calling humidex() for each pair of values but avoids
+    the overhead of a function call for each value.
+
+    Args:
+        ta: A list of air temperatures [C]
+        tdp: A list of Dew Point temperatures [C] that align with ta.
+
+    Returns:
+        list -- Humidex values
+    """
+    exp = math.exp
+    inv_freeze = 1 / 273.15
+    humidex_values = []
+    for t, d in zip(ta, tdp):
+        e = 6.11 * exp(5417.7530 * (inv_freeze - (1 / (d + 273.15))))
+        humidex_values.append(float(t + 0.5555 * (e - 10.0)))
+    return humidex_values
+
+
 def humidex_degree_of_comfort(humidex):
     """Get the degree of comfort associated with a given Humidex value.
 
@@ -77,3 +106,17 @@ weather-hazards/warm-season-weather-hazards.html#toc7
     elif 40.0 <= humidex < 46.0:
         return 3
     return 4
+
+
+def humidex_degree_of_comfort_batch(humidex):
+    """Get the degrees of comfort associated with a list of Humidex values.
+
+    This is equivalent to calling humidex_degree_of_comfort() for each value.
+
+    Args:
+        humidex: A list of Humidex values.
+
+    Returns:
+        list -- Integers for the Degree of Comfort from 0 to 4.
+    """
+    return categorize(humidex, (20.0, 30.0, 40.0, 46.0), (), (0, 1, 2, 3, 4))
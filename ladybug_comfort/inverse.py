@@ -0,0 +1,213 @@
+# coding=utf-8
+"""Closed-form inverses of the PPD and adaptive comfort relations.
+
+The PPD equation of the PMV model is a quadratic in the square of PMV and the
+neutral temperatures and offsets of the adaptive models are linear, so these
+relations can be inverted exactly without any iterative root finding. The
+functions with a _batch suffix evaluate lists of values at once.
+"""
+from __future__ import division
+
+import math
+
+# coefficients of the PPD equation: PPD = 100 - 95 * exp(-A * PMV^4 - B * PMV^2)
+_PPD_A = 0.03353
+_PPD_B = 0.2179
+
+
+def pmv_limit_from_ppd(ppd):
+    """Get the positive PMV at which the PPD equals a given value.
+
+    The two PMV values that produce the PPD are this value and its negative.
+
+    Args:
+        ppd: The percentage of people dissatisfied (PPD) [%]. Must be greater
+            than or equal to 5 and less than 100.
+
+    Returns:
+        pmv_limit -- The positive predicted mean vote (PMV) that produces the PPD.
+    """
+    assert 5 <= ppd < 100, \
+        'PPD value {}% is outside acceptable limits of the PMV model.'.format(ppd)
+    # solve A * x^2 + B * x + ln((100 - PPD) / 95) = 0 for x = PMV^2, using the
+    # form of the quadratic formula that is stable when the constant term is small
+    c = math.log((100. - ppd) / 95.)
+    x = -2. * c / (_PPD_B + math.sqrt(_PPD_B * _PPD_B - 4. * _PPD_A * c))
+    return math.sqrt(x)
+
+
+def pmv_limit_from_ppd_batch(ppd):
+    """Get a list of positive PMV values at which the PPD equals a list of values.
+
+    This is equivalent to calling pmv_limit_from_ppd() for each value but avoids
+    the overhead of a function call for each value.
+
+    Args:
+        ppd: A list of percentage of people dissatisfied (PPD) values [%]. All
+            values must be greater than or equal to 5 and less than 100.
+
+    Returns:
+        pmv_limit -- A list of the positive PMV values that produce each PPD.
+    """
+    log, sqrt = math.log, math.sqrt
+    b_2, a_4 = _PPD_B * _PPD_B, 4. * _PPD_A
+    pmv_limits = []
+    for val in ppd:
+        assert 5 <= val < 100, \
+            'PPD value {}% is outside acceptable limits of the PMV model.'.format(val)
+        c = log((100. - val) / 95.)
+        pmv_limits.append(sqrt(-2. * c / (_PPD_B + sqrt(b_2 - a_4 * c))))
+    return pmv_limits
+
+
+def ashrae55_ppd_from_neutral_offset(offset):
+    """Get the ASHRAE-55 PPD limit that corresponds to an offset from neutral.
+
+    This is the inverse of the ashrae55_neutral_offset_from_ppd function of the
+    adaptive module.
+
+    Args:
+        offset: The acceptable temperature offset from neutral temperature [C].
+
+    Returns:
+        ppd -- The acceptable limit of Percentage of People Dissatisfied (PPD).
+    """
+    ppd = (11.5 - offset) * 10.
+    assert 0 <= ppd <= 100, 'offset must be between -8.5 and 11.5. ' \
+        'Got {}'.format(offset)
+    return ppd
+
+
+def neutral_temperature_line(conditioning=0, model='ASHRAE-55'):
+    """Get the coefficients of the linear adaptive neutral temperature function.
+
+    The neutral temperature is slope * t_prevail + intercept where t_prevail
+    is clamped between the minimum and maximum prevailing temperature, which
+    matches the adaptive_comfort functions of the adaptive module.
+
+    Args:
+        conditioning: A number between 0 and 1 that represents how "conditioned" vs.
+            "free-running" the building is. (Default: 0).
+
+            * 0 = free-running (completely passive with no air conditioning)
+            * 1 = conditioned (no operable windows and fully air conditioned)
+
+        model: The comfort standard, which will be used to represent the "free-running"
+            function. Chose from: 'EN-15251', 'ASHRAE-55'. (Default: 'ASHRAE-55').
+
+    Returns:
+        A tuple with four elements
+
+        -   slope: The increase in neutral temperature per degree of
+            prevailing outdoor temperature.
+        -   intercept: The neutral temperature at a prevailing outdoor
+            temperature of 0 C [C].
+        -   prevail_min: The prevailing outdoor temperature below which the
+            neutral temperature is constant [C].
+        -   prevail_max: The prevailing outdoor temperature above which the
+            neutral temperature is constant [C].
+    """
+    if model == 'ASHRAE-55':
+        slope, intercept, prevail_max = 0.31, 17.8, 33.5
+    elif model == 'EN-15251':
+        slope, intercept, prevail_max = 0.33, 18.8, 30.
+    else:
+        raise ValueError('Adaptive comfort model type {} not recognized. '
+                         'Choose: EN-15251 or ASHRAE-55'.format(model))
+    if conditioning != 0:
+        inv_conditioning = 1 - conditioning
+        slope = 0.09 * conditioning + slope * inv_conditioning
+        intercept = 22.6 * conditioning + intercept * inv_conditioning
+        prevail_max = 30.
+    return slope, intercept, 10., prevail_max
+
+
+def adaptive_comfort_bounds_batch(t_prevail, neutral_offset, conditioning=0,
+                                  model='ASHRAE-55'):
+    """Get the operative temperature limits of the adaptive comfort band.
+
+    Args:
+        t_prevail: A list of prevailing outdoor temperatures [C].
+        neutral_offset: The number of degrees Celsius from the neutral temperature
+            where the input operative temperature is considered acceptable.
+        conditioning: A number between 0 and 1 that represents how "conditioned" vs.
+            "free-running" the building is. (Default: 0).
+        model: The comfort standard. Chose from: 'EN-15251', 'ASHRAE-55'.
+            (Default: 'ASHRAE-55').
+
+    Returns:
+        A tuple with two elements
+
+        -   lower: A list of the operative temperatures below which conditions
+            are too cold for each prevailing temperature [C].
+        -   upper: A list of the operative temperatures above which conditions
+            are too hot for each prevailing temperature [C].
+    """
+    slope, intercept, prevail_min, prevail_max = \
+        neutral_temperature_line(conditioning, model)
+    lower, upper = [], []
+    for t_p in t_prevail:
+        if t_p < prevail_min:
+            t_p = prevail_min
+        elif t_p > prevail_max:
+            t_p = prevail_max
+        t_comf = slope * t_p + intercept
+        lower.append(t_comf - neutral_offset)
+        upper.append(t_comf + neutral_offset)
+    return lower, upper
+
+
+def prevailing_temperature_from_neutral_batch(t_comf, conditioning=0,
+                                              model='ASHRAE-55'):
+    """Get the prevailing outdoor temperatures that produce neutral temperatures.
+
+    Note that the clamping of the prevailing temperature by the adaptive models
+    is not applied, such that the result can be outside of the range of
+    prevailing temperatures of the model (see neutral_temperature_line).
+
+    Args:
+        t_comf: A list of adaptive neutral temperatures [C].
+        conditioning: A number between 0 and 1 that represents how "conditioned" vs.
+            "free-running" the building is. (Default: 0).
+        model: The comfort standard. Chose from: 'EN-15251', 'ASHRAE-55'.
+            (Default: 'ASHRAE-55').
+
+    Returns:
+        t_prevail -- A list of prevailing outdoor temperatures [C].
+    """
+    slope, intercept = neutral_temperature_line(conditioning, model)[:2]
+    return [(t_c - intercept) / slope for t_c in t_comf]
+
+
+def comfortable_prevailing_range_batch(to, neutral_offset, conditioning=0,
+                                       model='ASHRAE-55'):
+    """Get the prevailing temperatures at which operative temperatures are comfortable.
+
+    This is the inverse of the adaptive comfort band and it is useful for finding
+    the times of year at which a given indoor temperature is acceptable. Note
+    that the clamping of the prevailing temperature by the adaptive models
+    is not applied.
+
+    Args:
+        to: A list of operative temperatures [C].
+        neutral_offset: The number of degrees Celsius from the neutral temperature
+            where the input operative temperature is considered acceptable.
+        conditioning: A number between 0 and 1 that represents how "conditioned" vs.
+            "free-running" the building is. (Default: 0).
+        model: The comfort standard. Chose from: 'EN-15251', 'ASHRAE-55'.
+            (Default: 'ASHRAE-55').
+
+    Returns:
+        A tuple with two elements
+
+        -   prevail_low: A list of the prevailing outdoor temperatures below which
+            each operative temperature is too hot [C].
+        -   prevail_high: A list of the prevailing outdoor temperatures above which
+            each operative temperature is too cold [C].
+    """
+    slope, intercept = neutral_temperature_line(conditioning, model)[:2]
+    prevail_low, prevail_high = [], []
+    for t_o in to:
+        prevail_low.append((t_o - neutral_offset - intercept) / slope)
+        prevail_high.append((t_o + neutral_offset - intercept) / slope)
+    return prevail_low, prevail_high
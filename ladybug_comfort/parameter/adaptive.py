@@ -6,6 +6,11 @@ from ._base import ComfortParameter
 from ..adaptive import neutral_temperature_conditioned, \
     ashrae55_neutral_offset_from_ppd, en15251_neutral_offset_from_comfort_class
 
+try:
+    from itertools import izip as zip  # python 2
+except ImportError:
+    pass
+
 
 class AdaptiveParameter(ComfortParameter):
     """Parameters of Adaptive comfort.
@@ -229,6 +234,51 @@ class AdaptiveParameter(ComfortParameter):
         else:
             return 0
 
+    def is_comfortable_batch(self, operative_temperatures, degrees_from_neutral,
+                             cooling_effects=None):
+        """Determine if lists of adaptive comfort results are comfortable or not.
+
+        This is equivalent to calling is_comfortable() for each result but it
+        accepts lists of numbers in place of comfort result dictionaries.
+
+        Args:
+            operative_temperatures: A list of operative temperatures in C.
+            degrees_from_neutral: A list of the degrees that each operative
+                temperature is from the neutral temperature.
+            cooling_effects: An optional list of cooling effects from elevated
+                air speed. If None, the cooling effect will be zero.
+        """
+        min_op, offset = self._min_operative, self.neutral_offset
+        if cooling_effects is None:
+            return [1 if to >= min_op and -offset <= deg <= offset else 0
+                    for to, deg in zip(operative_temperatures, degrees_from_neutral)]
+        return [1 if to >= min_op and -offset <= deg <= offset + ce else 0
+                for to, deg, ce in zip(
+                    operative_temperatures, degrees_from_neutral, cooling_effects)]
+
+    def thermal_condition_batch(self, operative_temperatures, degrees_from_neutral,
+                                cooling_effects=None, is_comfortable=None):
+        """Determine whether lists of adaptive comfort results are cold, neutral or hot.
+
+        This is equivalent to calling thermal_condition() for each result but it
+        accepts lists of numbers in place of comfort result dictionaries.
+
+        Args:
+            operative_temperatures: A list of operative temperatures in C.
+            degrees_from_neutral: A list of the degrees that each operative
+                temperature is from the neutral temperature.
+            cooling_effects: An optional list of cooling effects from elevated
+                air speed. If None, the cooling effect will be zero.
+            is_comfortable: An optional list of the results of is_comfortable_batch
+                for the same inputs, which avoids evaluating them again. If None,
+                they will be computed.
+        """
+        comf = self.is_comfortable_batch(
+            operative_temperatures, degrees_from_neutral, cooling_effects) \
+            if is_comfortable is None else is_comfortable
+        return [0 if c == 1 else (1 if deg > 0 else -1)
+                for c, deg in zip(comf, degrees_from_neutral)]
+
     def duplicate(self):
         """Duplicate comfort parameters."""
         return AdaptiveParameter(self.ashrae55_or_en15251, self.neutral_offset,
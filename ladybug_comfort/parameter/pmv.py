@@ -4,6 +4,12 @@ from __future__ import division
 
 from ._base import ComfortParameter
 from ..pmv import ppd_threshold_from_comfort_class
+from .._categorize import categorize
+
+try:
+    from itertools import izip as zip  # python 2
+except ImportError:
+    pass
 
 
 class PMVParameter(ComfortParameter):
@@ -146,6 +152,56 @@ class PMVParameter(ComfortParameter):
         else:
             return 0
 
+    def is_comfortable_batch(self, ppd_values, humidity_ratios=None):
+        """Determine if lists of PPD and humidity ratio values are comfortable or not.
+
+        This is equivalent to calling is_comfortable() for each value.
+
+        Args:
+            ppd_values: A list of PPD values.
+            humidity_ratios: An optional list of humidity ratios that align with
+                the ppd_values. If None, the humidity ratio is assumed to be zero
+                as it is with the is_comfortable() method.
+        """
+        thresh = self._ppd_thresh
+        if humidity_ratios is None:
+            if self.is_comfortable(thresh) == 0:  # humidity limits exclude zero
+                return [0] * len(ppd_values)
+            return [1 if ppd <= thresh else 0 for ppd in ppd_values]
+        hr_categ = categorize(humidity_ratios, (self._hr_lower,),
+                              (self._hr_upper,), (0, 1, 0))
+        return [1 if ppd <= thresh and hr_c == 1 else 0
+                for ppd, hr_c in zip(ppd_values, hr_categ)]
+
+    def thermal_condition_batch(self, pmv_values, ppd_values):
+        """Determine whether lists of PMV and PPD values are cold, neutral or hot.
+
+        This is equivalent to calling thermal_condition() for each value.
+        """
+        thresh = self._ppd_thresh
+        return [(1 if pmv > 0 else -1) if ppd >= thresh else 0
+                for pmv, ppd in zip(pmv_values, ppd_values)]
+
+    def discomfort_reason_batch(self, pmv_values, ppd_values, humidity_ratios=None):
+        """Determine the reasons why lists of PMV results are comfortable or not.
+
+        This is equivalent to calling discomfort_reason() for each value.
+
+        Args:
+            pmv_values: A list of PMV values.
+            ppd_values: A list of PPD values that align with the pmv_values.
+            humidity_ratios: An optional list of humidity ratios that align with
+                the ppd_values. If None, the humidity ratio is assumed to be zero
+                as it is with the discomfort_reason() method.
+        """
+        condits = self.thermal_condition_batch(pmv_values, ppd_values)
+        if humidity_ratios is None:
+            hr_c = self.discomfort_reason(0, 0)  # reason for a humidity ratio of zero
+            return [cond if cond != 0 else hr_c for cond in condits]
+        hr_categ = categorize(humidity_ratios, (self._hr_lower,),
+                              (self._hr_upper,), (-2, 0, 2))
+        return [cond if cond != 0 else hr_c for cond, hr_c in zip(condits, hr_categ)]
+
     def duplicate(self):
         """Duplicate these comfort parameters."""
         return PMVParameter(self.ppd_comfort_thresh, self.humid_ratio_upper,
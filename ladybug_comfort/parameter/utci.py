@@ -3,6 +3,7 @@
 from __future__ import division
 
 from ._base import ComfortParameter
+from .._categorize import categorize
 
 
 class UTCIParameter(ComfortParameter):
@@ -367,6 +368,76 @@ class UTCIParameter(ComfortParameter):
         else:
             return 5
 
+    def is_comfortable_batch(self, utci_values):
+        """Determine if a list of UTCI values are comfortable or not.
+
+        This is equivalent to calling is_comfortable() for each value but uses
+        a binary search over the thresholds to evaluate the whole list at once.
+        """
+        return categorize(utci_values, (self._cold_thresh,),
+                          (self._heat_thresh,), (0, 1, 0))
+
+    def thermal_condition_batch(self, utci_values):
+        """Determine whether a list of UTCI values are cold, neutral or hot.
+
+        This is equivalent to calling thermal_condition() for each value.
+        """
+        return categorize(utci_values, (self._cold_thresh,),
+                          (self._heat_thresh,), (-1, 0, 1))
+
+    def thermal_condition_five_point_batch(self, utci_values):
+        """Get a list of thermal conditions on a five-point scale from UTCI values.
+
+        This is equivalent to calling thermal_condition_five_point() for each value.
+        """
+        return categorize(
+            utci_values, (self._strong_cold_thresh, self._cold_thresh),
+            (self._heat_thresh, self._strong_heat_thresh), range(-2, 3))
+
+    def thermal_condition_seven_point_batch(self, utci_values):
+        """Get a list of thermal conditions on a seven-point scale from UTCI values.
+
+        This is equivalent to calling thermal_condition_seven_point() for each value.
+        """
+        return categorize(
+            utci_values,
+            (self._very_strong_cold_thresh, self._strong_cold_thresh,
+             self._cold_thresh),
+            (self._heat_thresh, self._strong_heat_thresh,
+             self._very_strong_heat_thresh), range(-3, 4))
+
+    def thermal_condition_nine_point_batch(self, utci_values):
+        """Get a list of thermal conditions on a nine-point scale from UTCI values.
+
+        This is equivalent to calling thermal_condition_nine_point() for each value.
+        """
+        return categorize(
+            utci_values,
+            (self._very_strong_cold_thresh, self._strong_cold_thresh,
+             self._moderate_cold_thresh, self._cold_thresh),
+            (self._heat_thresh, self._moderate_heat_thresh,
+             self._strong_heat_thresh, self._very_strong_heat_thresh),
+            range(-4, 5))
+
+    def thermal_condition_eleven_point_batch(self, utci_values):
+        """Get a list of thermal conditions on an eleven-point scale from UTCI values.
+
+        This is equivalent to calling thermal_condition_eleven_point() for each value.
+        """
+        return categorize(utci_values, self._low_thresholds(),
+                          self._high_thresholds(), range(-5, 6))
+
+    def original_utci_category_batch(self, utci_values):
+        """Get a list of original UTCI assessment scale categories from UTCI values.
+
+        This is equivalent to calling original_utci_category() for each value.
+        """
+        return categorize(
+            utci_values, self._low_thresholds(),
+            (self._heat_thresh, self._strong_heat_thresh,
+             self._very_strong_heat_thresh, self._extreme_heat_thresh),
+            range(10))
+
     def duplicate(self):
         """Duplicate these comfort parameters."""
         return UTCIParameter(self.cold_thresh, self.heat_thresh,
@@ -376,6 +447,18 @@ class UTCIParameter(ComfortParameter):
                              self.strong_heat_thresh,
                              self.very_strong_heat_thresh, self.extreme_heat_thresh)
 
+    def _low_thresholds(self):
+        """Get a tuple of all cold thresholds sorted from lowest to highest."""
+        return (self._extreme_cold_thresh, self._very_strong_cold_thresh,
+                self._strong_cold_thresh, self._moderate_cold_thresh,
+                self._cold_thresh)
+
+    def _high_thresholds(self):
+        """Get a tuple of all heat thresholds sorted from lowest to highest."""
+        return (self._heat_thresh, self._moderate_heat_thresh,
+                self._strong_heat_thresh, self._very_strong_heat_thresh,
+                self._extreme_heat_thresh)
+
     def __repr__(self):
         """UTCI comfort parameters representation."""
         return "UTCI Comfort Parameters\n Cold Threshold: {}C"\
@@ -1,6 +1,11 @@
 import enum
 import math
 
+from ._jit import jit
+from ._sequence import is_sequence
+from .backend import register_jit_kernel, implementation
+from .psychrometrics import PsychrometricColumns
+
 
 class BodyPosition(enum.Enum):
     """Effective radiating area of the body (1 = sitting, 2 = standing, 3 = crouching)"""
@@ -105,6 +110,88 @@ def predictedHeatStrain(
     )  # body surface area in m2
     spHeat = 57.83 * weight / body_surface_area
 
+    kernel = implementation('predictedHeatStrain') or _py_predicted_heat_strain_kernel
+    return kernel(
+        Ta, mrt, wind_speed, vapour_pressure_Pa, weight, body_surface_area, spHeat,
+        ardu, insulation, metabolic_rate, activityDuration, can_drink,
+        acclimatization, walk_speed, use_walk_speed, walk_angle, use_walk_angle,
+        reflective_clothing, reflective_clothing_emissivity, work, imst)
+
+
+def predictedHeatStrain_batch(
+    Ta, mrt, rel_humidity, wind_speed, SR, heightM, weight, body_position,
+    insulation, metabolic_rate, activityDuration, psychrometrics=None, **kwargs
+):
+    """Calculate predicted heat strain for lists of air temperature and humidity.
+
+    This is equivalent to calling predictedHeatStrain() for each item of the lists
+    but the dew point and vapour pressure inputs are taken from a
+    PsychrometricColumns object, which computes them once for the whole list
+    and can be shared with other models that use the same conditions
+    (eg. the humidity ratio of PMV).
+
+    Args:
+        Ta: A list of air temperatures in C.
+        mrt: A list of mean radiant temperatures in C or a single value to be
+            used for all of the air temperatures.
+        rel_humidity: A list of relative humidity values in % or a single value
+            to be used for all of the air temperatures.
+        wind_speed: A list of wind speeds in m/s or a single value.
+        SR: A list of solar radiation values in W/m2 or a single value.
+        heightM: Height of the subject in m.
+        weight: Weight of the subject in kg.
+        body_position: A BodyPosition of the subject.
+        insulation: Clothing insulation of the subject.
+        metabolic_rate: Metabolic rate of the subject in W.
+        activityDuration: Activity duration in minutes.
+        psychrometrics: An optional PsychrometricColumns object for the Ta and
+            rel_humidity, which can be used to share its results with other
+            calculations. If None, it will be computed from the Ta and
+            rel_humidity. (Default: None).
+        kwargs: Any of the optional keyword arguments of predictedHeatStrain
+            (eg. can_drink, walk_speed), which will be used for all items.
+
+    Returns:
+        A list with the result of predictedHeatStrain for each item of the lists,
+        which are tuples of the rectal temperature, the PHS effect and whether
+        conditions are comfortable.
+    """
+    count = len(Ta)
+
+    def _as_list(val, name):
+        if is_sequence(val):
+            assert len(val) == count, 'Length of {} ({}) does not match the ' \
+                'length of Ta ({}).'.format(name, len(val), count)
+            return val
+        return [val] * count
+
+    if psychrometrics is None:
+        psychrometrics = PsychrometricColumns(Ta, rel_humidity)
+    else:
+        assert isinstance(psychrometrics, PsychrometricColumns), 'psychrometrics ' \
+            'must be a PsychrometricColumns object. Got {}.'.format(
+                type(psychrometrics))
+        assert len(psychrometrics.air_temperature) == count, 'Length of ' \
+            'psychrometrics ({}) does not match the length of Ta ({}).'.format(
+                len(psychrometrics.air_temperature), count)
+    return [
+        predictedHeatStrain(
+            ta, tr, tdp, vel, sr, p_w / 100, heightM, weight, body_position,
+            insulation, metabolic_rate, activityDuration, **kwargs)
+        for ta, tr, tdp, vel, sr, p_w in zip(
+            Ta, _as_list(mrt, 'mrt'), psychrometrics.dew_point,
+            _as_list(wind_speed, 'wind_speed'), _as_list(SR, 'SR'),
+            psychrometrics.vapor_pressure)]
+
+
+@jit
+def _predicted_heat_strain_kernel(
+    Ta, mrt, wind_speed, vapour_pressure_Pa, weight, body_surface_area, spHeat,
+    ardu, insulation, metabolic_rate, activityDuration, can_drink,
+    acclimatization, walk_speed, use_walk_speed, walk_angle, use_walk_angle,
+    reflective_clothing, reflective_clothing_emissivity, work, imst
+):
+    """Run the minute by minute loop of predictedHeatStrain on validated inputs."""
     SWp: float = 0
     SWtot: float = 0
     temperature_rectal = 36.8
@@ -436,3 +523,7 @@ def predictedHeatStrain(
         is_comfortable = False
 
     return temperature_rectal, effectPHS, is_comfortable
+
+
+_py_predicted_heat_strain_kernel = register_jit_kernel(
+    'predictedHeatStrain', _predicted_heat_strain_kernel)
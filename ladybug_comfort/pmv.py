@@ -5,10 +5,25 @@ from __future__ import division
 from ladybug.rootfinding import secant
 from ladybug.rootfinding import bisect
 
+from .inverse import pmv_limit_from_ppd
+from ._jit import jit, check_overflow
+from .backend import register_jit_kernel, implementation
+
 import math
 
+# constants of the Pierce SET model
+# the pressure of the atmosphere in kPa was taken from the psychrometrics.js
+# file of the CBE comfort tool
+_P_ATM = (101325.0 / 1000.) * 0.009869  # pressure in atmospheres
+_LR = 2.2 / _P_ATM  # Lewis Relation is 2.2 at sea level
+_CHC_STILL = 3.0 * pow(_P_ATM, 0.53)  # convective heat transfer in still air
+_METFACTOR = 58.2
+_KCLO = 0.25
+_IMS = 0.45
+
 
-def predicted_mean_vote(ta, tr, vel, rh, met, clo, wme=0, still_air_threshold=0.1):
+def predicted_mean_vote(ta, tr, vel, rh, met, clo, wme=0, still_air_threshold=0.1,
+                        coefficients=None, ce_guess=None, set_table=None):
     """Calculate PMV using Fanger's original equation and Pierce SET model when necessary.
 
     This method is the officially corrent way to calculate PMV comfort according to.
@@ -41,6 +56,25 @@ def predicted_mean_vote(ta, tr, vel, rh, met, clo, wme=0, still_air_threshold=0.
             Standard Effective Temperature (SET) model will be used
             to correct values in the original Fanger PMV model.
             Default is 0.1 m/s per the 2015 release of ASHRAE Standard-55.
+        coefficients: Optional PierceSetCoefficients object for the input met,
+            clo and wme, which is used by all of the SET calculations of this
+            function. Passing the same object to many calls with the same met,
+            clo and wme avoids recomputing its terms. Its met, clo and wme must
+            match the inputs. If None, the terms will be computed for this call.
+        ce_guess: Optional number for an estimate of the cooling effect [C] (eg.
+            the cooling effect of the previous time step of a time series). When
+            the air velocity is above the still_air_threshold, the solution for
+            the cooling effect will start from a bracket of 2 C on either side
+            of this estimate, which typically needs fewer SET calculations than
+            the full bracket of 0 to 40 C. The solution from the estimate is
+            only used if the bracket contains a sign change and the solution
+            stays inside it. Otherwise, the full bracket is used. If None, the
+            full bracket is used.
+        set_table: Optional PierceSetTable object (from the settable module) with
+            the same met, clo and wme as the inputs. If specified, the table will
+            be used in place of the pierce_set function for all SET calculations,
+            which is several times faster but approximates SET to within about
+            the tolerance of the table. If None, the full SET model is used.
 
     Returns:
         A dictionary containing results of the PMV model with the following keys
@@ -61,7 +95,17 @@ def predicted_mean_vote(ta, tr, vel, rh, met, clo, wme=0, still_air_threshold=0.
             -   'rad': heat loss by radiation [W]
             -   'conv' heat loss by convection [W]
     """
-    se_temp = pierce_set(ta, tr, vel, rh, met, clo, wme)
+    if set_table is not None:
+        assert (set_table.met_rate, set_table.clo_value, set_table.external_work) \
+            == (met, clo, wme), 'set_table is for met {}, clo {} and wme {}. ' \
+            'Got met {}, clo {} and wme {}.'.format(
+                set_table.met_rate, set_table.clo_value, set_table.external_work,
+                met, clo, wme)
+        se_temp = set_table.set(ta, tr, vel, rh)
+    else:
+        if coefficients is None:
+            coefficients = PierceSetCoefficients(met, clo, wme)
+        se_temp = pierce_set(ta, tr, vel, rh, met, clo, wme, coefficients)
 
     if vel <= still_air_threshold:
         pmv, ppd, heat_loss = fanger_pmv(ta, tr, vel, rh, met, clo, wme)
@@ -72,14 +116,32 @@ def predicted_mean_vote(ta, tr, vel, rh, met, clo, wme=0, still_air_threshold=0.
         ce_r = 40.
         eps = 0.001  # precision of ce
 
-        def fn(ce):
-            return se_temp - pierce_set(ta - ce, tr - ce, still_air_threshold,
-                                        rh, met, clo, wme)
-
-        try:
-            ce = secant(ce_l, ce_r, fn, eps)
-        except OverflowError:
-            ce = None
+        if set_table is not None:
+            def fn(ce):
+                return se_temp - set_table.set(ta - ce, tr - ce, still_air_threshold, rh)
+        else:
+            def fn(ce):
+                return se_temp - pierce_set(ta - ce, tr - ce, still_air_threshold,
+                                            rh, met, clo, wme, coefficients)
+
+        ce = None
+        if ce_guess is not None:  # start from a narrow bracket around the guess
+            ce_g = min(max(ce_guess, ce_l), ce_r)
+            ce_a, ce_b = max(ce_g - 2., ce_l), min(ce_g + 2., ce_r)
+            known = {ce_a: fn(ce_a), ce_b: fn(ce_b)}
+            if known[ce_a] * known[ce_b] < 0:  # a sign change is in the bracket
+                try:
+                    ce = secant(ce_a, ce_b,
+                                lambda c: known[c] if c in known else fn(c), eps)
+                except (OverflowError, ZeroDivisionError):
+                    ce = None
+            if ce is not None and not ce_a <= ce <= ce_b:
+                ce = None  # the solution left the bracket; use the full bracket
+        if ce is None:
+            try:
+                ce = secant(ce_l, ce_r, fn, eps)
+            except OverflowError:
+                ce = None
         if ce is None:
             ce = bisect(ce_l, ce_r, fn, eps, 0)
 
@@ -136,7 +198,34 @@ def fanger_pmv(ta, tr, vel, rh, met, clo, wme=0):
             -   'rad': heat loss by radiation [W]
             -   'conv' heat loss by convection [W]
     """
+    kernel = implementation('fanger_pmv') or _py_fanger_pmv_kernel
+    converged, pmv, hl1, hl2, hl3, hl4, hl5, hl6 = \
+        kernel(ta, tr, vel, rh, met, clo, wme)
+    if not converged:
+        print('Max iterations exceeded')
+        return 1
+    ppd = ppd_from_pmv(check_overflow(pmv))
 
+    # collect heat loss terms.
+    heat_loss = {
+        'cond': hl1,
+        'sweat': hl2,
+        'res_l': hl3,
+        'res_s': hl4,
+        'rad': hl5,
+        'conv': hl6}
+
+    return pmv, ppd, heat_loss
+
+
+@jit
+def _fanger_pmv_kernel(ta, tr, vel, rh, met, clo, wme):
+    """Calculate the PMV and heat loss terms of fanger_pmv.
+
+    Returns:
+        A tuple with a boolean for whether the clothing temperature converged
+        followed by the PMV and the 6 heat loss terms of fanger_pmv.
+    """
     pa = rh * 10. * math.exp(16.6536 - 4030.183 / (ta + 235.))
 
     icl = 0.155 * clo  # thermal insulation of the clothing in M2K/W
@@ -174,8 +263,7 @@ def fanger_pmv(ta, tr, vel, rh, met, clo, wme=0):
         xn = (p5 + p4 * hc - p2 * (xf ** 4)) / (100. + p3 * hc)
         n += 1
         if n > 150:
-            print('Max iterations exceeded')
-            return 1
+            return False, 0., 0., 0., 0., 0., 0., 0.
 
     tcl = 100. * xn - 273.
 
@@ -197,21 +285,122 @@ def fanger_pmv(ta, tr, vel, rh, met, clo, wme=0):
 
     ts = 0.303 * math.exp(-0.036 * m) + 0.028
     pmv = ts * (mw - hl1 - hl2 - hl3 - hl4 - hl5 - hl6)
-    ppd = ppd_from_pmv(pmv)
+    return True, pmv, hl1, hl2, hl3, hl4, hl5, hl6
 
-    # collect heat loss terms.
-    heat_loss = {
-        'cond': hl1,
-        'sweat': hl2,
-        'res_l': hl3,
-        'res_s': hl4,
-        'rad': hl5,
-        'conv': hl6}
 
-    return pmv, ppd, heat_loss
+_py_fanger_pmv_kernel = register_jit_kernel('fanger_pmv', _fanger_pmv_kernel)
+
+
+class PierceSetCoefficients(object):
+    """Terms of the Pierce SET model that only depend on met, clo and external work.
+
+    Most of the clothing, metabolic and ASHRAE standard environment terms of
+    pierce_set are the same for every time step that shares the same met, clo
+    and external work. This object computes them once such that they can be
+    reused by every call to pierce_set (and predicted_mean_vote) with the same
+    met, clo and external work. The few terms that also depend on the air
+    velocity are computed for each call with the velocity_terms method.
+
+    Args:
+        met: Metabolic rate [met]
+        clo: Clothing [clo]
+        wme: External work [met], normally around 0 when seated
+
+    Properties:
+        * met
+        * clo
+        * wme
+
+    Usage:
+
+    .. code-block:: python
 
+        from ladybug_comfort.pmv import pierce_set, PierceSetCoefficients
 
-def pierce_set(ta, tr, vel, rh, met, clo, wme=0.):
+        coeffs = PierceSetCoefficients(1.1, 0.7)
+        set_values = [pierce_set(ta, ta, 0.1, 50, 1.1, 0.7, 0, coeffs)
+                      for ta in range(18, 30)]
+    """
+    __slots__ = ('_met', '_clo', '_wme', '_rcl', '_facl', '_icl', '_wcrit_factor',
+                 '_wcrit_exponent', '_rm', '_recl', '_chc_s', '_facls', '_rclos',
+                 '_rcls', '_fcls_factor', '_icls_factor', '_rea_s')
+
+    def __init__(self, met, clo, wme=0.):
+        """Initialize PierceSetCoefficients."""
+        self._met = met
+        self._clo = clo
+        self._wme = wme
+
+        # clothing and metabolic terms of the two-node model
+        self._rcl = 0.155 * clo
+        self._facl = 1.0 + 0.15 * clo  # % INCreaSE IN BODY SURFACE Area DUE TO CLOTHING
+        if clo <= 0:
+            self._wcrit_factor, self._wcrit_exponent = 0.38, -0.29
+            self._icl = 1.0
+        else:
+            self._wcrit_factor, self._wcrit_exponent = 0.59, -0.08
+            self._icl = 0.45
+        self._rm = met * _METFACTOR
+        self._recl = self._rcl / (_LR * self._icl)  # evaporative resistance of clothing
+
+        # terms of the ASHRAE standard environment... denoted "S"
+        if met < 0.85:
+            chc_s = 3.0
+        else:
+            chc_s = 5.66 * pow((met - 0.85), 0.39)
+            if chc_s < 3.0:
+                chc_s = 3.0
+        self._chc_s = chc_s
+        self._rclos = 1.52 / ((met - wme / _METFACTOR) + 0.6944) - 0.1835
+        self._rcls = 0.155 * self._rclos
+        self._facls = 1.0 + _KCLO * self._rclos
+        self._fcls_factor = 0.155 * self._facls
+        self._icls_factor = _IMS * chc_s
+        self._rea_s = 1.0 / (_LR * self._facls * chc_s)
+
+    @property
+    def met(self):
+        """Metabolic rate [met]."""
+        return self._met
+
+    @property
+    def clo(self):
+        """Clothing [clo]."""
+        return self._clo
+
+    @property
+    def wme(self):
+        """External work [met]."""
+        return self._wme
+
+    def velocity_terms(self, vel):
+        """Get a tuple of the terms that depend on the air velocity.
+
+        Args:
+            vel: Relative air velocity [m/s]
+
+        Returns:
+            A tuple with the air velocity used by the model (at least 0.1 m/s),
+            the critical skin wettedness, the convective heat transfer coefficient
+            and the evaporative resistance of the air layer.
+        """
+        air_velocity = max(vel, 0.1)
+        wcrit = self._wcrit_factor * pow(air_velocity, self._wcrit_exponent)
+        chc = max(_CHC_STILL, 8.600001 * pow((air_velocity * _P_ATM), 0.53))
+        rea = 1.0 / (_LR * self._facl * chc)  # evaporative resistance of air layer
+        return air_velocity, wcrit, chc, rea
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """PierceSetCoefficients representation."""
+        return 'Pierce SET Coefficients: [met: {}] [clo: {}] [wme: {}]'.format(
+            self._met, self._clo, self._wme)
+
+
+def pierce_set(ta, tr, vel, rh, met, clo, wme=0., coefficients=None):
     """Calculate Standard Effective Temperature (SET).
 
     This function uses the J.B. Pierce two-node model of human thermoregulation.
@@ -229,18 +418,42 @@ def pierce_set(ta, tr, vel, rh, met, clo, wme=0.):
         met: Metabolic rate [met]
         clo: Clothing [clo]
         wme: External work [met], normally around 0 when seated
+        coefficients: Optional PierceSetCoefficients object for the input met,
+            clo and wme, which can be reused across many calls to this function
+            to avoid recomputing the terms that only depend on these inputs.
+            Its met, clo and wme must match the inputs. If None, the terms
+            will be computed for this call.
 
     Returns:
         se_temp -- Standard effective temperature [C]
     """
+    if coefficients is None:
+        coefficients = PierceSetCoefficients(met, clo, wme)
+    else:
+        assert (coefficients._met, coefficients._clo, coefficients._wme) == \
+            (met, clo, wme), 'coefficients are for met {}, clo {} and wme {}. ' \
+            'Got met {}, clo {} and wme {}.'.format(
+                coefficients._met, coefficients._clo, coefficients._wme,
+                met, clo, wme)
+    air_velocity, wcrit, chc, rea = coefficients.velocity_terms(vel)
+    c = coefficients
+    kernel = implementation('pierce_set') or _py_pierce_set_kernel
+    return check_overflow(kernel(
+        ta, tr, rh, met, wme, wcrit, chc, rea, c._rcl, c._facl, c._recl, c._rm,
+        c._chc_s, c._rcls, c._rclos, c._facls, c._fcls_factor, c._icls_factor,
+        c._rea_s))
+
+
+@jit
+def _pierce_set_kernel(ta, tr, rh, met, wme, wcrit, chc, rea, rcl, facl, recl, RM,
+                       chcS, rcls, rclos, facls, fcls_factor, icls_factor, rea_s):
+    """Calculate the SET of pierce_set from the terms of PierceSetCoefficients."""
+    exp = math.exp
 
     # Key initial variables.
     vapor_pressure = (rh * saturated_vapor_pressure_torr(ta)) / 100.
-    air_velocity = max(vel, 0.1)
-    kclo = 0.25
     bodyweight = 69.9
     bodysurfacearea = 1.8258
-    metfactor = 58.2
     sbc = 0.000000056697  # Stefan-Boltzmann constant (W/m2K4)
     csw = 170.
     cdil = 120.
@@ -258,34 +471,8 @@ def pierce_set(ta, tr, vel, rh, met, clo, wme=0.):
     mshiv = 0.0
     alfa = 0.1
     esk = 0.1 * met
-
-    # Start new experiment here (for graded experiments)
-    # UNIT CONVERSIONS (from input variables)
-
-    # This variable is the pressure of the atmosphere in kPa and was taken
-    # from the psychrometrics.js file of the CBE comfort tool.
-    p = 101325.0 / 1000.
-
-    pressure_in_atmospheres = p * 0.009869
     ltime = 60
-    rcl = 0.155 * clo
-    # Adjusticl(rcl, Conditions);  TH: I don't think this is used in the software
-
-    facl = 1.0 + 0.15 * clo  # % INCreaSE IN BODY SURFACE Area DUE TO CLOTHING
-    LR = 2.2 / pressure_in_atmospheres  # Lewis Relation is 2.2 at sea level
-    RM = met * metfactor
-    M = met * metfactor
-
-    if clo <= 0:
-        wcrit = 0.38 * pow(air_velocity, -0.29)
-        icl = 1.0
-    else:
-        wcrit = 0.59 * pow(air_velocity, -0.08)
-        icl = 0.45
-
-    chc = 3.0 * pow(pressure_in_atmospheres, 0.53)
-    chcV = 8.600001 * pow((air_velocity * pressure_in_atmospheres), 0.53)
-    chc = max(chc, chcV)
+    M = RM
 
     # initial estimate of Tcl
     chr = 4.7
@@ -299,7 +486,7 @@ def pierce_set(ta, tr, vel, rh, met, clo, wme=0.):
     # Tcl and chr are solved iteratively using: H(Tsk - To) = ctc(Tcl - To),
     # where H = 1/(ra + Rcl) and ra = 1/Facl*ctc
 
-    tcl_old = False
+    tcl_old = 0.
     flag = True
     for i in range(ltime - 1):
         while abs(tcl - tcl_old) > 0.01:
@@ -339,14 +526,12 @@ def pierce_set(ta, tr, vel, rh, met, clo, wme=0.):
             skin_blood_flow = 90.0
         if skin_blood_flow < 0.5:
             skin_blood_flow = 0.5
-        regsw = csw * warmb * math.exp(warms / 10.7)
+        regsw = csw * warmb * exp(warms / 10.7)
         if regsw > 500.0:
             regsw = 500.0
         ersw = 0.68 * regsw
-        rea = 1.0 / (LR * facl * chc)  # evaporative resistance of air layer
-        recl = rcl / (LR * icl)  # evaporative resistance of clothing (icl=.45)
-        emax = (saturated_vapor_pressure_torr(
-            temp_skin) - vapor_pressure) / (rea + recl)
+        emax = (exp(18.6686 - 4030.183 / (temp_skin + 235.0)) - vapor_pressure) / \
+            (rea + recl)  # saturated_vapor_pressure_torr of the skin is inlined
         prsw = ersw / emax
         pwet = 0.06 + 0.94 * prsw
         edif = pwet * emax - ersw
@@ -370,34 +555,18 @@ def pierce_set(ta, tr, vel, rh, met, clo, wme=0.):
 
     # Define new heat flow terms, coeffs, and abbreviations
     hsk = dry + esk  # total heat loss from skin
-    RN = M - wme  # net metabolic heat production
-    ecomf = 0.42 * (RN - (1 * metfactor))
-    if ecomf < 0.0:
-        ecomf = 0.0  # from Fanger
-    emax = emax * wcrit
     W = pwet
     pssk = saturated_vapor_pressure_torr(temp_skin)
     # Definition of ASHRAE standard environment... denoted "S"
+    # (the terms that do not depend on chr are in the coefficients)
     chrS = chr
-    if met < 0.85:
-        chcS = 3.0
-    else:
-        chcS = 5.66 * pow((met - 0.85), 0.39)
-        if chcS < 3.0:
-            chcS = 3.0
-
     ctcs = chcS + chrS
-    rclos = 1.52 / ((met - wme / metfactor) + 0.6944) - 0.1835
-    rcls = 0.155 * rclos
-    facls = 1.0 + kclo * rclos
-    fcls = 1.0 / (1.0 + 0.155 * facls * ctcs * rclos)
-    ims = 0.45
-    icls = ims * chcS / ctcs * (1 - fcls) / (chcS / ctcs - fcls * ims)
+    fcls = 1.0 / (1.0 + fcls_factor * ctcs * rclos)
+    icls = icls_factor / ctcs * (1 - fcls) / (chcS / ctcs - fcls * _IMS)
     ras = 1.0 / (facls * ctcs)
-    reaS = 1.0 / (LR * facls * chcS)
-    reclS = rcls / (LR * icls)
+    reclS = rcls / (_LR * icls)
     hd_s = 1.0 / (ras + rcls)
-    he_s = 1.0 / (reaS + reclS)
+    he_s = 1.0 / (rea_s + reclS)
 
     # SET* (standardized humidity, clo, Pb, and chc)
     # determined using Newton's iterative solution
@@ -419,6 +588,10 @@ def pierce_set(ta, tr, vel, rh, met, clo, wme=0.):
     return se_temp
 
 
+_py_pierce_set_kernel = register_jit_kernel('pierce_set', _pierce_set_kernel)
+
+
+@jit
 def saturated_vapor_pressure_torr(db_temp):
     """Calculate saturated vapor pressure (Torr) at temperature (C)
 
@@ -446,10 +619,11 @@ def pmv_from_ppd(ppd, pmv_up_bound=3, ppd_tolerance=0.001):
     Args:
         ppd: The percentage of people dissatisfied (PPD) for which you want to know
             the possible PMV.
-        pmv_up_bound: The upper limit of PMV expected for the input PPD.  Putting
-            in a good estimate here will help the model converge on a
-            solution faster. Defaut = 3
-        ppd_tolerance: The acceptable error in meeting the target PPD.  Default = 0.001.
+        pmv_up_bound: This input is no longer used since the PMV is computed
+            exactly with the closed-form inverse of the PPD equation. It is
+            kept for compatibility.
+        ppd_tolerance: This input is no longer used since the PMV is computed
+            exactly. It is kept for compatibility.
 
     Returns:
         A tuple with two elements
@@ -459,15 +633,7 @@ def pmv_from_ppd(ppd, pmv_up_bound=3, ppd_tolerance=0.001):
     """
     assert ppd > 5 and ppd < 100, \
         'PPD value {}% is outside acceptable limits of the PMV model.'.format(ppd)
-
-    def fn(pmv):
-        return (100.0 - 95.0 * math.exp(
-            -0.03353 * pow(pmv, 4.) - 0.2179 * pow(pmv, 2.0))) - ppd
-
-    # Solve for the missing higher PMV value.
-    pmv_upper = secant(0, pmv_up_bound, fn, ppd_tolerance)
-    if pmv_upper is None:
-        pmv_upper = bisect(0, pmv_up_bound, fn, ppd_tolerance, 0)
+    pmv_upper = pmv_limit_from_ppd(ppd)
     pmv_lower = pmv_upper * -1
 
     return pmv_lower, pmv_upper
@@ -612,3 +778,164 @@ def calc_missing_pmv_input(target_pmv, pmv_inputs,
         for key in missing_key:
             pmv_inputs[key] = missing_val
     return pmv_inputs
+
+
+def calc_missing_pmv_input_batch(target_pmv, pmv_inputs,
+                                 low_bound=0., up_bound=100., tolerance=0.001,
+                                 still_air_threshold=0.1):
+    """Return lists of a missing_pmv_input given target_pmvs and the 6 other inputs.
+
+    This function produces the same results as calling calc_missing_pmv_input
+    for each item of the input lists but it is much faster when solving for
+    many values at once, such as when drawing comfort polygons on charts.
+    Each solution is used as the starting guess of the next one, which means
+    that most values converge in a couple of iterations when the inputs change
+    gradually from one item to the next. The full low_bound to up_bound range
+    is only searched when this warm start fails. Furthermore, the SET model is
+    skipped entirely when the air speed is at or below the still_air_threshold
+    since only Fanger's PMV is needed in this case.
+
+    Args:
+        target_pmv: A list of target PMV values that you are trying to produce
+            from the inputs to the PMV model. This can also be a single number
+            to be used for all of the pmv_inputs.
+        pmv_inputs: A dictionary of 7 pmv inputs with the following keys:
+            'ta', 'tr', 'vel', 'rh', 'met', 'clo', 'wme'. Each key should
+            correspond to either a list of values or a single value to be used
+            for all items. One of these inputs should have a value of None and
+            it will be solved for by this function. Like calc_missing_pmv_input,
+            one can also input None for both 'ta' and 'tr' to solve for the
+            operative temperature that meets the target_pmv.
+            Example (solving for relative humidity at several air temperatures):
+
+            .. code-block:: python
+
+                {'ta': [20, 22, 24], 'tr': 20, 'vel': 0.05, 'rh': None,
+                 'met': 1.2, 'clo': 0.75, 'wme': 0}
+
+        low_bound: The lowest possible value of the missing input you are tying to
+            find. Putting in a good value here will help the model converge to a
+            solution faster.
+        up_bound: The highest possible value of the missing input you are tying to
+            find. Putting in a good value here will help the model converge to a
+            solution faster.
+        tolerance: The acceptable error in the target_pmv. The default is set to 0.001
+        still_air_threshold: The air velocity in m/s at which the Pierce
+            Standard Effective Temperature (SET) model will be used
+            to correct values in the original Fanger PMV model.
+            Default is 0.1 m/s per the 2015 release of ASHRAE Standard-55.
+
+    Returns:
+        complete_pmv_inputs -- A dictionary with the same keys as the pmv_inputs
+        but with a list of values for each input. The missing input to the
+        PMV model will be filled by the values that return the target_pmv.
+    """
+    assert len(pmv_inputs.keys()) == 7, \
+        'pmv_inputs must have 7 keys. Got {}.'.format(len(pmv_inputs.keys()))
+    keys = ('ta', 'tr', 'vel', 'rh', 'met', 'clo', 'wme')
+
+    # determine the missing key and the number of values to be solved
+    if pmv_inputs['ta'] is None and pmv_inputs['tr'] is None:
+        missing_key = ('ta', 'tr')
+    else:
+        missing = [key for key in keys if pmv_inputs[key] is None]
+        assert len(missing) == 1, 'Exactly one of the pmv_inputs must be None. ' \
+            'Got {}.'.format(len(missing))
+        missing_key = missing[0]
+    seq_lens = [len(val) for val in list(pmv_inputs.values()) + [target_pmv]
+                if isinstance(val, (list, tuple))]
+    count = max(seq_lens) if len(seq_lens) != 0 else 1
+    assert all(s_len == count for s_len in seq_lens), 'All lists in pmv_inputs ' \
+        'and target_pmv must have the same length. Got {}.'.format(seq_lens)
+
+    def _as_list(val):
+        return list(val) if isinstance(val, (list, tuple)) else [val] * count
+
+    inputs = dict((key, _as_list(pmv_inputs[key])) for key in keys)
+    targets = _as_list(target_pmv)
+    missing_keys = missing_key if isinstance(missing_key, tuple) else (missing_key,)
+    step = (up_bound - low_bound) / 100.
+
+    # solve for the missing input of each item in the lists
+    solved, prev_args, prev_val = [], None, None
+    for i in range(count):
+        args = [inputs[key][i] for key in keys]
+        target = targets[i]
+        if prev_args is not None and args == prev_args[0] and target == prev_args[1]:
+            solved.append(prev_val)  # identical to the last item; reuse the result
+            continue
+        fn = _missing_pmv_function(args, missing_key, target, still_air_threshold)
+
+        missing_val = None
+        # bisect is much better at finding reasonable clo values
+        if missing_key != 'clo':
+            if prev_val is not None and prev_val != -999:
+                try:  # warm start from the previous solution
+                    missing_val = secant(prev_val, prev_val + step, fn, tolerance)
+                except (OverflowError, ZeroDivisionError, ValueError):
+                    missing_val = None
+                if missing_val is not None and \
+                        not low_bound <= missing_val <= up_bound:
+                    missing_val = None
+            if missing_val is None:
+                try:
+                    missing_val = secant(low_bound, up_bound, fn, tolerance)
+                except (OverflowError, ZeroDivisionError):
+                    missing_val = None
+        if missing_val is None:
+            missing_val = bisect(low_bound, up_bound, fn, tolerance, 0)
+
+        solved.append(missing_val)
+        prev_args, prev_val = (args, target), missing_val
+
+    # complete the input dictionary
+    for key in missing_keys:
+        inputs[key] = list(solved)
+    return inputs
+
+
+def _missing_pmv_function(args, missing_key, target_pmv, still_air_threshold):
+    """Get a function of the missing PMV input that is zero at the target_pmv.
+
+    Args:
+        args: A list of the 7 PMV inputs in the order of the predicted_mean_vote
+            function. The missing input(s) can be any value.
+        missing_key: Text for the missing PMV input key or the tuple ('ta', 'tr').
+        target_pmv: The target PMV.
+        still_air_threshold: The still air threshold of the PMV model.
+    """
+    ta, tr, vel, rh, met, clo, wme = args
+    if missing_key != 'vel' and vel <= still_air_threshold:
+        # the SET model is not needed and Fanger's PMV can be used directly
+        def pmv_funct(ta, tr, vel, rh, met, clo, wme):
+            return fanger_pmv(ta, tr, vel, rh, met, clo, wme)[0]
+    else:
+        def pmv_funct(ta, tr, vel, rh, met, clo, wme):
+            return predicted_mean_vote(
+                ta, tr, vel, rh, met, clo, wme, still_air_threshold)['pmv']
+
+    if missing_key == ('ta', 'tr'):
+        def fn(x):
+            return pmv_funct(x, x, vel, rh, met, clo, wme) - target_pmv
+    elif missing_key == 'ta':
+        def fn(x):
+            return pmv_funct(x, tr, vel, rh, met, clo, wme) - target_pmv
+    elif missing_key == 'tr':
+        def fn(x):
+            return pmv_funct(ta, x, vel, rh, met, clo, wme) - target_pmv
+    elif missing_key == 'vel':
+        def fn(x):
+            return target_pmv - pmv_funct(ta, tr, x, rh, met, clo, wme)
+    elif missing_key == 'rh':
+        def fn(x):
+            return pmv_funct(ta, tr, vel, x, met, clo, wme) - target_pmv
+    elif missing_key == 'met':
+        def fn(x):
+            return pmv_funct(ta, tr, vel, rh, x, clo, wme) - target_pmv
+    elif missing_key == 'clo':
+        def fn(x):
+            return pmv_funct(ta, tr, vel, rh, met, x, wme) - target_pmv
+    else:
+        def fn(x):
+            return pmv_funct(ta, tr, vel, rh, met, clo, x) - target_pmv
+    return fn
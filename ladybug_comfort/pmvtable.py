@@ -0,0 +1,345 @@
+# coding=utf-8
+"""Object for precomputing and interpolating the boundaries of the PMV comfort zone."""
+from __future__ import division
+
+from .pmv import pmv_from_ppd, calc_missing_pmv_input_batch
+from .parameter.pmv import PMVParameter
+
+from bisect import bisect_right
+import json
+
+try:
+    from itertools import izip as zip  # python 2
+except ImportError:
+    pass
+
+
+class PMVBoundaryTable(object):
+    """Table of PMV comfort zone boundaries precomputed over a grid of conditions.
+
+    Each item of the table is the pair of operative temperatures at which the PPD
+    reaches the comfort threshold on the cold and hot sides of the comfort zone.
+    These are computed once for every combination of the grid inputs and any
+    boundary within the grid can then be found by multilinear interpolation
+    without any root finding. This makes the table well suited for drawing
+    comfort polygons on charts many times over. Tables can be written to a file
+    and loaded again later so that they only need to be computed once.
+
+    Args:
+        rel_humidity: A list of relative humidity values in % at which boundaries
+            will be computed. Values must be sorted from lowest to highest.
+            Default is every 10% from 0% to 100%.
+        air_speed: A list of air speed values in m/s at which boundaries will be
+            computed. Values must be sorted from lowest to highest.
+            Default is (0.1, 0.3, 0.6, 1.0).
+        met_rate: A list of metabolic rates in met at which boundaries will be
+            computed. Values must be sorted from lowest to highest.
+            Default is (1.0, 1.1, 1.2, 1.4, 1.6).
+        clo_value: A list of clothing values in clo at which boundaries will be
+            computed. Values must be sorted from lowest to highest.
+            Default is (0.5, 0.7, 1.0).
+        external_work: A number for the external work in met used for all
+            boundaries. Default is 0.
+        comfort_parameter: Optional PMVParameter object to specify the PPD
+            threshold and the still air threshold of the boundaries. Use the
+            ppd_threshold_from_comfort_class function in the pmv module to get
+            the PPD threshold of a given comfort class. If None, default will
+            assume a PPD threshold of 10% and a still air threshold of 0.1 m/s.
+
+    Properties:
+        * rel_humidity
+        * air_speed
+        * met_rate
+        * clo_value
+        * external_work
+        * comfort_parameter
+        * pmv_limit
+        * cold_boundaries
+        * hot_boundaries
+    """
+    __slots__ = ('_rel_humidity', '_air_speed', '_met_rate', '_clo_value',
+                 '_external_work', '_comfort_par', '_pmv_limit',
+                 '_cold_boundaries', '_hot_boundaries')
+
+    def __init__(self, rel_humidity=None, air_speed=None, met_rate=None,
+                 clo_value=None, external_work=0, comfort_parameter=None):
+        """Initialize a PMVBoundaryTable and compute all of its boundaries."""
+        self._rel_humidity = self._check_grid(
+            rel_humidity if rel_humidity is not None else range(0, 101, 10),
+            'rel_humidity')
+        self._air_speed = self._check_grid(
+            air_speed if air_speed is not None else (0.1, 0.3, 0.6, 1.0), 'air_speed')
+        self._met_rate = self._check_grid(
+            met_rate if met_rate is not None else (1.0, 1.1, 1.2, 1.4, 1.6),
+            'met_rate')
+        self._clo_value = self._check_grid(
+            clo_value if clo_value is not None else (0.5, 0.7, 1.0), 'clo_value')
+        self._external_work = float(external_work)
+
+        if comfort_parameter is None:
+            self._comfort_par = PMVParameter()
+        else:
+            assert isinstance(comfort_parameter, PMVParameter), 'comfort_parameter '\
+                'must be a PMVParameter object. Got {}'.format(type(comfort_parameter))
+            self._comfort_par = comfort_parameter.duplicate()
+        ppd_thresh = self._comfort_par.ppd_comfort_thresh
+        self._pmv_limit = pmv_from_ppd(ppd_thresh)[1] if ppd_thresh > 5 else 0
+
+        self._compute_boundaries()
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a PMVBoundaryTable from a dictionary without recomputing boundaries.
+
+        Args:
+            data: A PMVBoundaryTable dictionary following the format below.
+
+        .. code-block:: python
+
+            {
+            "type": "PMVBoundaryTable",
+            "rel_humidity": [0, 50, 100],
+            "air_speed": [0.1, 0.5],
+            "met_rate": [1.1],
+            "clo_value": [0.5, 1.0],
+            "external_work": 0,
+            "ppd_comfort_thresh": 10,
+            "still_air_threshold": 0.1,
+            "cold_boundaries": [],  # list of temperatures with one per grid item
+            "hot_boundaries": []  # list of temperatures with one per grid item
+            }
+        """
+        assert data['type'] == 'PMVBoundaryTable', \
+            'Expected PMVBoundaryTable. Got {}.'.format(data['type'])
+        table = cls.__new__(cls)
+        table._rel_humidity = cls._check_grid(data['rel_humidity'], 'rel_humidity')
+        table._air_speed = cls._check_grid(data['air_speed'], 'air_speed')
+        table._met_rate = cls._check_grid(data['met_rate'], 'met_rate')
+        table._clo_value = cls._check_grid(data['clo_value'], 'clo_value')
+        table._external_work = float(data['external_work'])
+        table._comfort_par = PMVParameter(
+            data['ppd_comfort_thresh'], still_air_threshold=data['still_air_threshold'])
+        ppd_thresh = table._comfort_par.ppd_comfort_thresh
+        table._pmv_limit = pmv_from_ppd(ppd_thresh)[1] if ppd_thresh > 5 else 0
+        table._cold_boundaries = tuple(data['cold_boundaries'])
+        table._hot_boundaries = tuple(data['hot_boundaries'])
+        grid_count = len(table._rel_humidity) * len(table._air_speed) * \
+            len(table._met_rate) * len(table._clo_value)
+        assert len(table._cold_boundaries) == len(table._hot_boundaries) == \
+            grid_count, 'Number of boundaries does not match the grid size ' \
+            '({}).'.format(grid_count)
+        return table
+
+    @classmethod
+    def from_file(cls, file_path):
+        """Load a PMVBoundaryTable from a JSON file written with the to_file method.
+
+        Args:
+            file_path: Full path to a JSON file of a PMVBoundaryTable.
+        """
+        with open(file_path) as inf:
+            data = json.load(inf)
+        return cls.from_dict(data)
+
+    @property
+    def rel_humidity(self):
+        """Tuple of relative humidity values in % at which boundaries are computed."""
+        return self._rel_humidity
+
+    @property
+    def air_speed(self):
+        """Tuple of air speed values in m/s at which boundaries are computed."""
+        return self._air_speed
+
+    @property
+    def met_rate(self):
+        """Tuple of metabolic rates in met at which boundaries are computed."""
+        return self._met_rate
+
+    @property
+    def clo_value(self):
+        """Tuple of clothing values in clo at which boundaries are computed."""
+        return self._clo_value
+
+    @property
+    def external_work(self):
+        """The external work in met used for all boundaries."""
+        return self._external_work
+
+    @property
+    def comfort_parameter(self):
+        """PMV comfort parameters used to compute the boundaries."""
+        return self._comfort_par.duplicate()
+
+    @property
+    def pmv_limit(self):
+        """The positive PMV at which the PPD reaches the comfort threshold."""
+        return self._pmv_limit
+
+    @property
+    def cold_boundaries(self):
+        """Tuple of the cold boundary operative temperatures of every grid item.
+
+        The grid is ordered by relative humidity, then air speed, then metabolic
+        rate and then clothing value, with the last one changing fastest.
+        """
+        return self._cold_boundaries
+
+    @property
+    def hot_boundaries(self):
+        """Tuple of the hot boundary operative temperatures of every grid item.
+
+        The grid is ordered by relative humidity, then air speed, then metabolic
+        rate and then clothing value, with the last one changing fastest.
+        """
+        return self._hot_boundaries
+
+    def boundary(self, rel_humidity, air_speed=0.1, met_rate=1.1, clo_value=0.7):
+        """Get the cold and hot operative temperature boundaries of the comfort zone.
+
+        Inputs outside of the range of the table grid are clamped to the edge
+        of the grid.
+
+        Args:
+            rel_humidity: Relative humidity in %.
+            air_speed: Air speed in m/s. Default is 0.1.
+            met_rate: Metabolic rate in met. Default is 1.1.
+            clo_value: Clothing value in clo. Default is 0.7.
+
+        Returns:
+            A tuple with two elements
+
+            -   cold_temp: The operative temperature below which conditions are
+                too cold to be comfortable [C].
+            -   hot_temp: The operative temperature above which conditions are
+                too hot to be comfortable [C].
+        """
+        weights = self._interpolation_weights(
+            (rel_humidity, air_speed, met_rate, clo_value))
+        cold, hot = self._cold_boundaries, self._hot_boundaries
+        cold_temp = sum(cold[i] * w for i, w in weights)
+        hot_temp = sum(hot[i] * w for i, w in weights)
+        return cold_temp, hot_temp
+
+    def boundaries(self, rel_humidity, air_speed=0.1, met_rate=1.1, clo_value=0.7):
+        """Get lists of cold and hot boundaries for a list of relative humidity values.
+
+        This is useful for drawing a comfort polygon on a psychrometric chart.
+
+        Args:
+            rel_humidity: A list of relative humidity values in %.
+            air_speed: Air speed in m/s. Default is 0.1.
+            met_rate: Metabolic rate in met. Default is 1.1.
+            clo_value: Clothing value in clo. Default is 0.7.
+
+        Returns:
+            A tuple with two elements
+
+            -   cold_temps: A list of cold boundary operative temperatures [C].
+            -   hot_temps: A list of hot boundary operative temperatures [C].
+        """
+        results = [self.boundary(rh, air_speed, met_rate, clo_value)
+                   for rh in rel_humidity]
+        return [r[0] for r in results], [r[1] for r in results]
+
+    def to_dict(self):
+        """Get PMVBoundaryTable as a dictionary."""
+        return {
+            'type': 'PMVBoundaryTable',
+            'rel_humidity': list(self._rel_humidity),
+            'air_speed': list(self._air_speed),
+            'met_rate': list(self._met_rate),
+            'clo_value': list(self._clo_value),
+            'external_work': self._external_work,
+            'ppd_comfort_thresh': self._comfort_par.ppd_comfort_thresh,
+            'still_air_threshold': self._comfort_par.still_air_threshold,
+            'cold_boundaries': list(self._cold_boundaries),
+            'hot_boundaries': list(self._hot_boundaries)
+        }
+
+    def to_file(self, file_path):
+        """Write this PMVBoundaryTable to a JSON file.
+
+        Args:
+            file_path: Full path to the JSON file to be written.
+
+        Returns:
+            The path to the file that was written.
+        """
+        with open(file_path, 'w') as outf:
+            json.dump(self.to_dict(), outf)
+        return file_path
+
+    def _compute_boundaries(self):
+        """Compute the cold and hot boundaries for every item of the grid."""
+        cold_bounds, hot_bounds = [], []
+        rh_count = len(self._rel_humidity)
+        still_thresh = self._comfort_par.still_air_threshold
+        combo_bounds = []
+        for vel in self._air_speed:
+            for met in self._met_rate:
+                for clo in self._clo_value:
+                    inputs = {'ta': None, 'tr': None, 'vel': vel,
+                              'rh': list(self._rel_humidity), 'met': met,
+                              'clo': clo, 'wme': self._external_work}
+                    cold = calc_missing_pmv_input_batch(
+                        [-self._pmv_limit] * rh_count, dict(inputs), -20., 50.,
+                        still_air_threshold=still_thresh)['ta']
+                    hot = calc_missing_pmv_input_batch(
+                        [self._pmv_limit] * rh_count, dict(inputs), -20., 50.,
+                        still_air_threshold=still_thresh)['ta']
+                    combo_bounds.append((cold, hot))
+        # reorder the results so that relative humidity changes slowest
+        for i in range(rh_count):
+            for cold, hot in combo_bounds:
+                cold_bounds.append(cold[i])
+                hot_bounds.append(hot[i])
+        self._cold_boundaries = tuple(cold_bounds)
+        self._hot_boundaries = tuple(hot_bounds)
+
+    def _interpolation_weights(self, values):
+        """Get the flat grid indices and weights used to interpolate a set of values.
+
+        Args:
+            values: A tuple of (rel_humidity, air_speed, met_rate, clo_value).
+
+        Returns:
+            A list of (index, weight) tuples for the corners of the grid cell
+            that contains the values.
+        """
+        grids = (self._rel_humidity, self._air_speed, self._met_rate, self._clo_value)
+        weights = [(0, 1.)]
+        for grid, val in zip(grids, values):
+            count = len(grid)
+            if count == 1 or val <= grid[0]:
+                dim_weights = ((0, 1.),)
+            elif val >= grid[-1]:
+                dim_weights = ((count - 1, 1.),)
+            else:
+                i = bisect_right(grid, val) - 1
+                t = (val - grid[i]) / (grid[i + 1] - grid[i])
+                dim_weights = ((i, 1. - t), (i + 1, t))
+            weights = [(idx * count + d_i, w * d_w) for idx, w in weights
+                       for d_i, d_w in dim_weights if d_w != 0]
+        return weights
+
+    @staticmethod
+    def _check_grid(values, name):
+        """Check that a list of grid values is not empty and sorted."""
+        values = tuple(float(v) for v in values)
+        assert len(values) > 0, '{} must have at least one value.'.format(name)
+        for prev, nxt in zip(values[:-1], values[1:]):
+            assert prev < nxt, '{} must be sorted from lowest to highest. ' \
+                'Got {}.'.format(name, values)
+        return values
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """PMVBoundaryTable representation."""
+        return 'PMV Boundary Table: [{} rh x {} vel x {} met x {} clo] ' \
+            '(PPD threshold: {}%)'.format(
+                len(self._rel_humidity), len(self._air_speed), len(self._met_rate),
+                len(self._clo_value), self._comfort_par.ppd_comfort_thresh)
@@ -0,0 +1,153 @@
+# coding=utf-8
+"""Object for computing psychrometric properties for whole columns of values at once."""
+from __future__ import division
+
+from ._sequence import ConstantSequence, is_sequence
+
+from ladybug.psychrometrics import saturated_vapor_pressure, dew_point_from_db_rh
+
+try:
+    from itertools import izip as zip  # python 2
+except ImportError:
+    pass
+
+
+class PsychrometricColumns(object):
+    """Psychrometric properties of columns of air temperature and relative humidity.
+
+    Each property is computed once for the whole column the first time that it
+    is requested and the results are shared by all models that need them
+    (eg. the humidity ratio for PMV comfort limits or the dew point and vapor
+    pressure inputs of the Predicted Heat Strain model). Saturation pressures
+    are computed once for each unique air temperature and dew points are
+    computed once for each unique pair of air temperature and relative humidity,
+    which avoids most of the work for weather data with recorded precision.
+
+    Args:
+        air_temperature: A list of air temperature values in Celsius.
+        rel_humidity: A list of relative humidity values in % that align with the
+            air_temperature or a single value to be used for all of them.
+        pressure: A number for the barometric pressure in Pa. Default: 101325.
+
+    Properties:
+        * air_temperature
+        * rel_humidity
+        * pressure
+        * saturated_vapor_pressure
+        * vapor_pressure
+        * humidity_ratio
+        * dew_point
+
+    Usage:
+
+    .. code-block:: python
+
+        from ladybug.epw import EPW
+        from ladybug_comfort.psychrometrics import PsychrometricColumns
+
+        epw = EPW('./tests/epw/chicago.epw')
+        psychro = PsychrometricColumns(
+            epw.dry_bulb_temperature.values, epw.relative_humidity.values)
+        humidity_ratio = psychro.humidity_ratio
+        dew_point = psychro.dew_point
+    """
+    __slots__ = ('_air_temperature', '_rel_humidity', '_pressure', '_sat_press',
+                 '_vapor_press', '_humid_ratio', '_dew_point')
+
+    def __init__(self, air_temperature, rel_humidity, pressure=101325):
+        """Initialize PsychrometricColumns."""
+        assert is_sequence(air_temperature), 'air_temperature must be a sequence ' \
+            'of numbers. Got {}.'.format(type(air_temperature))
+        self._air_temperature = air_temperature
+        if is_sequence(rel_humidity):
+            assert len(rel_humidity) == len(air_temperature), 'Length of ' \
+                'rel_humidity ({}) does not match the length of air_temperature ' \
+                '({}).'.format(len(rel_humidity), len(air_temperature))
+            self._rel_humidity = rel_humidity
+        else:
+            self._rel_humidity = ConstantSequence(
+                float(rel_humidity), len(air_temperature))
+        assert pressure > 0, 'pressure must be greater than 0. Got {}.'.format(pressure)
+        self._pressure = pressure
+        self._sat_press = None
+        self._vapor_press = None
+        self._humid_ratio = None
+        self._dew_point = None
+
+    @property
+    def air_temperature(self):
+        """The air temperature values in Celsius."""
+        return self._air_temperature
+
+    @property
+    def rel_humidity(self):
+        """The relative humidity values in %."""
+        return self._rel_humidity
+
+    @property
+    def pressure(self):
+        """The barometric pressure in Pa."""
+        return self._pressure
+
+    @property
+    def saturated_vapor_pressure(self):
+        """A list of saturated vapor pressure values in Pa."""
+        if self._sat_press is None:
+            memo = {}
+            self._sat_press = []
+            for ta in self._air_temperature:
+                try:
+                    self._sat_press.append(memo[ta])
+                except KeyError:
+                    p_ws = memo[ta] = saturated_vapor_pressure(ta + 273.15)
+                    self._sat_press.append(p_ws)
+        return self._sat_press
+
+    @property
+    def vapor_pressure(self):
+        """A list of partial vapor pressure values in Pa.
+
+        Divide by 100 to get the vapor pressure in hPa, which is the unit used
+        by the Predicted Heat Strain (PHS) model.
+        """
+        if self._vapor_press is None:
+            self._vapor_press = [p_ws * (rh / 100) for p_ws, rh in zip(
+                self.saturated_vapor_pressure, self._rel_humidity)]
+        return self._vapor_press
+
+    @property
+    def humidity_ratio(self):
+        """A list of humidity ratio values in kg water / kg air.
+
+        Values are identical to those of ladybug's humid_ratio_from_db_rh.
+        """
+        if self._humid_ratio is None:
+            b_press = self._pressure
+            self._humid_ratio = [(p_w * 0.621945) / (b_press - p_w)
+                                 for p_w in self.vapor_pressure]
+        return self._humid_ratio
+
+    @property
+    def dew_point(self):
+        """A list of dew point temperature values in Celsius.
+
+        Values are identical to those of ladybug's dew_point_from_db_rh.
+        """
+        if self._dew_point is None:
+            memo = {}
+            self._dew_point = []
+            for ta, rh in zip(self._air_temperature, self._rel_humidity):
+                try:
+                    self._dew_point.append(memo[(ta, rh)])
+                except KeyError:
+                    dpt = memo[(ta, rh)] = dew_point_from_db_rh(ta, rh)
+                    self._dew_point.append(dpt)
+        return self._dew_point
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """PsychrometricColumns representation."""
+        return 'Psychrometric Columns [{} values]'.format(len(self._air_temperature))
@@ -0,0 +1,473 @@
+# coding=utf-8
+"""Object for approximating the Pierce SET model by interpolating a table of values."""
+from __future__ import division
+
+from .pmv import pierce_set, PierceSetCoefficients, _CHC_STILL, _P_ATM
+
+from bisect import bisect_right
+import json
+import math
+
+try:
+    from itertools import izip as zip  # python 2
+except ImportError:
+    pass
+
+# air speed at which the convective heat transfer of the SET model rises above its
+# still air value, which is a kink in SET that should be on the grid of the table
+_CHC_SPEED = pow(_CHC_STILL / 8.600001, 1 / 0.53) / _P_ATM
+
+
+class PierceSetTable(object):
+    """Surrogate of the Pierce SET model that interpolates a precomputed table.
+
+    The standard effective temperature (SET) is computed once with the pierce_set
+    function for every point of a grid of air temperature, the difference between
+    mean radiant temperature and air temperature, air speed and relative humidity
+    at a given metabolic rate, clothing level and external work. SET at any
+    condition within the grid is then found by multilinear interpolation of the
+    table, which is many times faster than the full model. Air speed is
+    interpolated along its square root since the convective heat transfer of
+    the model varies with about the square root of the air speed.
+
+    The pierce_set function is not smooth everywhere and jumps by up to 1 C at
+    some conditions, which no interpolation can follow. So the error of every
+    cell of the grid is checked against the full model at the center of the cell
+    when the table is computed and the cells with an error above the tolerance
+    use the full model instead of the interpolation. Conditions outside of the
+    grid also use the full model. The max_center_error of the table is the largest
+    error at the centers of the interpolated cells. It is a statistic of these
+    samples rather than a bound on the error of the table, which can be larger
+    at other points of the interpolated cells.
+
+    Tables can be written to a file and loaded again later so that they only
+    need to be computed once.
+
+    Args:
+        met_rate: Metabolic rate in met of the table. (Default: 1.1).
+        clo_value: Clothing in clo of the table. (Default: 0.7).
+        external_work: External work in met of the table. (Default: 0).
+        air_temperature: A list of air temperatures in C at which SET will be
+            computed. Values must be sorted from lowest to highest.
+            Default is every 1 C from -40 C to 50 C.
+        mrt_delta: A list of differences between the mean radiant temperature and
+            the air temperature in C at which SET will be computed. Values must
+            be sorted from lowest to highest.
+            Default is (-10, -5, 0, 5, 10, 15, 20, 30).
+        air_speed: A list of air speeds in m/s at which SET will be computed.
+            Values must be sorted from lowest to highest.
+            Default is (0.1, 0.137, 0.2, 0.3, 0.5, 0.75, 1, 1.5, 2, 3, 4, 6) where
+            0.137 m/s is the speed at which the convective heat transfer of the
+            model rises above its still air value.
+        rel_humidity: A list of relative humidity values in % at which SET will
+            be computed. Values must be sorted from lowest to highest.
+            Default is every 10% from 0% to 100%.
+        tolerance: The maximum error in C at the center of a cell for the cell
+            to be interpolated. Cells with a larger error use the full model.
+            (Default: 0.1).
+
+    Properties:
+        * met_rate
+        * clo_value
+        * external_work
+        * air_temperature
+        * mrt_delta
+        * air_speed
+        * rel_humidity
+        * tolerance
+        * set_values
+        * fallback_cells
+        * fallback_fraction
+        * max_center_error
+
+    Usage:
+
+    .. code-block:: python
+
+        from ladybug_comfort.settable import PierceSetTable
+        from ladybug_comfort.pmv import predicted_mean_vote
+
+        table = PierceSetTable(1.1, 0.7)
+        print(table.max_center_error)  # largest error at the cell centers
+        set_value = table.set(25, 27, 0.5, 50)  # ta, tr, vel, rh
+        pmv_result = predicted_mean_vote(25, 27, 0.5, 50, 1.1, 0.7, set_table=table)
+    """
+    __slots__ = ('_met_rate', '_clo_value', '_external_work', '_air_temperature',
+                 '_mrt_delta', '_air_speed', '_rel_humidity', '_tolerance',
+                 '_set_values', '_fallback_cells', '_fallback_flags',
+                 '_max_center_error', '_coefficients', '_axes')
+    _shared_tables = {}
+
+    def __init__(self, met_rate=1.1, clo_value=0.7, external_work=0,
+                 air_temperature=None, mrt_delta=None, air_speed=None,
+                 rel_humidity=None, tolerance=0.1):
+        """Initialize a PierceSetTable and compute all of its values."""
+        self._met_rate = float(met_rate)
+        self._clo_value = float(clo_value)
+        self._external_work = float(external_work)
+        self._air_temperature = self._check_grid(
+            air_temperature if air_temperature is not None else range(-40, 51),
+            'air_temperature')
+        self._mrt_delta = self._check_grid(
+            mrt_delta if mrt_delta is not None else (-10, -5, 0, 5, 10, 15, 20, 30),
+            'mrt_delta')
+        self._air_speed = self._check_grid(
+            air_speed if air_speed is not None else
+            (0.1, _CHC_SPEED, 0.2, 0.3, 0.5, 0.75, 1, 1.5, 2, 3, 4, 6), 'air_speed')
+        self._rel_humidity = self._check_grid(
+            rel_humidity if rel_humidity is not None else range(0, 101, 10),
+            'rel_humidity')
+        assert tolerance > 0, 'tolerance must be greater than 0. ' \
+            'Got {}.'.format(tolerance)
+        self._tolerance = float(tolerance)
+        self._coefficients = PierceSetCoefficients(
+            self._met_rate, self._clo_value, self._external_work)
+        self._set_axes()
+
+        self._compute_values()
+        self._validate_cells()
+
+    @classmethod
+    def shared_table(cls, met_rate=1.1, clo_value=0.7, external_work=0):
+        """Get a table with the default grid that is only computed once per session.
+
+        The first request for a given metabolic rate, clothing and external work
+        computes the table and later requests return the same object. This is
+        useful when many calculations use the same met and clo. Tables loaded
+        from files can be used in place of the computed ones with the share method.
+
+        Args:
+            met_rate: Metabolic rate in met of the table. (Default: 1.1).
+            clo_value: Clothing in clo of the table. (Default: 0.7).
+            external_work: External work in met of the table. (Default: 0).
+        """
+        key = (float(met_rate), float(clo_value), float(external_work))
+        try:
+            return cls._shared_tables[key]
+        except KeyError:
+            table = cls._shared_tables[key] = cls(*key)
+            return table
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a PierceSetTable from a dictionary without recomputing its values.
+
+        Args:
+            data: A PierceSetTable dictionary following the format below.
+
+        .. code-block:: python
+
+            {
+            "type": "PierceSetTable",
+            "met_rate": 1.1,
+            "clo_value": 0.7,
+            "external_work": 0,
+            "air_temperature": [20, 25, 30],
+            "mrt_delta": [0, 10],
+            "air_speed": [0.1, 1.0],
+            "rel_humidity": [0, 100],
+            "tolerance": 0.1,
+            "set_values": [],  # list of SET values with one per grid item
+            "fallback_cells": [],  # list of grid items of the non-interpolated cells
+            "max_center_error": 0.05
+            }
+        """
+        assert data['type'] == 'PierceSetTable', \
+            'Expected PierceSetTable. Got {}.'.format(data['type'])
+        table = cls.__new__(cls)
+        table._met_rate = float(data['met_rate'])
+        table._clo_value = float(data['clo_value'])
+        table._external_work = float(data['external_work'])
+        table._air_temperature = cls._check_grid(
+            data['air_temperature'], 'air_temperature')
+        table._mrt_delta = cls._check_grid(data['mrt_delta'], 'mrt_delta')
+        table._air_speed = cls._check_grid(data['air_speed'], 'air_speed')
+        table._rel_humidity = cls._check_grid(data['rel_humidity'], 'rel_humidity')
+        table._tolerance = float(data['tolerance'])
+        table._coefficients = PierceSetCoefficients(
+            table._met_rate, table._clo_value, table._external_work)
+        table._set_axes()
+        table._set_values = tuple(data['set_values'])
+        grid_count = len(table._air_temperature) * len(table._mrt_delta) * \
+            len(table._air_speed) * len(table._rel_humidity)
+        assert len(table._set_values) == grid_count, 'Number of SET values does ' \
+            'not match the grid size ({}).'.format(grid_count)
+        table._set_fallback_cells(data['fallback_cells'])
+        table._max_center_error = float(data['max_center_error'])
+        return table
+
+    @classmethod
+    def from_file(cls, file_path):
+        """Load a PierceSetTable from a JSON file written with the to_file method.
+
+        Args:
+            file_path: Full path to a JSON file of a PierceSetTable.
+        """
+        with open(file_path) as inf:
+            data = json.load(inf)
+        return cls.from_dict(data)
+
+    @property
+    def met_rate(self):
+        """The metabolic rate in met of the table."""
+        return self._met_rate
+
+    @property
+    def clo_value(self):
+        """The clothing in clo of the table."""
+        return self._clo_value
+
+    @property
+    def external_work(self):
+        """The external work in met of the table."""
+        return self._external_work
+
+    @property
+    def air_temperature(self):
+        """Tuple of air temperatures in C at which SET is computed."""
+        return self._air_temperature
+
+    @property
+    def mrt_delta(self):
+        """Tuple of differences between radiant and air temperature in C of the grid.
+        """
+        return self._mrt_delta
+
+    @property
+    def air_speed(self):
+        """Tuple of air speeds in m/s at which SET is computed."""
+        return self._air_speed
+
+    @property
+    def rel_humidity(self):
+        """Tuple of relative humidity values in % at which SET is computed."""
+        return self._rel_humidity
+
+    @property
+    def tolerance(self):
+        """The maximum error in C at the center of a cell for it to be interpolated.
+        """
+        return self._tolerance
+
+    @property
+    def set_values(self):
+        """Tuple of the SET values in C of every grid item.
+
+        The grid is ordered by air temperature, then MRT delta, then air speed
+        and then relative humidity, with the last one changing fastest.
+        """
+        return self._set_values
+
+    @property
+    def fallback_cells(self):
+        """Tuple of the lowest grid items of the cells that use the full model."""
+        return self._fallback_cells
+
+    @property
+    def fallback_fraction(self):
+        """The fraction of the cells of the grid that use the full model."""
+        cell_count = (len(self._air_temperature) - 1) * (len(self._mrt_delta) - 1) * \
+            (len(self._air_speed) - 1) * (len(self._rel_humidity) - 1)
+        return len(self._fallback_cells) / cell_count
+
+    @property
+    def max_center_error(self):
+        """The largest error in C at the centers of the interpolated cells.
+
+        This is not a bound on the error of the table since errors at other
+        points of the interpolated cells can be larger.
+        """
+        return self._max_center_error
+
+    def share(self):
+        """Make this table the shared_table of its met, clo and external work.
+
+        This is useful for using a table that has been loaded from a file
+        wherever shared tables are used (eg. the set_surrogate option of the
+        PMV collection) instead of computing a new table.
+        """
+        key = (self._met_rate, self._clo_value, self._external_work)
+        PierceSetTable._shared_tables[key] = self
+
+    def set(self, ta, tr, vel, rh):
+        """Get the standard effective temperature (SET) of a condition.
+
+        Args:
+            ta: Air temperature [C]
+            tr: Mean radiant temperature [C]
+            vel: Relative air velocity [m/s]
+            rh: Relative humidity [%]
+
+        Returns:
+            se_temp -- Standard effective temperature [C]
+        """
+        cell = self._cell(ta, tr - ta, math.sqrt(max(vel, 0.1)), rh)
+        if cell is None:
+            return pierce_set(ta, tr, vel, rh, self._met_rate, self._clo_value,
+                              self._external_work, self._coefficients)
+        return self._interpolate(*cell)
+
+    def set_batch(self, ta, tr, vel, rh):
+        """Get a list of standard effective temperatures (SET) for lists of conditions.
+
+        Args:
+            ta: A list of air temperatures [C]
+            tr: A list of mean radiant temperatures [C]
+            vel: A list of relative air velocities [m/s]
+            rh: A list of relative humidity values [%]
+
+        Returns:
+            A list of standard effective temperatures [C]
+        """
+        return [self.set(*vals) for vals in zip(ta, tr, vel, rh)]
+
+    def to_dict(self):
+        """Get PierceSetTable as a dictionary."""
+        return {
+            'type': 'PierceSetTable',
+            'met_rate': self._met_rate,
+            'clo_value': self._clo_value,
+            'external_work': self._external_work,
+            'air_temperature': list(self._air_temperature),
+            'mrt_delta': list(self._mrt_delta),
+            'air_speed': list(self._air_speed),
+            'rel_humidity': list(self._rel_humidity),
+            'tolerance': self._tolerance,
+            'set_values': list(self._set_values),
+            'fallback_cells': list(self._fallback_cells),
+            'max_center_error': self._max_center_error
+        }
+
+    def to_file(self, file_path):
+        """Write this PierceSetTable to a JSON file.
+
+        Args:
+            file_path: Full path to the JSON file to be written.
+
+        Returns:
+            The path to the file that was written.
+        """
+        with open(file_path, 'w') as outf:
+            json.dump(self.to_dict(), outf)
+        return file_path
+
+    def _compute_values(self):
+        """Compute the SET of every item of the grid."""
+        met, clo, wme = self._met_rate, self._clo_value, self._external_work
+        coeffs = self._coefficients
+        set_values = []
+        for ta in self._air_temperature:
+            for delta in self._mrt_delta:
+                tr = ta + delta
+                for vel in self._air_speed:
+                    for rh in self._rel_humidity:
+                        set_values.append(
+                            pierce_set(ta, tr, vel, rh, met, clo, wme, coeffs))
+        self._set_values = tuple(set_values)
+
+    def _validate_cells(self):
+        """Check the interpolation of every cell against the full model at its center.
+        """
+        met, clo, wme = self._met_rate, self._clo_value, self._external_work
+        coeffs = self._coefficients
+        mids = [[(g[i] + g[i + 1]) / 2 for i in range(len(g) - 1)]
+                for g in self._axes]
+        mids[2] = [root ** 2 for root in mids[2]]  # air speeds at the root midpoints
+        strides = self._strides()
+        fallback_cells, max_center_error = [], 0
+        for i, ta in enumerate(mids[0]):
+            for j, delta in enumerate(mids[1]):
+                tr = ta + delta
+                for k, vel in enumerate(mids[2]):
+                    for m, rh in enumerate(mids[3]):
+                        base = i * strides[0] + j * strides[1] + k * strides[2] + m
+                        approx = self._interpolate(base, .5, .5, .5, .5)
+                        error = abs(approx - pierce_set(
+                            ta, tr, vel, rh, met, clo, wme, coeffs))
+                        if error > self._tolerance:
+                            fallback_cells.append(base)
+                        elif error > max_center_error:
+                            max_center_error = error
+        self._set_fallback_cells(fallback_cells)
+        self._max_center_error = max_center_error
+
+    def _set_fallback_cells(self, fallback_cells):
+        """Set the cells that use the full model from a list of grid items."""
+        self._fallback_cells = tuple(int(c) for c in fallback_cells)
+        flags = bytearray(len(self._set_values))
+        for cell in self._fallback_cells:
+            flags[cell] = 1
+        self._fallback_flags = flags
+
+    def _set_axes(self):
+        """Set the grids along which values are interpolated."""
+        speed_roots = tuple(math.sqrt(v) for v in self._air_speed)
+        self._axes = (self._air_temperature, self._mrt_delta, speed_roots,
+                      self._rel_humidity)
+
+    def _strides(self):
+        """Get the number of grid items between consecutive values of each grid."""
+        s_3 = len(self._rel_humidity)
+        s_2 = len(self._air_speed) * s_3
+        return len(self._mrt_delta) * s_2, s_2, s_3, 1
+
+    def _cell(self, ta, delta, vel_root, rh):
+        """Get the cell and the interpolation fractions of a condition.
+
+        Args:
+            ta: Air temperature [C]
+            delta: Mean radiant temperature minus air temperature [C]
+            vel_root: Square root of the air velocity [m/s]
+            rh: Relative humidity [%]
+
+        Returns:
+            A tuple with the grid item at the lowest corner of the cell followed by
+            the fraction along each grid. This is None if the condition is outside
+            of the grid or in a cell that uses the full model.
+        """
+        base, fractions = 0, []
+        for grid, val, stride in zip(
+                self._axes, (ta, delta, vel_root, rh), self._strides()):
+            if not grid[0] <= val <= grid[-1]:
+                return None
+            i = min(bisect_right(grid, val), len(grid) - 1) - 1
+            base += i * stride
+            fractions.append((val - grid[i]) / (grid[i + 1] - grid[i]))
+        if self._fallback_flags[base]:
+            return None
+        return (base,) + tuple(fractions)
+
+    def _interpolate(self, base, t_0, t_1, t_2, t_3):
+        """Interpolate the SET of a cell from its lowest grid item and fractions."""
+        values = self._set_values
+        s_0, s_1, s_2, _ = self._strides()
+        result = 0.
+        for d_0, w_0 in ((0, 1. - t_0), (s_0, t_0)):
+            for d_1, w_1 in ((0, 1. - t_1), (s_1, t_1)):
+                for d_2, w_2 in ((0, 1. - t_2), (s_2, t_2)):
+                    i = base + d_0 + d_1 + d_2
+                    result += w_0 * w_1 * w_2 * \
+                        (values[i] * (1. - t_3) + values[i + 1] * t_3)
+        return result
+
+    @staticmethod
+    def _check_grid(values, name):
+        """Check that a list of grid values has at least two values and is sorted."""
+        values = tuple(float(v) for v in values)
+        assert len(values) > 1, '{} must have at least two values.'.format(name)
+        for prev, nxt in zip(values[:-1], values[1:]):
+            assert prev < nxt, '{} must be sorted from lowest to highest. ' \
+                'Got {}.'.format(name, values)
+        return values
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """PierceSetTable representation."""
+        return 'Pierce SET Table: [met: {}] [clo: {}] [{} ta x {} mrt delta x ' \
+            '{} vel x {} rh] (max center error: {} C)'.format(
+                self._met_rate, self._clo_value, len(self._air_temperature),
+                len(self._mrt_delta), len(self._air_speed), len(self._rel_humidity),
+                round(self._max_center_error, 3))
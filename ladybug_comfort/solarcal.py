@@ -22,6 +22,8 @@ from __future__ import division
 from ladybug.skymodel import calc_sky_temperature
 from ladybug.futil import csv_to_num_matrix
 
+from .backend import register_implementation, implementation
+
 import os
 import math
 
@@ -99,6 +101,12 @@ def outdoor_sky_heat_exch(srfs_temp, horiz_ir, diff_horiz_solar, dir_normal_sola
         -   l_dmrt : The MRT delta as a result of longwave sky exchange in C.
         -   mrt: The final MRT expereinced as a result of sky heat exchange in C.
     """
+    impl = implementation('outdoor_sky_heat_exch')
+    if impl is not None:
+        return impl(
+            srfs_temp, horiz_ir, diff_horiz_solar, dir_normal_solar, alt,
+            sky_exposure, fract_exposed, floor_reflectance, posture, sharp,
+            body_absorptivity, body_emissivity)
     # set defaults using the input parameters
     fract_efficiency = 0.696 if posture == 'seated' else 0.725
 
@@ -681,3 +689,7 @@ def transpose_altitude_azimuth(altitude, azimuth):
     altitude = abs(90 - azimuth)
     azimuth = alt_temp
     return altitude, azimuth
+
+
+# register the pure Python implementations of the model kernels
+register_implementation('outdoor_sky_heat_exch', 'python', outdoor_sky_heat_exch)
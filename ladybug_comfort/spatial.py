@@ -0,0 +1,434 @@
+# coding=utf-8
+"""Object for calculating outdoor MRT and UTCI at many points sharing one climate."""
+from __future__ import division
+
+from .solarcal import get_projection_factor, get_projection_factor_simple, \
+    sharp_from_solar_and_body_azimuth
+from .utci import universal_thermal_climate_index
+from .parameter.solarcal import SolarCalParameter
+from .parameter.utci import UTCIParameter
+from ._sequence import ConstantSequence
+
+from ladybug._datacollectionbase import BaseCollection
+from ladybug.location import Location
+from ladybug.sunpath import Sunpath
+from ladybug.skymodel import calc_sky_temperature
+
+from ladybug.datatype.temperature import Temperature
+from ladybug.datatype.fraction import RelativeHumidity
+from ladybug.datatype.speed import Speed
+from ladybug.datatype.energyflux import Irradiance, \
+    HorizontalInfraredRadiationIntensity
+from ladybug.datatype.energyintensity import Radiation
+
+import math
+import os
+
+try:
+    from itertools import izip as zip  # python 2
+except ImportError:
+    pass
+
+
+class OutdoorComfortMap(object):
+    """Outdoor MRT and UTCI for many sensor points that share the same weather data.
+
+    Each point has its own sky exposure, fraction of the body exposed to direct
+    sun, surface temperature and floor reflectance while the weather data and
+    the sun positions are shared by all points. Since the SolarCal model is
+    linear in these point attributes, all terms that only depend on the weather
+    and the sun positions are computed once for each hour and every point
+    only needs a few multiplications per hour to get the MRT. Results are
+    produced one point at a time and can be streamed to CSV files in chunks
+    of points, keeping memory use bounded regardless of the number of points.
+
+    Args:
+        location: A Ladybug Location object.
+        air_temperature: Hourly Data Collection of air temperature in Celsius.
+        rel_humidity: Data Collection of relative humidity in % or a single
+            relative humidity value to be used for the whole analysis.
+        wind_speed: Data Collection of meteorological wind speed in m/s (measured
+            10 m above the ground) or a single wind speed value to be used for
+            the whole analysis.
+        direct_normal_solar: Hourly Data Collection with the direct normal solar
+            irradiance in W/m2 or radiation in Wh/m2.
+        diffuse_horizontal_solar: Hourly Data Collection with the diffuse
+            horizontal solar irradiance in W/m2 or radiation in Wh/m2.
+        horizontal_infrared: Hourly Data Collection with the horizontal infrared
+            radiation intensity from the sky in W/m2.
+        sky_exposure: A list of numbers between 0 and 1 with one value for each
+            point. Each number represents the fraction of the sky vault in view
+            of a person at the point.
+        fraction_body_exposed: A list with one item for each point, which
+            represents the fraction of the body exposed to direct sunlight.
+            Each item can be a single number or a list of hourly numbers that
+            align with the air_temperature. If None, all points will have
+            a value of 1 for fully exposed.
+        surface_temperatures: A list with one item for each point, which
+            represents the temperature of surfaces around the person in Celsius.
+            Each item can be a single number, a list of hourly numbers that
+            align with the air_temperature or None to use the air_temperature
+            at the point. If None, the air_temperature will be used for all points.
+        floor_reflectance: A number between 0 and 1 for the reflectance of the
+            floor at all points or a list with one number for each point.
+            Default is 0.25.
+        solarcal_body_parameter: Optional SolarCalParameter object to account for
+            properties of the human geometry.
+        utci_parameter: Optional UTCIParameter object to specify the thresholds
+            used to compute the thermal_condition of each point.
+
+    Properties:
+        * location
+        * point_count
+        * calc_length
+        * solarcal_body_parameter
+        * utci_parameter
+
+    Usage:
+
+    .. code-block:: python
+
+        from ladybug.epw import EPW
+        from ladybug_comfort.spatial import OutdoorComfortMap
+
+        epw = EPW('./tests/epw/chicago.epw')
+        comfort_map = OutdoorComfortMap.from_epw(
+            epw, sky_exposure=[1, 0.5, 0.2], fraction_body_exposed=[1, 0.5, 0])
+        csv_files = comfort_map.write_csv('./comfort_map', chunk_size=1000)
+    """
+    __slots__ = ('_location', '_air_temp', '_rel_humid', '_wind_speed',
+                 '_horiz_ir', '_sky_exp', '_fract_exp', '_srf_temp', '_flr_ref',
+                 '_body_par', '_utci_par', '_calc_length', '_base_collection',
+                 '_dir_terms', '_diff_terms', '_ref_terms', '_sky_temps')
+
+    def __init__(self, location, air_temperature, rel_humidity, wind_speed,
+                 direct_normal_solar, diffuse_horizontal_solar, horizontal_infrared,
+                 sky_exposure, fraction_body_exposed=None, surface_temperatures=None,
+                 floor_reflectance=0.25, solarcal_body_parameter=None,
+                 utci_parameter=None):
+        """Initialize an OutdoorComfortMap."""
+        # check the location and the weather data
+        assert isinstance(location, Location), 'location must be a Ladybug Location' \
+            ' object. Got {}.'.format(type(location))
+        self._location = location.duplicate()
+        self._check_collection(air_temperature, Temperature, 'C', 'air_temperature')
+        self._base_collection = air_temperature
+        self._calc_length = len(air_temperature.values)
+        self._air_temp = air_temperature.values
+        input_colls = [air_temperature]
+        self._rel_humid = self._check_weather_input(
+            rel_humidity, RelativeHumidity, '%', 'rel_humidity', input_colls)
+        self._wind_speed = self._check_weather_input(
+            wind_speed, Speed, 'm/s', 'wind_speed', input_colls)
+        for coll, name in ((direct_normal_solar, 'direct_normal_solar'),
+                           (diffuse_horizontal_solar, 'diffuse_horizontal_solar')):
+            if isinstance(coll, BaseCollection) and \
+                    isinstance(coll.header.data_type, Radiation):
+                self._check_collection(coll, Radiation, 'Wh/m2', name)
+                timestep = coll.header.analysis_period.timestep
+                assert timestep == 1, '{} timestep must be 1 when using Radiation ' \
+                    'as the data type. Got timestep of {}'.format(name, timestep)
+            else:
+                self._check_collection(coll, Irradiance, 'W/m2', name)
+            input_colls.append(coll)
+        self._horiz_ir = self._check_weather_input(
+            horizontal_infrared, HorizontalInfraredRadiationIntensity, 'W/m2',
+            'horizontal_infrared', input_colls)
+        BaseCollection.are_collections_aligned(input_colls)
+
+        # check the point attributes
+        self._sky_exp = tuple(float(val) for val in sky_exposure)
+        point_count = len(self._sky_exp)
+        assert point_count > 0, 'sky_exposure must have at least one point.'
+        self._fract_exp = self._check_point_input(
+            fraction_body_exposed, 1, 'fraction_body_exposed')
+        self._srf_temp = self._check_point_input(
+            surface_temperatures, None, 'surface_temperatures')
+        self._flr_ref = self._check_point_input(
+            floor_reflectance, 0.25, 'floor_reflectance', hourly=False)
+
+        # check the comfort parameters
+        if solarcal_body_parameter is None:
+            self._body_par = SolarCalParameter(posture='standing')
+        else:
+            assert isinstance(solarcal_body_parameter, SolarCalParameter), \
+                'solarcal_body_parameter must be a SolarCalParameter object. ' \
+                'Got {}'.format(type(solarcal_body_parameter))
+            self._body_par = solarcal_body_parameter
+        if utci_parameter is None:
+            self._utci_par = UTCIParameter()
+        else:
+            assert isinstance(utci_parameter, UTCIParameter), 'utci_parameter ' \
+                'must be a UTCIParameter object. Got {}'.format(type(utci_parameter))
+            self._utci_par = utci_parameter
+
+        # compute the hourly terms that are shared by all points
+        self._calculate_hourly_terms(direct_normal_solar.values,
+                                     diffuse_horizontal_solar.values)
+
+    @classmethod
+    def from_epw(cls, epw, sky_exposure, fraction_body_exposed=None,
+                 surface_temperatures=None, floor_reflectance=0.25,
+                 include_wind=True, solarcal_body_parameter=None,
+                 utci_parameter=None):
+        """Get an OutdoorComfortMap from the conditions within an EPW file.
+
+        Args:
+            epw: A ladybug EPW object from which the map will be created.
+            sky_exposure: A list of numbers between 0 and 1 with one value for
+                each point.
+            fraction_body_exposed: A list with one item for each point. Each item
+                can be a single number or a list of 8760 hourly numbers. If None,
+                all points will be fully exposed.
+            surface_temperatures: A list with one item for each point. Each item
+                can be a single number or a list of 8760 hourly numbers. If None,
+                the EPW dry bulb temperature will be used for all points.
+            floor_reflectance: A number for the reflectance of the floor at all
+                points or a list with one number for each point. Default is 0.25.
+            include_wind: Set to True to include the EPW wind speed in the
+                calculation. Setting to False will assume a condition that is
+                shielded from wind where the human experiences a very low wind
+                speed of 0.1 m/s. Default: True.
+            solarcal_body_parameter: Optional SolarCalParameter object to account
+                for properties of the human geometry.
+            utci_parameter: Optional UTCIParameter object to specify the thresholds
+                used to compute the thermal_condition of each point.
+        """
+        wind_speed = epw.wind_speed if include_wind is True else 0.1
+        return cls(epw.location, epw.dry_bulb_temperature, epw.relative_humidity,
+                   wind_speed, epw.direct_normal_radiation,
+                   epw.diffuse_horizontal_radiation,
+                   epw.horizontal_infrared_radiation_intensity, sky_exposure,
+                   fraction_body_exposed, surface_temperatures, floor_reflectance,
+                   solarcal_body_parameter, utci_parameter)
+
+    @property
+    def location(self):
+        """Ladybug Location object."""
+        return self._location.duplicate()
+
+    @property
+    def point_count(self):
+        """The number of points in the map."""
+        return len(self._sky_exp)
+
+    @property
+    def calc_length(self):
+        """The number of hourly values computed for each point."""
+        return self._calc_length
+
+    @property
+    def solarcal_body_parameter(self):
+        """SolarCal body parameters that are assigned to this object."""
+        return self._body_par
+
+    @property
+    def utci_parameter(self):
+        """UTCI comfort parameters that are assigned to this object."""
+        return self._utci_par
+
+    def mean_radiant_temperature(self, start=0, end=None):
+        """Get an iterator over the hourly MRT of each point in C.
+
+        Args:
+            start: The index of the first point to be computed. Default: 0.
+            end: The index after the last point to be computed. If None, results
+                will be computed up to the last point.
+
+        Returns:
+            An iterator that yields one list of hourly MRT values for each point.
+        """
+        end = self.point_count if end is None else min(end, self.point_count)
+        dir_terms, diff_terms, ref_terms = \
+            self._dir_terms, self._diff_terms, self._ref_terms
+        sky_temps = self._sky_temps
+        for i in range(start, end):
+            sky_e, flr_ref = self._sky_exp[i], self._flr_ref[i]
+            fract_e = self._fract_exp[i]
+            srf_temp = self._srf_temp[i]
+            if srf_temp is None:
+                srf_temp = self._air_temp
+            yield [
+                t_s + fe * dir_t + sky_e * (diff_t + flr_ref * ref_t) +
+                0.5 * sky_e * (sky_t - t_s)
+                for t_s, fe, dir_t, diff_t, ref_t, sky_t in zip(
+                    self._hourly(srf_temp), self._hourly(fract_e), dir_terms,
+                    diff_terms, ref_terms, sky_temps)]
+
+    def universal_thermal_climate_index(self, start=0, end=None):
+        """Get an iterator over the hourly UTCI of each point in C.
+
+        Args:
+            start: The index of the first point to be computed. Default: 0.
+            end: The index after the last point to be computed. If None, results
+                will be computed up to the last point.
+
+        Returns:
+            An iterator that yields one list of hourly UTCI values for each point.
+        """
+        return self._utci_rows(self.mean_radiant_temperature(start, end))
+
+    def write_csv(self, folder, chunk_size=1000, mrt=True, utci=True,
+                  thermal_condition=True):
+        """Compute results for all points and write them to CSV files in a folder.
+
+        Each CSV file has one row for each point and one column for each hour.
+        Points are processed in chunks and each chunk is written to the files
+        before the next one is computed, such that only one chunk of results
+        is held in memory at a time.
+
+        Args:
+            folder: Path to a folder where the CSV files will be written. It will
+                be created if it does not exist.
+            chunk_size: An integer for the number of points computed in each
+                chunk. Default: 1000.
+            mrt: Boolean to note whether a mean_radiant_temperature.csv file
+                should be written. Default: True.
+            utci: Boolean to note whether a universal_thermal_climate_index.csv
+                file should be written. Default: True.
+            thermal_condition: Boolean to note whether a thermal_condition.csv file
+                should be written with integers for cold (-1), neutral (0) and
+                hot (+1) conditions. Default: True.
+
+        Returns:
+            A list of paths to the CSV files that were written.
+        """
+        assert chunk_size > 0, 'chunk_size must be greater than 0. ' \
+            'Got {}.'.format(chunk_size)
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+        names = [name for name, write in (
+            ('mean_radiant_temperature', mrt),
+            ('universal_thermal_climate_index', utci),
+            ('thermal_condition', thermal_condition)) if write]
+        file_paths = [os.path.join(folder, '{}.csv'.format(name)) for name in names]
+        files = [open(f_path, 'w') for f_path in file_paths]
+        try:
+            for start in range(0, self.point_count, chunk_size):
+                end = start + chunk_size
+                chunk = dict((name, []) for name in names)
+                mrt_rows = list(self.mean_radiant_temperature(start, end))
+                if mrt:
+                    chunk['mean_radiant_temperature'] = mrt_rows
+                if utci or thermal_condition:
+                    for utci_vals in self._utci_rows(mrt_rows):
+                        if utci:
+                            chunk['universal_thermal_climate_index'].append(utci_vals)
+                        if thermal_condition:
+                            chunk['thermal_condition'].append(
+                                self._utci_par.thermal_condition_batch(utci_vals))
+                for name, outf in zip(names, files):
+                    outf.write(''.join(
+                        ','.join(str(v) for v in row) + '\n' for row in chunk[name]))
+        finally:
+            for outf in files:
+                outf.close()
+        return file_paths
+
+    def _utci_rows(self, mrt_rows):
+        """Get an iterator over the hourly UTCI of each list of hourly MRT values."""
+        for mrt in mrt_rows:
+            yield [universal_thermal_climate_index(ta, tr, vel, rh)
+                   for ta, tr, vel, rh in zip(
+                       self._air_temp, mrt, self._wind_speed, self._rel_humid)]
+
+    def _calculate_hourly_terms(self, dir_normal, diff_horiz):
+        """Compute all terms of the SolarCal model that are shared by the points.
+
+        The MRT at each point is then computed from these terms as follows.
+
+        .. code-block:: python
+
+            mrt = srf_temp + fract_exposed * dir_term + \\
+                sky_exposure * (diff_term + floor_reflectance * ref_term) + \\
+                0.5 * sky_exposure * (sky_temp - srf_temp)
+        """
+        body_par = self._body_par
+        posture = body_par.posture
+        fract_eff = 0.696 if posture == 'seated' else 0.725
+        # factor to convert solar flux on the body to an MRT delta
+        flux_to_dmrt = (body_par.body_absorptivity / body_par.body_emissivity) / \
+            (fract_eff * 6.012)
+
+        # compute the sun positions once for all points
+        sp = Sunpath.from_location(self._location)
+        self._dir_terms, self._diff_terms, self._ref_terms = [], [], []
+        for t_date, dir_n, diff_h in zip(
+                self._base_collection.datetimes, dir_normal, diff_horiz):
+            sun = sp.calculate_sun_from_date_time(t_date)
+            alt = sun.altitude
+            if alt < 0:
+                self._dir_terms.append(0)
+                self._diff_terms.append(0)
+                self._ref_terms.append(0)
+                continue
+            if body_par.body_azimuth is None:
+                sharp = body_par.sharp
+            else:
+                sharp = sharp_from_solar_and_body_azimuth(
+                    sun.azimuth, body_par.body_azimuth)
+            try:
+                proj_fac = get_projection_factor(alt, sharp, posture)
+            except KeyError:
+                proj_fac = get_projection_factor_simple(alt, sharp, posture)
+            glob_h = diff_h + dir_n * math.sin(math.radians(alt))
+            self._dir_terms.append(proj_fac * dir_n * flux_to_dmrt)
+            self._diff_terms.append(0.5 * fract_eff * diff_h * flux_to_dmrt)
+            self._ref_terms.append(0.5 * fract_eff * glob_h * flux_to_dmrt)
+        self._sky_temps = [calc_sky_temperature(h_ir, body_par.body_emissivity)
+                           for h_ir in self._horiz_ir]
+
+    def _hourly(self, value):
+        """Get an iterable of hourly values from a single number or list of numbers."""
+        if isinstance(value, (int, float)):
+            return (value for _ in range(self._calc_length))
+        return value
+
+    def _check_point_input(self, values, default, name, hourly=True):
+        """Check an attribute that has one value for each point."""
+        point_count = len(self._sky_exp)
+        if values is None:
+            return (default,) * point_count
+        if isinstance(values, (int, float)):
+            return (float(values),) * point_count
+        values = tuple(values)
+        assert len(values) == point_count, 'Length of {} ({}) does not match the ' \
+            'number of points ({}).'.format(name, len(values), point_count)
+        if hourly:
+            for val in values:
+                if val is not None and not isinstance(val, (int, float)):
+                    assert len(val) == self._calc_length, 'Hourly {} must have {} ' \
+                        'values. Got {}.'.format(name, self._calc_length, len(val))
+        return values
+
+    def _check_weather_input(self, data_coll, dat_type, unit, name, input_colls):
+        """Check a weather input that can be a Data Collection or a single number."""
+        if isinstance(data_coll, BaseCollection):
+            self._check_collection(data_coll, dat_type, unit, name)
+            input_colls.append(data_coll)
+            return data_coll.values
+        try:
+            return ConstantSequence(float(data_coll), self._calc_length)
+        except (ValueError, TypeError):
+            raise TypeError('{} must be either a number or a Data Collection. '
+                            'Got {}'.format(name, type(data_coll)))
+
+    @staticmethod
+    def _check_collection(data_coll, dat_type, unit, name):
+        """Check the data type and units of a Data Collection."""
+        assert isinstance(data_coll, BaseCollection), '{} must be a ' \
+            'Data Collection. Got {}.'.format(name, type(data_coll))
+        assert isinstance(data_coll.header.data_type, dat_type) and \
+            data_coll.header.unit == unit, '{} must be {} in {}. ' \
+            'Got {} in {}'.format(name, dat_type().name, unit,
+                                  data_coll.header.data_type.name,
+                                  data_coll.header.unit)
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """OutdoorComfortMap representation."""
+        return 'Outdoor Comfort Map: {} [{} points x {} hours]'.format(
+            self._location.city, self.point_count, self._calc_length)
@@ -0,0 +1,437 @@
+# coding=utf-8
+"""Functions for evaluating comfort models over long series in chunks.
+
+The comfort collections hold all of their inputs and results in memory, which
+is not possible for very long records (eg. 30 years of hourly data or 10 years
+of 1-minute sensor data). The generators in this module consume input iterables
+chunk by chunk and yield dictionaries of result lists for each chunk, such that
+only one chunk of results is held in memory at a time. Each dictionary uses the
+names of the properties of the equivalent comfort collection as keys.
+"""
+from __future__ import division
+
+from .pmv import predicted_mean_vote, PierceSetCoefficients
+from .utci import universal_thermal_climate_index
+from .adaptive import adaptive_comfort_ashrae55, adaptive_comfort_en15251, \
+    adaptive_comfort_conditioned_function, cooling_effect_ashrae55, \
+    cooling_effect_en15251
+from .solarcal import outdoor_sky_heat_exch, sharp_from_solar_and_body_azimuth
+from .parameter.pmv import PMVParameter
+from .parameter.utci import UTCIParameter
+from .parameter.adaptive import AdaptiveParameter
+from .parameter.solarcal import SolarCalParameter
+from .psychrometrics import PsychrometricColumns
+
+from ladybug.location import Location
+from ladybug.sunpath import Sunpath
+
+from itertools import islice, repeat
+
+try:
+    from itertools import izip as zip  # python 2
+except ImportError:
+    pass
+
+
+class RunningMeanTemperature(object):
+    """Weighted running mean of outdoor temperature that is updated chunk by chunk.
+
+    The result is identical to weighted_running_mean_hourly except for the
+    starting value. Since a stream has no knowledge of the week before the first
+    value, the starting prevailing temperature is either input directly or taken
+    as the mean temperature of the first day of the stream.
+
+    Args:
+        steps_per_day: An integer for the number of outdoor temperature values
+            in each day (eg. 24 for hourly data, 1440 for 1-minute data).
+            Default: 24.
+        alpha: A constant between 0 and 1 that governs how quickly the running mean
+            responds to the outdoor temperature. Default: 0.8.
+        initial_prevailing: An optional number for the prevailing temperature
+            of the first day in C. If None, the mean temperature of the first
+            day will be used.
+
+    Properties:
+        * steps_per_day
+        * alpha
+        * current_prevailing
+    """
+    __slots__ = ('_steps_per_day', '_alpha', '_run_mean', '_day_sum', '_day_step',
+                 '_pending')
+
+    def __init__(self, steps_per_day=24, alpha=0.8, initial_prevailing=None):
+        """Initialize a RunningMeanTemperature."""
+        assert steps_per_day > 0, 'steps_per_day must be greater than 0. ' \
+            'Got {}.'.format(steps_per_day)
+        assert 0 <= alpha <= 1, 'alpha must be between 0 and 1. ' \
+            'Got {}.'.format(alpha)
+        self._steps_per_day = int(steps_per_day)
+        self._alpha = alpha
+        self._run_mean = initial_prevailing
+        self._day_sum = 0
+        self._day_step = 0
+        self._pending = []  # values of the first day awaiting a starting value
+
+    @property
+    def steps_per_day(self):
+        """The number of outdoor temperature values in each day."""
+        return self._steps_per_day
+
+    @property
+    def alpha(self):
+        """The constant that governs how quickly the running mean responds."""
+        return self._alpha
+
+    @property
+    def current_prevailing(self):
+        """The prevailing temperature of the current day or None if it is unknown."""
+        return self._run_mean
+
+    def update(self, outdoor_temperatures):
+        """Get prevailing temperatures for the next values of the stream.
+
+        Args:
+            outdoor_temperatures: A list of the next outdoor temperatures in C.
+
+        Returns:
+            A list of prevailing temperatures with one value for each input
+            outdoor temperature. When no initial_prevailing was input, the
+            values of the first day are only returned once the first day is
+            complete and the list may be shorter than the input.
+        """
+        prevailing = []
+        for t_out in outdoor_temperatures:
+            if self._run_mean is None:  # still collecting the first day
+                self._pending.append(t_out)
+            else:
+                prevailing.append(self._run_mean)
+            self._day_sum += t_out
+            self._day_step += 1
+            if self._day_step == self._steps_per_day:
+                prevailing.extend(self._next_day())
+        return prevailing
+
+    def flush(self):
+        """Get prevailing temperatures for any values still awaiting the first day.
+
+        This only returns values when the stream ended before the first day was
+        complete, in which case the mean of the incomplete day is used.
+        """
+        if self._run_mean is not None or not self._pending:
+            return []
+        self._run_mean = self._day_sum / self._day_step
+        pending, self._pending = self._pending, []
+        return [self._run_mean] * len(pending)
+
+    def _next_day(self):
+        """Move the running mean to the next day and return any pending values."""
+        pending = []
+        day_mean = self._day_sum / self._steps_per_day
+        if self._run_mean is None:
+            self._run_mean = day_mean
+            pending, self._pending = [day_mean] * len(self._pending), []
+        self._run_mean = (1 - self._alpha) * day_mean + self._alpha * self._run_mean
+        self._day_sum = 0
+        self._day_step = 0
+        return pending
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """RunningMeanTemperature representation."""
+        return 'Running Mean Temperature: [alpha: {}] [prevailing: {}]'.format(
+            self._alpha, self._run_mean)
+
+
+def pmv_stream(air_temperature, rel_humidity, rad_temperature=None, air_speed=0.1,
+               met_rate=1.1, clo_value=0.7, external_work=0, comfort_parameter=None,
+               chunk_size=8760):
+    """Get chunks of PMV results from iterables of inputs.
+
+    Args:
+        air_temperature: An iterable of air temperatures in C.
+        rel_humidity: An iterable of relative humidity values in % or a single
+            number to be used for all steps.
+        rad_temperature: An iterable of mean radiant temperatures in C or a single
+            number to be used for all steps. If None, the air_temperature is used.
+        air_speed: An iterable of air speeds in m/s or a single number. Default: 0.1.
+        met_rate: An iterable of metabolic rates in met or a single number.
+            Default: 1.1.
+        clo_value: An iterable of clothing values in clo or a single number.
+            Default: 0.7.
+        external_work: An iterable of external work values in met or a single
+            number. Default: 0.
+        comfort_parameter: Optional PMVParameter object to specify parameters
+            under which conditions are considered acceptable.
+        chunk_size: An integer for the number of steps in each chunk. Default: 8760.
+
+    Returns:
+        An iterator that yields a dictionary for each chunk with the following keys.
+
+        -   predicted_mean_vote
+        -   percentage_people_dissatisfied
+        -   standard_effective_temperature
+        -   cooling_effect
+        -   is_comfortable
+        -   thermal_condition
+        -   discomfort_reason
+    """
+    comf_par = _check_parameter(comfort_parameter, PMVParameter, 'PMVParameter')
+    hr_required = not (comf_par.humid_ratio_lower == 0 and
+                       comf_par.humid_ratio_upper == 1)
+    inputs = (air_temperature, rel_humidity, rad_temperature, air_speed,
+              met_rate, clo_value, external_work)
+    set_coeffs = {}  # SET coefficients for each distinct met, clo and wme
+    for ta, rh, tr, vel, met, clo, wme in _chunks(inputs, chunk_size):
+        result = {'predicted_mean_vote': [], 'percentage_people_dissatisfied': [],
+                  'standard_effective_temperature': [], 'cooling_effect': []}
+        for t_a, r_h, t_r, v, m, c, w in zip(ta, rh, tr, vel, met, clo, wme):
+            try:
+                coeffs = set_coeffs[(m, c, w)]
+            except KeyError:
+                coeffs = set_coeffs[(m, c, w)] = PierceSetCoefficients(m, c, w)
+            res = predicted_mean_vote(t_a, t_r, v, r_h, m, c, w,
+                                      comf_par.still_air_threshold, coeffs)
+            result['predicted_mean_vote'].append(res['pmv'])
+            result['percentage_people_dissatisfied'].append(res['ppd'])
+            result['standard_effective_temperature'].append(res['set'])
+            result['cooling_effect'].append(res['ce'])
+        pmv, ppd = result['predicted_mean_vote'], \
+            result['percentage_people_dissatisfied']
+        hr = PsychrometricColumns(ta, rh).humidity_ratio if hr_required else None
+        result['is_comfortable'] = comf_par.is_comfortable_batch(ppd, hr)
+        result['thermal_condition'] = comf_par.thermal_condition_batch(pmv, ppd)
+        result['discomfort_reason'] = comf_par.discomfort_reason_batch(pmv, ppd, hr)
+        yield result
+
+
+def utci_stream(air_temperature, rel_humidity, rad_temperature=None, wind_speed=0.1,
+                comfort_parameter=None, chunk_size=8760):
+    """Get chunks of UTCI results from iterables of inputs.
+
+    Args:
+        air_temperature: An iterable of air temperatures in C.
+        rel_humidity: An iterable of relative humidity values in % or a single
+            number to be used for all steps.
+        rad_temperature: An iterable of mean radiant temperatures in C or a single
+            number to be used for all steps. If None, the air_temperature is used.
+        wind_speed: An iterable of meteorological wind speeds in m/s or a single
+            number. Default: 0.1.
+        comfort_parameter: Optional UTCIParameter object to specify parameters
+            under which conditions are considered acceptable.
+        chunk_size: An integer for the number of steps in each chunk. Default: 8760.
+
+    Returns:
+        An iterator that yields a dictionary for each chunk with the following keys.
+
+        -   universal_thermal_climate_index
+        -   is_comfortable
+        -   thermal_condition
+        -   thermal_condition_eleven_point
+    """
+    comf_par = _check_parameter(comfort_parameter, UTCIParameter, 'UTCIParameter')
+    inputs = (air_temperature, rel_humidity, rad_temperature, wind_speed)
+    for ta, rh, tr, vel in _chunks(inputs, chunk_size):
+        utci = [universal_thermal_climate_index(t_a, t_r, v, r_h)
+                for t_a, r_h, t_r, v in zip(ta, rh, tr, vel)]
+        yield {
+            'universal_thermal_climate_index': utci,
+            'is_comfortable': comf_par.is_comfortable_batch(utci),
+            'thermal_condition': comf_par.thermal_condition_batch(utci),
+            'thermal_condition_eleven_point':
+                comf_par.thermal_condition_eleven_point_batch(utci)
+        }
+
+
+def adaptive_stream(outdoor_temperature, operative_temperature, air_speed=0.1,
+                    comfort_parameter=None, steps_per_day=24,
+                    initial_prevailing=None, chunk_size=8760):
+    """Get chunks of Adaptive comfort results from iterables of inputs.
+
+    The prevailing outdoor temperature is computed with a weighted running mean
+    of the outdoor_temperature, which is carried across the chunks with a
+    RunningMeanTemperature object. Note that the avg_month_or_running_mean
+    property of the comfort_parameter is not used since an average monthly
+    prevailing temperature requires data beyond the current step.
+
+    Args:
+        outdoor_temperature: An iterable of outdoor temperatures in C, which
+            align with the operative_temperature.
+        operative_temperature: An iterable of operative temperatures in C.
+        air_speed: An iterable of air speeds in m/s or a single number. Default: 0.1.
+        comfort_parameter: Optional AdaptiveParameter object to specify parameters
+            under which conditions are considered acceptable.
+        steps_per_day: An integer for the number of values in each day. Use 24
+            for hourly data and 1440 for 1-minute data. Default: 24.
+        initial_prevailing: An optional number for the prevailing temperature
+            of the first day in C. If None, the mean outdoor temperature of the
+            first day will be used.
+        chunk_size: An integer for the number of steps in each chunk. Default: 8760.
+
+    Returns:
+        An iterator that yields a dictionary for each chunk with the following keys.
+
+        -   prevailing_outdoor_temperature
+        -   neutral_temperature
+        -   degrees_from_neutral
+        -   cooling_effect
+        -   is_comfortable
+        -   thermal_condition
+    """
+    comf_par = _check_parameter(
+        comfort_parameter, AdaptiveParameter, 'AdaptiveParameter')
+    if comf_par.conditioning != 0:
+        comf_funct = adaptive_comfort_conditioned_function(
+            comf_par.conditioning, comf_par.standard)
+    elif comf_par.ashrae55_or_en15251 is True:
+        comf_funct = adaptive_comfort_ashrae55
+    else:
+        comf_funct = adaptive_comfort_en15251
+    cooling_funct = cooling_effect_ashrae55 \
+        if comf_par.discrete_or_continuous_air_speed is True else cooling_effect_en15251
+
+    running_mean = RunningMeanTemperature(steps_per_day, 0.8, initial_prevailing)
+    held = ([], [])  # operative temperatures and air speeds awaiting prevailing
+    inputs = (outdoor_temperature, operative_temperature, air_speed)
+    for t_out, to, vel in _chunks(inputs, chunk_size):
+        held[0].extend(to)
+        held[1].extend(vel)
+        prevail = running_mean.update(t_out)
+        if prevail:
+            yield _adaptive_chunk(prevail, held, comf_funct, cooling_funct, comf_par)
+    prevail = running_mean.flush()
+    if prevail:
+        yield _adaptive_chunk(prevail, held, comf_funct, cooling_funct, comf_par)
+
+
+def outdoor_solarcal_stream(location, datetimes, direct_normal_solar,
+                            diffuse_horizontal_solar, horizontal_infrared,
+                            surface_temperatures, fraction_body_exposed=1,
+                            sky_exposure=1, floor_reflectance=0.25,
+                            solarcal_body_parameter=None, chunk_size=8760):
+    """Get chunks of outdoor SolarCal results from iterables of inputs.
+
+    Args:
+        location: A Ladybug Location object.
+        datetimes: An iterable of Ladybug DateTime objects for each step, which
+            are used to compute the sun position.
+        direct_normal_solar: An iterable of direct normal solar irradiance in W/m2.
+        diffuse_horizontal_solar: An iterable of diffuse horizontal solar
+            irradiance in W/m2.
+        horizontal_infrared: An iterable of horizontal infrared radiation
+            intensity in W/m2.
+        surface_temperatures: An iterable of the temperature of surfaces around
+            the person in C or a single number to be used for all steps.
+        fraction_body_exposed: An iterable or number between 0 and 1 for the
+            fraction of the body exposed to direct sunlight. Default: 1.
+        sky_exposure: An iterable or number between 0 and 1 for the fraction of
+            the sky vault in occupant's view. Default: 1.
+        floor_reflectance: An iterable or number between 0 and 1 for the
+            reflectance of the floor. Default: 0.25.
+        solarcal_body_parameter: Optional SolarCalParameter object to account for
+            properties of the human geometry.
+        chunk_size: An integer for the number of steps in each chunk. Default: 8760.
+
+    Returns:
+        An iterator that yields a dictionary for each chunk with the following keys.
+
+        -   shortwave_effective_radiant_field
+        -   longwave_effective_radiant_field
+        -   shortwave_mrt_delta
+        -   longwave_mrt_delta
+        -   mrt_delta
+        -   mean_radiant_temperature
+    """
+    assert isinstance(location, Location), 'location must be a Ladybug Location' \
+        ' object. Got {}.'.format(type(location))
+    if solarcal_body_parameter is None:
+        body_par = SolarCalParameter(posture='standing')
+    else:
+        assert isinstance(solarcal_body_parameter, SolarCalParameter), \
+            'solarcal_body_parameter must be a SolarCalParameter object. ' \
+            'Got {}'.format(type(solarcal_body_parameter))
+        body_par = solarcal_body_parameter
+    sp = Sunpath.from_location(location)
+    inputs = (datetimes, direct_normal_solar, diffuse_horizontal_solar,
+              horizontal_infrared, surface_temperatures, fraction_body_exposed,
+              sky_exposure, floor_reflectance)
+    keys = ('s_erf', 'l_erf', 's_dmrt', 'l_dmrt')
+    names = ('shortwave_effective_radiant_field', 'longwave_effective_radiant_field',
+             'shortwave_mrt_delta', 'longwave_mrt_delta')
+    for chunk in _chunks(inputs, chunk_size):
+        result = dict((name, []) for name in names)
+        result['mrt_delta'], result['mean_radiant_temperature'] = [], []
+        for t_date, dir_n, diff, h_ir, t_srf, fract_e, sky_e, flr_ref in zip(*chunk):
+            sun = sp.calculate_sun_from_date_time(t_date)
+            sharp = body_par.sharp if body_par.body_azimuth is None else \
+                sharp_from_solar_and_body_azimuth(sun.azimuth, body_par.body_azimuth)
+            res = outdoor_sky_heat_exch(
+                t_srf, h_ir, diff, dir_n, sun.altitude, sky_e, fract_e, flr_ref,
+                body_par.posture, sharp, body_par.body_absorptivity,
+                body_par.body_emissivity)
+            for key, name in zip(keys, names):
+                result[name].append(res[key])
+            result['mrt_delta'].append(res['s_dmrt'] + res['l_dmrt'])
+            result['mean_radiant_temperature'].append(res['mrt'])
+        yield result
+
+
+def _adaptive_chunk(prevail, held, comf_funct, cooling_funct, comf_par):
+    """Compute Adaptive results for the held inputs that now have a prevailing temp.
+    """
+    count = len(prevail)
+    op_temps, speeds = held[0][:count], held[1][:count]
+    del held[0][:count]
+    del held[1][:count]
+    result = {'prevailing_outdoor_temperature': prevail, 'neutral_temperature': [],
+              'degrees_from_neutral': [], 'cooling_effect': []}
+    for tp, to, vel in zip(prevail, op_temps, speeds):
+        comf_result = comf_funct(tp, to)
+        result['neutral_temperature'].append(comf_result['t_comf'])
+        result['degrees_from_neutral'].append(comf_result['deg_comf'])
+        result['cooling_effect'].append(cooling_funct(vel, to))
+    degs, ces = result['degrees_from_neutral'], result['cooling_effect']
+    result['is_comfortable'] = comf_par.is_comfortable_batch(op_temps, degs, ces)
+    result['thermal_condition'] = comf_par.thermal_condition_batch(op_temps, degs, ces)
+    return result
+
+
+def _chunks(inputs, chunk_size):
+    """Yield tuples of lists with chunk_size values from iterables or numbers.
+
+    The first input must be an iterable and it determines the number of steps.
+    Any input that is None uses the values of the first input and any input
+    that is a number is repeated for every step.
+    """
+    assert chunk_size > 0, 'chunk_size must be greater than 0. ' \
+        'Got {}.'.format(chunk_size)
+    base = iter(inputs[0])
+    iterables, share_base = [base], []
+    for i, inp in enumerate(inputs[1:]):
+        if inp is None:
+            share_base.append(i + 1)
+            iterables.append(repeat(None))
+        elif isinstance(inp, (int, float)):
+            iterables.append(repeat(inp))
+        else:
+            iterables.append(iter(inp))
+    steps = zip(*iterables)
+    while True:
+        chunk = list(islice(steps, chunk_size))
+        if not chunk:
+            return
+        columns = [list(col) for col in zip(*chunk)]
+        for i in share_base:
+            columns[i] = columns[0]
+        yield tuple(columns)
+
+
+def _check_parameter(parameter, par_class, par_name):
+    """Check a comfort parameter, returning the default one if it is None."""
+    if parameter is None:
+        return par_class()
+    assert isinstance(parameter, par_class), 'comfort_parameter must be a {} ' \
+        'object. Got {}'.format(par_name, type(parameter))
+    return parameter
@@ -0,0 +1,274 @@
+# coding=utf-8
+"""Functions for surveying the outdoor comfort of many EPW files at once.
+
+The survey distributes EPW files across a pool of processes, evaluates the
+requested comfort models for each file with EPWComfort and streams one row
+of percent statistics per file to a CSV. Files that are already in the CSV
+are skipped, which allows an interrupted survey to be resumed by running
+it again with the same CSV.
+
+Usage:
+
+.. code-block:: shell
+
+    ladybug-comfort-survey ./weather_files -o survey.csv --models utci pmv
+"""
+from __future__ import division
+
+from .epw import EPWComfort
+from .collection.utci import UTCI
+from .collection.pmv import PMV
+from .collection.adaptive import Adaptive
+from .collection.hi import HeatIndex
+from .collection.humidex import Humidex
+from .collection.wc import WindChill
+from .collection.at import ApparentTemperature
+from .collection.di import DiscomfortIndex
+from .collection.ts import ThermalSensation
+from .collection.asv import ActualSensationVote
+
+from ladybug.epw import EPW
+
+import argparse
+import csv
+import os
+import sys
+
+try:  # multiprocessing is not available in IronPython
+    import multiprocessing
+except ImportError:
+    multiprocessing = None
+
+SURVEY_STATISTICS = ('percent_neutral', 'percent_hot', 'percent_cold')
+_MODEL_CLASSES = {
+    'utci': UTCI, 'pmv': PMV, 'adaptive': Adaptive, 'heat_index': HeatIndex,
+    'humidex': Humidex, 'wind_chill': WindChill,
+    'apparent_temperature': ApparentTemperature,
+    'discomfort_index': DiscomfortIndex, 'thermal_sensation': ThermalSensation,
+    'actual_sensation_vote': ActualSensationVote}
+
+
+def find_epw_files(paths, recursive=True):
+    """Get a sorted list of EPW file paths from a list of files and folders.
+
+    Args:
+        paths: A list of paths to EPW files or folders containing EPW files.
+        recursive: Boolean to note whether sub-folders of the folders should
+            also be searched for EPW files. (Default: True).
+
+    Returns:
+        A sorted list of absolute paths to the EPW files.
+    """
+    epw_files = set()
+    for path in paths:
+        if os.path.isfile(path):
+            epw_files.add(os.path.abspath(path))
+            continue
+        assert os.path.isdir(path), 'No file or folder was found at: {}'.format(path)
+        for root, dirs, files in os.walk(path):
+            for f in files:
+                if f.lower().endswith('.epw'):
+                    epw_files.add(os.path.abspath(os.path.join(root, f)))
+            if not recursive:
+                break
+    return sorted(epw_files)
+
+
+def survey_header(models=('utci', 'pmv')):
+    """Get the list of CSV column names of a survey for a list of models.
+
+    Args:
+        models: A list of model names from EPWComfort.MODELS.
+
+    Returns:
+        A list of column names, which are the EPW file path, the city, latitude
+        and longitude followed by the percent statistics of each model
+        (eg. 'utci_percent_neutral').
+    """
+    header = ['epw_file', 'city', 'latitude', 'longitude']
+    for model in models:
+        assert model in _MODEL_CLASSES, 'Comfort model "{}" is not recognized. ' \
+            'Choose from: {}.'.format(model, ', '.join(EPWComfort.MODELS))
+        percent_props = _MODEL_CLASSES[model]._percent_properties
+        header.extend('{}_{}'.format(model, stat) for stat in SURVEY_STATISTICS
+                      if stat in percent_props)
+    return header
+
+
+def survey_epw(epw_file, models=('utci', 'pmv'), include_wind=True,
+               include_sun=True):
+    """Get a row of comfort statistics for a single EPW file.
+
+    Args:
+        epw_file: Path to an EPW file.
+        models: A list of model names from EPWComfort.MODELS.
+            (Default: ('utci', 'pmv')).
+        include_wind: Boolean to note whether the EPW wind speed should be
+            included in the models. (Default: True).
+        include_sun: Boolean to note whether the sun should be included in
+            the models. (Default: True).
+
+    Returns:
+        A list of values that align with the survey_header of the models.
+    """
+    epw = EPW(epw_file)
+    epw_comfort = EPWComfort(epw, include_wind, include_sun)
+    loc = epw.location
+    row = [os.path.abspath(epw_file), loc.city, loc.latitude, loc.longitude]
+    for model in models:
+        comf_obj = getattr(epw_comfort, model)
+        row.extend(getattr(comf_obj, stat) for stat in SURVEY_STATISTICS
+                   if stat in comf_obj._percent_properties)
+    return row
+
+
+def climate_survey(epw_files, csv_path, models=('utci', 'pmv'), include_wind=True,
+                   include_sun=True, processes=None):
+    """Survey the outdoor comfort of many EPW files and write the results to a CSV.
+
+    Rows are written to the CSV as soon as each EPW file is finished such that
+    the results of an interrupted survey are not lost. If the CSV already
+    exists, the files that are already in it are skipped and the new rows are
+    appended to it.
+
+    Args:
+        epw_files: A list of paths to EPW files.
+        csv_path: Path to the CSV file to which the results will be written.
+        models: A list of model names from EPWComfort.MODELS.
+            (Default: ('utci', 'pmv')).
+        include_wind: Boolean to note whether the EPW wind speed should be
+            included in the models. (Default: True).
+        include_sun: Boolean to note whether the sun should be included in
+            the models. (Default: True).
+        processes: An integer for the number of processes used to evaluate the
+            EPW files. If None, the number of CPUs will be used. Setting this to
+            1 evaluates all files in the current process.
+
+    Returns:
+        A dictionary of the EPW files that could not be evaluated with the file
+        paths as keys and the error messages as values. These files are not
+        written to the CSV and they will be retried when the survey is resumed.
+    """
+    header = survey_header(models)
+    done = _read_finished_files(csv_path, header)
+    to_run = []
+    for epw_file in epw_files:
+        epw_file = os.path.abspath(epw_file)
+        if epw_file not in done:
+            to_run.append(epw_file)
+            done.add(epw_file)  # avoid running duplicate files twice
+    failures = {}
+    if not to_run:
+        return failures
+
+    new_file = not os.path.isfile(csv_path)
+    with _open_csv(csv_path, 'a') as csv_file:
+        writer = csv.writer(csv_file)
+        if new_file:
+            writer.writerow(header)
+        args = [(f, tuple(models), include_wind, include_sun) for f in to_run]
+        processes = processes or (multiprocessing.cpu_count() if multiprocessing
+                                  else 1)
+        if processes == 1 or multiprocessing is None or len(args) == 1:
+            results = (_survey_worker(arg) for arg in args)
+            _write_results(results, writer, csv_file, failures)
+        else:
+            pool = multiprocessing.Pool(min(processes, len(args)))
+            try:
+                results = pool.imap_unordered(_survey_worker, args)
+                _write_results(results, writer, csv_file, failures)
+            finally:
+                pool.terminate()
+                pool.join()
+    return failures
+
+
+def main(args=None):
+    """Run a climate survey from the command line."""
+    parser = argparse.ArgumentParser(
+        description='Survey the outdoor comfort of many EPW files and write one '
+        'row of percent statistics per file to a CSV. Running the same command '
+        'again resumes an interrupted survey.')
+    parser.add_argument('paths', nargs='+',
+                        help='EPW files or folders containing EPW files.')
+    parser.add_argument('-o', '--output', default='comfort_survey.csv',
+                        help='Path to the output CSV. (Default: comfort_survey.csv).')
+    parser.add_argument('-m', '--models', nargs='+', default=['utci', 'pmv'],
+                        choices=EPWComfort.MODELS,
+                        help='Comfort models to evaluate. (Default: utci pmv).')
+    parser.add_argument('--no-wind', dest='include_wind', action='store_false',
+                        help='Assume a condition that is shielded from wind.')
+    parser.add_argument('--no-sun', dest='include_sun', action='store_false',
+                        help='Assume a shaded condition.')
+    parser.add_argument('--no-recursive', dest='recursive', action='store_false',
+                        help='Do not search the sub-folders of the input folders.')
+    parser.add_argument('-p', '--processes', type=int, default=None,
+                        help='Number of processes. (Default: the number of CPUs).')
+    options = parser.parse_args(args)
+
+    epw_files = find_epw_files(options.paths, options.recursive)
+    failures = climate_survey(
+        epw_files, options.output, options.models, options.include_wind,
+        options.include_sun, options.processes)
+    for epw_file, error in sorted(failures.items()):
+        sys.stderr.write('Failed to survey {}: {}\n'.format(epw_file, error))
+    return 1 if failures else 0
+
+
+def _survey_worker(args):
+    """Evaluate one EPW file in a worker process without raising exceptions."""
+    epw_file = args[0]
+    try:
+        return epw_file, survey_epw(*args), None
+    except Exception as e:
+        return epw_file, None, '{}: {}'.format(e.__class__.__name__, e)
+
+
+def _write_results(results, writer, csv_file, failures):
+    """Write survey results to a CSV as they arrive, flushing after each row."""
+    for epw_file, row, error in results:
+        if error is not None:
+            failures[epw_file] = error
+            continue
+        writer.writerow(row)
+        csv_file.flush()
+
+
+def _read_finished_files(csv_path, header):
+    """Get a set of the EPW files that are already in a survey CSV.
+
+    A last row that was cut off by an interruption is removed from the file
+    such that it is evaluated again.
+    """
+    if not os.path.isfile(csv_path):
+        return set()
+    with _open_csv(csv_path, 'r') as csv_file:
+        rows = list(csv.reader(csv_file))
+        csv_file.seek(0)
+        cut_off = not csv_file.read().endswith('\n')
+    if not rows:
+        os.remove(csv_path)
+        return set()
+    assert rows[0] == header, 'The existing CSV at {} is for a survey with ' \
+        'different models. Use a different CSV path or delete the file.'.format(
+            csv_path)
+    if cut_off:  # the last row was not completely written
+        rows.pop(-1)
+    complete = [row for row in rows[1:] if len(row) == len(header)]
+    if cut_off or len(complete) != len(rows) - 1:  # rewrite without incomplete rows
+        with _open_csv(csv_path, 'w') as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(header)
+            writer.writerows(complete)
+    return set(row[0] for row in complete)
+
+
+def _open_csv(csv_path, mode):
+    """Open a CSV file in a way that works with the csv module of Python 2 and 3."""
+    if sys.version_info[0] < 3:
+        return open(csv_path, mode + 'b')
+    return open(csv_path, mode, newline='')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,5 +1,11 @@
 # coding=utf-8
 """Utility functions for calculating Thermal Sensation (TS)."""
+from ._categorize import categorize
+
+try:
+    from itertools import izip as zip  # python 2
+except ImportError:
+    pass
 
 
 def thermal_sensation(ta, ws, rh, sr, tground):
@@ -34,6 +40,26 @@ def thermal_sensation(ta, ws, rh, sr, tground):
     return ts
 
 
+def thermal_sensation_batch(ta, ws, rh, sr, tground):
+    """Calculate Thermal Sensation (TS) for lists of air temperature, wind speed,
+    relative humidity, solar radiation and ground temperature.
+
+    This is equivalent to calling thermal_sensation() for each set of values.
+
+    Args:
+        ta: A list of air temperatures [C]
+        ws: A list of wind speeds [m/s] that align with ta.
+        rh: A list of relative humidity values [%] that align with ta.
+        sr: A list of solar radiation values [Wh/m2] that align with ta.
+        tground: A list of ground temperatures [C] that align with ta.
+
+    Returns:
+        ts -- A list of Thermal sensation values [unitless]
+    """
+    return [1.7 + 0.1118 * t + 0.0019 * s - 0.322 * w - 0.0073 * r + 0.0054 * tg
+            for t, w, r, s, tg in zip(ta, ws, rh, sr, tground)]
+
+
 def thermal_sensation_effect_category(ts):
     """Get the category of effect associated with a given thermal sensation
     (TS).
@@ -80,3 +106,18 @@ def thermal_sensation_effect_category(ts):
         category = -3
 
     return category
+
+
+def thermal_sensation_effect_category_batch(ts):
+    """Get the categories of effect associated with a list of thermal sensation
+    (TS) values.
+
+    This is equivalent to calling thermal_sensation_effect_category() for each value.
+
+    Args:
+        ts: A list of Thermal Sensation values [unitless]
+
+    Returns:
+        category -- A list of integers from -3 (Very cold) to 3 (Very hot).
+    """
+    return categorize(ts, (2, 3, 4, 5, 6, 7), (), range(-3, 4))
@@ -5,6 +5,8 @@ from __future__ import division
 from ladybug.rootfinding import secant
 from ladybug.rootfinding import bisect
 
+from .backend import register_implementation, implementation
+
 import math
 
 
@@ -44,6 +46,9 @@ def universal_thermal_climate_index(ta, tr, vel, rh):
         UTCI_approx -- The Universal Thermal Climate Index (UTCI) for the input
         conditions as approximated by a 4-D polynomial.
     """
+    impl = implementation('universal_thermal_climate_index')
+    if impl is not None:
+        return impl(ta, tr, vel, rh)
     # set upper and lower limits of air velocity according to Fiala model scenarios
     vel = 0.5 if vel < 0.5 else vel
     vel = 17 if vel > 17 else vel
@@ -324,35 +329,10 @@ def calc_missing_utci_input(target_utci, utci_inputs,
         'utci_inputs must have 4 keys. Got {}.'.format(len(utci_inputs.keys()))
 
     # Determine the function that should be used given the missing input.
-    if utci_inputs['ta'] is None and utci_inputs['tr'] is None:
-        def fn(x):
-            return universal_thermal_climate_index(
-                x, x, utci_inputs['vel'], utci_inputs['rh']
-                ) - target_utci
-        missing_key = ('ta', 'tr')
-    elif utci_inputs['ta'] is None:
-        def fn(x):
-            return universal_thermal_climate_index(
-                x, utci_inputs['tr'], utci_inputs['vel'], utci_inputs['rh']
-                ) - target_utci
-        missing_key = 'ta'
-    elif utci_inputs['tr'] is None:
-        def fn(x):
-            return universal_thermal_climate_index(
-                utci_inputs['ta'], x, utci_inputs['vel'], utci_inputs['rh']
-                ) - target_utci
-        missing_key = 'tr'
-    elif utci_inputs['vel'] is None:
-        def fn(x):
-            return target_utci - universal_thermal_climate_index(
-                utci_inputs['ta'], utci_inputs['tr'], x, utci_inputs['rh'])
-        missing_key = 'vel'
-    else:
-        def fn(x):
-            return universal_thermal_climate_index(
-                utci_inputs['ta'], utci_inputs['tr'], utci_inputs['vel'], x
-                ) - target_utci
-        missing_key = 'rh'
+    missing_key = _missing_utci_key(utci_inputs)
+    fn = _missing_utci_function(
+        [utci_inputs[key] for key in ('ta', 'tr', 'vel', 'rh')],
+        missing_key, target_utci)
 
     # Solve for the missing input using the function.
     missing_val = secant(low_bound, up_bound, fn, tolerance)
@@ -366,3 +346,153 @@ def calc_missing_utci_input(target_utci, utci_inputs,
         for key in missing_key:
             utci_inputs[key] = missing_val
     return utci_inputs
+
+
+def calc_missing_utci_input_batch(target_utci, utci_inputs,
+                                  low_bound=0., up_bound=100., tolerance=0.001):
+    """Return lists of a missing_utci_input given target_utcis and the 3 other inputs.
+
+    This is particularly useful when generating many boundary curves of UTCI
+    stress categories (eg. for every hour of a year and every wind speed).
+    Each value is solved with Newton's method using a finite-difference derivative
+    of the UTCI polynomial, starting from the solution of the previous item in
+    the lists. Values that cannot be solved this way fall back to the
+    secant and bisect methods used by calc_missing_utci_input. Values that
+    still cannot be solved are reported as failures instead of raising an
+    exception.
+
+    Args:
+        target_utci: A list of target UTCI temperatures that you are trying to
+            produce from the inputs to the UTCI model. This can also be a
+            single number to be used for all of the utci_inputs.
+        utci_inputs: A dictionary of 4 UTCI inputs with the following keys:
+            'ta', 'tr', 'vel', 'rh'. Each key should correspond to either a list
+            of values or a single value to be used for all items. One of these
+            inputs should have a value of None and it will be solved for by
+            this function. Like calc_missing_utci_input, one can also input None
+            for both 'ta' and 'tr' to solve for the operative temperature.
+            Example (solving for air temperature at several wind speeds):
+
+         .. code-block:: python
+
+            {'ta': None, 'tr': 20, 'vel': [0.5, 1, 2, 4], 'rh': 50}
+
+        low_bound: The lowest possible value of the missing input you are tying to
+            find. Unlike calc_missing_utci_input, solutions outside of the
+            low_bound and up_bound are considered failures.
+        up_bound: The highest possible value of the missing input you are tying to
+            find. Unlike calc_missing_utci_input, solutions outside of the
+            low_bound and up_bound are considered failures.
+        tolerance: The acceptable error in the target_utci. The default is set to 0.001
+
+    Returns:
+        A tuple with two elements
+
+        -   complete_utci_inputs: A dictionary with the same keys as the utci_inputs
+            but with a list of values for each input. The missing input will be
+            filled by the values that return the target_utci and it will be None
+            wherever a solution could not be found.
+
+        -   success: A list of booleans noting whether a solution was found for
+            each item of the input lists.
+    """
+    assert len(utci_inputs.keys()) == 4, \
+        'utci_inputs must have 4 keys. Got {}.'.format(len(utci_inputs.keys()))
+    keys = ('ta', 'tr', 'vel', 'rh')
+    missing_key = _missing_utci_key(utci_inputs)
+    seq_lens = [len(val) for val in list(utci_inputs.values()) + [target_utci]
+                if isinstance(val, (list, tuple))]
+    count = max(seq_lens) if len(seq_lens) != 0 else 1
+    assert all(s_len == count for s_len in seq_lens), 'All lists in utci_inputs ' \
+        'and target_utci must have the same length. Got {}.'.format(seq_lens)
+
+    def _as_list(val):
+        return list(val) if isinstance(val, (list, tuple)) else [val] * count
+
+    inputs = dict((key, _as_list(utci_inputs[key])) for key in keys)
+    targets = _as_list(target_utci)
+    delta = max(tolerance, (up_bound - low_bound) * 1e-5)
+
+    # solve for the missing input of each item in the lists
+    solved, success, guess = [], [], (low_bound + up_bound) / 2
+    for i in range(count):
+        fn = _missing_utci_function(
+            [inputs[key][i] for key in keys], missing_key, targets[i])
+
+        # use Newton's method starting from the previous solution
+        missing_val, x = None, guess
+        for _ in range(20):
+            f_x = fn(x)
+            if abs(f_x) <= tolerance:
+                missing_val = x
+                break
+            slope = (fn(x + delta) - fn(x - delta)) / (2 * delta)
+            if slope == 0:
+                break
+            x = min(max(x - f_x / slope, low_bound), up_bound)
+
+        # fall back to the secant and bisect methods if Newton's method failed
+        if missing_val is None:
+            try:
+                missing_val = secant(low_bound, up_bound, fn, tolerance)
+            except (ZeroDivisionError, OverflowError):
+                missing_val = None
+            if missing_val is None or not low_bound <= missing_val <= up_bound:
+                missing_val = bisect(low_bound, up_bound, fn, tolerance, 0)
+                if missing_val == -999 or abs(fn(missing_val)) > tolerance * 10:
+                    missing_val = None
+
+        solved.append(missing_val)
+        success.append(missing_val is not None)
+        if missing_val is not None:
+            guess = missing_val
+
+    # complete the input dictionary
+    missing_keys = missing_key if isinstance(missing_key, tuple) else (missing_key,)
+    for key in missing_keys:
+        inputs[key] = list(solved)
+    return inputs, success
+
+
+def _missing_utci_key(utci_inputs):
+    """Get the key of the missing UTCI input from a dictionary of UTCI inputs."""
+    if utci_inputs['ta'] is None and utci_inputs['tr'] is None:
+        return ('ta', 'tr')
+    for key in ('ta', 'tr', 'vel'):
+        if utci_inputs[key] is None:
+            return key
+    return 'rh'
+
+
+def _missing_utci_function(args, missing_key, target_utci):
+    """Get a function of the missing UTCI input that is zero at the target_utci.
+
+    Args:
+        args: A list of the 4 UTCI inputs in the order of the
+            universal_thermal_climate_index function. The missing input(s)
+            can be any value.
+        missing_key: Text for the missing UTCI input key or the tuple ('ta', 'tr').
+        target_utci: The target UTCI temperature.
+    """
+    ta, tr, vel, rh = args
+    if missing_key == ('ta', 'tr'):
+        def fn(x):
+            return universal_thermal_climate_index(x, x, vel, rh) - target_utci
+    elif missing_key == 'ta':
+        def fn(x):
+            return universal_thermal_climate_index(x, tr, vel, rh) - target_utci
+    elif missing_key == 'tr':
+        def fn(x):
+            return universal_thermal_climate_index(ta, x, vel, rh) - target_utci
+    elif missing_key == 'vel':
+        def fn(x):
+            return target_utci - universal_thermal_climate_index(ta, tr, x, rh)
+    else:
+        def fn(x):
+            return universal_thermal_climate_index(ta, tr, vel, x) - target_utci
+    return fn
+
+
+# register the pure Python implementations of the model kernels
+register_implementation(
+    'universal_thermal_climate_index', 'python', universal_thermal_climate_index)
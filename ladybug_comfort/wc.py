@@ -2,8 +2,15 @@
 """Utility functions for calculating Wind Chill Index (WCI) and Wind Chill
 Temperature (WCT)"""
 
+from ._categorize import categorize
+
 import math
 
+try:
+    from itertools import izip as zip  # python 2
+except ImportError:
+    pass
+
 
 def windchill_index(ta, ws):
     """Calculate the Wind Chill Index (WCI) from air temperature and wind
@@ -29,6 +36,23 @@ def windchill_index(ta, ws):
     return wci
 
 
+def windchill_index_batch(ta, ws):
+    """Calculate the Wind Chill Index (WCI) for lists of air temperature and
+    wind speed.
+
+    This is equivalent to calling windchill_index() for each pair of values.
+
+    Args:
+        ta: A list of air temperatures [C]
+        ws: A list of wind speeds [m/s] that align with ta.
+
+    Returns:
+        wci -- A list of Wind Chill Index values [W/m2]
+    """
+    sqrt = math.sqrt
+    return [(10 * sqrt(w) + 10.45 - w) * (33 - t) * 1.163 for t, w in zip(ta, ws)]
+
+
 def windchill_index_effect_category(wci):
     """Get the category of effect associated with a given wind chill index
     (WCI).
@@ -81,6 +105,22 @@ def windchill_index_effect_category(wci):
     return category
 
 
+def windchill_index_effect_category_batch(wci):
+    """Get the categories of effect associated with a list of wind chill index
+    (WCI) values.
+
+    This is equivalent to calling windchill_index_effect_category() for each value.
+
+    Args:
+        wci: A list of Wind Chill Index values [W/m2]
+
+    Returns:
+        category -- A list of integers from -4 (Extreme frost) to 3 (Extremely hot).
+    """
+    return categorize(wci, (58.3, 116.3, 232.6, 581.5, 930.4, 1628.2, 2326), (),
+                      (3, 2, 1, 0, -1, -2, -3, -4))
+
+
 def windchill_temp(ta, ws):
     """Calculate the Wind Chill Temperature (WCT) from air temperature and wind
     speed.
@@ -108,6 +148,26 @@ def windchill_temp(ta, ws):
     return twc
 
 
+def windchill_temp_batch(ta, ws):
+    """Calculate the Wind Chill Temperature (WCT) for lists of air temperature and
+    wind speed.
+
+    This is equivalent to calling windchill_temp() for each pair of values.
+
+    Args:
+        ta: A list of air temperatures [C]
+        ws: A list of wind speeds [m/s] that align with ta.
+
+    Returns:
+        twc -- A list of Wind Chill Temperature values [C]
+    """
+    twc_values = []
+    for t, w in zip(ta, ws):
+        ws_fac = (w * 3.6) ** 0.16  # convert wind speed from m/s to km/h
+        twc_values.append(13.12 + 0.6215 * t - 11.37 * ws_fac + 0.3965 * t * ws_fac)
+    return twc_values
+
+
 def windchill_temp_effect_category(twc):
     """Get the category of effect associated with a given wind chill
     temperature (WCT).
@@ -166,3 +226,18 @@ def windchill_temp_effect_category(twc):
         category = -6
 
     return category
+
+
+def windchill_temp_effect_category_batch(twc):
+    """Get the categories of effect associated with a list of wind chill
+    temperature (WCT) values.
+
+    This is equivalent to calling windchill_temp_effect_category() for each value.
+
+    Args:
+        twc: A list of Wind Chill Temperature values [C]
+
+    Returns:
+        category -- A list of integers from -6 (Danger) to 0 (No discomfort).
+    """
+    return categorize(twc, (-54, -47, -39, -27, -9, 0), (), range(-6, 1))
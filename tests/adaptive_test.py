@@ -321,6 +321,24 @@ def test_thermal_condition_check():
     assert condition_test == 0
 
 
+def test_adaptive_parameter_batch():
+    """Test that the batch methods on AdaptiveParameter match the single-value ones."""
+    adaptive_par = AdaptiveParameter()
+    results = [adaptive_comfort_ashrae55(24, to) for to in (10, 20, 24, 26, 28, 32)]
+    ces = [0, 0, 0, 1.2, 3, 0]
+    to = [r['to'] for r in results]
+    deg = [r['deg_comf'] for r in results]
+    assert adaptive_par.is_comfortable_batch(to, deg) == \
+        [adaptive_par.is_comfortable(r) for r in results]
+    assert adaptive_par.is_comfortable_batch(to, deg, ces) == \
+        [adaptive_par.is_comfortable(r, c) for r, c in zip(results, ces)]
+    assert adaptive_par.thermal_condition_batch(to, deg, ces) == \
+        [adaptive_par.thermal_condition(r, c) for r, c in zip(results, ces)]
+    comf = adaptive_par.is_comfortable_batch(to, deg, ces)
+    assert adaptive_par.thermal_condition_batch(to, deg, ces, comf) == \
+        adaptive_par.thermal_condition_batch(to, deg, ces)
+
+
 def test_init_adaptive_collection():
     """Test the initialization of the Adaptive collection and basic outputs."""
     calc_length = 24
@@ -533,6 +551,54 @@ def test_adaptive_collection_comfort_percent_outputs():
     assert adapt_obj.percent_hot == pytest.approx(6.4726027, rel=1e-3)
     assert adapt_obj.percent_cold == pytest.approx(80.570776, rel=1e-3)
 
+    counts = adapt_obj.category_counts()
+    assert sorted(counts.keys()) == [-1, 0, 1]
+    assert sum(counts.values()) == 8760
+    summary = adapt_obj.summary()
+    assert len(summary) == 5
+    assert summary['percent_neutral'] == pytest.approx(12.95662, rel=1e-3)
+
+
+def test_adaptive_collection_mask():
+    """Test the Adaptive collection with a mask of the steps to evaluate."""
+    calc_length = 24
+    header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
+    op_temp = HourlyContinuousCollection(
+        header, [18 + i * 0.5 for i in range(calc_length)])
+    mask = [i >= 12 for i in range(calc_length)]
+    full_obj = Adaptive(24, op_temp)
+    adapt_obj = Adaptive(24, op_temp, mask=mask)
+
+    assert adapt_obj.degrees_from_neutral.values == \
+        (None,) * 12 + full_obj.degrees_from_neutral.values[12:]
+    assert adapt_obj.prevailing_outdoor_temperature.values == (24,) * calc_length
+    conditions = full_obj.thermal_condition.values[12:]
+    assert adapt_obj.percent_hot == pytest.approx(100 * conditions.count(1) / 12)
+    assert adapt_obj.percent_comfortable == \
+        pytest.approx(100 * conditions.count(0) / 12)
+
+
+def test_adaptive_collection_threshold_sweep():
+    """Test the neutral offset sweep of the Adaptive collection."""
+    calc_length = 24
+    header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
+    op_temp = HourlyContinuousCollection(
+        header, [14.1 + i * 0.73 for i in range(calc_length)])
+    mask = [i % 5 != 0 for i in range(calc_length)]
+    offsets = [0.5, 1.3, 2.5, 3.5, 4.7, 7.1, 10]
+    for prevail, air_speed, conditioning in ((24, 0.1, 0), (8, 1.2, 0), (20, 0.8, 0.5)):
+        comf_par = AdaptiveParameter(conditioning=conditioning)
+        adapt_obj = Adaptive(prevail, op_temp, air_speed, comf_par, mask=mask)
+        sweep = adapt_obj.threshold_sweep(offsets)
+        for i, offset in enumerate(offsets):
+            comf_par.neutral_offset = offset
+            test_obj = Adaptive(prevail, op_temp, air_speed, comf_par, mask=mask)
+            for key, val in sweep.items():
+                assert val[i] == pytest.approx(getattr(test_obj, key))
+
+    with pytest.raises(AssertionError):
+        adapt_obj.threshold_sweep([0])
+
 
 def test_adaptive_collection_epw_prevailing():
     """Test the percent outputs of the Adaptive collection."""
@@ -3,6 +3,11 @@ import pytest
 
 from ladybug_comfort.asv import actual_sensation_vote
 from ladybug_comfort.asv import actual_sensation_vote_effect_category
+from ladybug_comfort.asv import actual_sensation_vote_batch, \
+    actual_sensation_vote_effect_category_batch
+from ladybug_comfort.collection.asv import ActualSensationVote
+
+from ladybug.epw import EPW
 
 
 def test_actual_sensation_vote():
@@ -20,3 +25,34 @@ def test_actual_sensation_vote_effect_category():
     assert actual_sensation_vote_effect_category(0.5) == 0
     assert actual_sensation_vote_effect_category(-1.4) == -1
     assert actual_sensation_vote_effect_category(-2.5) == -2
+
+
+def test_actual_sensation_vote_batch():
+    """Test that the batch actual sensation vote functions match single values."""
+    ta = [t for t in range(-20, 50)]
+    ws = [t * 0.1 for t in range(70)]
+    rh = [50] * 70
+    sr = [t * 10 for t in range(70)]
+    asv_values = actual_sensation_vote_batch(ta, ws, rh, sr)
+    assert asv_values == pytest.approx(
+        [actual_sensation_vote(*vals) for vals in zip(ta, ws, rh, sr)])
+
+    asv_values.extend([-2, -1, 1, 2])
+    assert actual_sensation_vote_effect_category_batch(asv_values) == \
+        [actual_sensation_vote_effect_category(asv) for asv in asv_values]
+
+
+def test_actual_sensation_vote_collection():
+    """Test the ActualSensationVote collection against the scalar function."""
+    epw = EPW('./tests/epw/chicago.epw')
+    asv_obj = ActualSensationVote.from_epw(epw, include_sun=False)
+    assert asv_obj.comfort_model == 'Actual Sensation Vote'
+    assert asv_obj.calc_length == 8760
+    assert asv_obj.actual_sensation_vote.values == pytest.approx([
+        actual_sensation_vote(ta, ws, rh, 0) for ta, ws, rh in zip(
+            epw.dry_bulb_temperature, epw.wind_speed, epw.relative_humidity)])
+    assert asv_obj.actual_sensation_vote_category.values == tuple(
+        actual_sensation_vote_effect_category(asv)
+        for asv in asv_obj.actual_sensation_vote)
+    assert asv_obj.percent_neutral + asv_obj.percent_hot + asv_obj.percent_cold == \
+        pytest.approx(100)
@@ -2,6 +2,11 @@
 import pytest
 
 from ladybug_comfort.at import apparent_temperature, apparent_temperature_warning_category
+from ladybug_comfort.at import apparent_temperature_batch, \
+    apparent_temperature_warning_category_batch
+from ladybug_comfort.collection.at import ApparentTemperature
+
+from ladybug.epw import EPW
 
 
 def test_apparent_temperature():
@@ -20,3 +25,36 @@ def test_apparent_temperature():
     assert apparent_temperature_warning_category(5) == -4
     assert apparent_temperature_warning_category(0) == -5
     assert apparent_temperature_warning_category(-5) == -6
+
+
+def test_apparent_temperature_batch():
+    """Test that the batch apparent temperature functions match single values."""
+    ta = [t * 0.5 for t in range(-30, 100) for _ in range(5)]
+    rh = [r * 20 for _ in range(-30, 100) for r in range(5)]
+    ws = [r * 5 for _ in range(-30, 100) for r in range(5)]
+    at_values = apparent_temperature_batch(ta, rh, ws)
+    assert at_values == pytest.approx(
+        [apparent_temperature(t, r, w) for t, r, w in zip(ta, rh, ws)])
+
+    at_values.extend([-5, 0, 5, 10, 15, 20, 25, 30, 35, 40])
+    assert apparent_temperature_warning_category_batch(at_values) == \
+        [apparent_temperature_warning_category(at) for at in at_values]
+
+
+def test_apparent_temperature_collection():
+    """Test the ApparentTemperature collection against the scalar function."""
+    epw = EPW('./tests/epw/chicago.epw')
+    at_obj = ApparentTemperature.from_epw(epw)
+    assert at_obj.comfort_model == 'Apparent Temperature'
+    assert at_obj.calc_length == 8760
+    for ta, rh, ws, at in zip(epw.dry_bulb_temperature, epw.relative_humidity,
+                              epw.wind_speed, at_obj.apparent_temperature):
+        assert at == pytest.approx(apparent_temperature(ta, rh, ws * 3.6), abs=1e-9)
+    assert at_obj.apparent_temperature_category.values == tuple(
+        apparent_temperature_warning_category(at)
+        for at in at_obj.apparent_temperature)
+    assert at_obj.percent_neutral + at_obj.percent_hot + at_obj.percent_cold == \
+        pytest.approx(100)
+
+    at_obj = ApparentTemperature.from_epw(epw, include_wind=False)
+    assert at_obj.wind_speed[0] == 0.1
@@ -0,0 +1,135 @@
+# coding utf-8
+import pytest
+import threading
+
+from ladybug_comfort import backend
+from ladybug_comfort.backend import BACKENDS, register_implementation, \
+    available_backends, get_backend, set_backend, use_backend
+from ladybug_comfort._jit import JIT_AVAILABLE
+from ladybug_comfort.pmv import fanger_pmv, pierce_set
+from ladybug_comfort.utci import universal_thermal_climate_index
+from ladybug_comfort.adaptive import adaptive_comfort_conditioned
+from ladybug_comfort.solarcal import outdoor_sky_heat_exch
+from ladybug_comfort.phs import predictedHeatStrain, BodyPosition
+from ladybug_comfort.collection.utci import UTCI
+from ladybug_comfort.collection.pmv import PMV
+from ladybug_comfort.collection.adaptive import Adaptive
+
+from ladybug.analysisperiod import AnalysisPeriod
+from ladybug.header import Header
+from ladybug.datacollection import HourlyContinuousCollection
+
+from ladybug.datatype.temperature import Temperature
+
+
+def _fake_utci(ta, tr, vel, rh):
+    return -100.
+
+
+def test_select_backend():
+    """Test selecting the backend globally and with the context manager."""
+    default = get_backend()
+    assert default == ('compiled' if JIT_AVAILABLE else 'python')
+    for kernel in backend.KERNELS:
+        assert 'python' in available_backends(kernel)
+    assert ('compiled' in available_backends('pierce_set')) is JIT_AVAILABLE
+
+    with use_backend('python') as context:
+        assert get_backend() == context.backend == 'python'
+        with use_backend(None):
+            assert get_backend() == 'python'
+        python_set = pierce_set(30, 35, 0.5, 60, 1.2, 0.5)
+        python_pmv = fanger_pmv(30, 35, 0.5, 60, 1.2, 0.5)
+        python_phs = predictedHeatStrain(
+            35, 40, 20, 1, 300, 25, 1.8, 75, BodyPosition.standing, 0.5, 300, 60)
+        python_sky = outdoor_sky_heat_exch(25, 380, 200, 600, 45)
+    assert get_backend() == default
+    str(context)  # test that the string representation is ok
+
+    # kernels without an implementation for the backend use pure Python
+    with use_backend('numpy'):
+        assert get_backend() == 'numpy'
+        assert pierce_set(30, 35, 0.5, 60, 1.2, 0.5) == python_set
+        assert fanger_pmv(30, 35, 0.5, 60, 1.2, 0.5) == python_pmv
+        assert outdoor_sky_heat_exch(25, 380, 200, 600, 45) == python_sky
+    assert predictedHeatStrain(
+        35, 40, 20, 1, 300, 25, 1.8, 75, BodyPosition.standing, 0.5, 300, 60) == \
+        pytest.approx(python_phs)
+    assert pierce_set(30, 35, 0.5, 60, 1.2, 0.5) == pytest.approx(python_set)
+
+    with pytest.raises(ZeroDivisionError):
+        with use_backend('python'):
+            1 / 0
+    assert get_backend() == default
+
+    set_backend('python')
+    assert get_backend() == 'python'
+    set_backend(default)
+
+    with pytest.raises(AssertionError):
+        use_backend('cuda')
+    with pytest.raises(AssertionError):
+        set_backend('cuda')
+    with pytest.raises(AssertionError):
+        register_implementation('not_a_kernel', 'numpy', _fake_utci)
+    assert BACKENDS == ('python', 'numpy', 'compiled')
+
+
+def test_register_implementation(monkeypatch):
+    """Test registering an implementation and selecting it for a collection."""
+    monkeypatch.setitem(
+        backend._implementations, 'universal_thermal_climate_index',
+        dict(backend._implementations['universal_thermal_climate_index']))
+    register_implementation('universal_thermal_climate_index', 'numpy', _fake_utci)
+    assert available_backends('universal_thermal_climate_index') == \
+        ['python', 'numpy']
+
+    real_utci = universal_thermal_climate_index(20, 20, 3, 50)
+    with use_backend('numpy'):
+        assert universal_thermal_climate_index(20, 20, 3, 50) == -100
+    assert universal_thermal_climate_index(20, 20, 3, 50) == real_utci
+
+    calc_length = 24
+    header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
+    air_temp = HourlyContinuousCollection(header, [20] * calc_length)
+    utci_obj = UTCI(air_temp, 50, backend='numpy')
+    assert utci_obj.universal_thermal_climate_index.values == (-100,) * calc_length
+    utci_obj = UTCI(air_temp, 50)
+    assert utci_obj.universal_thermal_climate_index[0] == \
+        pytest.approx(universal_thermal_climate_index(20, 20, 0.1, 50))
+    with pytest.raises(AssertionError):
+        UTCI(air_temp, 50, backend='cuda')
+
+    # the backend of a collection does not change the backend of other threads
+    thread_results = []
+
+    def thread_utci():
+        thread_results.append(get_backend())
+        thread_results.append(UTCI(air_temp, 50).universal_thermal_climate_index[0])
+    with use_backend('numpy'):
+        thread = threading.Thread(target=thread_utci)
+        thread.start()
+        thread.join()
+        assert universal_thermal_climate_index(20, 20, 3, 50) == -100
+    assert thread_results[0] == get_backend()
+    assert thread_results[1] == \
+        pytest.approx(universal_thermal_climate_index(20, 20, 0.1, 50))
+
+
+def test_collection_backend():
+    """Test that collections give the same results with all backends."""
+    calc_length = 24
+    header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
+    air_temp = HourlyContinuousCollection(
+        header, [18 + i * 0.5 for i in range(calc_length)])
+    pmv_python = PMV(air_temp, 50, air_speed=0.6, backend='python')
+    for name in BACKENDS:
+        pmv_obj = PMV(air_temp, 50, air_speed=0.6, backend=name)
+        assert pmv_obj.standard_effective_temperature.values == \
+            pytest.approx(pmv_python.standard_effective_temperature.values)
+        assert pmv_obj.predicted_mean_vote.values == \
+            pytest.approx(pmv_python.predicted_mean_vote.values)
+
+    adapt_obj = Adaptive(24, air_temp, backend='numpy')
+    assert adapt_obj.neutral_temperature[0] == \
+        pytest.approx(adaptive_comfort_conditioned(24, 18, 0, 'ASHRAE-55')['t_comf'])
@@ -0,0 +1,115 @@
+# coding utf-8
+import pytest
+import shutil
+
+from ladybug_comfort.cache import ResultCache, hash_inputs, \
+    write_result_columns, read_result_columns, code_version, package_version, \
+    CACHE_SCHEMA
+from ladybug_comfort.pmv import predicted_mean_vote, pierce_set
+
+
+def test_result_cache():
+    """Test the initialization of ResultCache and its basic properties."""
+    pmv_cache = ResultCache(predicted_mean_vote)
+    str(pmv_cache)  # test the string representation
+
+    assert pmv_cache.function is predicted_mean_vote
+    assert pmv_cache.max_size == 100000
+    assert pmv_cache.quantum == 0
+    assert pmv_cache.hits == pmv_cache.misses == pmv_cache.size == 0
+
+    result = pmv_cache(22, 22, 0.1, 50, 1.1, 0.7, 0)
+    assert result == predicted_mean_vote(22, 22, 0.1, 50, 1.1, 0.7, 0)
+    assert pmv_cache(22, 22, 0.1, 50, 1.1, 0.7, 0) == result
+    assert pmv_cache(22.01, 22, 0.1, 50, 1.1, 0.7, 0) != result
+    assert pmv_cache.hits == 1
+
+    # editing a result does not change the cached result
+    result['pmv'] = 10
+    result['heat_loss']['cond'] = 10
+    cached = pmv_cache(22, 22, 0.1, 50, 1.1, 0.7, 0)
+    assert cached == predicted_mean_vote(22, 22, 0.1, 50, 1.1, 0.7, 0)
+    assert cached is not pmv_cache(22, 22, 0.1, 50, 1.1, 0.7, 0)
+    assert pmv_cache.hits == 3
+    assert pmv_cache.misses == 2
+    assert pmv_cache.size == 2
+
+    pmv_cache.clear()
+    assert pmv_cache.hits == pmv_cache.misses == pmv_cache.size == 0
+
+    with pytest.raises(AssertionError):
+        ResultCache(predicted_mean_vote, max_size=0)
+    with pytest.raises(AssertionError):
+        ResultCache(predicted_mean_vote, quantum=-1)
+
+
+def test_result_cache_quantum():
+    """Test ResultCache with a quantum for snapping inputs."""
+    set_cache = ResultCache(pierce_set, quantum=0.1)
+    result = set_cache(22.01, 22, 0.1, 50, 1.1, 0.7)
+    assert result == pytest.approx(pierce_set(22, 22, 0.1, 50, 1.1, 0.7))
+    assert set_cache(21.97, 22.02, 0.1, 50, 1.1, 0.7) == result
+    assert set_cache.hits == 1
+    assert set_cache.misses == 1
+
+    set_cache = ResultCache(pierce_set, quantum=(0.5, 0.5, 0, 0, 0, 0))
+    result = set_cache(22.2, 22, 0.13, 50, 1.1, 0.7)
+    assert result == pytest.approx(pierce_set(22, 22, 0.13, 50, 1.1, 0.7))
+
+    # a single quantum only snaps ta, tr, vel and rh; met, clo, etc. are exact
+    pmv_cache = ResultCache(predicted_mean_vote, quantum=0.5)
+    result = pmv_cache(25.1, 25, 0.3, 50, 1.1, 0.7, 0, 0.1)
+    assert result == predicted_mean_vote(25, 25, 0.5, 50, 1.1, 0.7, 0, 0.1)
+    assert result['pmv'] != \
+        predicted_mean_vote(25, 25, 0.5, 50, 1.0, 0.5, 0, 0.0)['pmv']
+    assert pmv_cache(25, 25, 0.5, 50, 1.2, 0.7, 0, 0.1)['pmv'] != result['pmv']
+    assert pmv_cache(25, 25, 0.5, 50, 1.1, 0.8, 0, 0.1)['pmv'] != result['pmv']
+    assert pmv_cache.misses == 3
+    assert pmv_cache(25, 25, 0.5, 50, 1.1, 0.7, 0, 0.2) == \
+        predicted_mean_vote(25, 25, 0.5, 50, 1.1, 0.7, 0, 0.2)
+    assert pmv_cache.misses == 4
+
+
+def test_result_cache_max_size():
+    """Test that ResultCache discards the least recently used results."""
+    set_cache = ResultCache(pierce_set, max_size=2)
+    set_cache(20, 20, 0.1, 50, 1.1, 0.7)
+    set_cache(21, 21, 0.1, 50, 1.1, 0.7)
+    set_cache(20, 20, 0.1, 50, 1.1, 0.7)  # 20 is now the most recently used
+    set_cache(22, 22, 0.1, 50, 1.1, 0.7)  # 21 is discarded
+    assert set_cache.size == 2
+    assert set_cache.hits == 1
+    set_cache(20, 20, 0.1, 50, 1.1, 0.7)
+    assert set_cache.hits == 2
+    set_cache(21, 21, 0.1, 50, 1.1, 0.7)
+    assert set_cache.misses == 4
+
+
+def test_hash_inputs():
+    """Test the hash_inputs function."""
+    key = hash_inputs('PMV', [20.0, 21.5, 22.0], (1, 2), 0.7)
+    assert key == hash_inputs('PMV', (20, 21.5, 22), [1, 2], 0.7)
+    assert key != hash_inputs('PMV', [20.0, 21.5, 22.1], (1, 2), 0.7)
+    assert key != hash_inputs('UTCI', [20.0, 21.5, 22.0], (1, 2), 0.7)
+    assert hash_inputs([None, 'a']) == hash_inputs([None, 'a'])
+
+
+def test_code_version():
+    """Test that the code_version includes the package version and cache schema."""
+    version = code_version()
+    assert version == code_version()
+    assert version.startswith('{}-{}-'.format(package_version(), CACHE_SCHEMA))
+    assert len(version.split('-')[-1]) == 40  # sha1 of the package source
+
+
+def test_write_read_result_columns():
+    """Test writing and reading result columns to and from a cache folder."""
+    folder = './tests/result_cache'
+    key = hash_inputs('test', [1, 2, 3])
+    assert read_result_columns(folder, key) is None
+
+    columns = [('_pmv', 'd', [-0.5, 0.25, 1.125]), ('_condition', 'b', [-1, 0, 1])]
+    write_result_columns(folder, key, columns)
+    result = read_result_columns(folder, key)
+    shutil.rmtree(folder)
+    assert result == {'_pmv': [-0.5, 0.25, 1.125], '_condition': [-1, 0, 1]}
@@ -3,6 +3,11 @@
 import pytest
 
 from ladybug_comfort.di import discomfort_index, discomfort_index_effect_category
+from ladybug_comfort.di import discomfort_index_batch, \
+    discomfort_index_effect_category_batch
+from ladybug_comfort.collection.di import DiscomfortIndex
+
+from ladybug.epw import EPW
 
 
 def test_discomfort_index():
@@ -20,3 +25,31 @@ def test_discomfort_index():
     assert discomfort_index_effect_category(-15) == -4
     assert discomfort_index_effect_category(-21) == -5
     assert discomfort_index_effect_category(-45) == -6
+
+
+def test_discomfort_index_batch():
+    """Test that the batch discomfort index functions match single values."""
+    ta = [t for t in range(-60, 50) for _ in range(5)]
+    rh = [r * 25 for _ in range(-60, 50) for r in range(5)]
+    di_values = discomfort_index_batch(ta, rh)
+    assert di_values == pytest.approx(
+        [discomfort_index(t, r) for t, r in zip(ta, rh)])
+
+    di_values.extend([-40, -20, -10, -1.8, 13, 15, 20, 26.5, 30])
+    assert discomfort_index_effect_category_batch(di_values) == \
+        [discomfort_index_effect_category(di) for di in di_values]
+
+
+def test_discomfort_index_collection():
+    """Test the DiscomfortIndex collection against the scalar function."""
+    epw = EPW('./tests/epw/chicago.epw')
+    di_obj = DiscomfortIndex.from_epw(epw)
+    assert di_obj.comfort_model == 'Discomfort Index'
+    assert di_obj.calc_length == 8760
+    assert di_obj.discomfort_index.values == pytest.approx([
+        discomfort_index(ta, rh) for ta, rh in
+        zip(epw.dry_bulb_temperature, epw.relative_humidity)])
+    assert di_obj.discomfort_index_category.values == tuple(
+        discomfort_index_effect_category(di) for di in di_obj.discomfort_index)
+    assert di_obj.percent_neutral + di_obj.percent_hot + di_obj.percent_cold == \
+        pytest.approx(100)
@@ -3,6 +3,9 @@ import pytest
 
 from ladybug_comfort.collection.utci import UTCI
 from ladybug_comfort.collection.pmv import PMV
+from ladybug_comfort.collection.hi import HeatIndex
+from ladybug_comfort.collection.ts import ThermalSensation
+from ladybug_comfort.epw import EPWComfort
 
 from ladybug.datacollection import HourlyContinuousCollection
 from ladybug.epw import EPW
@@ -115,3 +118,44 @@ def test_get_standard_effective_temperature_with_sun_and_wind():
     assert set_obj.percent_neutral == pytest.approx(17.95, rel=1e-2)
     assert set_obj.percent_hot == pytest.approx(18.82, rel=1e-2)
     assert set_obj.percent_cold == pytest.approx(63.23, rel=1e-2)
+
+
+def test_epw_comfort():
+    """Test that EPWComfort matches the from_epw methods of the comfort objects."""
+    epw_comfort = EPWComfort(epw)
+    assert str(epw_comfort) == 'EPW Comfort: Chicago Ohare Intl Ap'
+    utci_obj = UTCI.from_epw(epw)
+    pmv_obj = PMV.from_epw(epw)
+    assert epw_comfort.utci.universal_thermal_climate_index.values == \
+        utci_obj.universal_thermal_climate_index.values
+    assert epw_comfort.pmv.predicted_mean_vote.values == \
+        pmv_obj.predicted_mean_vote.values
+    assert epw_comfort.utci.rad_temperature.values == \
+        epw_comfort.pmv.rad_temperature.values
+    assert epw_comfort.heat_index.heat_index.values == \
+        HeatIndex.from_epw(epw).heat_index.values
+    assert epw_comfort.thermal_sensation.thermal_sensation.values == \
+        ThermalSensation.from_epw(epw).thermal_sensation.values
+
+    summary = epw_comfort.summary()
+    assert set(summary) == set(EPWComfort.MODELS)
+    assert summary['utci']['percent_neutral'] == utci_obj.percent_neutral
+    assert summary['adaptive']['percent_neutral'] == \
+        epw_comfort.adaptive.percent_neutral
+    with pytest.raises(AssertionError):
+        epw_comfort.summary(['set'])
+
+
+def test_epw_comfort_no_sun_no_wind():
+    """Test EPWComfort without the sun and wind."""
+    epw_comfort = EPWComfort(epw, include_wind=False, include_sun=False)
+    assert epw_comfort.solarcal is None
+    assert epw_comfort.mean_radiant_temperature is epw.dry_bulb_temperature
+    assert epw_comfort.operative_temperature.values == \
+        epw.dry_bulb_temperature.values
+    utci_obj = UTCI.from_epw(epw, False, False)
+    assert epw_comfort.utci.universal_thermal_climate_index.values == \
+        utci_obj.universal_thermal_climate_index.values
+    assert list(epw_comfort.comfort_objects(['wind_chill'])) == ['wind_chill']
+    assert epw_comfort.wind_chill.wind_speed[0] == 0.1
+    assert epw_comfort.thermal_sensation.solar_radiation[12] == 0
@@ -2,6 +2,8 @@
 import pytest
 
 from ladybug_comfort.hi import heat_index, heat_index_warning_category
+from ladybug_comfort.hi import heat_index_batch, heat_index_warning_category_batch
+from ladybug_comfort.collection.hi import HeatIndex
 
 from ladybug.epw import EPW
 from ladybug.datacollection import HourlyContinuousCollection
@@ -40,3 +42,41 @@ def test_heating_degree_time_collection():
     assert isinstance(hourly_category, HourlyContinuousCollection)
     assert len(hourly_category.values) == calc_length
     assert hourly_category[4000] == 1
+
+
+def test_heat_index_batch():
+    """Test that the batch heat index functions match the single-value functions."""
+    temps = [t * 0.5 for t in range(-20, 100)]
+    humids = [0, 5, 12, 13, 50, 85, 86, 100]
+    ta = [t for t in temps for _ in humids]
+    rh = [r for _ in temps for r in humids]
+    hi_values = heat_index_batch(ta, rh)
+    assert hi_values == [heat_index(t, r) for t, r in zip(ta, rh)]
+
+    hi_values.extend([26.6, 32.2, 40.5, 54.4])
+    assert heat_index_warning_category_batch(hi_values) == \
+        [heat_index_warning_category(hi) for hi in hi_values]
+
+
+def test_heat_index_collection():
+    """Test the HeatIndex collection against the heat_index function."""
+    epw = EPW('./tests/epw/chicago.epw')
+    hi_obj = HeatIndex.from_epw(epw)
+    assert hi_obj.comfort_model == 'Heat Index'
+    assert hi_obj.calc_length == 8760
+    assert isinstance(hi_obj.heat_index, HourlyContinuousCollection)
+    for ta, rh, hi in zip(epw.dry_bulb_temperature, epw.relative_humidity,
+                          hi_obj.heat_index):
+        assert hi == heat_index(ta, rh)
+    assert hi_obj.heat_index_category.values == \
+        tuple(heat_index_warning_category(hi) for hi in hi_obj.heat_index)
+    assert hi_obj.percent_neutral + hi_obj.percent_hot == pytest.approx(100)
+    assert sum(hi_obj.category_counts().values()) == 8760
+    assert hi_obj.percent_caution == \
+        pytest.approx(hi_obj.category_counts()[1] / 87.6)
+    assert set(hi_obj.summary()) == set(HeatIndex._percent_properties)
+
+    hi_obj = HeatIndex(epw.dry_bulb_temperature, 50)
+    assert hi_obj.rel_humidity.values == (50,) * 8760
+    with pytest.raises(AssertionError):
+        HeatIndex(epw.dry_bulb_temperature, [50] * 10)
@@ -2,6 +2,10 @@
 import pytest
 
 from ladybug_comfort.humidex import humidex, humidex_degree_of_comfort
+from ladybug_comfort.humidex import humidex_batch, humidex_degree_of_comfort_batch
+from ladybug_comfort.collection.humidex import Humidex
+
+from ladybug.epw import EPW
 
 
 def test_humidex():
@@ -26,3 +30,32 @@ def test_humidex_degree_of_comfort():
     assert humidex_degree_of_comfort(45.9) == 3
     assert humidex_degree_of_comfort(46.0) == 4
     assert humidex_degree_of_comfort(50.0) == 4
+
+
+def test_humidex_batch():
+    """Test that the batch humidex functions match the single-value functions."""
+    ta = [t * 0.5 for t in range(0, 100)]
+    tdp = [t - 10 for t in ta]
+    hx_values = humidex_batch(ta, tdp)
+    assert hx_values == pytest.approx([humidex(t, d) for t, d in zip(ta, tdp)])
+
+    hx_values.extend([20, 30, 40, 46])
+    assert humidex_degree_of_comfort_batch(hx_values) == \
+        [humidex_degree_of_comfort(hx) for hx in hx_values]
+
+
+def test_humidex_collection():
+    """Test the Humidex collection against the humidex function."""
+    epw = EPW('./tests/epw/chicago.epw')
+    humidex_obj = Humidex.from_epw(epw)
+    assert humidex_obj.comfort_model == 'Humidex'
+    assert humidex_obj.calc_length == 8760
+    for ta, tdp, hx in zip(epw.dry_bulb_temperature, epw.dew_point_temperature,
+                           humidex_obj.humidex):
+        assert hx == pytest.approx(humidex(ta, tdp), abs=1e-9)
+    assert humidex_obj.humidex_category.values == \
+        tuple(humidex_degree_of_comfort(hx) for hx in humidex_obj.humidex)
+    assert humidex_obj.percent_neutral + humidex_obj.percent_hot == pytest.approx(100)
+    assert humidex_obj.percent_hot == pytest.approx(
+        humidex_obj.percent_little_discomfort + humidex_obj.percent_some_discomfort +
+        humidex_obj.percent_great_discomfort + humidex_obj.percent_dangerous)
@@ -0,0 +1,88 @@
+# coding utf-8
+import pytest
+
+from ladybug_comfort.inverse import pmv_limit_from_ppd, pmv_limit_from_ppd_batch, \
+    ashrae55_ppd_from_neutral_offset, neutral_temperature_line, \
+    adaptive_comfort_bounds_batch, prevailing_temperature_from_neutral_batch, \
+    comfortable_prevailing_range_batch
+from ladybug_comfort.pmv import ppd_from_pmv, pmv_from_ppd
+from ladybug_comfort.adaptive import adaptive_comfort_ashrae55, \
+    adaptive_comfort_en15251, adaptive_comfort_conditioned, \
+    ashrae55_neutral_offset_from_ppd
+
+
+def test_pmv_limit_from_ppd():
+    """Test the closed-form inverse of the PPD equation."""
+    assert pmv_limit_from_ppd(5) == 0
+    assert pmv_limit_from_ppd(10) == pytest.approx(0.49, abs=0.01)
+    assert pmv_limit_from_ppd(20) == pytest.approx(0.85, abs=0.01)
+    for ppd in (5.001, 6, 10, 15, 25, 50, 75, 99.9):
+        pmv = pmv_limit_from_ppd(ppd)
+        assert ppd_from_pmv(pmv) == pytest.approx(ppd, abs=1e-9)
+        assert ppd_from_pmv(-pmv) == pytest.approx(ppd, abs=1e-9)
+        assert pmv_from_ppd(ppd) == (-pmv, pmv)
+    assert pmv_limit_from_ppd_batch([6, 10, 15]) == \
+        [pmv_limit_from_ppd(6), pmv_limit_from_ppd(10), pmv_limit_from_ppd(15)]
+
+    with pytest.raises(AssertionError):
+        pmv_limit_from_ppd(4)
+    with pytest.raises(AssertionError):
+        pmv_limit_from_ppd(100)
+    with pytest.raises(AssertionError):
+        pmv_limit_from_ppd_batch([10, 100])
+
+
+def test_ashrae55_ppd_from_neutral_offset():
+    """Test the inverse of ashrae55_neutral_offset_from_ppd."""
+    for ppd in (80, 90):
+        offset = ashrae55_neutral_offset_from_ppd(ppd)
+        assert ashrae55_ppd_from_neutral_offset(offset) == pytest.approx(ppd)
+    with pytest.raises(AssertionError):
+        ashrae55_ppd_from_neutral_offset(12)
+
+
+def test_adaptive_comfort_bounds_batch():
+    """Test the adaptive comfort bounds against the adaptive comfort functions."""
+    t_prevail = [5, 10, 22.2, 30, 33, 36]
+    lower, upper = adaptive_comfort_bounds_batch(t_prevail, 2.5)
+    for t_p, low, up in zip(t_prevail, lower, upper):
+        t_comf = adaptive_comfort_ashrae55(t_p, 25)['t_comf']
+        assert low == pytest.approx(t_comf - 2.5)
+        assert up == pytest.approx(t_comf + 2.5)
+
+    lower, upper = adaptive_comfort_bounds_batch(t_prevail, 3, model='EN-15251')
+    for t_p, low, up in zip(t_prevail, lower, upper):
+        t_comf = adaptive_comfort_en15251(t_p, 25)['t_comf']
+        assert low == pytest.approx(t_comf - 3)
+        assert up == pytest.approx(t_comf + 3)
+
+    for conditioning in (0.5, 1):
+        for model in ('ASHRAE-55', 'EN-15251'):
+            lower, upper = adaptive_comfort_bounds_batch(
+                t_prevail, 2, conditioning, model)
+            for t_p, low in zip(t_prevail, lower):
+                t_comf = adaptive_comfort_conditioned(
+                    t_p, 25, conditioning, model)['t_comf']
+                assert low == pytest.approx(t_comf - 2)
+
+    with pytest.raises(ValueError):
+        neutral_temperature_line(0, 'CIBSE')
+
+
+def test_prevailing_temperature_inverses():
+    """Test the inverses of the adaptive neutral temperature and comfort bounds."""
+    t_prevail = [12, 18.5, 25]
+    for conditioning, model in ((0, 'ASHRAE-55'), (0, 'EN-15251'), (0.4, 'EN-15251')):
+        lower, upper = adaptive_comfort_bounds_batch(
+            t_prevail, 2.5, conditioning, model)
+        t_comf = [(low + up) / 2 for low, up in zip(lower, upper)]
+        assert prevailing_temperature_from_neutral_batch(
+            t_comf, conditioning, model) == pytest.approx(t_prevail)
+
+        # an operative temperature at the upper bound is comfortable down to t_prevail
+        prevail_low, prevail_high = comfortable_prevailing_range_batch(
+            upper, 2.5, conditioning, model)
+        assert prevail_low == pytest.approx(t_prevail)
+        prevail_low, prevail_high = comfortable_prevailing_range_batch(
+            lower, 2.5, conditioning, model)
+        assert prevail_high == pytest.approx(t_prevail)
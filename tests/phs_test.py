@@ -0,0 +1,40 @@
+# coding utf-8
+import pytest
+
+from ladybug_comfort.phs import predictedHeatStrain, predictedHeatStrain_batch, \
+    BodyPosition
+from ladybug_comfort.psychrometrics import PsychrometricColumns
+
+from ladybug.psychrometrics import dew_point_from_db_rh, saturated_vapor_pressure
+
+
+def test_predicted_heat_strain_batch():
+    """Test predictedHeatStrain_batch against predictedHeatStrain."""
+    air_temp = [30, 35, 40]
+    rel_humid = [60, 40, 20]
+    results = predictedHeatStrain_batch(
+        air_temp, [35, 40, 50], rel_humid, 0.5, 300, 1.8, 75, BodyPosition.standing,
+        0.5, 300, 60)
+    for ta, tr, rh, result in zip(air_temp, [35, 40, 50], rel_humid, results):
+        vapor_press = saturated_vapor_pressure(ta + 273.15) * rh / 100
+        assert result == predictedHeatStrain(
+            ta, tr, dew_point_from_db_rh(ta, rh), 0.5, 300, vapor_press / 100,
+            1.8, 75, BodyPosition.standing, 0.5, 300, 60)
+
+    # share the psychrometric columns and use the optional arguments
+    psychro = PsychrometricColumns(air_temp, rel_humid)
+    results = predictedHeatStrain_batch(
+        air_temp, 40, rel_humid, 0.5, 300, 1.8, 75, BodyPosition.sitting, 0.5, 300,
+        60, psychro, can_drink=False)
+    assert results[1] == predictedHeatStrain(
+        35, 40, psychro.dew_point[1], 0.5, 300, psychro.vapor_pressure[1] / 100,
+        1.8, 75, BodyPosition.sitting, 0.5, 300, 60, can_drink=False)
+
+    with pytest.raises(AssertionError):
+        predictedHeatStrain_batch(
+            air_temp, [35, 40], rel_humid, 0.5, 300, 1.8, 75,
+            BodyPosition.standing, 0.5, 300, 60)
+    with pytest.raises(AssertionError):
+        predictedHeatStrain_batch(
+            air_temp, 35, rel_humid, 0.5, 300, 1.8, 75, BodyPosition.standing,
+            0.5, 300, 60, PsychrometricColumns([30], 50))
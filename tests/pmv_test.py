@@ -1,11 +1,21 @@
 # coding utf-8
 import pytest
+import shutil
+from array import array
 
 from ladybug_comfort.collection.pmv import PMV
 from ladybug_comfort.parameter.pmv import PMVParameter
+from ladybug_comfort.cache import ResultCache
+from ladybug_comfort._sequence import ConstantSequence
 
 from ladybug_comfort.pmv import predicted_mean_vote, fanger_pmv, \
-    pierce_set, ppd_from_pmv, pmv_from_ppd, calc_missing_pmv_input
+    pierce_set, ppd_from_pmv, pmv_from_ppd, calc_missing_pmv_input, \
+    calc_missing_pmv_input_batch, PierceSetCoefficients, _fanger_pmv_kernel, \
+    _pierce_set_kernel
+from ladybug_comfort.phs import predictedHeatStrain, BodyPosition, \
+    _predicted_heat_strain_kernel
+from ladybug_comfort.backend import use_backend
+from ladybug_comfort._jit import JIT_AVAILABLE, python_function
 
 from ladybug.analysisperiod import AnalysisPeriod
 from ladybug.header import Header
@@ -13,7 +23,7 @@ from ladybug.datacollection import HourlyContinuousCollection
 from ladybug.epw import EPW
 
 from ladybug.datatype.temperature import Temperature
-from ladybug.datatype.fraction import RelativeHumidity
+from ladybug.datatype.fraction import RelativeHumidity, Fraction
 from ladybug.datatype.speed import AirSpeed
 from ladybug.datatype.energyflux import MetabolicRate
 from ladybug.datatype.rvalue import ClothingInsulation
@@ -57,6 +67,69 @@ def test_pierce_set_validation():
             assert pierce_set(*values[:-1]) == pytest.approx(values[-1], rel=1e-2)
 
 
+def test_compiled_kernels_validation():
+    """Test that the compiled kernels match the pure Python kernels."""
+    pytest.importorskip('numba')
+    assert JIT_AVAILABLE
+    # compiled floating point math can differ from Python in the last digits
+    rel = 1e-9
+    py_fanger = python_function(_fanger_pmv_kernel)
+    assert py_fanger is not _fanger_pmv_kernel
+    with open('./tests/validation_tables/pmv_validation.csv') as csv_data_file:
+        csv_data_file.readline()
+        for row in csv_data_file:
+            values = [float(val) for val in row.split(',')][:-2] + [0.]
+            assert _fanger_pmv_kernel(*values) == \
+                pytest.approx(py_fanger(*values), rel=rel)
+
+    py_set = python_function(_pierce_set_kernel)
+    assert py_set is not _pierce_set_kernel
+    with open('./tests/validation_tables/set_validation.csv') as csv_data_file:
+        csv_data_file.readline()
+        for row in csv_data_file:
+            ta, tr, vel, rh, met, clo = [float(val) for val in row.split(',')][:-1]
+            c = PierceSetCoefficients(met, clo, 0.)
+            args = (ta, tr, rh, met, 0.) + c.velocity_terms(vel)[1:] + (
+                c._rcl, c._facl, c._recl, c._rm, c._chc_s, c._rcls, c._rclos,
+                c._facls, c._fcls_factor, c._icls_factor, c._rea_s)
+            assert _pierce_set_kernel(*args) == pytest.approx(py_set(*args), rel=rel)
+
+    assert python_function(_predicted_heat_strain_kernel) is not \
+        _predicted_heat_strain_kernel
+    phs_inputs = (
+        (35, 40, 20, 1, 300, 25, 1.8, 75, BodyPosition.standing, 0.5, 300, 60),
+        (30, 55, 18, 0.3, 600, 30, 1.7, 70, BodyPosition.sitting, 0.6, 150, 240,
+         False, 50, 1.2, True, 45, True),
+        (42, 42, 25, 2.5, 0, 40, 1.9, 90, BodyPosition.crouching, 0.8, 450, 480,
+         True, 100, 0, True, 0, False, 0.2, 0.9, 20, 0.5))
+    for inputs in phs_inputs:
+        with use_backend('python'):
+            py_phs = predictedHeatStrain(*inputs)
+        with use_backend('compiled'):
+            assert predictedHeatStrain(*inputs) == pytest.approx(py_phs, rel=rel)
+
+
+def test_pierce_set_coefficients():
+    """Test that PierceSetCoefficients give the same results as pierce_set."""
+    coeffs = PierceSetCoefficients(1.1, 0.7, 0)
+    assert (coeffs.met, coeffs.clo, coeffs.wme) == (1.1, 0.7, 0)
+    str(coeffs)  # test that the string representation is ok
+    for ta, vel, rh in ((22, 0.1, 50), (30, 1.5, 70), (-5, 0.05, 20)):
+        assert pierce_set(ta, ta, vel, rh, 1.1, 0.7, 0, coeffs) == \
+            pierce_set(ta, ta, vel, rh, 1.1, 0.7, 0)
+        assert predicted_mean_vote(ta, ta, vel, rh, 1.1, 0.7, 0, 0.1, coeffs) == \
+            predicted_mean_vote(ta, ta, vel, rh, 1.1, 0.7, 0)
+    assert coeffs.velocity_terms(0.05) == coeffs.velocity_terms(0.1)
+    with pytest.raises(AssertionError):
+        pierce_set(25, 25, 0.1, 50, 1.2, 0.7, 0, coeffs)
+    with pytest.raises(AssertionError):
+        predicted_mean_vote(25, 25, 0.5, 50, 1.1, 1.0, 0, 0.1, coeffs)
+
+    nude_coeffs = PierceSetCoefficients(1, 0)
+    assert pierce_set(25, 25, 0.1, 50, 1, 0, 0, nude_coeffs) == \
+        pierce_set(25, 25, 0.1, 50, 1, 0)
+
+
 def test_predicted_mean_vote():
     """Test the pmv function"""
     result = predicted_mean_vote(19, 23, 0.5, 60, 1.5, 0.4)
@@ -120,6 +193,36 @@ def test_calc_missing_pmv_input():
     assert updated_input_8['ta'] == updated_input_8['tr']
 
 
+def test_calc_missing_pmv_input_batch():
+    """Test the calc_missing_pmv_input_batch function"""
+    air_temps = [18, 20, 22, 24, 26]
+    input_1 = {'ta': air_temps, 'tr': 20, 'vel': 0.05, 'rh': None,
+               'met': 1.2, 'clo': 0.75, 'wme': 0}
+    updated_input_1 = calc_missing_pmv_input_batch([0.5] * 5, input_1)
+    assert updated_input_1['ta'] == air_temps
+    assert updated_input_1['tr'] == [20] * 5
+    for ta, rh in zip(air_temps, updated_input_1['rh']):
+        single = calc_missing_pmv_input(0.5, {
+            'ta': ta, 'tr': 20, 'vel': 0.05, 'rh': None,
+            'met': 1.2, 'clo': 0.75, 'wme': 0})
+        assert rh == pytest.approx(single['rh'], abs=0.1)
+
+    rel_humids = [10, 30, 50, 70, 90]
+    input_2 = {'ta': None, 'tr': None, 'vel': 0.5, 'rh': rel_humids,
+               'met': 1.2, 'clo': 0.75, 'wme': 0}
+    updated_input_2 = calc_missing_pmv_input_batch(-0.5, input_2, up_bound=40)
+    assert updated_input_2['ta'] == updated_input_2['tr']
+    for rh, ta in zip(rel_humids, updated_input_2['ta']):
+        pmv = predicted_mean_vote(ta, ta, 0.5, rh, 1.2, 0.75, 0)['pmv']
+        assert pmv == pytest.approx(-0.5, abs=1e-2)
+
+    input_3 = {'ta': 20, 'tr': 20, 'vel': 0.05, 'rh': 50,
+               'met': 1.2, 'clo': None, 'wme': 0}
+    updated_input_3 = calc_missing_pmv_input_batch([-1, -1], input_3, up_bound=1)
+    assert updated_input_3['clo'][0] == pytest.approx(0.6546, rel=1e-2)
+    assert updated_input_3['clo'][1] == updated_input_3['clo'][0]
+
+
 def test_pmv_parameter():
     """Test PMVParameter."""
     ppd_comfort_thresh = 20
@@ -180,6 +283,28 @@ def test_discomfort_reason_check():
     assert condition_test == 0
 
 
+def test_pmv_parameter_batch():
+    """Test that the batch methods on PMVParameter match the single-value ones."""
+    pmv_comf = PMVParameter(humid_ratio_upper=0.012, humid_ratio_lower=0.004)
+    pmv = [-1.5, -0.2, 0, 0.3, 0.5, 2]
+    ppd = [50, 6, 5, 7, 10, 76]
+    hr = [0.01, 0.002, 0.008, 0.015, 0.004, 0.012]
+    assert pmv_comf.is_comfortable_batch(ppd, hr) == \
+        [pmv_comf.is_comfortable(p, h) for p, h in zip(ppd, hr)]
+    assert pmv_comf.is_comfortable_batch(ppd) == \
+        [pmv_comf.is_comfortable(p) for p in ppd]
+    assert pmv_comf.thermal_condition_batch(pmv, ppd) == \
+        [pmv_comf.thermal_condition(v, p) for v, p in zip(pmv, ppd)]
+    assert pmv_comf.discomfort_reason_batch(pmv, ppd, hr) == \
+        [pmv_comf.discomfort_reason(v, p, h) for v, p, h in zip(pmv, ppd, hr)]
+    assert pmv_comf.discomfort_reason_batch(pmv, ppd) == \
+        [pmv_comf.discomfort_reason(v, p) for v, p in zip(pmv, ppd)]
+
+    pmv_comf = PMVParameter()
+    assert pmv_comf.is_comfortable_batch(ppd) == \
+        [pmv_comf.is_comfortable(p) for p in ppd]
+
+
 def test_init_pmv_collection():
     """Test the initialization of the PMV collection and basic outputs."""
     calc_length = 24
@@ -416,6 +541,96 @@ def test_init_pmv_collection_full_collection_input():
     assert pmv_obj.external_work[0] == 0.1
 
 
+def test_init_pmv_collection_sequence_input():
+    """Test initialization of the PMV collection with arrays and other sequences."""
+    calc_length = 24
+    air_temp_header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
+    air_temp = HourlyContinuousCollection(air_temp_header, [24] * calc_length)
+    rad_temp = array('d', [22] * calc_length)
+    air_speed = memoryview(array('d', [0.5] * calc_length))
+
+    pmv_obj = PMV(air_temp, (50,) * calc_length, rad_temp, air_speed, 1.2)
+    assert pmv_obj._rad_temperature is rad_temp
+    assert isinstance(pmv_obj._met_rate, ConstantSequence)
+    assert pmv_obj.rad_temperature.values == (22,) * calc_length
+    assert pmv_obj.air_speed.values == (0.5,) * calc_length
+    assert pmv_obj.met_rate.values == (1.2,) * calc_length
+    assert pmv_obj.predicted_mean_vote[0] == pytest.approx(
+        predicted_mean_vote(24, 22, 0.5, 50, 1.2, 0.7)['pmv'], rel=1e-3)
+
+    with pytest.raises(AssertionError):
+        PMV(air_temp, [50] * (calc_length - 1))
+    with pytest.raises(TypeError):
+        PMV(air_temp, 50, air_speed='fast')
+
+
+def test_pmv_collection_alignment():
+    """Test the alignment check of the PMV collection inputs."""
+    calc_length = 24
+    air_temp_header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
+    air_temp = HourlyContinuousCollection(air_temp_header, [24] * calc_length)
+    rel_humid_header = Header(RelativeHumidity(), '%', AnalysisPeriod(
+        end_month=1, end_day=1))
+    rel_humid = HourlyContinuousCollection(rel_humid_header, [50] * calc_length)
+    rad_temp = air_temp.get_aligned_collection(22)
+    shift_header = Header(RelativeHumidity(), '%', AnalysisPeriod(
+        st_month=1, st_day=2, end_month=1, end_day=2))
+    rel_humid_shift = HourlyContinuousCollection(shift_header, [50] * calc_length)
+
+    pmv_obj = PMV(air_temp, rel_humid, rad_temp)
+    assert pmv_obj._is_aligned_by_header(air_temp, rel_humid)
+    assert pmv_obj._is_aligned_by_header(air_temp, rad_temp)
+    assert not pmv_obj._is_aligned_by_header(air_temp, rel_humid_shift)
+    with pytest.raises(ValueError):
+        PMV(air_temp, rel_humid_shift)
+    pmv_obj = PMV(air_temp, rel_humid_shift, check_alignment=False)
+    assert pmv_obj.calc_length == calc_length
+
+
+def test_pmv_collection_warm_start(monkeypatch):
+    """Test that a warm-started PMV collection needs fewer SET calculations."""
+    import ladybug_comfort.pmv as pmv_module
+    epw = EPW('./tests/epw/chicago.epw')
+    period = AnalysisPeriod(7, 1, 0, 7, 7, 23)
+    air_temp = epw.dry_bulb_temperature.filter_by_analysis_period(period)
+    rel_humid = epw.relative_humidity.filter_by_analysis_period(period)
+    wind = epw.wind_speed.filter_by_analysis_period(period)
+    air_speed = [max(spd, 0.5) for spd in wind.values]
+
+    set_calls = []
+    pierce_set = pmv_module.pierce_set
+
+    def counted_pierce_set(*args, **kwargs):
+        set_calls.append(1)
+        return pierce_set(*args, **kwargs)
+    monkeypatch.setattr(pmv_module, 'pierce_set', counted_pierce_set)
+
+    cold_obj = PMV(air_temp, rel_humid, air_speed=air_speed, met_rate=2.4)
+    cold_calls = len(set_calls)
+    del set_calls[:]
+    warm_obj = PMV(air_temp, rel_humid, air_speed=air_speed, met_rate=2.4,
+                   warm_start=True)
+    assert len(set_calls) < cold_calls
+    for cold, warm in zip(cold_obj.predicted_mean_vote, warm_obj.predicted_mean_vote):
+        assert warm == pytest.approx(cold, abs=1e-2)
+    for cold, warm in zip(cold_obj.cooling_effect, warm_obj.cooling_effect):
+        assert warm == pytest.approx(cold, abs=1e-2)
+
+
+def test_pmv_collection_warm_start_epw():
+    """Test that warm-started and default PMV collections agree over an EPW year."""
+    epw = EPW('./tests/epw/chicago.epw')
+    cold_obj = PMV(epw.dry_bulb_temperature, epw.relative_humidity,
+                   air_speed=epw.wind_speed, met_rate=2.4)
+    warm_obj = PMV(epw.dry_bulb_temperature, epw.relative_humidity,
+                   air_speed=epw.wind_speed, met_rate=2.4, warm_start=True)
+    # both solutions are within the 0.001 C SET precision of the cooling effect
+    for cold, warm in zip(cold_obj.cooling_effect, warm_obj.cooling_effect):
+        assert warm == pytest.approx(cold, abs=5e-3)
+    for cold, warm in zip(cold_obj.predicted_mean_vote, warm_obj.predicted_mean_vote):
+        assert warm == pytest.approx(cold, abs=1e-3)
+
+
 def test_init_pmv_collection_epw():
     """Test the initialization of the PMV collection with EPW input."""
     calc_length = 8760
@@ -450,3 +665,159 @@ def test_pmv_collection_comfort_percent_outputs():
     assert pmv_obj.percent_cold == pytest.approx(42.39726027, rel=1e-3)
     assert pmv_obj.percent_dry == 0.0
     assert pmv_obj.percent_humid == 0.0
+
+    counts = pmv_obj.category_counts()
+    assert sorted(counts.keys()) == [-1, 0, 1]
+    assert sum(counts.values()) == 8760
+    summary = pmv_obj.summary()
+    assert len(summary) == 7
+    assert summary['percent_hot'] == pytest.approx(38.6415525, rel=1e-3)
+
+
+def test_pmv_collection_result_cache():
+    """Test the PMV collection with a ResultCache."""
+    relative_path = './tests/epw/chicago.epw'
+    epw = EPW(relative_path)
+    pmv_cache = ResultCache(predicted_mean_vote)
+    pmv_obj = PMV(epw.dry_bulb_temperature, epw.relative_humidity,
+                  met_rate=2.4, clo_value=1, result_cache=pmv_cache)
+    assert pmv_cache.hits > 0
+    assert pmv_cache.hits + pmv_cache.misses == 8760
+    assert pmv_obj.percent_neutral == pytest.approx(18.961187, rel=1e-3)
+
+    misses = pmv_cache.misses
+    PMV(epw.dry_bulb_temperature, epw.relative_humidity,
+        met_rate=2.4, clo_value=1, result_cache=pmv_cache)
+    assert pmv_cache.misses == misses
+
+    with pytest.raises(AssertionError):
+        PMV(epw.dry_bulb_temperature, epw.relative_humidity,
+            result_cache=ResultCache(pierce_set))
+
+    # results with a coarse result_cache do not replace exact results on disk
+    cache_folder = './tests/pmv_result_cache'
+    air_temp = epw.dry_bulb_temperature.filter_by_analysis_period(
+        AnalysisPeriod(end_month=1, end_day=2))
+    exact_obj = PMV(air_temp, 50, met_rate=2.4)
+    try:
+        coarse_obj = PMV(air_temp, 50, met_rate=2.4, cache_folder=cache_folder,
+                         result_cache=ResultCache(predicted_mean_vote, quantum=1))
+        assert coarse_obj.predicted_mean_vote.values != \
+            exact_obj.predicted_mean_vote.values
+        cached_obj = PMV(air_temp, 50, met_rate=2.4, cache_folder=cache_folder)
+        assert cached_obj.predicted_mean_vote.values == \
+            exact_obj.predicted_mean_vote.values
+    finally:
+        shutil.rmtree(cache_folder)
+
+
+def test_pmv_collection_from_scenarios():
+    """Test the from_scenarios method of the PMV collection."""
+    calc_length = 24
+    air_temp_header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
+    air_temp = HourlyContinuousCollection(air_temp_header, [24] * calc_length)
+    met_header = Header(MetabolicRate(), 'met', AnalysisPeriod(end_month=1, end_day=1))
+    met_rate = HourlyContinuousCollection(met_header, [1.6] * calc_length)
+    hr_par = PMVParameter(humid_ratio_upper=0.008)
+    scenarios = PMV.from_scenarios(
+        air_temp, 50, met_rates=[1.0, 1.2, met_rate], clo_values=[0.5],
+        comfort_parameters=[None, hr_par, None])
+
+    assert len(scenarios) == 3
+    for pmv_obj, met, comf_par in zip(scenarios, [1.0, 1.2, 1.6],
+                                      [None, hr_par, None]):
+        single_obj = PMV(air_temp, 50, met_rate=met, clo_value=0.5,
+                         comfort_parameter=comf_par)
+        assert pmv_obj.met_rate.values == single_obj.met_rate.values
+        assert pmv_obj.clo_value.values == single_obj.clo_value.values
+        assert pmv_obj.predicted_mean_vote.values == \
+            single_obj.predicted_mean_vote.values
+        assert pmv_obj.discomfort_reason.values == \
+            single_obj.discomfort_reason.values
+        assert pmv_obj.humidity_ratio.values == single_obj.humidity_ratio.values
+    assert scenarios[1].discomfort_reason[0] == 2
+    for pmv_obj in scenarios[1:]:  # the shared inputs are not copied
+        assert pmv_obj._air_temperature is scenarios[0]._air_temperature
+        assert pmv_obj._rel_humidity is scenarios[0]._rel_humidity
+        assert pmv_obj._pmv is not scenarios[0]._pmv
+
+    with pytest.raises(AssertionError):
+        PMV.from_scenarios(air_temp, 50, met_rates=[1.0, 1.2],
+                           clo_values=[0.5, 0.7, 1.0])
+
+
+def test_pmv_collection_mask():
+    """Test the PMV collection with a mask of the steps to evaluate."""
+    calc_length = 48
+    header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=2))
+    air_temp = HourlyContinuousCollection(
+        header, [16 + (i % 24) * 0.6 for i in range(calc_length)])
+    mask = [9 <= i % 24 < 17 for i in range(calc_length)]
+    full_obj = PMV(air_temp, 50, air_speed=0.5, met_rate=1.2)
+    pmv_obj = PMV(air_temp, 50, air_speed=0.5, met_rate=1.2, mask=mask)
+
+    for i, val in enumerate(pmv_obj.predicted_mean_vote):
+        if mask[i]:
+            assert val == full_obj.predicted_mean_vote[i]
+        else:
+            assert val is None
+    assert len(pmv_obj.cooling_effect) == calc_length
+    assert pmv_obj.air_temperature.values == air_temp.values
+    assert pmv_obj.humidity_ratio.values[8:10] == \
+        (None, full_obj.humidity_ratio[9])
+
+    conditions = full_obj.thermal_condition.filter_by_pattern(mask).values
+    comfortable = full_obj.is_comfortable.filter_by_pattern(mask).values
+    assert pmv_obj.percent_hot == pytest.approx(100 * conditions.count(1) / 16)
+    assert pmv_obj.percent_neutral == pytest.approx(100 * conditions.count(0) / 16)
+    assert pmv_obj.percent_comfortable == pytest.approx(100 * sum(comfortable) / 16)
+    assert sum(pmv_obj.category_counts().values()) == 16
+
+    # test a mask collection, scenarios and the disk cache with a mask
+    mask_coll = air_temp.get_aligned_collection(
+        [int(val) for val in mask], Fraction('Occupancy'), 'fraction')
+    cache_folder = './tests/pmv_mask_cache'
+    for _ in range(2):
+        cache_obj = PMV(air_temp, 50, air_speed=0.5, met_rate=1.2,
+                        cache_folder=cache_folder, mask=mask_coll)
+        assert cache_obj.predicted_mean_vote.values == \
+            pmv_obj.predicted_mean_vote.values
+    shutil.rmtree(cache_folder)
+    scenarios = PMV.from_scenarios(air_temp, 50, air_speed=0.5,
+                                   met_rates=[1.2, 1.6], mask=mask)
+    assert scenarios[0].predicted_mean_vote.values == \
+        pmv_obj.predicted_mean_vote.values
+    assert scenarios[1].predicted_mean_vote[0] is None
+    assert PMV(air_temp, 50, mask=[1] * calc_length).predicted_mean_vote[0] is not None
+
+    with pytest.raises(AssertionError):
+        PMV(air_temp, 50, mask=mask[:-1])
+    with pytest.raises(AssertionError):
+        PMV(air_temp, 50, mask=[False] * calc_length)
+
+
+def test_pmv_collection_threshold_sweep():
+    """Test the threshold sweep of the PMV collection against recomputed objects."""
+    calc_length = 48
+    header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=2))
+    air_temp = HourlyContinuousCollection(
+        header, [16 + (i % 24) * 0.6 for i in range(calc_length)])
+    rel_humid = HourlyContinuousCollection(
+        Header(RelativeHumidity(), '%', AnalysisPeriod(end_month=1, end_day=2)),
+        [10 + i * 1.8 for i in range(calc_length)])
+    mask = [i % 4 != 0 for i in range(calc_length)]
+    thresholds = [5, 8, 10, 15, 20, 50, 100]
+    for hr_upper, hr_lower in ((None, None), (0.012, 0.004)):
+        pmv_obj = PMV(air_temp, rel_humid, air_speed=0.3, mask=mask,
+                      comfort_parameter=PMVParameter(10, hr_upper, hr_lower))
+        sweep = pmv_obj.threshold_sweep(thresholds)
+        assert sorted(sweep.keys()) == sorted(pmv_obj.summary().keys())
+        for i, thresh in enumerate(thresholds):
+            summary = PMV(air_temp, rel_humid, air_speed=0.3, mask=mask,
+                          comfort_parameter=PMVParameter(
+                              thresh, hr_upper, hr_lower)).summary()
+            for key, val in summary.items():
+                assert sweep[key][i] == pytest.approx(val)
+
+    with pytest.raises(AssertionError):
+        pmv_obj.threshold_sweep([4])
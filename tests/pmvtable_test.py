@@ -0,0 +1,80 @@
+# coding utf-8
+import pytest
+import os
+
+from ladybug_comfort.pmvtable import PMVBoundaryTable
+from ladybug_comfort.parameter.pmv import PMVParameter
+from ladybug_comfort.pmv import calc_missing_pmv_input, \
+    ppd_threshold_from_comfort_class
+
+
+def test_pmv_boundary_table():
+    """Test the initialization of PMVBoundaryTable and its properties."""
+    table = PMVBoundaryTable([0, 50, 100], [0.1, 0.5], [1.1], [0.5, 1.0])
+    str(table)  # test the string representation
+
+    assert table.rel_humidity == (0, 50, 100)
+    assert table.air_speed == (0.1, 0.5)
+    assert table.met_rate == (1.1,)
+    assert table.clo_value == (0.5, 1.0)
+    assert table.external_work == 0
+    assert table.pmv_limit == pytest.approx(0.5, abs=0.02)
+    assert len(table.cold_boundaries) == 12
+    assert len(table.hot_boundaries) == 12
+    for cold, hot in zip(table.cold_boundaries, table.hot_boundaries):
+        assert cold < hot
+
+
+def test_pmv_boundary_table_boundary():
+    """Test the boundary method of PMVBoundaryTable against root finding."""
+    table = PMVBoundaryTable([0, 25, 50, 75, 100], [0.1], [1.0, 1.2], [0.5, 1.0])
+
+    cold, hot = table.boundary(50, 0.1, 1.2, 0.5)
+    input_dict = {'ta': None, 'tr': None, 'vel': 0.1, 'rh': 50,
+                  'met': 1.2, 'clo': 0.5, 'wme': 0}
+    assert cold == pytest.approx(calc_missing_pmv_input(
+        -table.pmv_limit, dict(input_dict), -20, 50)['ta'], abs=0.01)
+    assert hot == pytest.approx(calc_missing_pmv_input(
+        table.pmv_limit, dict(input_dict), -20, 50)['ta'], abs=0.01)
+
+    input_dict = {'ta': None, 'tr': None, 'vel': 0.1, 'rh': 40,
+                  'met': 1.1, 'clo': 0.7, 'wme': 0}
+    cold, hot = table.boundary(40, 0.1, 1.1, 0.7)
+    assert cold == pytest.approx(calc_missing_pmv_input(
+        -table.pmv_limit, dict(input_dict), -20, 50)['ta'], abs=0.2)
+    assert hot == pytest.approx(calc_missing_pmv_input(
+        table.pmv_limit, dict(input_dict), -20, 50)['ta'], abs=0.2)
+
+    colds, hots = table.boundaries([0, 50, 100], 0.1, 1.2, 0.5)
+    assert len(colds) == len(hots) == 3
+    assert colds[1] == pytest.approx(table.boundary(50, 0.1, 1.2, 0.5)[0])
+    assert table.boundary(200, 2, 3, 3) == table.boundary(100, 0.1, 1.2, 1.0)
+
+
+def test_pmv_boundary_table_comfort_class():
+    """Test PMVBoundaryTable with a PPD threshold from a comfort class."""
+    ppd_thresh = ppd_threshold_from_comfort_class(3)
+    table = PMVBoundaryTable(
+        [0, 100], [0.1], [1.1], [0.7], comfort_parameter=PMVParameter(ppd_thresh))
+    base_table = PMVBoundaryTable([0, 100], [0.1], [1.1], [0.7])
+    assert table.pmv_limit > base_table.pmv_limit
+    assert table.boundary(50)[0] < base_table.boundary(50)[0]
+    assert table.boundary(50)[1] > base_table.boundary(50)[1]
+
+    with pytest.raises(AssertionError):
+        PMVBoundaryTable([50, 0])
+
+
+def test_pmv_boundary_table_to_from_file():
+    """Test the serialization of PMVBoundaryTable to a dictionary and a file."""
+    table = PMVBoundaryTable([0, 50, 100], [0.1, 0.5], [1.1], [0.5, 1.0])
+    new_table = PMVBoundaryTable.from_dict(table.to_dict())
+    assert new_table.cold_boundaries == table.cold_boundaries
+    assert new_table.hot_boundaries == table.hot_boundaries
+    assert new_table.boundary(30, 0.2, 1.1, 0.7) == table.boundary(30, 0.2, 1.1, 0.7)
+
+    file_path = './tests/pmv_boundary_table.json'
+    table.to_file(file_path)
+    file_table = PMVBoundaryTable.from_file(file_path)
+    os.remove(file_path)
+    assert file_table.to_dict() == table.to_dict()
@@ -0,0 +1,36 @@
+# coding utf-8
+import pytest
+
+from ladybug_comfort.psychrometrics import PsychrometricColumns
+
+from ladybug.psychrometrics import humid_ratio_from_db_rh, dew_point_from_db_rh
+from ladybug.epw import EPW
+
+
+def test_psychrometric_columns():
+    """Test PsychrometricColumns against the single-value ladybug functions."""
+    epw = EPW('./tests/epw/chicago.epw')
+    temps = epw.dry_bulb_temperature.values
+    humids = epw.relative_humidity.values
+    psychro = PsychrometricColumns(temps, humids)
+
+    assert str(psychro) == 'Psychrometric Columns [8760 values]'
+    assert psychro.pressure == 101325
+    assert psychro.humidity_ratio == \
+        [humid_ratio_from_db_rh(ta, rh) for ta, rh in zip(temps, humids)]
+    assert psychro.dew_point[:500] == \
+        [dew_point_from_db_rh(ta, rh) for ta, rh in zip(temps[:500], humids[:500])]
+    assert psychro.vapor_pressure[0] == pytest.approx(
+        psychro.saturated_vapor_pressure[0] * humids[0] / 100)
+
+
+def test_psychrometric_columns_constant_humidity():
+    """Test PsychrometricColumns with a single relative humidity value."""
+    psychro = PsychrometricColumns([10, 20, 30], 50, 90000)
+    assert len(psychro.rel_humidity) == 3
+    assert psychro.humidity_ratio == pytest.approx(
+        [humid_ratio_from_db_rh(ta, 50, 90000) for ta in (10, 20, 30)])
+    assert psychro.dew_point[1] == pytest.approx(9.3, abs=0.1)
+
+    with pytest.raises(AssertionError):
+        PsychrometricColumns([10, 20, 30], [50, 50])
@@ -0,0 +1,137 @@
+# coding utf-8
+import pytest
+import os
+
+from ladybug_comfort.settable import PierceSetTable
+from ladybug_comfort.collection.pmv import PMV
+from ladybug_comfort.pmv import pierce_set, predicted_mean_vote
+
+from ladybug.analysisperiod import AnalysisPeriod
+from ladybug.header import Header
+from ladybug.datacollection import HourlyContinuousCollection
+from ladybug.datatype.temperature import Temperature
+from ladybug.datatype.rvalue import ClothingInsulation
+
+
+def _small_table(met_rate=1.1, clo_value=0.7, tolerance=0.1):
+    """Get a small PierceSetTable that is fast to compute."""
+    return PierceSetTable(met_rate, clo_value, 0, range(10, 41, 2), (-5, 0, 5, 10),
+                          (0.1, 0.137, 0.2, 0.5, 1.0, 2.0), range(0, 101, 20),
+                          tolerance)
+
+
+def test_pierce_set_table():
+    """Test the initialization of PierceSetTable and its properties."""
+    table = _small_table()
+    str(table)  # test the string representation
+
+    assert table.met_rate == 1.1
+    assert table.clo_value == 0.7
+    assert table.external_work == 0
+    assert table.air_temperature == tuple(float(t) for t in range(10, 41, 2))
+    assert table.mrt_delta == (-5, 0, 5, 10)
+    assert table.air_speed == (0.1, 0.137, 0.2, 0.5, 1.0, 2.0)
+    assert table.rel_humidity == (0, 20, 40, 60, 80, 100)
+    assert table.tolerance == 0.1
+    assert len(table.set_values) == 16 * 4 * 6 * 6
+    assert 0 <= table.fallback_fraction < 0.5
+    assert 0 < table.max_center_error <= table.tolerance
+
+    with pytest.raises(AssertionError):
+        PierceSetTable(air_temperature=[20])
+    with pytest.raises(AssertionError):
+        PierceSetTable(rel_humidity=[50, 0])
+    with pytest.raises(AssertionError):
+        PierceSetTable(tolerance=0)
+
+
+def test_pierce_set_table_set():
+    """Test the set method of PierceSetTable against the full SET model."""
+    table = _small_table()
+    # values on the grid and outside of the grid are the same as the full model
+    assert table.set(20, 25, 0.5, 40) == pytest.approx(
+        pierce_set(20, 25, 0.5, 40, 1.1, 0.7), abs=1e-9)
+    assert table.set(5, 5, 0.5, 40) == pierce_set(5, 5, 0.5, 40, 1.1, 0.7)
+    assert table.set(20, 40, 0.5, 40) == pierce_set(20, 40, 0.5, 40, 1.1, 0.7)
+    assert table.set(20, 20, 3, 40) == pierce_set(20, 20, 3, 40, 1.1, 0.7)
+    # air speeds below 0.1 m/s are the same as 0.1 m/s in the full model
+    assert table.set(20, 20, 0.05, 40) == table.set(20, 20, 0.1, 40)
+
+    for ta, tr, vel, rh in ((21.3, 24.7, 0.33, 47), (27.9, 27.9, 0.12, 71),
+                            (33.1, 30.2, 1.6, 25)):
+        assert table.set(ta, tr, vel, rh) == pytest.approx(
+            pierce_set(ta, tr, vel, rh, 1.1, 0.7), abs=0.3)
+    assert table.set_batch([21.3, 27.9], [24.7, 27.9], [0.33, 0.12], [47, 71]) == \
+        [table.set(21.3, 24.7, 0.33, 47), table.set(27.9, 27.9, 0.12, 71)]
+
+    # a table where every cell uses the full model gives the full model results
+    exact_table = _small_table(tolerance=1e-12)
+    assert exact_table.fallback_fraction == 1
+    assert exact_table.set(21.3, 24.7, 0.33, 47) == \
+        pierce_set(21.3, 24.7, 0.33, 47, 1.1, 0.7)
+
+
+def test_pierce_set_table_validation():
+    """Test PierceSetTable against the SET reference table from ASHRAE-55 2017."""
+    table = PierceSetTable(1, 0.5, 0, range(0, 41), (-15, -10, -5, 0, 5, 10, 15),
+                           (0.1, 0.137, 0.2, 0.4, 0.6, 1, 2, 3), range(0, 101, 10))
+    validation_csv_file_path = './tests/validation_tables/set_validation.csv'
+    with open(validation_csv_file_path) as csv_data_file:
+        csv_data_file.readline()
+        for row in csv_data_file:
+            values = [float(val) for val in row.split(',')]
+            if values[4:6] != [1, 0.5]:
+                continue
+            # the table is within 0.05 C of the full model and the full model is
+            # within 0.1 C of the reference values, which are rounded to 0.1 C
+            full_set = pierce_set(*values[:6])
+            assert table.set(*values[:4]) == pytest.approx(full_set, abs=0.05)
+            assert table.set(*values[:4]) == pytest.approx(values[-1], abs=0.1)
+
+
+def test_pierce_set_table_pmv():
+    """Test the use of PierceSetTable by predicted_mean_vote and PMV."""
+    table = _small_table()
+    for ta, tr, vel, rh in ((24, 26, 0.05, 50), (27.3, 28, 0.6, 60)):
+        full = predicted_mean_vote(ta, tr, vel, rh, 1.1, 0.7)
+        approx = predicted_mean_vote(ta, tr, vel, rh, 1.1, 0.7, set_table=table)
+        assert approx['set'] == pytest.approx(full['set'], abs=0.1)
+        assert approx['pmv'] == pytest.approx(full['pmv'], abs=0.05)
+    with pytest.raises(AssertionError):
+        predicted_mean_vote(24, 26, 0.6, 50, 1.2, 0.7, set_table=table)
+
+    calc_length = 24
+    air_temp_header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
+    air_temp = HourlyContinuousCollection(
+        air_temp_header, [20 + i * 0.5 for i in range(calc_length)])
+    table.share()
+    try:
+        assert PierceSetTable.shared_table(1.1, 0.7) is table
+        pmv_obj = PMV(air_temp, 50, air_speed=0.6, set_surrogate=True)
+    finally:
+        PierceSetTable._shared_tables.pop((1.1, 0.7, 0.), None)
+    for ta, pmv in zip(air_temp, pmv_obj.predicted_mean_vote):
+        assert pmv == predicted_mean_vote(
+            ta, ta, 0.6, 50, 1.1, 0.7, set_table=table)['pmv']
+
+    # tables are only computed for a single met, clo and external work
+    clo = air_temp.get_aligned_collection(
+        [0.5] * 12 + [1.0] * 12, ClothingInsulation(), 'clo')
+    with pytest.raises(AssertionError):
+        PMV(air_temp, 50, clo_value=clo, set_surrogate=True)
+
+
+def test_pierce_set_table_to_from_file():
+    """Test the serialization of PierceSetTable to a dictionary and a file."""
+    table = _small_table()
+    new_table = PierceSetTable.from_dict(table.to_dict())
+    assert new_table.set_values == table.set_values
+    assert new_table.fallback_cells == table.fallback_cells
+    assert new_table.max_center_error == table.max_center_error
+    assert new_table.set(21.3, 24.7, 0.33, 47) == table.set(21.3, 24.7, 0.33, 47)
+
+    file_path = './tests/pierce_set_table.json'
+    table.to_file(file_path)
+    file_table = PierceSetTable.from_file(file_path)
+    os.remove(file_path)
+    assert file_table.to_dict() == table.to_dict()
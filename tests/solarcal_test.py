@@ -1,5 +1,6 @@
 # coding utf-8
 import pytest
+import shutil
 
 from ladybug_comfort.collection.solarcal import OutdoorSolarCal, IndoorSolarCal, \
     HorizontalSolarCal
@@ -356,6 +357,27 @@ def test_init_outdoor_solarcal_collection_epw():
     assert solarcal_obj.mean_radiant_temperature[12] == pytest.approx(9.524518, rel=1e-3)
 
 
+def test_outdoor_solarcal_collection_from_epw():
+    """Test the OutdoorSolarCal from_epw method with a cache_folder."""
+    relative_path = './tests/epw/chicago.epw'
+    epw = EPW(relative_path)
+    solarcal_obj = OutdoorSolarCal(epw.location, epw.direct_normal_radiation,
+                                   epw.diffuse_horizontal_radiation,
+                                   epw.horizontal_infrared_radiation_intensity,
+                                   epw.dry_bulb_temperature)
+    cache_folder = './tests/solarcal_cache'
+    epw_obj = OutdoorSolarCal.from_epw(epw, cache_folder=cache_folder)
+    cached_obj = OutdoorSolarCal.from_epw(epw, cache_folder=cache_folder)
+    shutil.rmtree(cache_folder)
+
+    assert epw_obj.mean_radiant_temperature.values == \
+        solarcal_obj.mean_radiant_temperature.values
+    assert cached_obj.mean_radiant_temperature.values == \
+        solarcal_obj.mean_radiant_temperature.values
+    assert cached_obj.shortwave_mrt_delta.values == \
+        solarcal_obj.shortwave_mrt_delta.values
+
+
 def test_init_indoor_solarcal_collection():
     """Test the initialization of the IndoorSolarCal collection."""
     calc_length = 24
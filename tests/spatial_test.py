@@ -0,0 +1,78 @@
+# coding utf-8
+import pytest
+import os
+import shutil
+
+from ladybug_comfort.spatial import OutdoorComfortMap
+from ladybug_comfort.collection.solarcal import OutdoorSolarCal
+from ladybug_comfort.collection.utci import UTCI
+from ladybug_comfort.parameter.solarcal import SolarCalParameter
+
+from ladybug.epw import EPW
+
+
+def test_init_outdoor_comfort_map():
+    """Test the initialization of the OutdoorComfortMap object."""
+    epw = EPW('./tests/epw/chicago.epw')
+    comfort_map = OutdoorComfortMap.from_epw(
+        epw, [1, 0.5, 0.2], [1, 0.5, 0], floor_reflectance=[0.2, 0.3, 0.4])
+
+    assert comfort_map.point_count == 3
+    assert comfort_map.calc_length == 8760
+    assert comfort_map.location.city == epw.location.city
+    assert comfort_map.solarcal_body_parameter.posture == 'standing'
+    assert str(comfort_map) == \
+        'Outdoor Comfort Map: Chicago Ohare Intl Ap [3 points x 8760 hours]'
+
+    with pytest.raises(AssertionError):
+        OutdoorComfortMap.from_epw(epw, [1, 0.5, 0.2], [1, 0.5])
+    with pytest.raises(AssertionError):
+        OutdoorComfortMap.from_epw(epw, [1, 0.5], surface_temperatures=[20, [20]])
+
+
+def test_outdoor_comfort_map_parity():
+    """Test that OutdoorComfortMap matches the OutdoorSolarCal and UTCI results."""
+    epw = EPW('./tests/epw/chicago.epw')
+    body_par = SolarCalParameter(body_azimuth=180)
+    comfort_map = OutdoorComfortMap.from_epw(
+        epw, [1, 0.5], [1, 0.3], [None, 10], 0.3, solarcal_body_parameter=body_par)
+    mrts = list(comfort_map.mean_radiant_temperature())
+    assert len(mrts) == 2
+    assert len(mrts[0]) == 8760
+
+    for mrt, sky_e, fract_e, srf_temp in zip(
+            mrts, (1, 0.5), (1, 0.3), (epw.dry_bulb_temperature, 10)):
+        solarcal = OutdoorSolarCal(
+            epw.location, epw.direct_normal_radiation,
+            epw.diffuse_horizontal_radiation,
+            epw.horizontal_infrared_radiation_intensity, srf_temp, fract_e,
+            sky_e, 0.3, body_par)
+        assert mrt == pytest.approx(solarcal.mean_radiant_temperature.values)
+
+    utci_vals = list(comfort_map.universal_thermal_climate_index(0, 1))[0]
+    utci_obj = UTCI(epw.dry_bulb_temperature, epw.relative_humidity,
+                    OutdoorSolarCal.from_epw(
+                        epw, 1, 1, 0.3, body_par).mean_radiant_temperature,
+                    epw.wind_speed)
+    assert utci_vals == pytest.approx(utci_obj.universal_thermal_climate_index.values)
+
+
+def test_outdoor_comfort_map_write_csv():
+    """Test the write_csv method of the OutdoorComfortMap object."""
+    epw = EPW('./tests/epw/chicago.epw')
+    comfort_map = OutdoorComfortMap.from_epw(
+        epw, [1, 0.8, 0.6, 0.4, 0.2], include_wind=False)
+    folder = './tests/comfort_map'
+    csv_files = comfort_map.write_csv(folder, chunk_size=2, mrt=False)
+    assert [os.path.basename(f) for f in csv_files] == \
+        ['universal_thermal_climate_index.csv', 'thermal_condition.csv']
+
+    utci_vals = list(comfort_map.universal_thermal_climate_index())
+    with open(csv_files[0]) as inf:
+        rows = [[float(v) for v in line.split(',')] for line in inf]
+    assert len(rows) == 5
+    assert rows[3] == pytest.approx(utci_vals[3])
+    with open(csv_files[1]) as inf:
+        rows = [[int(v) for v in line.split(',')] for line in inf]
+    assert rows[4] == comfort_map.utci_parameter.thermal_condition_batch(utci_vals[4])
+    shutil.rmtree(folder)
@@ -0,0 +1,100 @@
+# coding utf-8
+import pytest
+
+from ladybug_comfort.stream import RunningMeanTemperature, pmv_stream, \
+    utci_stream, adaptive_stream, outdoor_solarcal_stream
+from ladybug_comfort.collection.utci import UTCI
+from ladybug_comfort.collection.adaptive import Adaptive
+from ladybug_comfort.collection.solarcal import OutdoorSolarCal
+from ladybug_comfort.parameter.adaptive import AdaptiveParameter
+from ladybug_comfort.pmv import predicted_mean_vote
+from ladybug_comfort.adaptive import weighted_running_mean_hourly
+
+from ladybug.epw import EPW
+
+
+def _join_chunks(chunks):
+    """Join the dictionaries of result lists yielded by a stream."""
+    result = {}
+    for chunk in chunks:
+        for key, values in chunk.items():
+            result.setdefault(key, []).extend(values)
+    return result
+
+
+def test_running_mean_temperature():
+    """Test that RunningMeanTemperature matches weighted_running_mean_hourly."""
+    epw = EPW('./tests/epw/chicago.epw')
+    temps = epw.dry_bulb_temperature.values
+    expected = weighted_running_mean_hourly(temps)
+
+    running_mean = RunningMeanTemperature(initial_prevailing=expected[0])
+    prevailing = []
+    for i in range(0, len(temps), 1000):
+        prevailing.extend(running_mean.update(temps[i:i + 1000]))
+    assert prevailing == pytest.approx(expected)
+
+    running_mean = RunningMeanTemperature(steps_per_day=4)
+    assert running_mean.update([1, 2, 3]) == []
+    assert running_mean.update([4, 10]) == [2.5, 2.5, 2.5, 2.5, 2.5]
+    assert running_mean.current_prevailing == pytest.approx(2.5)
+    assert running_mean.flush() == []
+
+
+def test_pmv_stream():
+    """Test the pmv_stream function."""
+    temps = [18 + i * 0.1 for i in range(100)]
+    chunks = list(pmv_stream(temps, 50, air_speed=0.5, chunk_size=30))
+    assert len(chunks) == 4
+    assert len(chunks[-1]['predicted_mean_vote']) == 10
+    result = _join_chunks(chunks)
+    for ta, pmv in zip(temps, result['predicted_mean_vote']):
+        assert pmv == pytest.approx(
+            predicted_mean_vote(ta, ta, 0.5, 50, 1.1, 0.7)['pmv'])
+    assert set(result['thermal_condition']) == set([-1, 0])
+
+
+def test_utci_stream():
+    """Test that utci_stream matches the UTCI collection."""
+    epw = EPW('./tests/epw/chicago.epw')
+    utci_obj = UTCI(epw.dry_bulb_temperature, epw.relative_humidity,
+                    wind_speed=epw.wind_speed)
+    result = _join_chunks(utci_stream(
+        iter(epw.dry_bulb_temperature.values), epw.relative_humidity.values,
+        None, epw.wind_speed.values, chunk_size=1000))
+    assert result['universal_thermal_climate_index'] == \
+        list(utci_obj.universal_thermal_climate_index.values)
+    assert result['thermal_condition'] == list(utci_obj.thermal_condition.values)
+
+
+def test_adaptive_stream():
+    """Test that adaptive_stream matches the Adaptive collection."""
+    epw = EPW('./tests/epw/chicago.epw')
+    temps = epw.dry_bulb_temperature
+    adapt_obj = Adaptive(temps, temps, comfort_parameter=AdaptiveParameter(
+        avg_month_or_running_mean=False))
+    initial = adapt_obj.prevailing_outdoor_temperature.values[0]
+    result = _join_chunks(adaptive_stream(
+        temps.values, temps.values, initial_prevailing=initial, chunk_size=500))
+    assert result['degrees_from_neutral'] == \
+        pytest.approx(adapt_obj.degrees_from_neutral.values)
+    assert result['thermal_condition'] == list(adapt_obj.thermal_condition.values)
+
+    # test a stream that ends before the first day is complete
+    result = _join_chunks(adaptive_stream([20] * 10, [22] * 10, chunk_size=3))
+    assert result['prevailing_outdoor_temperature'] == [20] * 10
+
+
+def test_outdoor_solarcal_stream():
+    """Test that outdoor_solarcal_stream matches the OutdoorSolarCal collection."""
+    epw = EPW('./tests/epw/chicago.epw')
+    solarcal_obj = OutdoorSolarCal.from_epw(epw, sky_exposure=0.5)
+    result = _join_chunks(outdoor_solarcal_stream(
+        epw.location, epw.dry_bulb_temperature.datetimes,
+        epw.direct_normal_radiation.values, epw.diffuse_horizontal_radiation.values,
+        epw.horizontal_infrared_radiation_intensity.values,
+        epw.dry_bulb_temperature.values, sky_exposure=0.5, chunk_size=2000))
+    assert result['mean_radiant_temperature'] == \
+        pytest.approx(solarcal_obj.mean_radiant_temperature.values)
+    assert result['shortwave_mrt_delta'] == \
+        pytest.approx(solarcal_obj.shortwave_mrt_delta.values)
@@ -0,0 +1,90 @@
+# coding utf-8
+import pytest
+import csv
+import os
+import shutil
+
+from ladybug_comfort.survey import find_epw_files, survey_header, survey_epw, \
+    climate_survey, main
+from ladybug_comfort.collection.utci import UTCI
+from ladybug_comfort.collection.hi import HeatIndex
+
+from ladybug.epw import EPW
+
+
+def _read_rows(csv_path):
+    with open(csv_path) as csv_file:
+        return list(csv.reader(csv_file))
+
+
+def test_survey_epw():
+    """Test the survey_epw function against the comfort collections."""
+    epw_path = './tests/epw/chicago.epw'
+    header = survey_header(('utci', 'heat_index'))
+    assert header == ['epw_file', 'city', 'latitude', 'longitude',
+                      'utci_percent_neutral', 'utci_percent_hot', 'utci_percent_cold',
+                      'heat_index_percent_neutral', 'heat_index_percent_hot']
+    row = survey_epw(epw_path, ('utci', 'heat_index'), include_sun=False)
+    assert len(row) == len(header)
+    assert row[0] == os.path.abspath(epw_path)
+
+    epw = EPW(epw_path)
+    utci_obj = UTCI.from_epw(epw, include_sun=False)
+    assert row[4:7] == [utci_obj.percent_neutral, utci_obj.percent_hot,
+                        utci_obj.percent_cold]
+    assert row[7] == HeatIndex.from_epw(epw).percent_neutral
+
+    with pytest.raises(AssertionError):
+        survey_header(('set',))
+
+
+def test_climate_survey_resume():
+    """Test that climate_survey skips the files that are already in the CSV."""
+    folder = './tests/survey'
+    sub_folder = os.path.join(folder, 'sub')
+    os.makedirs(sub_folder)
+    for epw_dir in (folder, sub_folder):
+        shutil.copy('./tests/epw/chicago.epw', epw_dir)
+    with open(os.path.join(folder, 'broken.epw'), 'w') as f:
+        f.write('not an epw')
+    csv_path = os.path.join(folder, 'survey.csv')
+
+    epw_files = find_epw_files([folder])
+    assert len(epw_files) == 3
+    assert len(find_epw_files([folder], recursive=False)) == 2
+    failures = climate_survey(epw_files, csv_path, ('heat_index', 'humidex'),
+                              processes=2)
+    assert list(failures) == [os.path.abspath(os.path.join(folder, 'broken.epw'))]
+    rows = _read_rows(csv_path)
+    assert rows[0] == survey_header(('heat_index', 'humidex'))
+    assert len(rows) == 3
+    assert rows[1][1:] == rows[2][1:]
+
+    # simulate an interruption that cut off the last row
+    with open(csv_path) as csv_file:
+        content = csv_file.read()
+    with open(csv_path, 'w') as csv_file:
+        csv_file.write(content[:-10])
+    failures = climate_survey(epw_files[1:], csv_path, ('heat_index', 'humidex'),
+                              processes=1)
+    assert failures == {}
+    rows = _read_rows(csv_path)
+    assert len(rows) == 3
+    assert rows[1][1:] == rows[2][1:]
+
+    with pytest.raises(AssertionError):
+        climate_survey(epw_files, csv_path, ('utci',))
+    shutil.rmtree(folder)
+
+
+def test_survey_main():
+    """Test the command line interface of the climate survey."""
+    folder = './tests/survey_cli'
+    os.makedirs(folder)
+    csv_path = os.path.join(folder, 'survey.csv')
+    assert main(['./tests/epw', '-o', csv_path, '-m', 'wind_chill',
+                 '--no-sun', '-p', '1']) == 0
+    rows = _read_rows(csv_path)
+    assert rows[0][-1] == 'wind_chill_percent_cold'
+    assert rows[1][1] == 'Chicago Ohare Intl Ap'
+    shutil.rmtree(folder)
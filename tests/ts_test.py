@@ -3,6 +3,11 @@ import pytest
 
 from ladybug_comfort.ts import thermal_sensation
 from ladybug_comfort.ts import thermal_sensation_effect_category
+from ladybug_comfort.ts import thermal_sensation_batch, \
+    thermal_sensation_effect_category_batch
+from ladybug_comfort.collection.ts import ThermalSensation
+
+from ladybug.epw import EPW
 
 
 def test_thermal_sensation():
@@ -22,3 +27,41 @@ def test_thermal_sensation_effect_category():
     assert thermal_sensation_effect_category(3.7) == -1
     assert thermal_sensation_effect_category(2.5) == -2
     assert thermal_sensation_effect_category(-4) == -3
+
+
+def test_thermal_sensation_batch():
+    """Test that the batch thermal sensation functions match single values."""
+    ta = [t for t in range(-20, 50)]
+    ws = [t * 0.1 for t in range(70)]
+    rh = [50] * 70
+    sr = [t * 10 for t in range(70)]
+    tg = [t - 2 for t in ta]
+    ts_values = thermal_sensation_batch(ta, ws, rh, sr, tg)
+    assert ts_values == pytest.approx(
+        [thermal_sensation(*vals) for vals in zip(ta, ws, rh, sr, tg)])
+
+    ts_values.extend([2, 3, 4, 5, 6, 7])
+    assert thermal_sensation_effect_category_batch(ts_values) == \
+        [thermal_sensation_effect_category(ts) for ts in ts_values]
+
+
+def test_thermal_sensation_collection():
+    """Test the ThermalSensation collection against the scalar function."""
+    epw = EPW('./tests/epw/chicago.epw')
+    ts_obj = ThermalSensation.from_epw(epw)
+    assert ts_obj.comfort_model == 'Thermal Sensation'
+    assert ts_obj.calc_length == 8760
+    assert ts_obj.thermal_sensation.values == pytest.approx([
+        thermal_sensation(ta, ws, rh, sr, ta) for ta, ws, rh, sr in zip(
+            epw.dry_bulb_temperature, epw.wind_speed, epw.relative_humidity,
+            epw.global_horizontal_radiation)])
+    assert ts_obj.thermal_sensation_category.values == tuple(
+        thermal_sensation_effect_category(ts) for ts in ts_obj.thermal_sensation)
+    assert ts_obj.percent_neutral + ts_obj.percent_hot + ts_obj.percent_cold == \
+        pytest.approx(100)
+
+    ts_obj = ThermalSensation(epw.dry_bulb_temperature, 0.5, 50, 0, 10)
+    assert ts_obj.thermal_sensation[0] == pytest.approx(
+        thermal_sensation(epw.dry_bulb_temperature[0], 0.5, 50, 0, 10))
+    with pytest.raises(AssertionError):
+        ThermalSensation(epw.dry_bulb_temperature, epw.dry_bulb_temperature, 50, 0)
@@ -1,10 +1,13 @@
 # coding utf-8
 import pytest
+import os
+import shutil
 
 from ladybug_comfort.collection.utci import UTCI
 from ladybug_comfort.parameter.utci import UTCIParameter
 
-from ladybug_comfort.utci import universal_thermal_climate_index, calc_missing_utci_input
+from ladybug_comfort.utci import universal_thermal_climate_index, \
+    calc_missing_utci_input, calc_missing_utci_input_batch
 
 from ladybug.analysisperiod import AnalysisPeriod
 from ladybug.header import Header
@@ -44,6 +47,41 @@ def test_calc_missing_utci_input():
     assert updated_input_5['ta'] == updated_input_5['tr']
 
 
+def test_calc_missing_utci_input_batch():
+    """Test the calc_missing_utci_input_batch function"""
+    wind_speeds = [0.5, 1, 2, 4, 8]
+    input_1 = {'ta': None, 'tr': 20, 'vel': wind_speeds, 'rh': 50}
+    updated_input_1, success = calc_missing_utci_input_batch(25, input_1)
+    assert all(success)
+    assert updated_input_1['vel'] == wind_speeds
+    assert updated_input_1['ta'][0] == pytest.approx(26.9827, rel=1e-2)
+    for ta, vel in zip(updated_input_1['ta'], wind_speeds):
+        assert universal_thermal_climate_index(ta, 20, vel, 50) == \
+            pytest.approx(25, abs=1e-2)
+
+    input_2 = {'ta': None, 'tr': None, 'vel': 5, 'rh': 50}
+    updated_input_2, success = calc_missing_utci_input_batch([22, 22], input_2)
+    assert success == [True, True]
+    assert updated_input_2['ta'][0] == pytest.approx(26.413594, rel=1e-2)
+    assert updated_input_2['ta'] == updated_input_2['tr']
+
+    input_3 = {'ta': 20, 'tr': 20, 'vel': 0.5, 'rh': None}
+    updated_input_3, success = calc_missing_utci_input_batch([22, 60], input_3)
+    assert success == [True, False]
+    assert updated_input_3['rh'][0] == pytest.approx(90.388989, rel=1e-2)
+    assert updated_input_3['rh'][1] is None
+
+    # unreachable targets are failures rather than exceptions
+    input_4 = {'ta': 30, 'tr': 30, 'vel': None, 'rh': 50}
+    updated_input_4, success = calc_missing_utci_input_batch([45], input_4, 0, 17)
+    assert success == [False]
+    assert updated_input_4['vel'] == [None]
+    input_5 = {'ta': None, 'tr': 20, 'vel': 1, 'rh': 50}
+    updated_input_5, success = calc_missing_utci_input_batch([10, 300], input_5)
+    assert success == [True, False]
+    assert updated_input_5['ta'][1] is None
+
+
 def test_utci_parameters():
     """Test UTCI Parameters."""
     cold_thresh = 8
@@ -214,6 +252,27 @@ def test_original_utci_category():
     assert condition_test == 9
 
 
+def test_utci_parameter_batch():
+    """Test that the batch methods on UTCI Parameters match the single-value ones."""
+    utci_comf = UTCIParameter()
+    values = [-50, -40, -35, -27, -20, -13, -5, 0, 5, 9, 15,
+              26, 27, 28, 30, 32, 35, 38, 42, 46, 50]
+    assert utci_comf.is_comfortable_batch(values) == \
+        [utci_comf.is_comfortable(v) for v in values]
+    assert utci_comf.thermal_condition_batch(values) == \
+        [utci_comf.thermal_condition(v) for v in values]
+    assert utci_comf.thermal_condition_five_point_batch(values) == \
+        [utci_comf.thermal_condition_five_point(v) for v in values]
+    assert utci_comf.thermal_condition_seven_point_batch(values) == \
+        [utci_comf.thermal_condition_seven_point(v) for v in values]
+    assert utci_comf.thermal_condition_nine_point_batch(values) == \
+        [utci_comf.thermal_condition_nine_point(v) for v in values]
+    assert utci_comf.thermal_condition_eleven_point_batch(values) == \
+        [utci_comf.thermal_condition_eleven_point(v) for v in values]
+    assert utci_comf.original_utci_category_batch(values) == \
+        [utci_comf.original_utci_category(v) for v in values]
+
+
 def test_init_utci_collection():
     """Test the initialization of the UTCI collection and basic outputs."""
     calc_length = 24
@@ -433,3 +492,83 @@ def test_utci_collection_comfort_percent_outputs():
     assert utci_obj.percent_strong_heat_stress == pytest.approx(0.2054794, rel=1e-3)
     assert utci_obj.percent_very_strong_heat_stress == 0.0
     assert utci_obj.percent_extreme_heat_stress == 0.0
+
+    counts = utci_obj.category_counts()
+    assert sorted(counts.keys()) == list(range(-5, 6))
+    assert sum(counts.values()) == 8760
+    assert counts[5] == 0
+    summary = utci_obj.summary()
+    assert len(summary) == 15
+    assert summary['percent_cold'] == pytest.approx(60.970319, rel=1e-3)
+
+
+def test_utci_collection_cache_folder():
+    """Test the UTCI collection with a cache_folder."""
+    relative_path = './tests/epw/chicago.epw'
+    epw = EPW(relative_path)
+    cache_folder = './tests/utci_cache'
+    utci_obj = UTCI.from_epw(epw, cache_folder=cache_folder)
+    assert len(os.listdir(cache_folder)) == 4  # SolarCal and UTCI bin + json files
+
+    cached_obj = UTCI.from_epw(epw, cache_folder=cache_folder)
+    assert len(os.listdir(cache_folder)) == 4
+    assert cached_obj.universal_thermal_climate_index.values == \
+        utci_obj.universal_thermal_climate_index.values
+    assert cached_obj.thermal_condition_eleven_point.values == \
+        utci_obj.thermal_condition_eleven_point.values
+    assert cached_obj.percent_neutral == utci_obj.percent_neutral
+
+    utci_par = UTCIParameter(cold_thresh=8)
+    UTCI.from_epw(epw, utci_parameter=utci_par, cache_folder=cache_folder)
+    assert len(os.listdir(cache_folder)) == 6
+    shutil.rmtree(cache_folder)
+
+
+def test_utci_collection_mask():
+    """Test the UTCI collection with a mask of the steps to evaluate."""
+    calc_length = 24
+    header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
+    air_temp = HourlyContinuousCollection(
+        header, [-10 + i * 2 for i in range(calc_length)])
+    mask = [i % 3 == 0 for i in range(calc_length)]
+    full_obj = UTCI(air_temp, 50, wind_speed=2)
+    utci_obj = UTCI(air_temp, 50, wind_speed=2, mask=mask)
+
+    assert utci_obj.universal_thermal_climate_index.values[:4] == \
+        (full_obj.universal_thermal_climate_index[0], None, None,
+         full_obj.universal_thermal_climate_index[3])
+    assert utci_obj.thermal_condition.values[1] is None
+    categories = full_obj.thermal_condition_eleven_point.filter_by_pattern(mask)
+    assert sum(utci_obj.category_counts().values()) == 8
+    assert utci_obj.percent_neutral == \
+        pytest.approx(100 * categories.values.count(0) / 8)
+    assert utci_obj.percent_comfortable + utci_obj.percent_uncomfortable == \
+        pytest.approx(100)
+
+
+def test_utci_collection_threshold_sweep():
+    """Test the threshold sweep of the UTCI collection against recomputed objects."""
+    calc_length = 24
+    header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
+    air_temp = HourlyContinuousCollection(
+        header, [-10 + i * 2 for i in range(calc_length)])
+    mask = [i % 3 != 0 for i in range(calc_length)]
+    utci_obj = UTCI(air_temp, 50, wind_speed=2, mask=mask)
+    cold_thresholds = [0, 4, 9, 12]
+    heat_thresholds = [20, 24, 26, 28]
+    sweep = utci_obj.threshold_sweep(cold_thresholds, heat_thresholds)
+    for i, (cold, heat) in enumerate(zip(cold_thresholds, heat_thresholds)):
+        test_obj = UTCI(air_temp, 50, wind_speed=2, mask=mask,
+                        comfort_parameter=UTCIParameter(cold, heat))
+        for key, val in sweep.items():
+            assert val[i] == pytest.approx(getattr(test_obj, key))
+
+    sweep = utci_obj.threshold_sweep(heat_thresholds=heat_thresholds)
+    assert len(sweep['percent_cold']) == 4
+    assert sweep['percent_cold'] == [utci_obj.percent_cold] * 4
+    assert utci_obj.threshold_sweep()['percent_neutral'] == \
+        [pytest.approx(utci_obj.percent_neutral)]
+    with pytest.raises(AssertionError):
+        utci_obj.threshold_sweep([0, 5], [10, 20, 30])
+    with pytest.raises(AssertionError):
+        utci_obj.threshold_sweep([30], [20])
@@ -5,6 +5,12 @@ from ladybug_comfort.wc import windchill_index
 from ladybug_comfort.wc import windchill_index_effect_category
 from ladybug_comfort.wc import windchill_temp
 from ladybug_comfort.wc import windchill_temp_effect_category
+from ladybug_comfort.wc import windchill_index_batch, \
+    windchill_index_effect_category_batch, windchill_temp_batch, \
+    windchill_temp_effect_category_batch
+from ladybug_comfort.collection.wc import WindChill
+
+from ladybug.epw import EPW
 
 
 def test_windchill_index():
@@ -40,3 +46,44 @@ def test_windchill_temp_effect_category():
     assert windchill_temp_effect_category(-45) == -4
     assert windchill_temp_effect_category(-50) == -5
     assert windchill_temp_effect_category(-60) == -6
+
+
+def test_windchill_batch():
+    """Test that the batch wind chill functions match the single-value functions."""
+    ta = [t for t in range(-60, 40) for _ in range(10)]
+    ws = [w * 1.5 for _ in range(-60, 40) for w in range(10)]
+    wci_values = windchill_index_batch(ta, ws)
+    assert wci_values == pytest.approx(
+        [windchill_index(t, w) for t, w in zip(ta, ws)])
+    wci_values.extend([58.3, 116.3, 232.6, 581.5, 930.4, 1628.2, 2326])
+    assert windchill_index_effect_category_batch(wci_values) == \
+        [windchill_index_effect_category(wci) for wci in wci_values]
+
+    twc_values = windchill_temp_batch(ta, ws)
+    assert twc_values == pytest.approx(
+        [windchill_temp(t, w) for t, w in zip(ta, ws)])
+    twc_values.extend([-54, -47, -39, -27, -9, 0])
+    assert windchill_temp_effect_category_batch(twc_values) == \
+        [windchill_temp_effect_category(twc) for twc in twc_values]
+
+
+def test_windchill_collection():
+    """Test the WindChill collection against the wind chill functions."""
+    epw = EPW('./tests/epw/chicago.epw')
+    wc_obj = WindChill.from_epw(epw)
+    assert wc_obj.comfort_model == 'Wind Chill'
+    assert wc_obj.calc_length == 8760
+    temps, winds = epw.dry_bulb_temperature.values, epw.wind_speed.values
+    assert wc_obj.windchill_index.values == pytest.approx(
+        [windchill_index(ta, ws) for ta, ws in zip(temps, winds)])
+    assert wc_obj.windchill_index_category.values == tuple(
+        windchill_index_effect_category(wci) for wci in wc_obj.windchill_index)
+    assert wc_obj.windchill_temperature.values == pytest.approx(
+        [windchill_temp(ta, ws) for ta, ws in zip(temps, winds)])
+    assert wc_obj.windchill_temperature_category.values == tuple(
+        windchill_temp_effect_category(twc) for twc in wc_obj.windchill_temperature)
+    assert wc_obj.percent_neutral + wc_obj.percent_hot + wc_obj.percent_cold == \
+        pytest.approx(100)
+    wct_cats = wc_obj.windchill_temperature_category.values
+    assert wc_obj.percent_hypothermia_risk == \
+        pytest.approx(sum(1 for cat in wct_cats if cat <= -2) / 87.6)